@@ -2,6 +2,9 @@
 NEXUS OVERLORD v2.0 - Main Entry Point
 
 Flask Web Application mit Blueprint-Architektur.
+
+Entwicklung: python app/main.py (Flask-Server)
+Produktion:  gunicorn -c gunicorn.conf.py app.main:app
 """
 
 import logging
@@ -11,17 +14,15 @@ import sys
 # Fix Python path for background threads
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from flask import Flask
+from flask import Flask, request
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Logging konfigurieren
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging konfigurieren (JSON + Queue, siehe app/utils/structured_logging.py)
+from app.utils.structured_logging import setup_logging  # noqa: E402
+setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -42,10 +43,32 @@ def create_app() -> Flask:
     app.config['DEBUG'] = os.getenv('DEBUG', 'False') == 'True'
     app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024  # 5MB
 
+    # Korrelations-ID pro Request (X-Request-ID) - zuerst, damit alle Hooks sie sehen
+    from app.utils.structured_logging import init_correlation
+    init_correlation(app)
+
+    # async Views auf der gemeinsamen Event-Loop (LLM-Routen, siehe app/utils/async_loop.py)
+    from app.utils.async_loop import init_async
+    init_async(app)
+
     # Blueprints registrieren
     from app.routes import register_blueprints
     register_blueprints(app)
 
+    # Prometheus-Metriken (GET /metrics, METRICS_ENABLED=0 schaltet ab)
+    from app.utils.metrics import init_metrics
+    init_metrics(app)
+
+    # Opt-in: Server-Timing und ?_profile=1 (REQUEST_PROFILING=1)
+    from app.utils.request_profiler import init_profiler
+    init_profiler(app)
+
+    @app.before_request
+    def _llm_projekt_kontext() -> None:
+        """Ordnet LLM-Calls dieses Requests dem Projekt aus der URL zu (LLM-Ledger)."""
+        from app.services.llm_ledger import set_projekt_id
+        set_projekt_id((request.view_args or {}).get('projekt_id'))
+
     logger.info("Flask-App initialisiert")
     return app
 
@@ -80,4 +103,8 @@ if __name__ == '__main__':
 
     print("=" * 60)
 
+    # Schwere Module nach dem Binden im Hintergrund vorladen (WARMUP=0 schaltet ab)
+    from app.utils.warmup import start_warmup
+    start_warmup(app)
+
     app.run(host=host, port=port, debug=debug)
@@ -20,6 +20,7 @@ def register_blueprints(app: Flask) -> None:
     from .steuern import steuern_bp
     from .uebergaben import uebergaben_bp
     from .chat import chat_bp
+    from .metrics import metrics_bp
 
     app.register_blueprint(home_bp)
     app.register_blueprint(projekt_bp)
@@ -27,3 +28,4 @@ def register_blueprints(app: Flask) -> None:
     app.register_blueprint(steuern_bp)
     app.register_blueprint(uebergaben_bp)
     app.register_blueprint(chat_bp)
+    app.register_blueprint(metrics_bp)
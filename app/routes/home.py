@@ -17,5 +17,7 @@ def index():
 
 @home_bp.route('/health')
 def health():
-    """Health Check Endpoint."""
-    return {'status': 'ok', 'version': '2.0.0'}
+    """Health Check Endpoint (inkl. Warm-up Status: pending, running, done, disabled)."""
+    from app.utils.warmup import get_warmup_status
+
+    return {'status': 'ok', 'version': '2.0.0', 'warmup': get_warmup_status()['status']}
@@ -0,0 +1,58 @@
+"""
+NEXUS OVERLORD v2.0 - Metrics Routes
+
+Kennzahlen fuer Betrieb und Performance-Arbeit.
+"""
+
+from flask import Blueprint, Response, abort, current_app, jsonify, request
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('/metrics')
+def prometheus_metrics():
+    """
+    Alle In-Process Metriken im Prometheus-Textformat.
+
+    Returns:
+        text/plain (Version 0.0.4), 404 wenn METRICS_ENABLED=0
+    """
+    from app.utils.metrics import CONTENT_TYPE, REGISTRY
+
+    if not current_app.config.get('METRICS_ENABLED'):
+        abort(404)
+    return Response(REGISTRY.expose(), content_type=CONTENT_TYPE)
+
+
+@metrics_bp.route('/metrics/llm')
+def llm_metrics():
+    """
+    Token-, Latenz- und Kostenuebersicht aller LLM-Calls aus dem Ledger.
+
+    Query-Parameter:
+        tage: Zeitfenster in Tagen (Standard 30, 0 = alles)
+        projekt_id: Optional - nur dieses Projekt
+        gruppe: Optional - nur eine Gruppierung (tag, modell, projekt, call_site)
+
+    Returns:
+        JSON: gesamt + Aggregate je Gruppierung
+    """
+    from app.services.llm_ledger import GRUPPEN, get_ledger
+
+    ledger = get_ledger()
+    tage = request.args.get('tage', 30, type=int)
+    projekt_id = request.args.get('projekt_id', type=int)
+    gruppe = request.args.get('gruppe')
+
+    if gruppe and gruppe not in GRUPPEN:
+        return jsonify({'error': f"Unbekannte Gruppierung: {gruppe}",
+                        'erlaubt': list(GRUPPEN)}), 400
+
+    gruppen = [gruppe] if gruppe else list(GRUPPEN)
+    return jsonify({
+        'tage': tage or None,
+        'projekt_id': projekt_id,
+        'enabled': ledger.enabled,
+        'gesamt': ledger.totals(tage, projekt_id),
+        **{f'nach_{name}': ledger.summary(name, tage, projekt_id) for name in gruppen}
+    })
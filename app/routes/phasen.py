@@ -4,10 +4,22 @@ NEXUS OVERLORD v2.0 - Phasen Routes
 Kachel 2: Phasen und Auftraege generieren, Qualitaetspruefung.
 """
 
+import contextvars
+import json
 import logging
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
 
-import markdown2
-from flask import Blueprint, render_template, request, redirect, url_for, flash, session
+from flask import (
+    Blueprint, Response, render_template, request, redirect, url_for, flash, session, jsonify
+)
+
+from app.services.session_store import (
+    get_session_artifact, pop_session_artifact,
+    reserve_session_artifact, release_reserved_artifact, link_session_artifact, get_store
+)
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -17,9 +29,13 @@ phasen_bp = Blueprint('phasen', __name__)
 
 @phasen_bp.route('/projekt/<int:projekt_id>/phasen', methods=['GET', 'POST'])
 def projekt_phasen_view(projekt_id: int):
-    """Kachel 2: Phasen & Auftraege generieren (Phase 3)."""
+    """
+    Kachel 2: Phasen & Auftraege generieren (Phase 3).
+
+    POST startet die Phasen-Generierung als Hintergrund-Job, mit
+    bis=qualitaet die komplette Planung (siehe app/services/planung_jobs.py).
+    """
     from app.services.database import get_projekt
-    from app.services.phasen_generator import generate_phasen
 
     projekt = get_projekt(projekt_id)
 
@@ -28,32 +44,106 @@ def projekt_phasen_view(projekt_id: int):
         return redirect(url_for('home.index'))
 
     if request.method == 'POST':
-        enterprise_plan = projekt['enterprise_plan']
+        return _planung_starten(projekt, 'phasen')
 
-        try:
-            phasen_data = generate_phasen(enterprise_plan)
-            session['phasen_data'] = phasen_data
-            session['projekt_id'] = projekt_id
+    return render_template('projekt_phasen.html', projekt=projekt)
 
-            flash('Phasen erfolgreich generiert!', 'success')
-            return redirect(url_for('phasen.projekt_phasen_ergebnis', projekt_id=projekt_id))
 
+def _stream_generation(
+    run: Callable[[Callable[[dict[str, Any]], None]], dict[str, Any]],
+    item_typ: str,
+    list_key: str,
+    artifact_ref: str,
+    release_ref: str | None,
+    redirect_url: str
+) -> Response:
+    """
+    Streamt die Elemente einer Generierung als NDJSON.
+
+    Die Generierung laeuft in einem eigenen Thread und meldet jedes fertige
+    Element ueber eine Queue. Das Ergebnis wird unter artifact_ref
+    gespeichert - auch wenn der Browser die Verbindung vorher schliesst.
+    Bis dahin (und bei einem Fehler) liefert artifact_ref die Kopie des
+    vorherigen Ergebnisses, release_ref wird danach geloescht.
+
+    Zeilen:
+        {"typ": "<item_typ>", "daten": {...}}
+        {"typ": "fertig", "anzahl": n, "redirect": "/..."}
+        {"typ": "fehler", "meldung": "..."}
+
+    Args:
+        run: Ruft den Generator mit dem Element-Callback auf
+        item_typ: Typ der Element-Zeilen ('phase' oder 'auftrag')
+        list_key: Schluessel der Liste im Ergebnis ('phasen' oder 'auftraege')
+        artifact_ref: Vorab reservierte Referenz im Session-Store
+        release_ref: Alte Referenz, danach zu loeschen (oder None)
+        redirect_url: Ziel nach erfolgreicher Generierung
+
+    Returns:
+        Response: Streaming-Response (application/x-ndjson)
+    """
+    events: queue.Queue = queue.Queue()
+
+    def worker() -> None:
+        try:
+            data = run(lambda item: events.put({'typ': item_typ, 'daten': item}))
+            get_store().put(data, ref=artifact_ref)
+            events.put({'typ': 'fertig', 'anzahl': len(data[list_key]), 'redirect': redirect_url})
         except Exception as e:
-            logger.error(f"Phasen-Generierung fehlgeschlagen: {e}")
-            flash(f'Fehler bei Phasen-Generierung: {str(e)}', 'error')
-            return redirect(url_for('phasen.projekt_phasen_view', projekt_id=projekt_id))
+            logger.error(f"Streaming-Generierung ({item_typ}) fehlgeschlagen: {e}")
+            events.put({'typ': 'fehler', 'meldung': str(e)})
+        finally:
+            release_reserved_artifact(release_ref)
 
-    return render_template('projekt_phasen.html', projekt=projekt)
+    # Kontext mitnehmen (Projekt-ID fuer den LLM-Ledger)
+    threading.Thread(target=contextvars.copy_context().run, args=(worker,),
+                     name=f'stream-{item_typ}', daemon=True).start()
+
+    def generate() -> Iterator[str]:
+        while True:
+            event = events.get()
+            yield json.dumps(event, ensure_ascii=False) + '\n'
+            if event['typ'] in ('fertig', 'fehler'):
+                return
+
+    return Response(generate(), mimetype='application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@phasen_bp.route('/projekt/<int:projekt_id>/phasen/stream', methods=['POST'])
+def projekt_phasen_stream(projekt_id: int):
+    """Generiert Phasen und streamt jede fertige Phase (NDJSON)."""
+    from app.services.database import get_projekt
+    from app.services.phasen_generator import generate_phasen
+
+    projekt = get_projekt(projekt_id)
+    if not projekt:
+        return jsonify({'success': False, 'error': 'Projekt nicht gefunden'}), 404
+
+    enterprise_plan = projekt['enterprise_plan']
+    ref, alt_ref = reserve_session_artifact('phasen_data')
+    session['projekt_id'] = projekt_id
+
+    return _stream_generation(
+        lambda on_phase: generate_phasen(enterprise_plan, on_phase=on_phase),
+        'phase',
+        'phasen',
+        ref,
+        alt_ref,
+        url_for('phasen.projekt_phasen_ergebnis', projekt_id=projekt_id)
+    )
 
 
 @phasen_bp.route('/projekt/<int:projekt_id>/phasen/ergebnis')
 def projekt_phasen_ergebnis(projekt_id: int):
     """Zeigt generierte Phasen an (Auftrag 3.1)."""
+    import markdown2
+
     from app.services.database import get_projekt
     from app.services.phasen_generator import format_phasen_for_display
 
     projekt = get_projekt(projekt_id)
-    phasen_data = session.get('phasen_data')
+    phasen_data = get_session_artifact('phasen_data')
 
     if not phasen_data:
         flash('Keine Phasen gefunden. Bitte erst generieren.', 'error')
@@ -81,33 +171,49 @@ def projekt_phasen():
 
 @phasen_bp.route('/projekt/<int:projekt_id>/auftraege/generieren', methods=['POST'])
 def auftraege_generieren(projekt_id: int):
-    """Generiert Auftraege mit Opus 4.5 (Auftrag 3.2)."""
+    """Startet die Auftrags-Generierung mit Opus 4.5 als Hintergrund-Job (Auftrag 3.2)."""
     from app.services.database import get_projekt
-    from app.services.auftraege_generator import generate_auftraege
 
     projekt = get_projekt(projekt_id)
-    phasen_data = session.get('phasen_data')
 
     if not projekt:
         flash('Projekt nicht gefunden', 'error')
         return redirect(url_for('home.index'))
 
-    if not phasen_data:
+    if not get_session_artifact('phasen_data'):
         flash('Erst Phasen generieren!', 'error')
         return redirect(url_for('phasen.projekt_phasen_view', projekt_id=projekt_id))
 
-    try:
-        auftraege_data = generate_auftraege(phasen_data, projekt['enterprise_plan'])
-        session['auftraege_data'] = auftraege_data
-        session['projekt_id'] = projekt_id
+    return _planung_starten(projekt, 'auftraege')
 
-        flash('Auftraege erfolgreich generiert!', 'success')
-        return redirect(url_for('phasen.auftraege_anzeigen', projekt_id=projekt_id))
 
-    except Exception as e:
-        logger.error(f"Auftrags-Generierung fehlgeschlagen: {e}")
-        flash(f'Fehler bei Auftrags-Generierung: {str(e)}', 'error')
-        return redirect(url_for('phasen.projekt_phasen_ergebnis', projekt_id=projekt_id))
+@phasen_bp.route('/projekt/<int:projekt_id>/auftraege/stream', methods=['POST'])
+def auftraege_stream(projekt_id: int):
+    """Generiert Auftraege und streamt jeden fertigen Auftrag (NDJSON)."""
+    from app.services.database import get_projekt
+    from app.services.auftraege_generator import generate_auftraege
+
+    projekt = get_projekt(projekt_id)
+    phasen_data = get_session_artifact('phasen_data')
+
+    if not projekt:
+        return jsonify({'success': False, 'error': 'Projekt nicht gefunden'}), 404
+
+    if not phasen_data:
+        return jsonify({'success': False, 'error': 'Erst Phasen generieren!'}), 400
+
+    enterprise_plan = projekt['enterprise_plan']
+    ref, alt_ref = reserve_session_artifact('auftraege_data')
+    session['projekt_id'] = projekt_id
+
+    return _stream_generation(
+        lambda on_auftrag: generate_auftraege(phasen_data, enterprise_plan, on_auftrag=on_auftrag),
+        'auftrag',
+        'auftraege',
+        ref,
+        alt_ref,
+        url_for('phasen.auftraege_anzeigen', projekt_id=projekt_id)
+    )
 
 
 @phasen_bp.route('/projekt/<int:projekt_id>/auftraege')
@@ -116,8 +222,8 @@ def auftraege_anzeigen(projekt_id: int):
     from app.services.database import get_projekt
 
     projekt = get_projekt(projekt_id)
-    auftraege_data = session.get('auftraege_data')
-    phasen_data = session.get('phasen_data')
+    auftraege_data = get_session_artifact('auftraege_data')
+    phasen_data = get_session_artifact('phasen_data')
 
     if not auftraege_data:
         flash('Keine Auftraege gefunden. Bitte erst generieren.', 'error')
@@ -146,34 +252,20 @@ def auftraege_anzeigen(projekt_id: int):
 
 @phasen_bp.route('/projekt/<int:projekt_id>/auftraege/pruefen', methods=['POST'])
 def auftraege_pruefen(projekt_id: int):
-    """Prueft Auftraege mit Gemini 3 Pro (Auftrag 3.3)."""
+    """Startet die Qualitaetspruefung mit Gemini 3 Pro als Hintergrund-Job (Auftrag 3.3)."""
     from app.services.database import get_projekt
-    from app.services.qualitaetspruefung import pruefen_auftraege
 
     projekt = get_projekt(projekt_id)
-    phasen_data = session.get('phasen_data')
-    auftraege_data = session.get('auftraege_data')
 
     if not projekt:
         flash('Projekt nicht gefunden', 'error')
         return redirect(url_for('home.index'))
 
-    if not phasen_data or not auftraege_data:
+    if not get_session_artifact('phasen_data') or not get_session_artifact('auftraege_data'):
         flash('Erst Phasen und Auftraege generieren!', 'error')
         return redirect(url_for('phasen.projekt_phasen_view', projekt_id=projekt_id))
 
-    try:
-        qualitaet_data = pruefen_auftraege(auftraege_data, phasen_data, projekt['enterprise_plan'])
-        session['qualitaet_data'] = qualitaet_data
-        session['projekt_id'] = projekt_id
-
-        flash('Qualitaetspruefung abgeschlossen!', 'success')
-        return redirect(url_for('phasen.qualitaet_anzeigen', projekt_id=projekt_id))
-
-    except Exception as e:
-        logger.error(f"Qualitaetspruefung fehlgeschlagen: {e}")
-        flash(f'Fehler bei Qualitaetspruefung: {str(e)}', 'error')
-        return redirect(url_for('phasen.auftraege_anzeigen', projekt_id=projekt_id))
+    return _planung_starten(projekt, 'qualitaet')
 
 
 @phasen_bp.route('/projekt/<int:projekt_id>/auftraege/qualitaet')
@@ -183,7 +275,7 @@ def qualitaet_anzeigen(projekt_id: int):
     from app.services.qualitaetspruefung import get_status_icon, get_status_color
 
     projekt = get_projekt(projekt_id)
-    qualitaet_data = session.get('qualitaet_data')
+    qualitaet_data = get_session_artifact('qualitaet_data')
 
     if not qualitaet_data:
         flash('Keine Qualitaetspruefung gefunden. Bitte erst pruefen.', 'error')
@@ -198,14 +290,197 @@ def qualitaet_anzeigen(projekt_id: int):
                           qualitaet=qualitaet_data)
 
 
+# ========================================
+# PLANUNGS-JOBS (Hintergrund, siehe app/services/planung_jobs.py)
+# ========================================
+
+# Ergebnis-Seite je Stufe und Rueckweg bei Fehlern
+_PLANUNG_ERGEBNIS = {
+    'phasen': 'phasen.projekt_phasen_ergebnis',
+    'auftraege': 'phasen.auftraege_anzeigen',
+    'qualitaet': 'phasen.qualitaet_anzeigen',
+}
+_PLANUNG_START = {
+    'phasen': 'phasen.projekt_phasen_view',
+    'auftraege': 'phasen.projekt_phasen_ergebnis',
+    'qualitaet': 'phasen.auftraege_anzeigen',
+}
+_PLANUNG_TITEL = {
+    'phasen': 'Phasen-Generierung',
+    'auftraege': 'Auftrags-Generierung',
+    'qualitaet': 'Qualitaetspruefung',
+}
+
+
+def _planung_submit(projekt: dict, stufe: str, bis: str | None, neu: bool) -> dict[str, Any]:
+    """
+    Reicht einen Planungs-Job mit den Artefakten der Session ein.
+
+    Args:
+        projekt: Projekt aus get_projekt()
+        stufe: Erste Stufe
+        bis: Letzte Stufe der Kette (None = nur stufe)
+        neu: Vorhandenes Ergebnis ignorieren
+
+    Returns:
+        dict: Job-Status aus PlanungJobManager.submit()
+
+    Raises:
+        ValueError: Bei ungueltiger Stufe oder fehlenden Artefakten
+    """
+    from app.services.planung_jobs import ARTEFAKTE, get_planung_manager
+
+    daten = {'enterprise_plan': projekt['enterprise_plan']}
+    for name in ARTEFAKTE.values():
+        artefakt = get_session_artifact(name)
+        if artefakt:
+            daten[name] = artefakt
+
+    session['projekt_id'] = projekt['id']
+    return get_planung_manager().submit(projekt['id'], stufe, daten, bis=bis, neu=neu)
+
+
+def _planung_starten(projekt: dict, stufe: str) -> Response:
+    """
+    Formular-POST: Job einreichen und zur Fortschritts-Seite weiterleiten.
+
+    Ein Klick auf Generieren/Pruefen erzeugt immer ein neues Ergebnis
+    (neu=True, wie die Stream-Routen) - wiederverwendet wird nur ueber die
+    JSON-API (planung_start).
+    """
+    try:
+        job = _planung_submit(projekt, stufe, request.form.get('bis') or None, neu=True)
+    except ValueError as e:
+        flash(f'{_PLANUNG_TITEL[stufe]} nicht moeglich: {e}', 'error')
+        return redirect(url_for(_PLANUNG_START[stufe], projekt_id=projekt['id']))
+
+    return redirect(url_for('phasen.planung_fortschritt', projekt_id=projekt['id'], job_id=job['job_id']))
+
+
+def _planung_status(projekt_id: int, job_id: str) -> dict[str, Any] | None:
+    """
+    Fasst eine Job-Kette zusammen und uebernimmt fertige Ergebnisse in die Session.
+
+    Args:
+        projekt_id: ID des Projekts (muss zum Job passen)
+        job_id: ID des ersten Jobs der Kette
+
+    Returns:
+        dict | None: job_id, status, progress, stufe, schritt, stufen, events,
+                     error, redirect, status_url - None wenn unbekannt
+    """
+    from app.services.planung_jobs import ARTEFAKTE, STUFEN, get_planung_manager
+
+    kette = get_planung_manager().get_kette(job_id)
+    if not kette or kette[0]['projekt_id'] != projekt_id:
+        return None
+
+    for job in kette:
+        if job['status'] == 'done':
+            link_session_artifact(ARTEFAKTE[job['stufe']], job['ergebnis_ref'])
+
+    letzter = kette[-1]
+    bis = max((job['bis'] for job in kette), key=STUFEN.index)
+    stufen = STUFEN[STUFEN.index(kette[0]['stufe']):STUFEN.index(bis) + 1]
+    fehler = next((job for job in kette if job['status'] == 'error'), None)
+
+    if fehler:
+        status = 'error'
+        ziel = url_for(_PLANUNG_START[fehler['stufe']], projekt_id=projekt_id)
+    elif letzter['status'] == 'done' and letzter['stufe'] == stufen[-1]:
+        status = 'done'
+        ziel = url_for(_PLANUNG_ERGEBNIS[letzter['stufe']], projekt_id=projekt_id)
+    else:
+        status = 'queued' if len(kette) == 1 and letzter['status'] == 'queued' else 'running'
+        ziel = None
+
+    fertige = sum(1 for job in kette if job['status'] == 'done')
+    laufend = 0 if letzter['status'] == 'done' else letzter['progress']
+
+    return {
+        'job_id': job_id,
+        'status': status,
+        'progress': (100 * fertige + laufend) // len(stufen),
+        'stufe': letzter['stufe'],
+        'schritt': letzter['schritt'],
+        'stufen': [
+            {'stufe': stufe, 'titel': _PLANUNG_TITEL[stufe],
+             'status': next((job['status'] for job in kette if job['stufe'] == stufe), 'waiting')}
+            for stufe in stufen
+        ],
+        'events': [{'stufe': job['stufe'], **event} for job in kette for event in job['events']],
+        'error': fehler['error'] if fehler else None,
+        'redirect': ziel,
+        'status_url': url_for('phasen.planung_status', projekt_id=projekt_id, job_id=job_id),
+    }
+
+
+@phasen_bp.route('/projekt/<int:projekt_id>/planung/jobs', methods=['POST'])
+def planung_start(projekt_id: int):
+    """
+    Startet einen Planungs-Job (JSON-API).
+
+    Parameter (Formular oder JSON): stufe ('phasen', 'auftraege', 'qualitaet'),
+    bis (letzte Stufe, Standard: stufe), neu (1/true = nicht wiederverwenden).
+    Eingaben sind Enterprise-Plan und die Artefakte der Session.
+    """
+    from app.services.database import get_projekt
+
+    projekt = get_projekt(projekt_id)
+    if not projekt:
+        return jsonify({'success': False, 'error': 'Projekt nicht gefunden'}), 404
+
+    params = request.get_json(silent=True) or request.form
+    try:
+        job = _planung_submit(projekt, params.get('stufe', 'phasen'), params.get('bis') or None,
+                              str(params.get('neu', '')).lower() in ('1', 'true'))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    return jsonify(_planung_status(projekt_id, job['job_id'])), 202
+
+
+@phasen_bp.route('/projekt/<int:projekt_id>/planung/jobs/<job_id>')
+def planung_status(projekt_id: int, job_id: str):
+    """Status einer Job-Kette fuer Polling (JSON), fertige Ergebnisse landen in der Session."""
+    status = _planung_status(projekt_id, job_id)
+    if not status:
+        return jsonify({'success': False, 'error': 'Job nicht gefunden'}), 404
+    return jsonify(status)
+
+
+@phasen_bp.route('/projekt/<int:projekt_id>/planung/jobs/<job_id>/fortschritt')
+def planung_fortschritt(projekt_id: int, job_id: str):
+    """Fortschritts-Seite (laedt sich neu, leitet nach Abschluss zum Ergebnis weiter)."""
+    from app.services.database import get_projekt
+
+    status = _planung_status(projekt_id, job_id)
+    if not status:
+        flash('Planungs-Job nicht gefunden oder abgelaufen', 'error')
+        return redirect(url_for('phasen.projekt_phasen_view', projekt_id=projekt_id))
+
+    if status['status'] == 'done':
+        flash(f"{' & '.join(s['titel'] for s in status['stufen'])} abgeschlossen!", 'success')
+        return redirect(status['redirect'])
+
+    if status['status'] == 'error':
+        logger.error(f"Planungs-Job {job_id} fehlgeschlagen: {status['error']}")
+        flash(f"Fehler bei {_PLANUNG_TITEL[status['stufe']]}: {status['error']}", 'error')
+        return redirect(status['redirect'])
+
+    return render_template('projekt_planung_fortschritt.html',
+                          projekt=get_projekt(projekt_id),
+                          job=status)
+
+
 @phasen_bp.route('/projekt/<int:projekt_id>/abschliessen', methods=['POST'])
 def projekt_abschliessen(projekt_id: int):
     """Speichert alle generierten Daten in DB (Auftrag 3.4)."""
     from app.services.database import save_phasen, save_auftraege, update_projekt_qualitaet
 
-    phasen_data = session.get('phasen_data')
-    auftraege_data = session.get('auftraege_data')
-    qualitaet_data = session.get('qualitaet_data')
+    phasen_data = get_session_artifact('phasen_data')
+    auftraege_data = get_session_artifact('auftraege_data')
+    qualitaet_data = get_session_artifact('qualitaet_data')
 
     if not phasen_data or not auftraege_data or not qualitaet_data:
         flash('Nicht alle Daten vorhanden. Bitte Workflow komplett durchlaufen.', 'error')
@@ -226,9 +501,9 @@ def projekt_abschliessen(projekt_id: int):
         update_projekt_qualitaet(projekt_id, qualitaet_data)
 
         # 4. Session aufraeumen
-        session.pop('phasen_data', None)
-        session.pop('auftraege_data', None)
-        session.pop('qualitaet_data', None)
+        pop_session_artifact('phasen_data')
+        pop_session_artifact('auftraege_data')
+        pop_session_artifact('qualitaet_data')
         session.pop('projekt_id', None)
 
         flash('Projekt erfolgreich gespeichert! Status: BEREIT', 'success')
@@ -4,27 +4,65 @@ NEXUS OVERLORD v2.0 - Projekt Routes
 Kachel 1: Neues Projekt erstellen, Multi-Agent Workflow, Ergebnis anzeigen.
 """
 
+import contextvars
 import logging
 import re
+import secrets
 import threading
-import time
+from typing import Any
 
-import markdown2
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session, jsonify
 
+from app.services.session_store import get_store, set_session_artifact, get_session_artifact
+
 # Logger
 logger = logging.getLogger(__name__)
 
 projekt_bp = Blueprint('projekt', __name__)
 
-# Global workflow storage (in production: use Redis or DB)
-workflow_storage = {}
+# Maximale Groesse hochgeladener Plaene (PDF/DOCX/TXT)
+PLAN_UPLOAD_MAX_BYTES = 10 * 1024 * 1024
+
+
+# ========================================
+# WORKFLOW-STATUS (SQLite, fuer alle Worker sichtbar)
+# ========================================
+
+def save_workflow_status(workflow_id: str, status: dict[str, Any]) -> None:
+    """
+    Speichert den Workflow-Status im Session-Store (Referenz = workflow_id).
+
+    Der Workflow laeuft im Thread eines Workers, die Status-Abfragen
+    koennen bei mehreren Gunicorn-Workern in einem anderen Prozess landen.
+
+    Args:
+        workflow_id: ID des Workflows
+        status: Status mit current_step, steps, final_plan, bewertung, error
+    """
+    get_store().put(status, ref=workflow_id)
+
+
+def get_workflow_status(workflow_id: str | None) -> dict[str, Any] | None:
+    """
+    Laedt den Workflow-Status.
+
+    Args:
+        workflow_id: ID des Workflows (aus der Session)
+
+    Returns:
+        dict | None: Status oder None (unbekannt/abgelaufen)
+    """
+    if not workflow_id:
+        return None
+    return get_store().get(workflow_id)
 
 
 def run_workflow_background(workflow_id: str, projektname: str, projektplan: str) -> None:
     """
     Fuehrt den Multi-Agent Workflow in einem Background-Thread aus.
 
+    Jede Status-Aenderung wird per save_workflow_status() persistiert.
+
     Args:
         workflow_id: Eindeutige ID fuer den Workflow
         projektname: Name des Projekts
@@ -38,29 +76,33 @@ def run_workflow_background(workflow_id: str, projektname: str, projektplan: str
     if project_root not in sys.path:
         sys.path.insert(0, project_root)
 
+    from app.utils.metrics import WORKFLOWS_ACTIVE
+
+    WORKFLOWS_ACTIVE.inc()
+    workflow = None
     try:
         logger.info(f"Thread gestartet fuer Workflow {workflow_id}")
 
         # Import AFTER setting sys.path
         from app.services.multi_agent import MultiAgentWorkflow
 
-        workflow = MultiAgentWorkflow()
-        workflow_storage[workflow_id] = workflow
+        workflow = MultiAgentWorkflow(on_status=lambda status: save_workflow_status(workflow_id, status))
 
         logger.info(f"Starte Workflow fuer: {projektname}")
         workflow.run(projektname, projektplan)
-        workflow_storage[workflow_id] = workflow
 
         logger.info("Workflow abgeschlossen!")
 
     except Exception as e:
         logger.error(f"Workflow Fehler: {e}", exc_info=True)
-        workflow_storage[workflow_id] = {
+        save_workflow_status(workflow_id, {
             'status': 'error',
             'error': str(e),
-            'current_step': 0,
-            'steps': []
-        }
+            'current_step': workflow.status['current_step'] if workflow else 0,
+            'steps': workflow.status['steps'] if workflow else []
+        })
+    finally:
+        WORKFLOWS_ACTIVE.dec()
 
 
 def parse_bewertung_score(bewertung_text: str) -> int:
@@ -115,7 +157,8 @@ def upload_plan():
 
     Extrahiert Text aus der Datei und gibt ihn zurueck.
     """
-    from app.services.document_extractor import extract_text_from_file, is_supported_format
+    from app.services.document_extractor import extract_text_from_upload, is_supported_format
+    from app.services.upload_spool import UploadTooLarge, spool_upload
 
     if 'file' not in request.files:
         return jsonify({'success': False, 'error': 'Keine Datei hochgeladen'}), 400
@@ -131,8 +174,12 @@ def upload_plan():
             'error': 'Nicht unterstuetztes Format. Erlaubt: PDF, DOCX, TXT, MD'
         }), 400
 
-    # Text extrahieren
-    text, error = extract_text_from_file(file, file.filename)
+    # Upload blockweise auf die Platte spoolen, dann Text extrahieren
+    try:
+        with spool_upload(file, PLAN_UPLOAD_MAX_BYTES, sniff_text=True) as upload:
+            text, error = extract_text_from_upload(upload)
+    except UploadTooLarge as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
 
     if error:
         return jsonify({'success': False, 'error': error}), 400
@@ -151,46 +198,52 @@ def upload_plan():
     })
 
 
+@projekt_bp.route('/projekt/extraktion/stats')
+def extraktion_stats():
+    """
+    Liefert Kennzahlen des Extraktions-Caches fuer Plan-Uploads.
+
+    Returns:
+        JSON: hits, misses, hit_rate, entries, bytes, max_bytes, enabled
+    """
+    from app.services.extraction_cache import get_extraction_cache
+
+    return jsonify(get_extraction_cache().stats())
+
+
 @projekt_bp.route('/projekt/tracker')
 def projekt_tracker():
     """Live-Tracker fuer Multi-Agent Workflow (Auftrag 2.3)."""
     projektname = session.get('projektname', 'Unbenanntes Projekt')
     projektplan = session.get('projektplan', '')
 
-    # Generate workflow ID
-    workflow_id = f"workflow_{int(time.time())}"
+    # Eindeutig ueber alle Worker, Startstatus sofort persistieren
+    workflow_id = f"workflow_{secrets.token_hex(8)}"
     session['workflow_id'] = workflow_id
 
-    # Start workflow in background if not running
-    if workflow_id not in workflow_storage:
-        thread = threading.Thread(
-            target=run_workflow_background,
-            args=(workflow_id, projektname, projektplan),
-            daemon=True
-        )
-        thread.start()
+    tracker_status = {
+        'status': 'running',
+        'current_step': 1,
+        'steps': [
+            {'nr': 1, 'name': 'Opus analysiert', 'icon': '🔍', 'ai': 'Opus 4.5', 'status': 'active'},
+            {'nr': 2, 'name': 'Gemini Feedback', 'icon': '💭', 'ai': 'Gemini 3 Pro', 'status': 'waiting'},
+            {'nr': 3, 'name': 'Enterprise-Plan', 'icon': '📋', 'ai': 'Opus 4.5', 'status': 'waiting'},
+            {'nr': 4, 'name': 'Qualitaetspruefung', 'icon': '🔎', 'ai': 'Gemini 3 Pro', 'status': 'waiting'},
+            {'nr': 5, 'name': 'Verbesserung', 'icon': '✨', 'ai': 'Opus 4.5', 'status': 'waiting'},
+            {'nr': 6, 'name': 'Finale Bewertung', 'icon': '⭐', 'ai': 'Gemini 3 Pro', 'status': 'waiting'},
+        ]
+    }
+    save_workflow_status(workflow_id, tracker_status)
+
+    # Kontext kopieren: Korrelations-ID und Projekt gelten auch im Thread
+    thread = threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(run_workflow_background, workflow_id, projektname, projektplan),
+        daemon=True
+    )
+    thread.start()
 
-    # Get current status
-    if workflow_id in workflow_storage:
-        workflow = workflow_storage[workflow_id]
-        if hasattr(workflow, 'get_status'):
-            tracker_status = workflow.get_status()
-        else:
-            tracker_status = workflow
-        tracker_status['projektname'] = projektname
-    else:
-        tracker_status = {
-            'current_step': 1,
-            'projektname': projektname,
-            'steps': [
-                {'nr': 1, 'name': 'Opus analysiert', 'icon': '🔍', 'ai': 'Opus 4.5', 'status': 'active'},
-                {'nr': 2, 'name': 'Gemini Feedback', 'icon': '💭', 'ai': 'Gemini 3 Pro', 'status': 'waiting'},
-                {'nr': 3, 'name': 'Enterprise-Plan', 'icon': '📋', 'ai': 'Opus 4.5', 'status': 'waiting'},
-                {'nr': 4, 'name': 'Qualitaetspruefung', 'icon': '🔎', 'ai': 'Gemini 3 Pro', 'status': 'waiting'},
-                {'nr': 5, 'name': 'Verbesserung', 'icon': '✨', 'ai': 'Opus 4.5', 'status': 'waiting'},
-                {'nr': 6, 'name': 'Finale Bewertung', 'icon': '⭐', 'ai': 'Gemini 3 Pro', 'status': 'waiting'},
-            ]
-        }
+    tracker_status = {**tracker_status, 'projektname': projektname}
 
     return render_template('projekt_tracker.html', tracker=tracker_status)
 
@@ -198,9 +251,9 @@ def projekt_tracker():
 @projekt_bp.route('/projekt/tracker/status')
 def projekt_tracker_status():
     """HTMX endpoint for live status updates (Progress Bar + Steps)."""
-    workflow_id = session.get('workflow_id')
+    status = get_workflow_status(session.get('workflow_id'))
 
-    if not workflow_id or workflow_id not in workflow_storage:
+    if status is None:
         return '''
         <div class="progress-section">
             <div class="progress-label">
@@ -218,12 +271,6 @@ def projekt_tracker_status():
         </div>
         '''
 
-    workflow = workflow_storage[workflow_id]
-    if hasattr(workflow, 'get_status'):
-        status = workflow.get_status()
-    else:
-        status = workflow
-
     current_step = status.get('current_step', 0)
     progress_percent = int((current_step / 6) * 100)
 
@@ -280,15 +327,12 @@ def projekt_tracker_status():
 @projekt_bp.route('/projekt/ergebnis')
 def projekt_ergebnis():
     """Ergebnis-Anzeige nach Workflow-Ende (Auftrag 2.4)."""
-    workflow_id = session.get('workflow_id')
+    import markdown2
 
-    if workflow_id and workflow_id in workflow_storage:
-        workflow = workflow_storage[workflow_id]
-        if hasattr(workflow, 'get_status'):
-            status = workflow.get_status()
-        else:
-            status = workflow
+    workflow_id = session.get('workflow_id')
 
+    status = get_workflow_status(workflow_id)
+    if status is not None:
         enterprise_plan = status.get('final_plan', 'Plan wird noch erstellt...')
         bewertung = status.get('bewertung', 'Bewertung ausstehend...')
     else:
@@ -313,13 +357,8 @@ def projekt_speichern():
 
     workflow_id = session.get('workflow_id')
 
-    if workflow_id and workflow_id in workflow_storage:
-        workflow = workflow_storage[workflow_id]
-        if hasattr(workflow, 'get_status'):
-            status = workflow.get_status()
-        else:
-            status = workflow
-
+    status = get_workflow_status(workflow_id)
+    if status is not None:
         enterprise_plan = status.get('final_plan', '')
         bewertung = status.get('bewertung', '')
     else:
@@ -340,8 +379,8 @@ def projekt_speichern():
         session['projekt_id'] = projekt_id
 
         # Clean up
-        if workflow_id and workflow_id in workflow_storage:
-            del workflow_storage[workflow_id]
+        if workflow_id:
+            get_store().delete(workflow_id)
         session.pop('workflow_id', None)
 
         flash(f'Projekt "{projektname}" erfolgreich gespeichert!', 'success')
@@ -376,11 +415,24 @@ def projekt_liste():
     return render_template('projekt_liste.html', projekte=projekte)
 
 
+def _export_filename(projekt: dict) -> str:
+    """Dateiname fuer den PDF-Export (Projektname + Datum)."""
+    from datetime import datetime
+
+    projekt_name = projekt['name'].replace(' ', '_').replace('/', '-')
+    datum = datetime.now().strftime('%Y-%m-%d')
+    return f"NEXUS_{projekt_name}_Dokumentation_{datum}.pdf"
+
+
 @projekt_bp.route('/projekt/<int:projekt_id>/export-pdf')
 def export_pdf(projekt_id: int):
     """
     Exportiert komplette Projekt-Dokumentation als PDF (Auftrag 6.2).
 
+    Bereits gerenderte PDFs kommen direkt aus dem Cache (siehe
+    app/services/pdf_export.py). Der Cache-Key wird als ETag gesendet,
+    bei passendem If-None-Match antwortet die Route mit 304.
+
     Args:
         projekt_id: ID des Projekts
 
@@ -395,10 +447,12 @@ def export_pdf(projekt_id: int):
         5. Fehler & Loesungen
         6. Statistiken
     """
-    from flask import Response
-    from datetime import datetime
-    from app.services.database import get_projekt_komplett, get_fehler_stats, get_all_fehler
-    from app.services.pdf_generator import generate_full_documentation
+    from flask import send_file
+    from app.services.database import get_projekt_komplett
+    from app.services.pdf_export import (
+        cache_enabled, compute_export_key, get_cached_export,
+        render_export, render_export_spooled
+    )
 
     logger.info(f"PDF-Export (vollstaendig) fuer Projekt {projekt_id}")
 
@@ -408,42 +462,82 @@ def export_pdf(projekt_id: int):
         flash('Projekt nicht gefunden.', 'error')
         return redirect(url_for('home.index'))
 
-    # Phasen aus Projekt extrahieren
-    phasen = projekt.get('phasen', [])
+    key = compute_export_key(projekt)
+    if request.if_none_match.contains(key):
+        # Client hat dieses PDF bereits - nicht erneut rendern
+        return '', 304, {'ETag': f'"{key}"'}
 
-    # Fehler laden (falls Funktion existiert)
-    try:
-        fehler = get_all_fehler()
-    except:
-        fehler = []
+    if not cache_enabled():
+        # Ohne Cache: in eine SpooledTemporaryFile rendern und gestreamt senden
+        source = render_export_spooled(projekt)
+    else:
+        source = get_cached_export(key)
+        if source:
+            logger.info(f"PDF-Export aus Cache ({key[:12]})")
+        else:
+            source = render_export(projekt, key)
 
-    # Fehler-Statistiken laden
-    try:
-        stats = get_fehler_stats()
-    except:
-        stats = {}
-
-    # Vollstaendige Dokumentation generieren
-    pdf_bytes = generate_full_documentation(
-        projekt=projekt,
-        phasen=phasen,
-        fehler=fehler,
-        stats=stats
+    # send_file streamt Datei und File-Objekt blockweise (kein Komplett-Buffer)
+    return send_file(
+        source,
+        mimetype='application/pdf',
+        as_attachment=True,
+        download_name=_export_filename(projekt),
+        etag=key,
+        conditional=True,
+        max_age=0
     )
 
-    # Dateiname mit Datum
-    projekt_name = projekt['name'].replace(' ', '_').replace('/', '-')
-    datum = datetime.now().strftime('%Y-%m-%d')
-    filename = f"NEXUS_{projekt_name}_Dokumentation_{datum}.pdf"
 
-    return Response(
-        pdf_bytes,
-        mimetype='application/pdf',
-        headers={
-            'Content-Disposition': f'attachment; filename="{filename}"',
-            'Content-Length': str(len(pdf_bytes))
-        }
-    )
+@projekt_bp.route('/projekt/<int:projekt_id>/export-pdf/jobs', methods=['POST'])
+def export_pdf_start(projekt_id: int):
+    """
+    Startet den PDF-Export als Hintergrund-Job.
+
+    Returns:
+        JSON: Job-Status mit status_url und download_url (202 Accepted)
+    """
+    from app.services.database import get_projekt_komplett
+    from app.services.pdf_export import get_export_manager
+
+    projekt = get_projekt_komplett(projekt_id)
+    if not projekt:
+        return jsonify({'success': False, 'error': 'Projekt nicht gefunden'}), 404
+
+    job = get_export_manager().submit(projekt)
+    return jsonify(_export_job_response(projekt_id, job)), 202
+
+
+@projekt_bp.route('/projekt/<int:projekt_id>/export-pdf/jobs/<job_id>')
+def export_pdf_status(projekt_id: int, job_id: str):
+    """
+    Liefert den Fortschritt eines PDF-Export Jobs (Polling).
+
+    Returns:
+        JSON: status ('queued', 'running', 'done', 'error'), progress (0-100), schritt
+    """
+    from app.services.pdf_export import get_export_manager
+
+    job = get_export_manager().get_job(job_id)
+    if not job or job['projekt_id'] != projekt_id:
+        return jsonify({'success': False, 'error': 'Job nicht gefunden'}), 404
+
+    return jsonify(_export_job_response(projekt_id, job))
+
+
+def _export_job_response(projekt_id: int, job: dict) -> dict:
+    """Baut die JSON-Antwort fuer einen Export-Job."""
+    return {
+        'success': job['status'] != 'error',
+        'job_id': job['job_id'],
+        'status': job['status'],
+        'progress': job['progress'],
+        'schritt': job['schritt'],
+        'error': job['error'],
+        'etag': job['key'],
+        'status_url': url_for('projekt.export_pdf_status', projekt_id=projekt_id, job_id=job['job_id']),
+        'download_url': url_for('projekt.export_pdf', projekt_id=projekt_id),
+    }
 
 
 @projekt_bp.route('/test-pdf')
@@ -490,7 +584,8 @@ def projekt_import_upload():
     Verarbeitet den hochgeladenen Plan.
     Extrahiert Text aus DOCX/PDF und speichert in Session.
     """
-    from app.services.document_extractor import extract_text_from_file
+    from app.services.document_extractor import extract_text_from_upload
+    from app.services.upload_spool import UploadTooLarge, spool_upload
 
     # Projektname
     projektname = request.form.get('projektname', '').strip()
@@ -514,18 +609,14 @@ def projekt_import_upload():
         flash('Nur DOCX und PDF Dateien erlaubt', 'error')
         return redirect(url_for('projekt.projekt_import'))
 
-    # Dateigroesse pruefen (max 10 MB)
-    datei.seek(0, 2)  # Ende der Datei
-    groesse = datei.tell()
-    datei.seek(0)  # Zurueck zum Anfang
-
-    if groesse > 10 * 1024 * 1024:
-        flash('Datei zu gross (max 10 MB)', 'error')
-        return redirect(url_for('projekt.projekt_import'))
-
     try:
-        # Text extrahieren
-        text, error = extract_text_from_file(datei, datei.filename)
+        # Blockweise spoolen (Groessenlimit max 10 MB), dann Text extrahieren
+        try:
+            with spool_upload(datei, PLAN_UPLOAD_MAX_BYTES) as upload:
+                text, error = extract_text_from_upload(upload)
+        except UploadTooLarge:
+            flash('Datei zu gross (max 10 MB)', 'error')
+            return redirect(url_for('projekt.projekt_import'))
 
         if error:
             flash(f'Fehler: {error}', 'error')
@@ -537,7 +628,7 @@ def projekt_import_upload():
 
         # In Session speichern
         session['import_projektname'] = projektname
-        session['import_plan_text'] = text
+        set_session_artifact('import_plan_text', text)
         session['import_dateiname'] = datei.filename
 
         logger.info(f"Plan importiert: {datei.filename} ({len(text)} Zeichen)")
@@ -558,7 +649,7 @@ def projekt_import_analysieren():
     Placeholder fuer Auftrag 8.2.
     """
     projektname = session.get('import_projektname', 'Unbekannt')
-    plan_text = session.get('import_plan_text', '')
+    plan_text = get_session_artifact('import_plan_text', '')
     dateiname = session.get('import_dateiname', '')
 
     if not plan_text:
@@ -4,6 +4,7 @@ NEXUS OVERLORD v2.0 - Steuern Routes
 Kachel 3: Projekt steuern mit 5 Buttons (Auftrag, Fehler, Analyse, etc.)
 """
 
+import asyncio
 import logging
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
@@ -105,40 +106,45 @@ def auftrag_status_update(projekt_id: int, auftrag_id: int):
 
 
 @steuern_bp.route('/projekt/<int:projekt_id>/fehler', methods=['POST'])
-def projekt_fehler(projekt_id: int):
+async def projekt_fehler(projekt_id: int):
     """
     Analysiert einen Fehler und gibt Loesung zurueck (Auftrag 4.3).
 
-    Prueft DB nach bekannten Fehlern, sonst KI-Analyse.
+    Prueft DB nach bekannten Fehlern, sonst KI-Analyse (async, wartet
+    auf der gemeinsamen Event-Loop statt in einem eigenen Thread).
+    SQLite-Zugriffe, Formular und Templates laufen per asyncio.to_thread,
+    damit die Loop fuer die anderen LLM-Coroutinen frei bleibt.
     """
     from app.services.database import get_projekt, save_chat_message
-    from app.services.fehler_analyzer import analyze_fehler
+    from app.services.fehler_analyzer import analyze_fehler_async
 
-    projekt = get_projekt(projekt_id)
+    projekt = await asyncio.to_thread(get_projekt, projekt_id)
     if not projekt:
-        return render_template('partials/chat_message.html',
-                             message_type='error',
-                             content='Projekt nicht gefunden.')
+        return await asyncio.to_thread(render_template, 'partials/chat_message.html',
+                                       message_type='error',
+                                       content='Projekt nicht gefunden.')
 
-    fehler_text = request.form.get('fehler_text', '').strip()
+    form = await asyncio.to_thread(lambda: request.form)
+    fehler_text = form.get('fehler_text', '').strip()
 
     if not fehler_text:
-        return render_template('partials/chat_message.html',
-                             message_type='error',
-                             content='Bitte gib einen Fehler-Text ein.')
+        return await asyncio.to_thread(render_template, 'partials/chat_message.html',
+                                       message_type='error',
+                                       content='Bitte gib einen Fehler-Text ein.')
 
-    result = analyze_fehler(fehler_text, projekt.get('name', 'NEXUS OVERLORD'))
-    save_chat_message(projekt_id, 'FEHLER', f"Fehler analysiert: {result['kategorie']}")
+    result = await analyze_fehler_async(fehler_text, projekt.get('name', 'NEXUS OVERLORD'))
+    await asyncio.to_thread(save_chat_message, projekt_id, 'FEHLER',
+                            f"Fehler analysiert: {result['kategorie']}")
 
-    return render_template('partials/fehler_response.html',
-                         bekannt=result['bekannt'],
-                         kategorie=result['kategorie'],
-                         ursache=result['ursache'],
-                         loesung=result['loesung'],
-                         auftrag=result['auftrag'],
-                         fehler_id=result.get('fehler_id'),
-                         erfolgsrate=result.get('erfolgsrate', 0),
-                         anzahl=result.get('anzahl', 0))
+    return await asyncio.to_thread(render_template, 'partials/fehler_response.html',
+                                   bekannt=result['bekannt'],
+                                   kategorie=result['kategorie'],
+                                   ursache=result['ursache'],
+                                   loesung=result['loesung'],
+                                   auftrag=result['auftrag'],
+                                   fehler_id=result.get('fehler_id'),
+                                   erfolgsrate=result.get('erfolgsrate', 0),
+                                   anzahl=result.get('anzahl', 0))
 
 
 @steuern_bp.route('/projekt/<int:projekt_id>/fehler/<int:fehler_id>/feedback', methods=['POST'])
@@ -170,7 +176,8 @@ def fehler_stats():
     Liefert Fehler-Datenbank Statistiken (Auftrag 5.3).
 
     Returns:
-        JSON: Umfangreiche Statistiken zur Fehler-Datenbank
+        JSON: Umfangreiche Statistiken zur Fehler-Datenbank, inkl.
+              'computed_at' und 'source' ('cache' oder 'live')
     """
     from app.services.database import get_fehler_stats
 
@@ -56,6 +56,8 @@ def uebergaben_liste(projekt_id: int):
 def uebergabe_upload(projekt_id: int):
     """Laedt eine Uebergabe-Datei hoch."""
     from app.services.database import get_projekt, save_uebergabe, get_current_auftrag_for_projekt
+    from app.services.blob_store import get_blob_store
+    from app.services.upload_spool import UploadTooLarge, spool_upload
 
     projekt = get_projekt(projekt_id)
     if not projekt:
@@ -72,18 +74,10 @@ def uebergabe_upload(projekt_id: int):
     if not allowed_file(file.filename):
         return jsonify({'success': False, 'error': 'Dateityp nicht erlaubt'}), 400
 
-    # Dateigroesse pruefen
-    file.seek(0, 2)
-    size = file.tell()
-    file.seek(0)
-
-    if size > MAX_CONTENT_LENGTH:
-        return jsonify({'success': False, 'error': 'Datei zu gross. Max 5MB erlaubt.'}), 400
-
     aktueller_auftrag = get_current_auftrag_for_projekt(projekt_id)
     auftrag_id = aktueller_auftrag['id'] if aktueller_auftrag else None
 
-    # Dateiname generieren
+    # Anzeigename generieren
     timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M')
     original_name = secure_filename(file.filename)
 
@@ -93,17 +87,14 @@ def uebergabe_upload(projekt_id: int):
     else:
         filename = f"{timestamp}_{original_name}"
 
-    # Upload-Ordner
-    upload_folder = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-        'projekt', 'uebergaben'
-    )
-    os.makedirs(upload_folder, exist_ok=True)
-
-    filepath = os.path.join(upload_folder, filename)
-
+    # Blockweise in den Blob Store spoolen (Groessenlimit waehrend des Lesens),
+    # identische Inhalte werden nur einmal abgelegt
+    store = get_blob_store()
     try:
-        file.save(filepath)
+        with spool_upload(file, MAX_CONTENT_LENGTH, spool_dir=store.tmp_dir) as upload:
+            filepath, dedupliziert = store.put(upload)
+    except UploadTooLarge:
+        return jsonify({'success': False, 'error': 'Datei zu gross. Max 5MB erlaubt.'}), 400
     except Exception as e:
         logger.error(f"Fehler beim Speichern: {e}")
         return jsonify({'success': False, 'error': f'Fehler beim Speichern: {str(e)}'}), 500
@@ -114,6 +105,7 @@ def uebergabe_upload(projekt_id: int):
         'success': True,
         'uebergabe_id': uebergabe_id,
         'filename': filename,
+        'dedupliziert': dedupliziert,
         'auftrag': f"{aktueller_auftrag['phase_nummer']}.{aktueller_auftrag['nummer']}" if aktueller_auftrag else None
     })
 
@@ -121,6 +113,7 @@ def uebergabe_upload(projekt_id: int):
 @uebergaben_bp.route('/projekt/<int:projekt_id>/uebergaben/<int:uebergabe_id>', methods=['GET'])
 def uebergabe_anzeigen(projekt_id: int, uebergabe_id: int):
     """Zeigt Inhalt einer Uebergabe an."""
+    from app.services.blob_store import get_blob_store
     from app.services.database import get_uebergabe
 
     uebergabe = get_uebergabe(uebergabe_id)
@@ -129,8 +122,7 @@ def uebergabe_anzeigen(projekt_id: int, uebergabe_id: int):
         return jsonify({'success': False, 'error': 'Uebergabe nicht gefunden'}), 404
 
     try:
-        with open(uebergabe['datei_pfad'], 'r', encoding='utf-8') as f:
-            inhalt = f.read()
+        inhalt = get_blob_store().read_text(uebergabe['datei_pfad'])
     except FileNotFoundError:
         inhalt = '[Datei nicht gefunden]'
     except Exception as e:
@@ -141,6 +133,38 @@ def uebergabe_anzeigen(projekt_id: int, uebergabe_id: int):
                          inhalt=inhalt)
 
 
+@uebergaben_bp.route('/projekt/<int:projekt_id>/uebergaben/<int:uebergabe_id>/download', methods=['GET'])
+def uebergabe_download(projekt_id: int, uebergabe_id: int):
+    """
+    Laedt die Original-Datei einer Uebergabe herunter.
+
+    Unterstuetzt Range-Requests (Teil-Downloads, Fortsetzen) und
+    If-None-Match ueber send_file(conditional=True).
+    """
+    from flask import send_file
+    from app.services.blob_store import get_blob_store
+    from app.services.database import get_uebergabe
+
+    uebergabe = get_uebergabe(uebergabe_id)
+    if not uebergabe or uebergabe.get('projekt_id') != projekt_id:
+        return jsonify({'success': False, 'error': 'Uebergabe nicht gefunden'}), 404
+
+    pfad = uebergabe['datei_pfad']
+    if not os.path.isfile(pfad):
+        return jsonify({'success': False, 'error': 'Datei nicht gefunden'}), 404
+
+    # Inhalt im Blob Store ist unveraenderlich - der Digest ist ein starkes ETag
+    digest = get_blob_store().digest_for_path(pfad)
+
+    return send_file(
+        pfad,
+        as_attachment=True,
+        download_name=uebergabe.get('datei_name') or os.path.basename(pfad),
+        conditional=True,
+        etag=digest if digest else True
+    )
+
+
 @uebergaben_bp.route('/projekt/<int:projekt_id>/uebergaben/<int:uebergabe_id>/delete', methods=['POST'])
 def uebergabe_loeschen(projekt_id: int, uebergabe_id: int):
     """Loescht eine Uebergabe."""
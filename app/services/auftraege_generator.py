@@ -13,17 +13,36 @@ Jeder Auftrag enthaelt:
     - Regelwerk (Commit-Message, Uebergabe-Pfad, Pflichten)
 """
 
-import json
+import asyncio
+import contextvars
 import logging
+import os
 import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
-from app.services.openrouter import get_client
+from app.services.openrouter import get_async_client, get_client
+from app.services.prompt_builder import PromptBuilder, compact_json
 from app.utils.json_extractor import extract_json
+from app.utils.json_stream import JsonArrayStreamer
 
 # Logger konfigurieren
 logger = logging.getLogger(__name__)
 
+# Fan-out: Auftraege pro Phase in eigenen, parallelen Requests generieren
+# (opt-in - aendert Prompts, Anzahl Requests und Kosten)
+AUFTRAEGE_FANOUT = os.getenv('AUFTRAEGE_FANOUT', '0') == '1'
+
+# Maximale Anzahl gleichzeitiger Phasen-Requests
+AUFTRAEGE_FANOUT_WORKERS = int(os.getenv('AUFTRAEGE_FANOUT_WORKERS', '4'))
+
+# Wiederholungsrunden fuer fehlgeschlagene Phasen (zusaetzlich zur Retry-Logik des Clients)
+AUFTRAEGE_PHASE_RETRIES = int(os.getenv('AUFTRAEGE_PHASE_RETRIES', '1'))
+
+# Timeout eines einzelnen Phasen-Requests in Sekunden
+AUFTRAEGE_PHASE_TIMEOUT = int(os.getenv('AUFTRAEGE_PHASE_TIMEOUT', '90'))
+
 
 # Prompt-Template fuer Auftrags-Generierung
 AUFTRAEGE_PROMPT = """Du bist ein erfahrener Software-Entwickler und Projekt-Manager. Erstelle fuer jede Phase konkrete Auftraege, die Claude Code als KI-Entwickler ausfuehren kann.
@@ -144,13 +163,93 @@ HINWEIS: Erstelle fuer JEDE Phase mindestens 2 und maximal 5 Auftraege. Passe di
 """
 
 
-def generate_auftraege(phasen_data: dict[str, Any], enterprise_plan: str) -> dict[str, Any]:
+# Gemeinsamer Kontext aller Phasen-Requests. Steht identisch am Anfang
+# jedes Prompts, damit der Provider ihn per Prompt-Caching wiederverwendet.
+AUFTRAEGE_KONTEXT_PROMPT = """Du bist ein erfahrener Software-Entwickler und Projekt-Manager. Du erstellst konkrete Auftraege, die Claude Code als KI-Entwickler ausfuehren kann.
+
+KONTEXT:
+Du planst Auftraege fuer ein Software-Projekt. Claude Code wird diese Auftraege nacheinander abarbeiten.
+
+ENTERPRISE-PLAN:
+{enterprise_plan}
+
+ALLE PHASEN (Ueberblick):
+{phasen_uebersicht}
+"""
+
+# Phasen-spezifischer Teil des Prompts
+AUFTRAEGE_PHASE_PROMPT = """AUFGABE:
+Erstelle 2-5 konkrete, ausfuehrbare Auftraege NUR fuer diese Phase:
+
+{phase_json}
+
+Jeder Auftrag enthaelt:
+1. **Auftragsnummer**: Format "{nummer}.Y" (z.B. "{nummer}.1", "{nummer}.2")
+2. **Name**: Kurzer, praegnanter Name (max 4 Woerter)
+3. **Beschreibung**: Was soll gemacht werden (1-2 Saetze)
+4. **Schritte**: 3-6 konkrete Schritte zum Ausfuehren
+5. **Dateien**: Welche Dateien werden erstellt/geaendert
+6. **Technische Details**: Frameworks, Libraries, Patterns
+7. **Erfolgs-Kriterien**: Wie wird Erfolg gemessen
+8. **Regelwerk**: Anweisungen fuer Claude Code
+
+WICHTIG:
+- Auftraege in logischer Reihenfolge (erst Setup/Grundlagen, zuletzt Tests/Integration)
+- Jeder Auftrag muss eigenstaendig ausfuehrbar sein
+- Keine Auftraege fuer andere Phasen
+- Konkrete Dateinamen und Pfade
+
+AUSGABE als JSON (NUR JSON, kein anderer Text):
+{{
+    "auftraege": [
+        {{
+            "phase_nummer": {nummer},
+            "auftrag_nummer": "{nummer}.1",
+            "name": "Setup & Dependencies",
+            "beschreibung": "Grundlegende Projektstruktur und Dependencies installieren",
+            "schritte": ["requirements.txt erstellen", "Dependencies installieren"],
+            "dateien": [{{"pfad": "requirements.txt", "aktion": "neu"}}],
+            "technische_details": ["Python 3.11+", "Flask Framework"],
+            "erfolgs_kriterien": ["requirements.txt existiert", "Alle Dependencies installiert"],
+            "regelwerk": {{
+                "commit_message": "[{nummer}.1] Setup & Dependencies",
+                "uebergabe_pfad": "/projekt/uebergaben/YYYY-MM-DD_HH-MM_auftrag-{nummer}-1.md",
+                "pflichten": [
+                    "GitHub Commit erstellen",
+                    "GitHub Push durchfuehren",
+                    "Uebergabe-Datei schreiben mit Details",
+                    "Status melden an User"
+                ]
+            }}
+        }}
+    ],
+    "geschaetzte_dauer": "3-4 Stunden",
+    "hinweise": "Hinweise zur Umsetzung dieser Phase"
+}}
+"""
+
+
+def generate_auftraege(
+    phasen_data: dict[str, Any],
+    enterprise_plan: str,
+    on_auftrag: Callable[[dict[str, Any]], None] | None = None,
+    fanout: bool | None = None
+) -> dict[str, Any]:
     """
     Generiert Auftraege mit Opus 4.5.
 
+    Standardmaessig werden alle Auftraege in einem Request erzeugt; mit
+    on_auftrag wird diese Antwort gestreamt und jeder Auftrag gemeldet,
+    sobald sein JSON-Objekt vollstaendig ist. Der Fan-out-Modus ist opt-in
+    (AUFTRAEGE_FANOUT=1 bei mehr als einer Phase oder fanout=True): Dann
+    bekommt jede Phase einen eigenen Request, siehe
+    _generate_auftraege_fanout().
+
     Args:
         phasen_data: Phasen-Struktur aus dem Phasen-Generator
         enterprise_plan: Original Enterprise-Plan
+        on_auftrag: Optional - Callback fuer jeden fertigen Auftrag
+        fanout: Fan-out erzwingen/abschalten (Standard: AUFTRAEGE_FANOUT)
 
     Returns:
         dict: Auftrags-Struktur mit:
@@ -163,25 +262,68 @@ def generate_auftraege(phasen_data: dict[str, Any], enterprise_plan: str) -> dic
         ValueError: Bei ungueltiger JSON-Antwort oder Validierungsfehler
         Exception: Bei API-Fehler
     """
+    if fanout is None:
+        fanout = AUFTRAEGE_FANOUT and len(phasen_data.get("phasen", [])) > 1
+    if fanout:
+        return _generate_auftraege_fanout(phasen_data, enterprise_plan, on_auftrag)
+
     logger.info("Starte Auftrags-Generierung")
 
     client = get_client()
 
-    # Phasen als JSON formatieren
-    phasen_json = json.dumps(phasen_data, indent=2, ensure_ascii=False)
-
-    # Prompt mit Daten fuellen
-    prompt = AUFTRAEGE_PROMPT.format(
-        enterprise_plan=enterprise_plan,
-        phasen_json=phasen_json
-    )
-
     # Opus 4.5 aufrufen
     logger.debug("Rufe Opus 4.5 auf")
-    response = client.call_sonnet([
-        {"role": "user", "content": prompt}
-    ], temperature=0.7, timeout=120)
+    messages = _auftraege_messages(phasen_data, enterprise_plan)
+    if on_auftrag is None:
+        response = client.call_sonnet(messages, temperature=0.7, timeout=120, call_site='auftraege')
+    else:
+        anzahl_phasen = len(phasen_data.get("phasen", []))
+        streamer = JsonArrayStreamer('auftraege')
+        for chunk in client.stream_sonnet(messages, temperature=0.7, timeout=120,
+                                              call_site='auftraege'):
+            fertig = streamer.feed(chunk)
+            # emitted zaehlt die fertigen Elemente dieses Chunks schon mit
+            for i, auftrag in enumerate(fertig, streamer.emitted - len(fertig)):
+                _validate_auftrag(auftrag, i, anzahl_phasen)
+                on_auftrag(auftrag)
+        response = streamer.text
+
+    return _parse_auftraege(response, phasen_data)
+
+
+def _auftraege_messages(phasen_data: dict[str, Any], enterprise_plan: str) -> list[dict[str, Any]]:
+    """
+    Baut die Nachrichten fuer die Auftrags-Generierung in einem Request.
+
+    Args:
+        phasen_data: Phasen-Struktur
+        enterprise_plan: Original Enterprise-Plan
+
+    Returns:
+        list: Nachrichten fuer den Client
+    """
+    # Prompt mit Daten fuellen (Phasen als kompaktes JSON)
+    prompt = (PromptBuilder('auftraege', AUFTRAEGE_PROMPT)
+              .add('enterprise_plan', enterprise_plan)
+              .add_json('phasen_json', phasen_data)
+              .build())
+    return [{"role": "user", "content": prompt}]
 
+
+def _parse_auftraege(response: str, phasen_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Extrahiert und validiert die Auftraege aus der Modell-Antwort.
+
+    Args:
+        response: Antworttext von Opus
+        phasen_data: Phasen-Struktur (fuer validate_auftraege)
+
+    Returns:
+        dict: Validierte Auftrags-Struktur
+
+    Raises:
+        ValueError: Bei ungueltiger JSON-Antwort oder Validierungsfehler
+    """
     logger.debug(f"Opus-Antwort erhalten ({len(response)} Zeichen)")
 
     # JSON aus Response extrahieren
@@ -201,6 +343,320 @@ def generate_auftraege(phasen_data: dict[str, Any], enterprise_plan: str) -> dic
     return parsed
 
 
+def _generate_auftraege_fanout(
+    phasen_data: dict[str, Any],
+    enterprise_plan: str,
+    on_auftrag: Callable[[dict[str, Any]], None] | None = None
+) -> dict[str, Any]:
+    """
+    Generiert die Auftraege jeder Phase in einem eigenen, parallelen Request.
+
+    - Hoechstens AUFTRAEGE_FANOUT_WORKERS Requests gleichzeitig
+    - Gemeinsamer Kontext (Plan + Phasen-Ueberblick) wird einmal gebaut und
+      als cachebarer Prompt-Anfang an alle Requests gehaengt
+    - Jede Phase wird fuer sich validiert, nur fehlgeschlagene Phasen werden
+      wiederholt (AUFTRAEGE_PHASE_RETRIES Runden)
+    - on_auftrag wird im aufrufenden Thread gerufen, sobald eine Phase fertig ist
+
+    Args:
+        phasen_data: Phasen-Struktur aus dem Phasen-Generator
+        enterprise_plan: Original Enterprise-Plan
+        on_auftrag: Optional - Callback fuer jeden fertigen Auftrag
+
+    Returns:
+        dict: Auftrags-Struktur wie generate_auftraege()
+
+    Raises:
+        ValueError: Wenn Phasen auch nach allen Wiederholungen fehlschlagen
+    """
+    phasen = phasen_data.get("phasen", [])
+    logger.info(f"Starte Auftrags-Generierung (Fan-out, {len(phasen)} Phasen, "
+                f"max {AUFTRAEGE_FANOUT_WORKERS} parallel)")
+
+    client = get_client()
+    kontext = _build_shared_context(phasen, enterprise_plan)
+
+    ergebnisse: dict[int, dict[str, Any]] = {}
+    fehler: dict[int, str] = {}
+    offen = list(phasen)
+
+    with ThreadPoolExecutor(max_workers=max(1, AUFTRAEGE_FANOUT_WORKERS),
+                            thread_name_prefix='auftraege') as executor:
+        for runde in range(AUFTRAEGE_PHASE_RETRIES + 1):
+            if runde:
+                logger.warning(f"Wiederhole {len(offen)} fehlgeschlagene Phase(n): "
+                               f"{[p['nummer'] for p in offen]}")
+            futures = {
+                executor.submit(contextvars.copy_context().run, _generate_phase_auftraege,
+                                client, kontext, phase, phasen_data): phase
+                for phase in offen
+            }
+            offen = []
+            for future in as_completed(futures):
+                phase = futures[future]
+                try:
+                    ergebnis = future.result()
+                except Exception as e:
+                    logger.warning(f"Phase {phase['nummer']}: Auftrags-Generierung fehlgeschlagen: {e}")
+                    fehler[phase["nummer"]] = str(e)
+                    offen.append(phase)
+                    continue
+
+                fehler.pop(phase["nummer"], None)
+                ergebnisse[phase["nummer"]] = ergebnis
+                if on_auftrag:
+                    for auftrag in ergebnis["auftraege"]:
+                        on_auftrag(auftrag)
+
+            if not offen:
+                break
+
+    return _merge_fanout(phasen_data, ergebnisse, offen, fehler)
+
+
+async def generate_auftraege_async(
+    phasen_data: dict[str, Any],
+    enterprise_plan: str,
+    fanout: bool | None = None,
+    on_fortschritt: Callable[[int, int], None] | None = None
+) -> dict[str, Any]:
+    """
+    Async Variante von generate_auftraege() (ohne Streaming) fuer async Views.
+
+    Der Fan-out laeuft per asyncio.gather auf der Event-Loop des Aufrufers,
+    hoechstens AUFTRAEGE_FANOUT_WORKERS Requests gleichzeitig.
+
+    Args:
+        phasen_data: Phasen-Struktur aus dem Phasen-Generator
+        enterprise_plan: Original Enterprise-Plan
+        fanout: Fan-out erzwingen/abschalten (Standard: AUFTRAEGE_FANOUT)
+        on_fortschritt: Optional - Callback (fertige Phasen, alle Phasen) im Fan-out,
+                        wird auf der Loop gerufen und darf nicht blockieren
+
+    Returns:
+        dict: Auftrags-Struktur wie generate_auftraege()
+
+    Raises:
+        ValueError: Bei ungueltiger JSON-Antwort, Validierungsfehler oder
+                    wenn Phasen auch nach allen Wiederholungen fehlschlagen
+        Exception: Bei API-Fehler
+    """
+    client = get_async_client()
+    phasen = phasen_data.get("phasen", [])
+    if fanout is None:
+        fanout = AUFTRAEGE_FANOUT and len(phasen) > 1
+
+    if not fanout:
+        logger.info("Starte Auftrags-Generierung (async)")
+        response = await client.call_sonnet(_auftraege_messages(phasen_data, enterprise_plan),
+                                            temperature=0.7, timeout=120, call_site='auftraege')
+        return _parse_auftraege(response, phasen_data)
+
+    logger.info(f"Starte Auftrags-Generierung (async Fan-out, {len(phasen)} Phasen, "
+                f"max {AUFTRAEGE_FANOUT_WORKERS} parallel)")
+    kontext = _build_shared_context(phasen, enterprise_plan)
+    limit = asyncio.Semaphore(max(1, AUFTRAEGE_FANOUT_WORKERS))
+
+    async def phase_generieren(phase: dict[str, Any]) -> dict[str, Any]:
+        async with limit:
+            response = await client.call_sonnet(_phase_messages(kontext, phase), temperature=0.7,
+                                                timeout=AUFTRAEGE_PHASE_TIMEOUT, call_site='auftraege_phase')
+        ergebnis = _parse_phase_auftraege(response, phase, phasen_data)
+        if on_fortschritt:
+            on_fortschritt(len(ergebnisse) + 1, len(phasen))
+        ergebnisse[phase["nummer"]] = ergebnis
+        return ergebnis
+
+    ergebnisse: dict[int, dict[str, Any]] = {}
+    fehler: dict[int, str] = {}
+    offen = list(phasen)
+
+    for runde in range(AUFTRAEGE_PHASE_RETRIES + 1):
+        if runde:
+            logger.warning(f"Wiederhole {len(offen)} fehlgeschlagene Phase(n): "
+                           f"{[p['nummer'] for p in offen]}")
+        resultate = await asyncio.gather(*(phase_generieren(p) for p in offen), return_exceptions=True)
+        naechste = []
+        for phase, ergebnis in zip(offen, resultate):
+            if isinstance(ergebnis, Exception):
+                logger.warning(f"Phase {phase['nummer']}: Auftrags-Generierung fehlgeschlagen: {ergebnis}")
+                fehler[phase["nummer"]] = str(ergebnis)
+                naechste.append(phase)
+            else:
+                fehler.pop(phase["nummer"], None)
+        offen = naechste
+        if not offen:
+            break
+
+    return _merge_fanout(phasen_data, ergebnisse, offen, fehler)
+
+
+def _merge_fanout(
+    phasen_data: dict[str, Any],
+    ergebnisse: dict[int, dict[str, Any]],
+    offen: list[dict[str, Any]],
+    fehler: dict[int, str]
+) -> dict[str, Any]:
+    """
+    Fuehrt die Ergebnisse der Phasen-Requests in Phasen-Reihenfolge zusammen.
+
+    Args:
+        phasen_data: Phasen-Struktur
+        ergebnisse: Phase-Nummer -> Ergebnis von _parse_phase_auftraege()
+        offen: Auch nach allen Runden fehlgeschlagene Phasen
+        fehler: Phase-Nummer -> letzte Fehlermeldung
+
+    Returns:
+        dict: Auftrags-Struktur wie generate_auftraege()
+
+    Raises:
+        ValueError: Wenn noch Phasen offen sind
+    """
+    phasen = phasen_data.get("phasen", [])
+    if offen:
+        details = "; ".join(f"Phase {nr}: {msg}" for nr, msg in sorted(fehler.items()))
+        raise ValueError(f"Auftrags-Generierung fuer {len(offen)} Phase(n) fehlgeschlagen: {details}")
+
+    auftraege = []
+    hinweise = []
+    for phase in phasen:
+        ergebnis = ergebnisse[phase["nummer"]]
+        auftraege.extend(ergebnis["auftraege"])
+        if ergebnis.get("hinweise"):
+            hinweise.append(f"Phase {phase['nummer']}: {ergebnis['hinweise']}")
+
+    data = {
+        "auftraege": auftraege,
+        "gesamt_auftraege": len(auftraege),
+        "geschaetzte_dauer": phasen_data.get("gesamt_dauer", "N/A"),
+        "hinweise": "\n".join(hinweise),
+    }
+    validate_auftraege(data, phasen_data)
+
+    logger.info(f"Auftrags-Generierung erfolgreich: {len(auftraege)} Auftraege aus {len(phasen)} Phasen")
+    return data
+
+
+def _build_shared_context(phasen: list[dict[str, Any]], enterprise_plan: str) -> str:
+    """
+    Baut den gemeinsamen Prompt-Anfang aller Phasen-Requests.
+
+    Der Ueberblick enthaelt nur Nummer, Name, Abhaengigkeiten und
+    Beschreibung jeder Phase (kompaktes JSON), die Details der
+    jeweiligen Phase stehen im phasen-spezifischen Teil.
+
+    Args:
+        phasen: Liste der Phasen
+        enterprise_plan: Original Enterprise-Plan
+
+    Returns:
+        str: Gemeinsamer Kontext
+    """
+    uebersicht = "\n".join(
+        compact_json({
+            "nummer": p.get("nummer"),
+            "name": p.get("name"),
+            "abhaengigkeiten": p.get("abhaengigkeiten", []),
+            "beschreibung": p.get("beschreibung", ""),
+        })
+        for p in phasen
+    )
+    return (PromptBuilder('auftraege_phase', AUFTRAEGE_KONTEXT_PROMPT)
+            .add('enterprise_plan', enterprise_plan)
+            .add('phasen_uebersicht', uebersicht, priority=0)
+            .build())
+
+
+def _generate_phase_auftraege(
+    client: Any,
+    kontext: str,
+    phase: dict[str, Any],
+    phasen_data: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Generiert und validiert die Auftraege einer einzelnen Phase.
+
+    Args:
+        client: OpenRouterClient
+        kontext: Gemeinsamer Prompt-Anfang aus _build_shared_context()
+        phase: Die Phase
+        phasen_data: Alle Phasen (fuer validate_auftraege)
+
+    Returns:
+        dict: {"auftraege": [...], "hinweise": ...} dieser Phase
+
+    Raises:
+        ValueError: Bei ungueltiger Antwort
+    """
+    response = client.call_sonnet(_phase_messages(kontext, phase), temperature=0.7,
+                                  timeout=AUFTRAEGE_PHASE_TIMEOUT, call_site='auftraege_phase')
+    return _parse_phase_auftraege(response, phase, phasen_data)
+
+
+def _phase_messages(kontext: str, phase: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Baut die Nachrichten eines Phasen-Requests.
+
+    Der Kontext ist ein eigener Content-Block mit cache_control, damit
+    Anthropic-Modelle ihn zwischen den Phasen-Requests cachen koennen.
+
+    Args:
+        kontext: Gemeinsamer Prompt-Anfang aus _build_shared_context()
+        phase: Die Phase
+
+    Returns:
+        list: Nachrichten fuer den Client
+    """
+    aufgabe = AUFTRAEGE_PHASE_PROMPT.format(
+        phase_json=compact_json(phase),
+        nummer=phase["nummer"]
+    )
+    return [{
+        "role": "user",
+        "content": [
+            {"type": "text", "text": kontext, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": aufgabe},
+        ]
+    }]
+
+
+def _parse_phase_auftraege(
+    response: str,
+    phase: dict[str, Any],
+    phasen_data: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Extrahiert und validiert die Auftraege einer Phase aus der Modell-Antwort.
+
+    Args:
+        response: Antworttext von Opus
+        phase: Die Phase
+        phasen_data: Alle Phasen (fuer validate_auftraege)
+
+    Returns:
+        dict: {"auftraege": [...], "hinweise": ...} dieser Phase
+
+    Raises:
+        ValueError: Bei ungueltiger Antwort
+    """
+    nummer = phase["nummer"]
+    parsed = extract_json(response)
+    if not parsed or not isinstance(parsed.get("auftraege"), list):
+        raise ValueError(f"Keine gueltigen Auftraege fuer Phase {nummer}: {response[:200]}")
+
+    # Auftraege anderer Phasen verwerfen, Phase-Nummer festsetzen
+    auftraege = [a for a in parsed["auftraege"]
+                 if isinstance(a, dict) and a.get("phase_nummer", nummer) == nummer]
+    for auftrag in auftraege:
+        auftrag["phase_nummer"] = nummer
+
+    parsed["auftraege"] = auftraege
+    validate_auftraege(parsed, phasen_data)
+
+    logger.debug(f"Phase {nummer}: {len(auftraege)} Auftraege")
+    return parsed
+
+
 def validate_auftraege(data: dict[str, Any], phasen_data: dict[str, Any]) -> None:
     """
     Validiert die Auftrags-Struktur.
@@ -229,67 +685,82 @@ def validate_auftraege(data: dict[str, Any], phasen_data: dict[str, Any]) -> Non
 
     # Validiere jeden Auftrag
     for i, auftrag in enumerate(auftraege):
-        # Required fields - mit Standardwerten falls fehlend
-        required = ["phase_nummer", "auftrag_nummer", "name", "beschreibung",
-                   "schritte", "dateien", "technische_details",
-                   "erfolgs_kriterien", "regelwerk"]
-
-        for field in required:
-            if field not in auftrag:
-                # Fuege Standardwerte hinzu statt Fehler zu werfen
-                if field == "schritte":
-                    auftrag["schritte"] = []
-                    logger.warning(f"Auftrag {i+1}: 'schritte' fehlt, setze auf []")
-                elif field == "dateien":
-                    auftrag["dateien"] = []
-                    logger.warning(f"Auftrag {i+1}: 'dateien' fehlt, setze auf []")
-                elif field == "technische_details":
-                    auftrag["technische_details"] = []
-                    logger.warning(f"Auftrag {i+1}: 'technische_details' fehlt, setze auf []")
-                elif field == "erfolgs_kriterien":
-                    auftrag["erfolgs_kriterien"] = []
-                    logger.warning(f"Auftrag {i+1}: 'erfolgs_kriterien' fehlt, setze auf []")
-                elif field == "regelwerk":
-                    auftrag["regelwerk"] = {
-                        "commit_message": f"[{auftrag.get('auftrag_nummer', i+1)}] {auftrag.get('name', 'Auftrag')}",
-                        "uebergabe_pfad": "/projekt/uebergaben/",
-                        "pflichten": ["Status melden"]
-                    }
-                    logger.warning(f"Auftrag {i+1}: 'regelwerk' fehlt, setze Standard")
-                else:
-                    raise ValueError(f"Auftrag {i+1} fehlt kritisches Feld: '{field}'")
-
-        # Phase-Nummer muss valid sein
-        if not (1 <= auftrag["phase_nummer"] <= max(anzahl_phasen, 10)):
-            logger.warning(f"Auftrag {i+1}: Phase-Nummer {auftrag['phase_nummer']} korrigiert")
-            auftrag["phase_nummer"] = min(auftrag["phase_nummer"], anzahl_phasen)
-
-        # Auftragsnummer-Format pruefen (X.Y)
-        if not re.match(r'^\d+\.\d+$', str(auftrag["auftrag_nummer"])):
-            # Korrigiere das Format
-            phase_nr = auftrag["phase_nummer"]
-            auftrag_nr = i + 1
-            auftrag["auftrag_nummer"] = f"{phase_nr}.{auftrag_nr}"
-            logger.warning(f"Auftrag {i+1}: Format korrigiert zu '{auftrag['auftrag_nummer']}'")
-
-        # Listen validieren
-        if not isinstance(auftrag.get("schritte", []), list):
-            auftrag["schritte"] = []
-
-        if not isinstance(auftrag.get("dateien", []), list):
-            auftrag["dateien"] = []
-
-        # Regelwerk validieren
-        if not isinstance(auftrag.get("regelwerk", {}), dict):
-            auftrag["regelwerk"] = {
-                "commit_message": f"[{auftrag['auftrag_nummer']}] {auftrag['name']}",
-                "uebergabe_pfad": "/projekt/uebergaben/",
-                "pflichten": ["Status melden"]
-            }
+        _validate_auftrag(auftrag, i, anzahl_phasen)
 
     logger.debug("Auftrags-Validierung erfolgreich")
 
 
+def _validate_auftrag(auftrag: dict[str, Any], i: int, anzahl_phasen: int) -> None:
+    """
+    Validiert und korrigiert einen einzelnen Auftrag (auch fuer gestreamte Auftraege).
+
+    Args:
+        auftrag: Auftrag aus der KI-Antwort (wird in-place korrigiert)
+        i: Position in der Auftrags-Liste (0-basiert)
+        anzahl_phasen: Anzahl der Phasen zur Pruefung der Phase-Nummer
+
+    Raises:
+        ValueError: Wenn ein kritisches Feld fehlt
+    """
+    # Required fields - mit Standardwerten falls fehlend
+    required = ["phase_nummer", "auftrag_nummer", "name", "beschreibung",
+               "schritte", "dateien", "technische_details",
+               "erfolgs_kriterien", "regelwerk"]
+
+    for field in required:
+        if field not in auftrag:
+            # Fuege Standardwerte hinzu statt Fehler zu werfen
+            if field == "schritte":
+                auftrag["schritte"] = []
+                logger.warning(f"Auftrag {i+1}: 'schritte' fehlt, setze auf []")
+            elif field == "dateien":
+                auftrag["dateien"] = []
+                logger.warning(f"Auftrag {i+1}: 'dateien' fehlt, setze auf []")
+            elif field == "technische_details":
+                auftrag["technische_details"] = []
+                logger.warning(f"Auftrag {i+1}: 'technische_details' fehlt, setze auf []")
+            elif field == "erfolgs_kriterien":
+                auftrag["erfolgs_kriterien"] = []
+                logger.warning(f"Auftrag {i+1}: 'erfolgs_kriterien' fehlt, setze auf []")
+            elif field == "regelwerk":
+                auftrag["regelwerk"] = {
+                    "commit_message": f"[{auftrag.get('auftrag_nummer', i+1)}] {auftrag.get('name', 'Auftrag')}",
+                    "uebergabe_pfad": "/projekt/uebergaben/",
+                    "pflichten": ["Status melden"]
+                }
+                logger.warning(f"Auftrag {i+1}: 'regelwerk' fehlt, setze Standard")
+            else:
+                raise ValueError(f"Auftrag {i+1} fehlt kritisches Feld: '{field}'")
+
+    # Phase-Nummer muss valid sein
+    if not (1 <= auftrag["phase_nummer"] <= max(anzahl_phasen, 10)):
+        logger.warning(f"Auftrag {i+1}: Phase-Nummer {auftrag['phase_nummer']} korrigiert")
+        auftrag["phase_nummer"] = min(auftrag["phase_nummer"], anzahl_phasen)
+
+    # Auftragsnummer-Format pruefen (X.Y)
+    if not re.match(r'^\d+\.\d+$', str(auftrag["auftrag_nummer"])):
+        # Korrigiere das Format
+        phase_nr = auftrag["phase_nummer"]
+        auftrag_nr = i + 1
+        auftrag["auftrag_nummer"] = f"{phase_nr}.{auftrag_nr}"
+        logger.warning(f"Auftrag {i+1}: Format korrigiert zu '{auftrag['auftrag_nummer']}'")
+
+    # Listen validieren
+    if not isinstance(auftrag.get("schritte", []), list):
+        auftrag["schritte"] = []
+
+    if not isinstance(auftrag.get("dateien", []), list):
+        auftrag["dateien"] = []
+
+    # Regelwerk validieren
+    if not isinstance(auftrag.get("regelwerk", {}), dict):
+        auftrag["regelwerk"] = {
+            "commit_message": f"[{auftrag['auftrag_nummer']}] {auftrag['name']}",
+            "uebergabe_pfad": "/projekt/uebergaben/",
+            "pflichten": ["Status melden"]
+        }
+
+
 def format_auftraege_for_display(data: dict[str, Any]) -> str:
     """
     Formatiert Auftraege fuer die Anzeige (Markdown).
@@ -192,7 +192,7 @@ Der Output soll direkt in Claude Code eingefuegt werden koennen."""
             {"role": "user", "content": prompt}
         ]
 
-        response = client.call_sonnet(messages, temperature=0.3, timeout=30)
+        response = client.call_sonnet(messages, temperature=0.3, timeout=30, call_site='auftrag_formatierung')
 
         return response
 
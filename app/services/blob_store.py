@@ -0,0 +1,201 @@
+"""
+NEXUS OVERLORD v2.0 - Content-Addressed Blob Store fuer Uebergaben
+
+Uebergabe-Dateien werden unter ihrem SHA-256 abgelegt:
+
+    <UEBERGABE_BLOB_DIR>/ab/cd/abcd...(64 Hex-Zeichen)
+
+Identische Dateien (z.B. dieselbe Uebergabe fuer mehrere Auftraege)
+liegen nur einmal auf der Platte, die uebergaben-Zeilen zeigen auf
+denselben Pfad. Geloescht wird eine Datei erst, wenn keine Zeile mehr
+darauf verweist (siehe delete_uebergabe).
+
+Lesen:
+    - Kleine, haeufig angezeigte Dateien kommen aus einem In-Memory LRU
+      (Inhalt ist unveraenderlich, der Cache kann nie veralten)
+    - Grosse Dateien werden per mmap dekodiert statt komplett eingelesen
+    - Downloads laufen ueber send_file(conditional=True) inkl. Range-Requests
+"""
+
+import logging
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Wurzelverzeichnis des Blob Stores
+BLOB_STORE_DIR = os.getenv('UEBERGABE_BLOB_DIR', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    'projekt',
+    'blobs'
+))
+
+# Groesse des In-Memory LRU fuer dekodierte Inhalte (MB)
+BLOB_CACHE_MAX_MB = float(os.getenv('UEBERGABE_BLOB_CACHE_MB', '32'))
+
+# Dateien ab dieser Groesse werden nicht gecacht, sondern per mmap gelesen
+MMAP_THRESHOLD = 512 * 1024
+
+_DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+class BlobStore:
+    """
+    Content-addressed Ablage mit Sharding und LRU fuer heisse Dateien.
+
+    Attributes:
+        root: Wurzelverzeichnis
+        tmp_dir: Spool-Verzeichnis (gleiches Dateisystem, Umbenennen ist atomar)
+        hits / misses: Treffer und Fehlschlaege des LRU (nur Blobs)
+    """
+
+    def __init__(self, root: str = BLOB_STORE_DIR, cache_mb: float = BLOB_CACHE_MAX_MB):
+        """
+        Args:
+            root: Wurzelverzeichnis
+            cache_mb: Groesse des In-Memory LRU in MB
+        """
+        self.root = os.path.abspath(root)
+        self.tmp_dir = os.path.join(self.root, 'tmp')
+        self._cache_max = int(cache_mb * 1024 * 1024)
+        self._cache: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+    def path_for(self, digest: str) -> str:
+        """
+        Liefert den Ablagepfad eines Blobs (zwei Ebenen Sharding).
+
+        Args:
+            digest: SHA-256 Hex-Digest
+
+        Returns:
+            str: Absoluter Pfad
+        """
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def digest_for_path(self, path: str) -> str | None:
+        """
+        Ermittelt den Digest, falls der Pfad im Store liegt.
+
+        Args:
+            path: Dateipfad (z.B. uebergaben.datei_pfad)
+
+        Returns:
+            str | None: Digest oder None fuer Dateien ausserhalb des Stores
+        """
+        digest = os.path.basename(path)
+        if _DIGEST_RE.match(digest) and os.path.abspath(path) == self.path_for(digest):
+            return digest
+        return None
+
+    def put(self, upload) -> tuple[str, bool]:
+        """
+        Uebernimmt einen gespoolten Upload in den Store.
+
+        Args:
+            upload: SpooledUpload (idealerweise mit spool_dir=self.tmp_dir)
+
+        Returns:
+            tuple: (Pfad im Store, dedupliziert) - dedupliziert ist True,
+                   wenn der Inhalt bereits vorhanden war
+        """
+        target = self.path_for(upload.sha256)
+        if os.path.exists(target):
+            upload.cleanup()
+            logger.info(f"Uebergabe dedupliziert: {upload.filename} -> {upload.sha256[:12]}")
+            return target, True
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        upload.move_to(target)
+        logger.info(f"Uebergabe abgelegt: {upload.filename} -> {upload.sha256[:12]} ({upload.size} Bytes)")
+        return target, False
+
+    def read_text(self, path: str, encoding: str = 'utf-8') -> str:
+        """
+        Liest eine Datei als Text (LRU fuer Blobs, mmap fuer grosse Dateien).
+
+        Funktioniert auch fuer alte Uebergaben ausserhalb des Stores,
+        diese werden nur nicht gecacht.
+
+        Args:
+            path: Dateipfad
+            encoding: Text-Encoding (ungueltige Bytes werden ersetzt)
+
+        Returns:
+            str: Dateiinhalt
+
+        Raises:
+            FileNotFoundError: Wenn die Datei fehlt
+        """
+        digest = self.digest_for_path(path)
+        if digest:
+            with self._lock:
+                entry = self._cache.get(digest)
+                if entry is not None:
+                    self.hits += 1
+                    self._cache.move_to_end(digest)
+                    return entry[0]
+                self.misses += 1
+
+        size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            if size >= MMAP_THRESHOLD:
+                # Direkt aus dem gemappten Speicher dekodieren, ohne bytes-Kopie
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return str(mapped, encoding, 'replace')
+            text = f.read().decode(encoding, 'replace')
+
+        if digest:
+            self._remember(digest, text, size)
+        return text
+
+    def _remember(self, digest: str, text: str, size: int) -> None:
+        """Legt einen Inhalt im LRU ab und verdraengt alte Eintraege."""
+        with self._lock:
+            if digest in self._cache or size > self._cache_max:
+                return
+            self._cache[digest] = (text, size)
+            self._cache_bytes += size
+            while self._cache_bytes > self._cache_max and self._cache:
+                _, (_, old_size) = self._cache.popitem(last=False)
+                self._cache_bytes -= old_size
+
+    def delete(self, path: str) -> None:
+        """
+        Loescht einen Blob (nur aufrufen, wenn keine Uebergabe mehr darauf zeigt).
+
+        Args:
+            path: Pfad im Store
+        """
+        digest = self.digest_for_path(path)
+        if digest:
+            with self._lock:
+                entry = self._cache.pop(digest, None)
+                if entry is not None:
+                    self._cache_bytes -= entry[1]
+        os.remove(path)
+
+
+# Singleton-Instanz
+_store: BlobStore | None = None
+
+
+def get_blob_store() -> BlobStore:
+    """
+    Gibt die Singleton-Instanz des Blob Stores zurueck.
+
+    Returns:
+        BlobStore: Die Store-Instanz
+    """
+    global _store
+    if _store is None:
+        _store = BlobStore()
+    return _store
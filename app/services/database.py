@@ -29,6 +29,9 @@ DB_PATH = os.path.join(
     'nexus.db'
 )
 
+# Verbindungsklasse fuer get_db (das Request-Profiling setzt eine messende Unterklasse)
+CONNECTION_FACTORY: type[sqlite3.Connection] = sqlite3.Connection
+
 
 # ========================================
 # BASIS-FUNKTIONEN
@@ -42,11 +45,11 @@ def get_db() -> sqlite3.Connection:
         sqlite3.Connection: Datenbankverbindung
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite3.connect(DB_PATH, factory=CONNECTION_FACTORY)
         conn.row_factory = sqlite3.Row
         return conn
     except sqlite3.Error as e:
-        logger.error(f"Datenbankverbindung fehlgeschlagen: {e}")
+        logger.error("Datenbankverbindung fehlgeschlagen: %s", e)
         raise
 
 
@@ -66,7 +69,7 @@ def save_projekt(name: str, original_plan: str, enterprise_plan: str, bewertung:
     Raises:
         sqlite3.Error: Bei Datenbankfehlern
     """
-    logger.info(f"Speichere neues Projekt: {name}")
+    logger.info("Speichere neues Projekt: %s", name)
 
     try:
         conn = get_db()
@@ -82,11 +85,11 @@ def save_projekt(name: str, original_plan: str, enterprise_plan: str, bewertung:
         conn.commit()
         conn.close()
 
-        logger.info(f"Projekt gespeichert mit ID: {projekt_id}")
+        logger.info("Projekt gespeichert mit ID: %s", projekt_id)
         return projekt_id
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Speichern des Projekts '{name}': {e}")
+        logger.error("Fehler beim Speichern des Projekts '%s': %s", name, e)
         raise
 
 
@@ -109,7 +112,7 @@ def get_projekt(projekt_id: int) -> dict | None:
         return dict(projekt) if projekt else None
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden von Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Laden von Projekt %s: %s", projekt_id, e)
         return None
 
 
@@ -129,7 +132,7 @@ def get_all_projekte() -> list[dict]:
         return [dict(p) for p in projekte]
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden aller Projekte: {e}")
+        logger.error("Fehler beim Laden aller Projekte: %s", e)
         return []
 
 
@@ -148,7 +151,7 @@ def save_phasen(projekt_id: int, phasen_data: dict) -> list[tuple[int, int]]:
     Returns:
         list[tuple[int, int]]: Liste von (phase_nummer, phase_id) Tupeln
     """
-    logger.info(f"Speichere Phasen fuer Projekt {projekt_id}")
+    logger.info("Speichere Phasen fuer Projekt %s", projekt_id)
 
     try:
         conn = get_db()
@@ -174,11 +177,11 @@ def save_phasen(projekt_id: int, phasen_data: dict) -> list[tuple[int, int]]:
         conn.commit()
         conn.close()
 
-        logger.info(f"{len(phase_ids)} Phasen gespeichert fuer Projekt {projekt_id}")
+        logger.info("%s Phasen gespeichert fuer Projekt %s", len(phase_ids), projekt_id)
         return phase_ids
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Speichern der Phasen fuer Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Speichern der Phasen fuer Projekt %s: %s", projekt_id, e)
         raise
 
 
@@ -190,7 +193,7 @@ def save_auftraege(phase_id: int, auftraege: list[dict]) -> None:
         phase_id: Phase-ID
         auftraege: Liste der Auftraege
     """
-    logger.debug(f"Speichere {len(auftraege)} Auftraege fuer Phase {phase_id}")
+    logger.debug("Speichere %s Auftraege fuer Phase %s", len(auftraege), phase_id)
 
     try:
         conn = get_db()
@@ -217,10 +220,10 @@ def save_auftraege(phase_id: int, auftraege: list[dict]) -> None:
         conn.commit()
         conn.close()
 
-        logger.debug(f"Auftraege fuer Phase {phase_id} gespeichert")
+        logger.debug("Auftraege fuer Phase %s gespeichert", phase_id)
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Speichern der Auftraege fuer Phase {phase_id}: {e}")
+        logger.error("Fehler beim Speichern der Auftraege fuer Phase %s: %s", phase_id, e)
         raise
 
 
@@ -232,7 +235,7 @@ def update_projekt_qualitaet(projekt_id: int, qualitaet_data: dict) -> None:
         projekt_id: Projekt-ID
         qualitaet_data: Qualitaetsdaten aus der Pruefung
     """
-    logger.info(f"Aktualisiere Qualitaetsbewertung fuer Projekt {projekt_id}")
+    logger.info("Aktualisiere Qualitaetsbewertung fuer Projekt %s", projekt_id)
 
     try:
         conn = get_db()
@@ -254,10 +257,10 @@ def update_projekt_qualitaet(projekt_id: int, qualitaet_data: dict) -> None:
         conn.commit()
         conn.close()
 
-        logger.info(f"Qualitaetsbewertung fuer Projekt {projekt_id}: {qualitaet_data.get('gesamt_bewertung', 0)}/5")
+        logger.info("Qualitaetsbewertung fuer Projekt %s: %s/5", projekt_id, qualitaet_data.get('gesamt_bewertung', 0))
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Aktualisieren der Qualitaet fuer Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Aktualisieren der Qualitaet fuer Projekt %s: %s", projekt_id, e)
         raise
 
 
@@ -271,7 +274,7 @@ def get_projekt_komplett(projekt_id: int) -> dict | None:
     Returns:
         dict: Komplette Projektdaten inkl. Phasen und Auftraegen, oder None
     """
-    logger.debug(f"Lade komplettes Projekt {projekt_id}")
+    logger.debug("Lade komplettes Projekt %s", projekt_id)
 
     try:
         conn = get_db()
@@ -282,7 +285,7 @@ def get_projekt_komplett(projekt_id: int) -> dict | None:
         projekt_row = cursor.fetchone()
         if not projekt_row:
             conn.close()
-            logger.warning(f"Projekt {projekt_id} nicht gefunden")
+            logger.warning("Projekt %s nicht gefunden", projekt_id)
             return None
 
         projekt = dict(projekt_row)
@@ -325,11 +328,11 @@ def get_projekt_komplett(projekt_id: int) -> dict | None:
         projekt['phasen'] = phasen
         conn.close()
 
-        logger.debug(f"Projekt {projekt_id} geladen mit {len(phasen)} Phasen")
+        logger.debug("Projekt %s geladen mit %s Phasen", projekt_id, len(phasen))
         return projekt
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden von Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Laden von Projekt %s: %s", projekt_id, e)
         return None
 
 
@@ -377,7 +380,7 @@ def get_next_open_auftrag(projekt_id: int) -> dict | None:
         return auftrag
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Suchen des naechsten Auftrags fuer Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Suchen des naechsten Auftrags fuer Projekt %s: %s", projekt_id, e)
         return None
 
 
@@ -392,7 +395,7 @@ def update_auftrag_status(auftrag_id: int, status: str) -> bool:
     Returns:
         bool: True wenn erfolgreich
     """
-    logger.debug(f"Aktualisiere Auftrag {auftrag_id} auf Status '{status}'")
+    logger.debug("Aktualisiere Auftrag %s auf Status '%s'", auftrag_id, status)
 
     try:
         conn = get_db()
@@ -409,11 +412,11 @@ def update_auftrag_status(auftrag_id: int, status: str) -> bool:
         conn.close()
 
         if affected > 0:
-            logger.info(f"Auftrag {auftrag_id} Status geaendert auf '{status}'")
+            logger.info("Auftrag %s Status geaendert auf '%s'", auftrag_id, status)
         return affected > 0
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Aktualisieren von Auftrag {auftrag_id}: {e}")
+        logger.error("Fehler beim Aktualisieren von Auftrag %s: %s", auftrag_id, e)
         return False
 
 
@@ -461,7 +464,7 @@ def get_projekt_stats(projekt_id: int) -> dict:
         return stats
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Ermitteln der Stats fuer Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Ermitteln der Stats fuer Projekt %s: %s", projekt_id, e)
         return {'total_phasen': 0, 'total_auftraege': 0, 'offen': 0, 'in_arbeit': 0, 'fertig': 0, 'fehler': 0}
 
 
@@ -469,6 +472,41 @@ def get_projekt_stats(projekt_id: int) -> dict:
 # FEHLER-FUNKTIONEN (Erweitert v2.0)
 # ========================================
 
+def _fetch_fehler_stats_row(cursor: sqlite3.Cursor, fehler_id: int) -> dict | None:
+    """
+    Laedt die fuer die Fehler-Statistik relevanten Spalten einer Zeile.
+
+    Args:
+        cursor: Cursor der laufenden Verbindung
+        fehler_id: Fehler-ID
+
+    Returns:
+        dict: Zeile mit STATS_COLUMNS oder None
+    """
+    from app.services.fehler_stats import STATS_COLUMNS
+
+    cursor.execute(f"SELECT {STATS_COLUMNS} FROM fehler WHERE id = ?", (fehler_id,))
+    row = cursor.fetchone()
+    return dict(row) if row else None
+
+
+def _notify_fehler_stats(old: dict | None, new: dict | None) -> None:
+    """
+    Meldet eine committete Aenderung an die Fehler-Statistik Engine.
+
+    Fehler in der Statistik duerfen Schreibzugriffe nie abbrechen.
+
+    Args:
+        old: Zeile vor der Aenderung oder None (Insert)
+        new: Zeile nach der Aenderung oder None (Delete)
+    """
+    try:
+        from app.services.fehler_stats import get_stats_engine
+        get_stats_engine().record_change(old, new)
+    except Exception as e:
+        logger.warning("Fehler-Statistik konnte nicht aktualisiert werden: %s", e)
+
+
 def search_fehler(fehler_text: str) -> dict | None:
     """
     Sucht nach bekanntem Fehler in der Datenbank (Pattern-Matching).
@@ -496,7 +534,7 @@ def search_fehler(fehler_text: str) -> dict | None:
         conn.close()
 
         if row:
-            logger.debug(f"Bekannter Fehler gefunden: ID {row['id']}")
+            logger.debug("Bekannter Fehler gefunden: ID %s", row['id'])
             fehler = dict(row)
             # Tags parsen wenn vorhanden
             if fehler.get('tags'):
@@ -508,7 +546,7 @@ def search_fehler(fehler_text: str) -> dict | None:
         return None
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler bei Fehlersuche: {e}")
+        logger.error("Fehler bei Fehlersuche: %s", e)
         return None
 
 
@@ -538,7 +576,7 @@ def save_fehler(
     Returns:
         int: Fehler-ID
     """
-    logger.info(f"Speichere neuen Fehler: Kategorie={kategorie}, Severity={severity}")
+    logger.info("Speichere neuen Fehler: Kategorie=%s, Severity=%s", kategorie, severity)
 
     try:
         conn = get_db()
@@ -564,11 +602,17 @@ def save_fehler(
         conn.commit()
         conn.close()
 
-        logger.info(f"Fehler gespeichert mit ID: {fehler_id}")
+        _notify_fehler_stats(None, {
+            'id': fehler_id, 'muster': muster, 'kategorie': kategorie,
+            'severity': severity, 'status': 'aktiv', 'erfolgsrate': 100,
+            'anzahl': 1, 'similar_count': 0, 'created_at': now
+        })
+
+        logger.info("Fehler gespeichert mit ID: %s", fehler_id)
         return fehler_id
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Speichern des Fehlers: {e}")
+        logger.error("Fehler beim Speichern des Fehlers: %s", e)
         return 0
 
 
@@ -583,6 +627,7 @@ def increment_fehler_count(fehler_id: int) -> None:
         conn = get_db()
         cursor = conn.cursor()
 
+        alt = _fetch_fehler_stats_row(cursor, fehler_id)
         cursor.execute("""
             UPDATE fehler
             SET anzahl = anzahl + 1,
@@ -590,14 +635,17 @@ def increment_fehler_count(fehler_id: int) -> None:
                 updated_at = datetime('now')
             WHERE id = ?
         """, (fehler_id,))
+        neu = _fetch_fehler_stats_row(cursor, fehler_id)
 
         conn.commit()
         conn.close()
 
-        logger.debug(f"Fehler {fehler_id} Zaehler erhoeht")
+        _notify_fehler_stats(alt, neu)
+
+        logger.debug("Fehler %s Zaehler erhoeht", fehler_id)
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Erhoehen des Zaehlers fuer Fehler {fehler_id}: {e}")
+        logger.error("Fehler beim Erhoehen des Zaehlers fuer Fehler %s: %s", fehler_id, e)
 
 
 def increment_similar_count(fehler_id: int) -> None:
@@ -611,20 +659,24 @@ def increment_similar_count(fehler_id: int) -> None:
         conn = get_db()
         cursor = conn.cursor()
 
+        alt = _fetch_fehler_stats_row(cursor, fehler_id)
         cursor.execute("""
             UPDATE fehler
             SET similar_count = similar_count + 1,
                 updated_at = datetime('now')
             WHERE id = ?
         """, (fehler_id,))
+        neu = _fetch_fehler_stats_row(cursor, fehler_id)
 
         conn.commit()
         conn.close()
 
-        logger.debug(f"Fehler {fehler_id} Similar-Count erhoeht")
+        _notify_fehler_stats(alt, neu)
+
+        logger.debug("Fehler %s Similar-Count erhoeht", fehler_id)
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Erhoehen des Similar-Counts fuer Fehler {fehler_id}: {e}")
+        logger.error("Fehler beim Erhoehen des Similar-Counts fuer Fehler %s: %s", fehler_id, e)
 
 
 def update_fehler_erfolgsrate(fehler_id: int, erfolg: bool) -> None:
@@ -640,8 +692,7 @@ def update_fehler_erfolgsrate(fehler_id: int, erfolg: bool) -> None:
         cursor = conn.cursor()
 
         # Aktuelle Werte laden
-        cursor.execute("SELECT anzahl, erfolgsrate FROM fehler WHERE id = ?", (fehler_id,))
-        row = cursor.fetchone()
+        row = _fetch_fehler_stats_row(cursor, fehler_id)
 
         if row:
             anzahl = row['anzahl']
@@ -657,12 +708,13 @@ def update_fehler_erfolgsrate(fehler_id: int, erfolg: bool) -> None:
             """, (neue_rate, fehler_id))
 
             conn.commit()
-            logger.debug(f"Fehler {fehler_id} Erfolgsrate aktualisiert: {neue_rate:.1f}%")
+            _notify_fehler_stats(row, {**row, 'erfolgsrate': neue_rate})
+            logger.debug("Fehler %s Erfolgsrate aktualisiert: %.1f%%", fehler_id, neue_rate)
 
         conn.close()
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Aktualisieren der Erfolgsrate fuer Fehler {fehler_id}: {e}")
+        logger.error("Fehler beim Aktualisieren der Erfolgsrate fuer Fehler %s: %s", fehler_id, e)
 
 
 def update_fehler_status(fehler_id: int, status: str) -> bool:
@@ -677,13 +729,14 @@ def update_fehler_status(fehler_id: int, status: str) -> bool:
         bool: True wenn erfolgreich
     """
     if status not in ['aktiv', 'geloest', 'veraltet']:
-        logger.warning(f"Ungueltiger Fehler-Status: {status}")
+        logger.warning("Ungueltiger Fehler-Status: %s", status)
         return False
 
     try:
         conn = get_db()
         cursor = conn.cursor()
 
+        alt = _fetch_fehler_stats_row(cursor, fehler_id)
         cursor.execute("""
             UPDATE fehler
             SET status = ?,
@@ -696,11 +749,12 @@ def update_fehler_status(fehler_id: int, status: str) -> bool:
         conn.close()
 
         if affected > 0:
-            logger.info(f"Fehler {fehler_id} Status geaendert auf '{status}'")
+            _notify_fehler_stats(alt, {**alt, 'status': status})
+            logger.info("Fehler %s Status geaendert auf '%s'", fehler_id, status)
         return affected > 0
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Aktualisieren des Status fuer Fehler {fehler_id}: {e}")
+        logger.error("Fehler beim Aktualisieren des Status fuer Fehler %s: %s", fehler_id, e)
         return False
 
 
@@ -735,14 +789,40 @@ def get_all_fehler(limit: int = 100) -> list[dict]:
                 except json.JSONDecodeError:
                     f['tags_list'] = []
 
-        logger.debug(f"Alle Fehler geladen: {len(fehler)} Eintraege")
+        logger.debug("Alle Fehler geladen: %s Eintraege", len(fehler))
         return fehler
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden aller Fehler: {e}")
+        logger.error("Fehler beim Laden aller Fehler: %s", e)
         return []
 
 
+def get_fehler_db_version() -> str:
+    """
+    Liefert einen Versions-Fingerprint der Fehler-Datenbank.
+
+    Aendert sich bei jedem Insert, Delete, Merge und Feedback. Wird als
+    Teil des Cache-Keys fuer den PDF-Export verwendet.
+
+    Returns:
+        str: Fingerprint (leer bei Datenbankfehlern)
+    """
+    try:
+        conn = get_db()
+        row = conn.execute("""
+            SELECT COUNT(*), COALESCE(MAX(id), 0), COALESCE(MAX(updated_at), ''),
+                   COALESCE(SUM(anzahl), 0), COALESCE(SUM(erfolgsrate), 0),
+                   COALESCE(SUM(similar_count), 0), COALESCE(SUM(status = 'aktiv'), 0)
+            FROM fehler
+        """).fetchone()
+        conn.close()
+        return ':'.join(str(value) for value in row)
+
+    except sqlite3.Error as e:
+        logger.error("Fehler beim Ermitteln der Fehler-DB Version: %s", e)
+        return ''
+
+
 def get_fehler_by_kategorie(kategorie: str, limit: int = 20) -> list[dict]:
     """
     Holt alle Fehler einer Kategorie.
@@ -779,7 +859,7 @@ def get_fehler_by_kategorie(kategorie: str, limit: int = 20) -> list[dict]:
         return fehler
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden der Fehler fuer Kategorie {kategorie}: {e}")
+        logger.error("Fehler beim Laden der Fehler fuer Kategorie %s: %s", kategorie, e)
         return []
 
 
@@ -811,7 +891,7 @@ def get_fehler_by_severity(severity: str, limit: int = 20) -> list[dict]:
         return fehler
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden der Fehler fuer Severity {severity}: {e}")
+        logger.error("Fehler beim Laden der Fehler fuer Severity %s: %s", severity, e)
         return []
 
 
@@ -856,89 +936,10 @@ def get_fehler_by_tags(tags: list[str], limit: int = 20) -> list[dict]:
         return fehler
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden der Fehler fuer Tags {tags}: {e}")
+        logger.error("Fehler beim Laden der Fehler fuer Tags %s: %s", tags, e)
         return []
 
 
-def get_fehler_stats() -> dict:
-    """
-    Gibt erweiterte Fehler-Statistiken zurueck.
-
-    Returns:
-        dict: Statistiken ueber Fehler
-    """
-    try:
-        conn = get_db()
-        cursor = conn.cursor()
-
-        # Gesamt-Zahlen
-        cursor.execute("SELECT COUNT(*) as total FROM fehler")
-        total = cursor.fetchone()['total']
-
-        cursor.execute("SELECT AVG(erfolgsrate) as avg_rate FROM fehler")
-        avg_rate = cursor.fetchone()['avg_rate'] or 0
-
-        # Nach Kategorie
-        cursor.execute("""
-            SELECT kategorie, COUNT(*) as count
-            FROM fehler
-            GROUP BY kategorie
-            ORDER BY count DESC
-        """)
-        kategorien = {row['kategorie']: row['count'] for row in cursor.fetchall()}
-
-        # Nach Severity
-        cursor.execute("""
-            SELECT severity, COUNT(*) as count
-            FROM fehler
-            WHERE severity IS NOT NULL
-            GROUP BY severity
-        """)
-        severities = {row['severity']: row['count'] for row in cursor.fetchall()}
-
-        # Nach Status
-        cursor.execute("""
-            SELECT status, COUNT(*) as count
-            FROM fehler
-            WHERE status IS NOT NULL
-            GROUP BY status
-        """)
-        statuses = {row['status']: row['count'] for row in cursor.fetchall()}
-
-        # Aktive kritische Fehler
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM fehler
-            WHERE severity = 'critical' AND status = 'aktiv'
-        """)
-        critical_aktiv = cursor.fetchone()['count']
-
-        # Letzte 7 Tage
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM fehler
-            WHERE created_at > datetime('now', '-7 days')
-        """)
-        letzte_7_tage = cursor.fetchone()['count']
-
-        conn.close()
-
-        return {
-            'total': total,
-            'avg_erfolgsrate': round(avg_rate, 1),
-            'kategorien': kategorien,
-            'severities': severities,
-            'statuses': statuses,
-            'critical_aktiv': critical_aktiv,
-            'letzte_7_tage': letzte_7_tage
-        }
-
-    except sqlite3.Error as e:
-        logger.error(f"Fehler beim Ermitteln der Fehler-Stats: {e}")
-        return {
-            'total': 0, 'avg_erfolgsrate': 0, 'kategorien': {},
-            'severities': {}, 'statuses': {}, 'critical_aktiv': 0, 'letzte_7_tage': 0
-        }
-
-
 def migrate_fehler_table() -> bool:
     """
     Migriert die Fehler-Tabelle auf die neue Struktur (v2.0).
@@ -974,7 +975,7 @@ def migrate_fehler_table() -> bool:
         # Fehlende Spalten hinzufuegen
         for col_name, col_type in new_columns:
             if col_name not in existing_columns:
-                logger.info(f"Fuege Spalte hinzu: {col_name}")
+                logger.info("Fuege Spalte hinzu: %s", col_name)
                 cursor.execute(f"ALTER TABLE fehler ADD COLUMN {col_name} {col_type}")
 
         # Setze Default-Werte fuer bestehende Zeilen
@@ -997,7 +998,7 @@ def migrate_fehler_table() -> bool:
         return True
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler bei Migration: {e}")
+        logger.error("Fehler bei Migration: %s", e)
         return False
 
 
@@ -1094,7 +1095,7 @@ def search_similar_fehler(
     from rapidfuzz import fuzz
     import json
 
-    logger.debug(f"Suche aehnliche Fehler fuer: {fehler_text[:100]}...")
+    logger.debug("Suche aehnliche Fehler fuer: %s...", fehler_text[:100])
 
     try:
         conn = get_db()
@@ -1151,11 +1152,11 @@ def search_similar_fehler(
         # Limit anwenden
         results = scored_results[:limit]
 
-        logger.info(f"Gefunden: {len(results)} aehnliche Fehler (min_score={min_score})")
+        logger.info("Gefunden: %s aehnliche Fehler (min_score=%s)", len(results), min_score)
         return results
 
     except Exception as e:
-        logger.error(f"Fehler bei Fuzzy-Search: {e}")
+        logger.error("Fehler bei Fuzzy-Search: %s", e)
         return []
 
 
@@ -1215,7 +1216,7 @@ def save_or_merge_fehler(
     Returns:
         dict: {'merged': bool, 'fehler_id': int, 'action': str, 'match_score': float}
     """
-    logger.debug(f"save_or_merge_fehler: {muster[:50]}...")
+    logger.debug("save_or_merge_fehler: %s...", muster[:50])
 
     try:
         # Suche aehnliche Fehler (>= 80% Match)
@@ -1244,6 +1245,7 @@ def save_or_merge_fehler(
             else:
                 new_trace = fehler.get('stack_trace')
 
+            alt = _fetch_fehler_stats_row(cursor, fehler_id)
             cursor.execute("""
                 UPDATE fehler
                 SET similar_count = similar_count + 1,
@@ -1258,11 +1260,14 @@ def save_or_merge_fehler(
                 datetime.now().isoformat(),
                 fehler_id
             ))
+            neu = _fetch_fehler_stats_row(cursor, fehler_id)
 
             conn.commit()
             conn.close()
 
-            logger.info(f"Fehler gemerged mit ID {fehler_id} (Score: {score:.1f}%)")
+            _notify_fehler_stats(alt, neu)
+
+            logger.info("Fehler gemerged mit ID %s (Score: %.1f%%)", fehler_id, score)
             return {
                 'merged': True,
                 'fehler_id': fehler_id,
@@ -1283,7 +1288,7 @@ def save_or_merge_fehler(
                 fix_command=fix_command
             )
 
-            logger.info(f"Neuer Fehler erstellt mit ID {fehler_id}")
+            logger.info("Neuer Fehler erstellt mit ID %s", fehler_id)
             return {
                 'merged': False,
                 'fehler_id': fehler_id,
@@ -1292,7 +1297,7 @@ def save_or_merge_fehler(
             }
 
     except Exception as e:
-        logger.error(f"Fehler bei save_or_merge_fehler: {e}")
+        logger.error("Fehler bei save_or_merge_fehler: %s", e)
         # Fallback: Direkt speichern
         fehler_id = save_fehler(
             muster=muster,
@@ -1323,18 +1328,14 @@ def update_fehler_feedback(fehler_id: int, helpful: bool) -> dict:
     Returns:
         dict: {'success': bool, 'neue_rate': float, 'status': str}
     """
-    logger.debug(f"Feedback fuer Fehler {fehler_id}: helpful={helpful}")
+    logger.debug("Feedback fuer Fehler %s: helpful=%s", fehler_id, helpful)
 
     try:
         conn = get_db()
         cursor = conn.cursor()
 
         # Aktuellen Stand holen
-        cursor.execute(
-            "SELECT erfolgsrate, anzahl FROM fehler WHERE id = ?",
-            (fehler_id,)
-        )
-        row = cursor.fetchone()
+        row = _fetch_fehler_stats_row(cursor, fehler_id)
 
         if not row:
             conn.close()
@@ -1366,7 +1367,9 @@ def update_fehler_feedback(fehler_id: int, helpful: bool) -> dict:
         conn.commit()
         conn.close()
 
-        logger.info(f"Feedback verarbeitet: Fehler {fehler_id} neue Rate={neue_rate:.1f}%, Status={neuer_status}")
+        _notify_fehler_stats(row, {**row, 'erfolgsrate': neue_rate, 'status': neuer_status})
+
+        logger.info("Feedback verarbeitet: Fehler %s neue Rate=%.1f%%, Status=%s", fehler_id, neue_rate, neuer_status)
         return {
             'success': True,
             'neue_rate': round(neue_rate, 1),
@@ -1375,7 +1378,7 @@ def update_fehler_feedback(fehler_id: int, helpful: bool) -> dict:
         }
 
     except Exception as e:
-        logger.error(f"Fehler bei update_fehler_feedback: {e}")
+        logger.error("Fehler bei update_fehler_feedback: %s", e)
         return {'success': False, 'error': str(e)}
 
 
@@ -1391,7 +1394,7 @@ def find_and_merge_duplicates(threshold: float = 90.0) -> dict:
     """
     from rapidfuzz import fuzz
 
-    logger.info(f"Starte Duplikat-Suche (threshold={threshold}%)")
+    logger.info("Starte Duplikat-Suche (threshold=%s%%)", threshold)
 
     try:
         conn = get_db()
@@ -1400,7 +1403,7 @@ def find_and_merge_duplicates(threshold: float = 90.0) -> dict:
         # Alle aktiven Fehler holen (sortiert nach Anzahl, damit haeufigste bleiben)
         cursor.execute("""
             SELECT id, muster, kategorie, loesung, anzahl, erfolgsrate,
-                   similar_count, stack_trace, tags
+                   similar_count, stack_trace, tags, severity, status, created_at
             FROM fehler
             WHERE status = 'aktiv'
             ORDER BY anzahl DESC
@@ -1410,6 +1413,7 @@ def find_and_merge_duplicates(threshold: float = 90.0) -> dict:
         merged_count = 0
         processed = set()
         errors = []
+        stats_changes = []
 
         for i, fehler1 in enumerate(alle_fehler):
             if fehler1['id'] in processed:
@@ -1459,10 +1463,18 @@ def find_and_merge_duplicates(threshold: float = 90.0) -> dict:
 
                         cursor.execute("DELETE FROM fehler WHERE id = ?", (fehler2['id'],))
 
+                        # fehler1 fuer weitere Merges im selben Lauf aktuell halten
+                        alt = dict(fehler1)
+                        fehler1['anzahl'] = new_anzahl
+                        fehler1['similar_count'] = new_similar
+                        fehler1['stack_trace'] = combined_trace
+                        stats_changes.append((alt, dict(fehler1)))
+                        stats_changes.append((fehler2, None))
+
                         processed.add(fehler2['id'])
                         merged_count += 1
 
-                        logger.debug(f"Merged: {fehler2['id']} → {fehler1['id']} (Score: {score}%)")
+                        logger.debug("Merged: %s → %s (Score: %s%%)", fehler2['id'], fehler1['id'], score)
 
                     except Exception as e:
                         errors.append(f"Merge {fehler2['id']} → {fehler1['id']}: {e}")
@@ -1470,7 +1482,10 @@ def find_and_merge_duplicates(threshold: float = 90.0) -> dict:
         conn.commit()
         conn.close()
 
-        logger.info(f"Deduplizierung abgeschlossen: {merged_count} Duplikate gemerged")
+        for alt, neu in stats_changes:
+            _notify_fehler_stats(alt, neu)
+
+        logger.info("Deduplizierung abgeschlossen: %s Duplikate gemerged", merged_count)
         return {
             'merged_count': merged_count,
             'processed': len(alle_fehler),
@@ -1478,7 +1493,7 @@ def find_and_merge_duplicates(threshold: float = 90.0) -> dict:
         }
 
     except Exception as e:
-        logger.error(f"Fehler bei find_and_merge_duplicates: {e}")
+        logger.error("Fehler bei find_and_merge_duplicates: %s", e)
         return {'merged_count': 0, 'processed': 0, 'errors': [str(e)]}
 
 
@@ -1493,15 +1508,17 @@ def cleanup_old_fehler(days: int = 180, min_erfolgsrate: float = 30.0) -> dict:
     Returns:
         dict: {'deleted_count': int, 'candidates': int}
     """
-    logger.info(f"Starte Cleanup (days={days}, min_rate={min_erfolgsrate}%)")
+    logger.info("Starte Cleanup (days=%s, min_rate=%s%%)", days, min_erfolgsrate)
 
     try:
         conn = get_db()
         cursor = conn.cursor()
 
-        # Erst zaehlen
-        cursor.execute("""
-            SELECT COUNT(*) FROM fehler
+        from app.services.fehler_stats import STATS_COLUMNS
+
+        # Erst Kandidaten laden (Anzahl + Zeilen fuer die Statistik)
+        cursor.execute(f"""
+            SELECT {STATS_COLUMNS} FROM fehler
             WHERE (
                 created_at < datetime('now', '-' || ? || ' days')
                 AND erfolgsrate < ?
@@ -1509,7 +1526,8 @@ def cleanup_old_fehler(days: int = 180, min_erfolgsrate: float = 30.0) -> dict:
             )
             OR status = 'veraltet'
         """, (days, min_erfolgsrate))
-        candidates = cursor.fetchone()[0]
+        kandidaten = [dict(row) for row in cursor.fetchall()]
+        candidates = len(kandidaten)
 
         # Dann loeschen
         cursor.execute("""
@@ -1526,14 +1544,21 @@ def cleanup_old_fehler(days: int = 180, min_erfolgsrate: float = 30.0) -> dict:
         conn.commit()
         conn.close()
 
-        logger.info(f"Cleanup abgeschlossen: {deleted_count} Fehler geloescht")
+        if deleted_count == candidates:
+            for fehler in kandidaten:
+                _notify_fehler_stats(fehler, None)
+        elif deleted_count:
+            from app.services.fehler_stats import get_stats_engine
+            get_stats_engine().invalidate()
+
+        logger.info("Cleanup abgeschlossen: %s Fehler geloescht", deleted_count)
         return {
             'deleted_count': deleted_count,
             'candidates': candidates
         }
 
     except Exception as e:
-        logger.error(f"Fehler bei cleanup_old_fehler: {e}")
+        logger.error("Fehler bei cleanup_old_fehler: %s", e)
         return {'deleted_count': 0, 'candidates': 0, 'error': str(e)}
 
 
@@ -1541,100 +1566,16 @@ def get_fehler_stats() -> dict:
     """
     Liefert Statistiken zur Fehler-Datenbank.
 
+    Die Aggregation laeuft ueber die Fehler-Statistik Engine (Single-Scan,
+    inkrementelle Zaehler, TTL-Cache), siehe app/services/fehler_stats.py.
+
     Returns:
-        dict: Umfangreiche Statistiken
+        dict: Umfangreiche Statistiken inkl. 'computed_at' und 'source'
     """
-    logger.debug("Sammle Fehler-Statistiken")
-
-    try:
-        conn = get_db()
-        cursor = conn.cursor()
-
-        # Gesamt-Statistiken
-        cursor.execute("SELECT COUNT(*) FROM fehler")
-        gesamt = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM fehler WHERE status = 'aktiv'")
-        aktiv = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM fehler WHERE status = 'veraltet'")
-        veraltet = cursor.fetchone()[0]
-
-        cursor.execute("SELECT COUNT(*) FROM fehler WHERE status = 'geloest'")
-        geloest = cursor.fetchone()[0]
-
-        cursor.execute("SELECT AVG(erfolgsrate) FROM fehler WHERE status = 'aktiv'")
-        avg_rate = cursor.fetchone()[0] or 0
+    from app.services.fehler_stats import get_stats_engine
 
-        cursor.execute("SELECT SUM(anzahl) FROM fehler")
-        total_nutzungen = cursor.fetchone()[0] or 0
-
-        # Pro Kategorie
-        cursor.execute("""
-            SELECT kategorie,
-                   COUNT(*) as anzahl,
-                   AVG(erfolgsrate) as avg_rate,
-                   SUM(anzahl) as nutzungen,
-                   SUM(similar_count) as similar_total
-            FROM fehler
-            WHERE status = 'aktiv'
-            GROUP BY kategorie
-            ORDER BY anzahl DESC
-        """)
-        kategorien_rows = cursor.fetchall()
-
-        kategorien = {}
-        for row in kategorien_rows:
-            kategorien[row['kategorie']] = {
-                'anzahl': row['anzahl'],
-                'erfolgsrate': round(row['avg_rate'] or 0, 1),
-                'nutzungen': row['nutzungen'] or 0,
-                'similar_matches': row['similar_total'] or 0
-            }
-
-        # Top 5 haeufigste Fehler
-        cursor.execute("""
-            SELECT muster, kategorie, anzahl, erfolgsrate
-            FROM fehler
-            WHERE status = 'aktiv'
-            ORDER BY anzahl DESC
-            LIMIT 5
-        """)
-        top_fehler = [dict(row) for row in cursor.fetchall()]
-
-        # Severity-Verteilung
-        cursor.execute("""
-            SELECT severity, COUNT(*) as count
-            FROM fehler
-            WHERE status = 'aktiv'
-            GROUP BY severity
-        """)
-        severity_rows = cursor.fetchall()
-        severity_verteilung = {row['severity']: row['count'] for row in severity_rows}
-
-        conn.close()
-
-        return {
-            'gesamt': gesamt,
-            'aktiv': aktiv,
-            'veraltet': veraltet,
-            'geloest': geloest,
-            'durchschnitt_erfolgsrate': round(avg_rate, 1),
-            'total_nutzungen': total_nutzungen,
-            'kategorien': kategorien,
-            'top_fehler': top_fehler,
-            'severity_verteilung': severity_verteilung
-        }
-
-    except Exception as e:
-        logger.error(f"Fehler bei get_fehler_stats: {e}")
-        return {
-            'gesamt': 0,
-            'aktiv': 0,
-            'veraltet': 0,
-            'geloest': 0,
-            'error': str(e)
-        }
+    logger.debug("Sammle Fehler-Statistiken")
+    return get_stats_engine().get_stats()
 
 
 def run_fehler_maintenance() -> dict:
@@ -1661,8 +1602,8 @@ def run_fehler_maintenance() -> dict:
     # 3. Statistiken sammeln
     results['stats'] = get_fehler_stats()
 
-    logger.info(f"Wartung abgeschlossen: {results['deduplizierung']['merged_count']} gemerged, "
-                f"{results['cleanup']['deleted_count']} geloescht")
+    logger.info("Wartung abgeschlossen: %s gemerged, %s geloescht",
+                results['deduplizierung']['merged_count'], results['cleanup']['deleted_count'])
 
     return results
 
@@ -1681,7 +1622,7 @@ def get_projekt_analyse(projekt_id: int) -> dict | None:
     Returns:
         dict: Komplette Projekt-Daten fuer Analyse, oder None
     """
-    logger.debug(f"Sammle Analyse-Daten fuer Projekt {projekt_id}")
+    logger.debug("Sammle Analyse-Daten fuer Projekt %s", projekt_id)
 
     try:
         conn = get_db()
@@ -1692,7 +1633,7 @@ def get_projekt_analyse(projekt_id: int) -> dict | None:
         projekt_row = cursor.fetchone()
         if not projekt_row:
             conn.close()
-            logger.warning(f"Projekt {projekt_id} nicht gefunden fuer Analyse")
+            logger.warning("Projekt %s nicht gefunden fuer Analyse", projekt_id)
             return None
 
         projekt = dict(projekt_row)
@@ -1783,7 +1724,7 @@ def get_projekt_analyse(projekt_id: int) -> dict | None:
         }
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler bei Projekt-Analyse fuer {projekt_id}: {e}")
+        logger.error("Fehler bei Projekt-Analyse fuer %s: %s", projekt_id, e)
         return None
 
 
@@ -1829,7 +1770,7 @@ def get_projekt_uebergaben(projekt_id: int) -> list[dict]:
         return uebergaben
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden der Uebergaben fuer Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Laden der Uebergaben fuer Projekt %s: %s", projekt_id, e)
         return []
 
 
@@ -1846,7 +1787,7 @@ def save_uebergabe(projekt_id: int, auftrag_id: int | None, datei_pfad: str, dat
     Returns:
         int: ID der neuen Uebergabe
     """
-    logger.info(f"Speichere Uebergabe fuer Projekt {projekt_id}: {datei_name}")
+    logger.info("Speichere Uebergabe fuer Projekt %s: %s", projekt_id, datei_name)
 
     try:
         conn = get_db()
@@ -1861,11 +1802,11 @@ def save_uebergabe(projekt_id: int, auftrag_id: int | None, datei_pfad: str, dat
         conn.commit()
         conn.close()
 
-        logger.info(f"Uebergabe gespeichert mit ID: {uebergabe_id}")
+        logger.info("Uebergabe gespeichert mit ID: %s", uebergabe_id)
         return uebergabe_id
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Speichern der Uebergabe: {e}")
+        logger.error("Fehler beim Speichern der Uebergabe: %s", e)
         return 0
 
 
@@ -1905,7 +1846,7 @@ def get_uebergabe(uebergabe_id: int) -> dict | None:
         return dict(row) if row else None
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden der Uebergabe {uebergabe_id}: {e}")
+        logger.error("Fehler beim Laden der Uebergabe %s: %s", uebergabe_id, e)
         return None
 
 
@@ -1919,7 +1860,7 @@ def delete_uebergabe(uebergabe_id: int) -> bool:
     Returns:
         bool: True wenn erfolgreich
     """
-    logger.info(f"Loesche Uebergabe {uebergabe_id}")
+    logger.info("Loesche Uebergabe %s", uebergabe_id)
 
     try:
         conn = get_db()
@@ -1931,28 +1872,39 @@ def delete_uebergabe(uebergabe_id: int) -> bool:
 
         if not row:
             conn.close()
-            logger.warning(f"Uebergabe {uebergabe_id} nicht gefunden")
+            logger.warning("Uebergabe %s nicht gefunden", uebergabe_id)
             return False
 
         datei_pfad = row['datei_pfad']
 
         # Aus DB loeschen
         cursor.execute("DELETE FROM uebergaben WHERE id = ?", (uebergabe_id,))
+
+        # Dateien im Blob Store koennen von mehreren Uebergaben geteilt werden
+        cursor.execute("SELECT COUNT(*) FROM uebergaben WHERE datei_pfad = ?", (datei_pfad,))
+        weitere_referenzen = cursor.fetchone()[0]
+
         conn.commit()
         conn.close()
 
+        if weitere_referenzen:
+            logger.debug("Datei bleibt erhalten (%s weitere Uebergaben): %s", weitere_referenzen, datei_pfad)
+            return True
+
         # Physische Datei loeschen
         try:
             if os.path.exists(datei_pfad):
-                os.remove(datei_pfad)
-                logger.debug(f"Datei geloescht: {datei_pfad}")
+                from app.services.blob_store import get_blob_store
+
+                get_blob_store().delete(datei_pfad)
+                logger.debug("Datei geloescht: %s", datei_pfad)
         except OSError as e:
-            logger.warning(f"Konnte Datei nicht loeschen: {datei_pfad} - {e}")
+            logger.warning("Konnte Datei nicht loeschen: %s - %s", datei_pfad, e)
 
         return True
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Loeschen der Uebergabe {uebergabe_id}: {e}")
+        logger.error("Fehler beim Loeschen der Uebergabe %s: %s", uebergabe_id, e)
         return False
 
 
@@ -1985,7 +1937,7 @@ def get_current_auftrag_for_projekt(projekt_id: int) -> dict | None:
         return dict(row) if row else None
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden des aktuellen Auftrags fuer Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Laden des aktuellen Auftrags fuer Projekt %s: %s", projekt_id, e)
         return None
 
 
@@ -2032,7 +1984,7 @@ def get_chat_messages(projekt_id: int, limit: int = 50) -> list[dict]:
         return messages
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Laden der Chat-Nachrichten fuer Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Laden der Chat-Nachrichten fuer Projekt %s: %s", projekt_id, e)
         return []
 
 
@@ -2062,11 +2014,11 @@ def save_chat_message(projekt_id: int, typ: str, inhalt: str, auftrag_id: int |
         conn.commit()
         conn.close()
 
-        logger.debug(f"Chat-Nachricht gespeichert: Typ={typ}, Projekt={projekt_id}")
+        logger.debug("Chat-Nachricht gespeichert: Typ=%s, Projekt=%s", typ, projekt_id)
         return message_id
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Speichern der Chat-Nachricht: {e}")
+        logger.error("Fehler beim Speichern der Chat-Nachricht: %s", e)
         return 0
 
 
@@ -2080,7 +2032,7 @@ def delete_chat_messages(projekt_id: int) -> bool:
     Returns:
         bool: True wenn erfolgreich
     """
-    logger.info(f"Loesche alle Chat-Nachrichten fuer Projekt {projekt_id}")
+    logger.info("Loesche alle Chat-Nachrichten fuer Projekt %s", projekt_id)
 
     try:
         conn = get_db()
@@ -2091,11 +2043,11 @@ def delete_chat_messages(projekt_id: int) -> bool:
         conn.commit()
         conn.close()
 
-        logger.info(f"{deleted} Chat-Nachrichten geloescht fuer Projekt {projekt_id}")
+        logger.info("%s Chat-Nachrichten geloescht fuer Projekt %s", deleted, projekt_id)
         return True
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Loeschen der Chat-Nachrichten fuer Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Loeschen der Chat-Nachrichten fuer Projekt %s: %s", projekt_id, e)
         return False
 
 
@@ -2119,5 +2071,5 @@ def get_chat_message_count(projekt_id: int) -> int:
         return count
 
     except sqlite3.Error as e:
-        logger.error(f"Fehler beim Zaehlen der Chat-Nachrichten fuer Projekt {projekt_id}: {e}")
+        logger.error("Fehler beim Zaehlen der Chat-Nachrichten fuer Projekt %s: %s", projekt_id, e)
         return 0
@@ -6,11 +6,18 @@ Extrahiert Text aus PDF- und DOCX-Dateien fuer Projekt-Upload.
 
 import logging
 import os
+import shutil
+import tempfile
+import threading
+import time
 from typing import Any
 
 # Logger konfigurieren
 logger = logging.getLogger(__name__)
 
+# Bei Aenderungen an der Extraktion erhoehen (invalidiert den Extraktions-Cache)
+EXTRACTOR_VERSION = '2'
+
 
 def extract_text_from_file(file: Any, filename: str) -> tuple[str, str | None]:
     """
@@ -21,6 +28,9 @@ def extract_text_from_file(file: Any, filename: str) -> tuple[str, str | None]:
         - Word (.docx, .doc)
         - Text (.txt, .md)
 
+    Erfolgreiche Extraktionen werden per Inhalts-Hash gecacht
+    (siehe app/services/extraction_cache.py).
+
     Args:
         file: Werkzeug FileStorage Objekt
         filename: Original-Dateiname
@@ -28,67 +38,366 @@ def extract_text_from_file(file: Any, filename: str) -> tuple[str, str | None]:
     Returns:
         tuple: (extrahierter_text, fehler_nachricht oder None)
     """
+    from app.services.extraction_cache import get_extraction_cache, hash_upload
+
     ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
 
     try:
-        if ext == 'pdf':
-            return extract_pdf_text(file)
-        elif ext in ['docx', 'doc']:
-            return extract_docx_text(file)
-        elif ext in ['txt', 'md']:
-            return extract_txt_text(file)
-        else:
-            return '', f'Nicht unterstuetztes Format: .{ext}'
+        content_hash = hash_upload(file) if get_extraction_cache().enabled else None
+        return _extract_cached(file, ext, content_hash)
 
     except Exception as e:
         logger.error(f"Fehler beim Extrahieren aus {filename}: {e}")
         return '', f'Fehler beim Extrahieren: {str(e)}'
 
 
+def extract_text_from_upload(upload: Any) -> tuple[str, str | None]:
+    """
+    Extrahiert Text aus einem gespoolten Upload (siehe upload_spool.py).
+
+    Hash und Encoding stammen aus dem Spool-Durchlauf, die Datei wird
+    direkt vom Pfad gelesen und nicht erneut kopiert.
+
+    Args:
+        upload: SpooledUpload
+
+    Returns:
+        tuple: (extrahierter_text, fehler_nachricht oder None)
+    """
+    try:
+        return _extract_cached(upload.path, upload.ext, upload.sha256, upload.encoding)
+
+    except Exception as e:
+        logger.error(f"Fehler beim Extrahieren aus {upload.filename}: {e}")
+        return '', f'Fehler beim Extrahieren: {str(e)}'
+
+
+def _extract_cached(
+    source: Any,
+    ext: str,
+    content_hash: str | None,
+    encoding: str | None = None
+) -> tuple[str, str | None]:
+    """
+    Waehlt den Extraktor nach Dateiendung, mit Extraktions-Cache.
+
+    Args:
+        source: Dateipfad oder binaeres File-Objekt
+        ext: Dateiendung in Kleinbuchstaben
+        content_hash: SHA-256 des Inhalts (None = ohne Cache)
+        encoding: Bekanntes Text-Encoding fuer TXT/MD (optional)
+
+    Returns:
+        tuple: (extrahierter_text, fehler_nachricht oder None)
+    """
+    from app.services.extraction_cache import cache_key, get_extraction_cache
+
+    if ext == 'pdf':
+        extract = extract_pdf_text
+    elif ext in ['docx', 'doc']:
+        extract = extract_docx_text
+    elif ext in ['txt', 'md']:
+        def extract(src):
+            return extract_txt_text(src, encoding=encoding)
+    else:
+        return '', f'Nicht unterstuetztes Format: .{ext}'
+
+    cache = get_extraction_cache()
+    key = None
+    if content_hash and cache.enabled:
+        key = cache_key(content_hash, ext, EXTRACTOR_VERSION)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached, None
+
+    text, error = extract(source)
+
+    if key and not error:
+        cache.put(key, text)
+    return text, error
+
+
+# ========================================
+# PDF-EXTRAKTION
+# ========================================
+
+# Ab dieser Seitenzahl wird auf mehrere Prozesse verteilt
+PDF_PARALLEL_MIN_PAGES = int(os.getenv('PDF_PARALLEL_MIN_PAGES', '40'))
+
+# Anzahl Worker-Prozesse (0 = immer sequentiell im Request-Thread)
+PDF_EXTRACT_WORKERS = int(os.getenv('PDF_EXTRACT_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+# Zeitbudget pro Upload in Sekunden
+PDF_EXTRACT_TIME_BUDGET = float(os.getenv('PDF_EXTRACT_TIME_BUDGET', '30'))
+
+# Seiten mit weniger Zeichen im Text-Layer werden layout-basiert nachextrahiert
+PDF_MIN_PAGE_CHARS = 20
+
+# Prozess-Pool (lazy, wird zwischen Uploads wiederverwendet)
+_pdf_pool = None
+_pdf_pool_size = 0
+_pdf_pool_lock = threading.Lock()
+
+
+def _text_layer_usable(text: str) -> bool:
+    """
+    Prueft ob der Text-Layer einer Seite brauchbar ist.
+
+    Args:
+        text: Ergebnis des schnellen Durchlaufs
+
+    Returns:
+        bool: False bei (fast) leerer Seite oder kaputtem Encoding
+    """
+    stripped = text.strip()
+    if len(stripped) < PDF_MIN_PAGE_CHARS:
+        return False
+    # Viele Ersatzzeichen = fehlende ToUnicode-Map, Layout-Extraktion versuchen
+    return stripped.count('\ufffd') < len(stripped) * 0.1
+
+
+def _extract_page_range(path: str, start: int, end: int, deadline: float) -> list[tuple[int, str, str]]:
+    """
+    Extrahiert die Seiten [start, end) einer PDF-Datei.
+
+    Erst schneller Durchlauf ueber den Text-Layer (pypdfium2), nur fuer
+    unbrauchbare Seiten layout-basierte Extraktion mit pdfplumber. Laeuft
+    im Worker-Prozess oder sequentiell im Request-Thread.
+
+    Args:
+        path: Pfad zur PDF-Datei
+        start: Erste Seite (0-basiert)
+        end: Seite nach der letzten
+        deadline: time.time()-Grenze; danach keine Layout-Extraktion mehr
+
+    Returns:
+        list: (seiten_index, text, methode) mit methode 'text', 'layout',
+              'leer' oder 'timeout'
+    """
+    results: dict[int, tuple[str, str]] = {}
+
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        pdfium = None
+
+    if pdfium is not None:
+        doc = pdfium.PdfDocument(path)
+        try:
+            for index in range(start, end):
+                page = doc[index]
+                textpage = page.get_textpage()
+                text = textpage.get_text_range().replace('\r\n', '\n')
+                textpage.close()
+                page.close()
+                if _text_layer_usable(text):
+                    results[index] = (text, 'text')
+        finally:
+            doc.close()
+
+    missing = [index for index in range(start, end) if index not in results]
+    if missing:
+        import pdfplumber
+
+        with pdfplumber.open(path) as pdf:
+            for index in missing:
+                if time.time() > deadline:
+                    results[index] = ('', 'timeout')
+                    continue
+                page = pdf.pages[index]
+                text = page.extract_text() or ''
+                results[index] = (text, 'layout' if text.strip() else 'leer')
+                # Seiten-Cache von pdfplumber freigeben
+                page.close()
+
+    return [(index, *results[index]) for index in range(start, end)]
+
+
+def _count_pdf_pages(path: str) -> int:
+    """Ermittelt die Seitenzahl ohne Inhalte zu parsen."""
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        import pdfplumber
+
+        with pdfplumber.open(path) as pdf:
+            return len(pdf.pages)
+
+    doc = pdfium.PdfDocument(path)
+    try:
+        return len(doc)
+    finally:
+        doc.close()
+
+
+def _get_pdf_pool(workers: int):
+    """
+    Gibt den Prozess-Pool fuer die PDF-Extraktion zurueck.
+
+    Verwendet 'spawn', damit keine Locks oder Verbindungen aus dem
+    (multi-threaded) Server-Prozess in die Worker geforkt werden.
+
+    Args:
+        workers: Mindestanzahl Worker-Prozesse
+    """
+    global _pdf_pool, _pdf_pool_size
+    with _pdf_pool_lock:
+        if _pdf_pool is None or _pdf_pool_size < workers:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            if _pdf_pool is not None:
+                _pdf_pool.shutdown(wait=False)
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            _pdf_pool_size = workers
+        return _pdf_pool
+
+
+def _split_pages(page_count: int, parts: int) -> list[tuple[int, int]]:
+    """Teilt [0, page_count) in bis zu `parts` zusammenhaengende Bereiche."""
+    parts = max(1, min(parts, page_count))
+    size, rest = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        end = start + size + (1 if i < rest else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def extract_pdf_pages(
+    path: str,
+    workers: int | None = None,
+    time_budget: float | None = None
+) -> tuple[list[tuple[int, str, str]], bool]:
+    """
+    Extrahiert alle Seiten einer PDF-Datei, bei vielen Seiten parallel.
+
+    Args:
+        path: Pfad zur PDF-Datei
+        workers: Anzahl Worker-Prozesse (Standard: PDF_EXTRACT_WORKERS)
+        time_budget: Zeitbudget in Sekunden (Standard: PDF_EXTRACT_TIME_BUDGET)
+
+    Returns:
+        tuple: (Liste (seiten_index, text, methode) in Seitenreihenfolge,
+                vollstaendig) - vollstaendig ist False wenn das Budget
+                ueberschritten wurde
+    """
+    from concurrent.futures import TimeoutError as FuturesTimeout, wait
+
+    workers = PDF_EXTRACT_WORKERS if workers is None else workers
+    time_budget = PDF_EXTRACT_TIME_BUDGET if time_budget is None else time_budget
+    deadline = time.time() + time_budget
+
+    page_count = _count_pdf_pages(path)
+
+    if workers <= 1 or page_count < PDF_PARALLEL_MIN_PAGES:
+        pages = _extract_page_range(path, 0, page_count, deadline)
+        return pages, all(method != 'timeout' for _, _, method in pages)
+
+    # Mehr Bereiche als Worker, damit langsame Seiten sich besser verteilen
+    pool = _get_pdf_pool(workers)
+    futures = [
+        pool.submit(_extract_page_range, path, start, end, deadline)
+        for start, end in _split_pages(page_count, workers * 2)
+    ]
+
+    done, not_done = wait(futures, timeout=max(0.0, deadline - time.time()) + 1.0)
+    for future in not_done:
+        future.cancel()
+
+    pages = []
+    for future in futures:
+        if future not in done:
+            continue
+        try:
+            pages.extend(future.result(timeout=0))
+        except FuturesTimeout:
+            continue
+
+    pages.sort(key=lambda page: page[0])
+    complete = (
+        not not_done
+        and len(pages) == page_count
+        and all(method != 'timeout' for _, _, method in pages)
+    )
+    return pages, complete
+
+
 def extract_pdf_text(file: Any) -> tuple[str, str | None]:
     """
     Extrahiert Text aus einer PDF-Datei.
 
+    File-Objekte werden in eine temporaere Datei geschrieben, damit Worker-
+    Prozesse sie selbst oeffnen koennen (siehe extract_pdf_pages).
+
     Args:
-        file: FileStorage Objekt
+        file: Dateipfad oder FileStorage Objekt
 
     Returns:
         tuple: (text, fehler oder None)
     """
     try:
-        import pdfplumber
+        import pdfplumber  # noqa: F401
     except ImportError:
         logger.warning("pdfplumber nicht installiert")
         return '', 'PDF-Extraktion nicht verfuegbar (pdfplumber fehlt)'
 
+    tmp_path = None
     try:
-        text_parts = []
-
-        with pdfplumber.open(file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-
+        if isinstance(file, str):
+            path = file
+        else:
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
+                tmp_path = path = tmp.name
+                if hasattr(file, 'seek'):
+                    file.seek(0)
+                shutil.copyfileobj(file, tmp)
+
+        start = time.perf_counter()
+        pages, complete = extract_pdf_pages(path)
+        elapsed = time.perf_counter() - start
+
+        if not complete:
+            return '', (
+                f'PDF-Extraktion abgebrochen: Zeitbudget von '
+                f'{PDF_EXTRACT_TIME_BUDGET:.0f}s ueberschritten'
+            )
+
+        text_parts = [text for _, text, _ in pages if text]
         text = '\n\n'.join(text_parts)
 
         if not text.strip():
             return '', 'PDF enthaelt keinen extrahierbaren Text (evtl. gescanntes Dokument)'
 
-        logger.info(f"PDF extrahiert: {len(text)} Zeichen aus {len(text_parts)} Seiten")
+        methods = {}
+        for _, _, method in pages:
+            methods[method] = methods.get(method, 0) + 1
+        logger.info(
+            f"PDF extrahiert: {len(text)} Zeichen aus {len(text_parts)} Seiten "
+            f"in {elapsed:.2f}s ({methods})"
+        )
         return text, None
 
     except Exception as e:
         logger.error(f"PDF-Extraktion fehlgeschlagen: {e}")
         return '', f'PDF-Extraktion fehlgeschlagen: {str(e)}'
 
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 
 def extract_docx_text(file: Any) -> tuple[str, str | None]:
     """
     Extrahiert Text aus einer DOCX-Datei.
 
     Args:
-        file: FileStorage Objekt
+        file: Dateipfad oder FileStorage Objekt
 
     Returns:
         tuple: (text, fehler oder None)
@@ -115,28 +424,45 @@ def extract_docx_text(file: Any) -> tuple[str, str | None]:
         return '', f'DOCX-Extraktion fehlgeschlagen: {str(e)}'
 
 
-def extract_txt_text(file: Any) -> tuple[str, str | None]:
+def extract_txt_text(file: Any, encoding: str | None = None) -> tuple[str, str | None]:
     """
     Extrahiert Text aus einer TXT/MD-Datei.
 
+    Ohne bekanntes Encoding wird es blockweise erkannt (utf-8, latin-1,
+    cp1252), danach wird die Datei genau einmal dekodiert.
+
     Args:
-        file: FileStorage Objekt
+        file: Dateipfad oder FileStorage Objekt
+        encoding: Bereits bekanntes Encoding (z.B. aus spool_upload)
 
     Returns:
         tuple: (text, fehler oder None)
     """
+    from app.services.upload_spool import CHUNK_SIZE, EncodingSniffer
+
+    if isinstance(file, str):
+        with open(file, 'rb') as f:
+            return extract_txt_text(f, encoding=encoding)
+
     try:
-        # Versuche verschiedene Encodings
-        for encoding in ['utf-8', 'latin-1', 'cp1252']:
-            try:
-                file.seek(0)
-                text = file.read().decode(encoding)
-                logger.info(f"TXT extrahiert: {len(text)} Zeichen (Encoding: {encoding})")
-                return text, None
-            except UnicodeDecodeError:
-                continue
-
-        return '', 'Datei konnte nicht dekodiert werden (unbekanntes Encoding)'
+        if encoding is None:
+            sniffer = EncodingSniffer()
+            file.seek(0)
+            while True:
+                chunk = file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                sniffer.feed(chunk)
+            sniffer.feed(b'', final=True)
+            encoding = sniffer.encoding
+
+        if encoding is None:
+            return '', 'Datei konnte nicht dekodiert werden (unbekanntes Encoding)'
+
+        file.seek(0)
+        text = file.read().decode(encoding)
+        logger.info(f"TXT extrahiert: {len(text)} Zeichen (Encoding: {encoding})")
+        return text, None
 
     except Exception as e:
         logger.error(f"TXT-Extraktion fehlgeschlagen: {e}")
@@ -0,0 +1,270 @@
+"""
+NEXUS OVERLORD v2.0 - Cache fuer Dokument-Extraktion
+
+Extrahierter Text aus PDF/DOCX/TXT-Uploads wird auf der Platte gecacht.
+Wird derselbe Plan erneut hochgeladen, entfaellt das Parsen komplett.
+
+Key: SHA-256 ueber Extraktor-Version, Dateiformat und Datei-Inhalt.
+Speicher: eigene SQLite-Datenbank (wie der Session-Store), die am
+laengsten nicht genutzten Eintraege werden oberhalb von
+EXTRACTION_CACHE_MAX_MB entfernt.
+
+Treffer und Fehlschlaege werden gezaehlt (stats()) und geloggt.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Pfad der Cache-Datenbank (getrennt von nexus.db)
+EXTRACTION_CACHE_PATH = os.getenv('EXTRACTION_CACHE_PATH', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    'database',
+    'extraction_cache.db'
+))
+
+# Maximale Groesse des Caches in MB (0 = Cache deaktiviert)
+EXTRACTION_CACHE_MAX_MB = float(os.getenv('EXTRACTION_CACHE_MAX_MB', '200'))
+
+# Blockgroesse beim Hashen von Uploads
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def hash_upload(file: Any) -> str:
+    """
+    Berechnet SHA-256 eines Uploads blockweise und spult danach zurueck.
+
+    Args:
+        file: FileStorage oder binaeres File-Objekt
+
+    Returns:
+        str: Hex-Digest
+    """
+    digest = hashlib.sha256()
+    file.seek(0)
+    while True:
+        chunk = file.read(HASH_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def cache_key(content_hash: str, ext: str, extractor_version: str) -> str:
+    """
+    Baut den Cache-Key aus Inhalts-Hash, Format und Extraktor-Version.
+
+    Args:
+        content_hash: SHA-256 des Datei-Inhalts
+        ext: Dateiendung (z.B. 'pdf')
+        extractor_version: EXTRACTOR_VERSION aus document_extractor
+
+    Returns:
+        str: SHA-256 Hex-Digest
+    """
+    raw = f"{extractor_version}:{ext}:{content_hash}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ExtractionCache:
+    """
+    SQLite-basierter LRU-Cache fuer extrahierten Text.
+
+    Attributes:
+        db_path: Pfad zur SQLite-Datei
+        max_bytes: Groessenlimit fuer alle Eintraege zusammen
+    """
+
+    def __init__(self, db_path: str = EXTRACTION_CACHE_PATH,
+                 max_mb: float = EXTRACTION_CACHE_MAX_MB):
+        """
+        Initialisiert den Cache und legt die Tabelle bei Bedarf an.
+
+        Args:
+            db_path: Pfad zur SQLite-Datei
+            max_mb: Groessenlimit in MB (0 = deaktiviert)
+        """
+        self.db_path = db_path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if not self.enabled:
+            return
+
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS extraction_cache (
+                    key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_extraction_cache_last_used "
+                "ON extraction_cache(last_used)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    @property
+    def enabled(self) -> bool:
+        """True wenn der Cache aktiv ist."""
+        return self.max_bytes > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Oeffnet eine Verbindung zur Cache-Datenbank.
+
+        Returns:
+            sqlite3.Connection: Datenbankverbindung
+        """
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def get(self, key: str) -> str | None:
+        """
+        Liefert den gecachten Text und zaehlt Treffer/Fehlschlag.
+
+        Args:
+            key: Key aus cache_key()
+
+        Returns:
+            str | None: Extrahierter Text oder None
+        """
+        if not self.enabled:
+            return None
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT text FROM extraction_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE extraction_cache SET last_used = ? WHERE key = ?",
+                    (time.time(), key)
+                )
+                conn.commit()
+        finally:
+            conn.close()
+
+        with self._lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+            rate = self.hits / (self.hits + self.misses) * 100
+
+        logger.info(
+            f"Extraktions-Cache {'Treffer' if row else 'Fehlschlag'} "
+            f"({key[:12]}, Trefferquote {rate:.0f}%)"
+        )
+        return row[0] if row else None
+
+    def put(self, key: str, text: str) -> None:
+        """
+        Speichert extrahierten Text und haelt das Groessenlimit ein.
+
+        Args:
+            key: Key aus cache_key()
+            text: Extrahierter Text
+        """
+        if not self.enabled:
+            return
+
+        size = len(text.encode('utf-8'))
+        if size > self.max_bytes:
+            logger.debug(f"Extraktion zu gross fuer Cache: {size} Bytes")
+            return
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO extraction_cache (key, text, size, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, text, size, time.time())
+            )
+            self._evict(conn)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Entfernt die am laengsten nicht genutzten Eintraege ueber max_bytes."""
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM extraction_cache"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in conn.execute(
+            "SELECT key, size FROM extraction_cache ORDER BY last_used ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM extraction_cache WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+
+        logger.info(f"Extraktions-Cache: {evicted} Eintraege verdraengt")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Liefert Kennzahlen des Caches.
+
+        Returns:
+            dict: hits, misses, hit_rate (%), entries, bytes, max_bytes, enabled
+        """
+        entries, total = 0, 0
+        if self.enabled:
+            conn = self._connect()
+            try:
+                entries, total = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extraction_cache"
+                ).fetchone()
+            finally:
+                conn.close()
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0,
+                'entries': entries,
+                'bytes': total,
+                'max_bytes': self.max_bytes,
+            }
+
+
+# Singleton-Instanz
+_cache: ExtractionCache | None = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """
+    Gibt die Singleton-Instanz des Extraktions-Caches zurueck.
+
+    Returns:
+        ExtractionCache: Die Cache-Instanz
+    """
+    global _cache
+    if _cache is None:
+        _cache = ExtractionCache()
+    return _cache
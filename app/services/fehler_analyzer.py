@@ -7,11 +7,12 @@ Auftrag 5.2: Fuzzy-Matching mit rapidfuzz fuer intelligente Fehlersuche.
 Auftrag 5.3: Intelligentes Merging - Duplikate vermeiden, Learning-Loop.
 """
 
+import asyncio
 import json
 import logging
 import re
 
-from app.services.openrouter import get_client
+from app.services.openrouter import get_async_client, get_client
 from app.services.database import (
     search_fehler, save_fehler, increment_fehler_count,
     increment_similar_count, search_similar_fehler, get_best_match,
@@ -47,6 +48,85 @@ def analyze_fehler(fehler_text: str, projekt_name: str = "NEXUS OVERLORD", proje
     """
     logger.info(f"Analysiere Fehler fuer Projekt: {projekt_name}")
 
+    auto_analyse, similar_fehler, bekannt = _suche_bekannten_fehler(fehler_text, projekt_id)
+    if bekannt:
+        return bekannt
+
+    # 2. Neuer Fehler -> KI-Analyse
+    try:
+        logger.info("Neuer Fehler - starte KI-Analyse")
+
+        # Gemini 3 Pro analysiert den Fehler
+        ki_analyse = _analyze_with_gemini(fehler_text)
+
+        # Opus 4.5 erstellt Loesungs-Auftrag
+        auftrag = _create_auftrag_with_opus(fehler_text, ki_analyse, projekt_name)
+
+        return _speichere_neuen_fehler(fehler_text, ki_analyse, auftrag, auto_analyse,
+                                       similar_fehler, projekt_id)
+
+    except Exception as e:
+        logger.error(f"KI-Analyse fehlgeschlagen: {e}")
+        return _fallback_ergebnis(fehler_text, auto_analyse, similar_fehler, e)
+
+
+async def analyze_fehler_async(
+    fehler_text: str,
+    projekt_name: str = "NEXUS OVERLORD",
+    projekt_id: int | None = None
+) -> dict:
+    """
+    Async Variante von analyze_fehler() fuer async Views.
+
+    Fuzzy-Suche und Speichern (SQLite, rapidfuzz) laufen per
+    asyncio.to_thread, damit die Event-Loop frei bleibt.
+
+    Args:
+        fehler_text: Fehler-Text vom User
+        projekt_name: Name des Projekts
+        projekt_id: Optional - Projekt-ID fuer Verknuepfung
+
+    Returns:
+        dict: Erweiterte Fehler-Analyse wie analyze_fehler()
+    """
+    logger.info(f"Analysiere Fehler fuer Projekt: {projekt_name} (async)")
+
+    auto_analyse, similar_fehler, bekannt = await asyncio.to_thread(
+        _suche_bekannten_fehler, fehler_text, projekt_id
+    )
+    if bekannt:
+        return bekannt
+
+    try:
+        logger.info("Neuer Fehler - starte KI-Analyse")
+        client = get_async_client()
+
+        response = await client.call_gemini(_gemini_messages(fehler_text), temperature=0.3,
+                                            timeout=30, call_site='fehler_analyse')
+        ki_analyse = _parse_gemini_analyse(response, fehler_text)
+
+        auftrag = await client.call_sonnet(_opus_messages(fehler_text, ki_analyse, projekt_name),
+                                           temperature=0.3, timeout=30, call_site='fehler_auftrag')
+
+        return await asyncio.to_thread(_speichere_neuen_fehler, fehler_text, ki_analyse, auftrag,
+                                       auto_analyse, similar_fehler, projekt_id)
+
+    except Exception as e:
+        logger.error(f"KI-Analyse fehlgeschlagen: {e}")
+        return _fallback_ergebnis(fehler_text, auto_analyse, similar_fehler, e)
+
+
+def _suche_bekannten_fehler(fehler_text: str, projekt_id: int | None) -> tuple[dict, list, dict | None]:
+    """
+    Vor-Analyse und Suche in der Fehler-Datenbank (Fuzzy, dann exakt).
+
+    Args:
+        fehler_text: Fehler-Text vom User
+        projekt_id: Optional - Projekt-ID
+
+    Returns:
+        tuple: (auto_analyse, similar_fehler, Ergebnis oder None wenn unbekannt)
+    """
     # 0. Automatische Vor-Analyse mit Helper
     auto_analyse = helper_analyze(fehler_text, projekt_id)
     kategorie = auto_analyse['kategorie']
@@ -69,7 +149,7 @@ def analyze_fehler(fehler_text: str, projekt_name: str = "NEXUS OVERLORD", proje
         if best_match.get('muster') and best_match['muster'] not in fehler_text:
             increment_similar_count(best_match['id'])
 
-        return {
+        return auto_analyse, similar_fehler, {
             'bekannt': True,
             'match_score': best_match.get('match_score', 0),
             'kategorie': best_match.get('kategorie', kategorie),
@@ -93,7 +173,7 @@ def analyze_fehler(fehler_text: str, projekt_name: str = "NEXUS OVERLORD", proje
         logger.info(f"Exakter Match gefunden: ID {bekannter_fehler['id']}")
         increment_fehler_count(bekannter_fehler['id'])
 
-        return {
+        return auto_analyse, similar_fehler, {
             'bekannt': True,
             'match_score': 100.0,
             'kategorie': bekannter_fehler.get('kategorie', kategorie),
@@ -111,78 +191,113 @@ def analyze_fehler(fehler_text: str, projekt_name: str = "NEXUS OVERLORD", proje
             'similar_fehler': similar_fehler[:2]
         }
 
-    # 2. Neuer Fehler -> KI-Analyse
-    try:
-        logger.info("Neuer Fehler - starte KI-Analyse")
+    return auto_analyse, similar_fehler, None
 
-        # Gemini 3 Pro analysiert den Fehler
-        ki_analyse = _analyze_with_gemini(fehler_text)
 
-        # Kombiniere KI-Analyse mit Auto-Analyse
-        final_kategorie = ki_analyse.get('kategorie', kategorie)
-        final_severity = detect_severity(fehler_text, final_kategorie)
+def _speichere_neuen_fehler(
+    fehler_text: str,
+    ki_analyse: dict,
+    auftrag: str,
+    auto_analyse: dict,
+    similar_fehler: list,
+    projekt_id: int | None
+) -> dict:
+    """
+    Speichert einen neu analysierten Fehler (oder merged ihn) und baut das Ergebnis.
 
-        # Opus 4.5 erstellt Loesungs-Auftrag
-        auftrag = _create_auftrag_with_opus(fehler_text, ki_analyse, projekt_name)
+    Args:
+        fehler_text: Fehler-Text vom User
+        ki_analyse: Analyse von Gemini
+        auftrag: Loesungs-Auftrag von Opus
+        auto_analyse: Ergebnis der Vor-Analyse (helper_analyze)
+        similar_fehler: Aehnliche Fehler aus der Fuzzy-Suche
+        projekt_id: Optional - Projekt-ID
 
-        # Fehler in Datenbank speichern ODER mit aehnlichem mergen (Auftrag 5.3)
-        merge_result = save_or_merge_fehler(
-            muster=ki_analyse.get('muster', fehler_text[:100]),
-            kategorie=final_kategorie,
-            loesung=ki_analyse.get('loesung', 'Keine Loesung gefunden'),
-            projekt_id=projekt_id,
-            severity=final_severity,
-            tags=tags,
-            stack_trace=fehler_text if len(fehler_text) > 200 else None,
-            fix_command=ki_analyse.get('fix_command', fix_command)
-        )
+    Returns:
+        dict: Fehler-Analyse
+    """
+    kategorie = auto_analyse['kategorie']
+    tags = auto_analyse['tags']
+    fix_command = auto_analyse['fix_command']
 
-        fehler_id = merge_result['fehler_id']
-        was_merged = merge_result['merged']
+    # Kombiniere KI-Analyse mit Auto-Analyse
+    final_kategorie = ki_analyse.get('kategorie', kategorie)
+    final_severity = detect_severity(fehler_text, final_kategorie)
+
+    # Fehler in Datenbank speichern ODER mit aehnlichem mergen (Auftrag 5.3)
+    merge_result = save_or_merge_fehler(
+        muster=ki_analyse.get('muster', fehler_text[:100]),
+        kategorie=final_kategorie,
+        loesung=ki_analyse.get('loesung', 'Keine Loesung gefunden'),
+        projekt_id=projekt_id,
+        severity=final_severity,
+        tags=tags,
+        stack_trace=fehler_text if len(fehler_text) > 200 else None,
+        fix_command=ki_analyse.get('fix_command', fix_command)
+    )
+
+    fehler_id = merge_result['fehler_id']
+    was_merged = merge_result['merged']
+
+    logger.info(f"Fehler {'gemerged' if was_merged else 'erstellt'} mit ID: {fehler_id}")
+
+    return {
+        'bekannt': was_merged,  # Wenn gemerged, dann war es quasi bekannt
+        'match_score': merge_result.get('match_score', 0),
+        'merged': was_merged,
+        'merge_action': merge_result.get('action', 'unknown'),
+        'kategorie': final_kategorie,
+        'severity': final_severity,
+        'status': 'aktiv',
+        'tags': tags,
+        'ursache': ki_analyse.get('ursache', 'Unbekannt'),
+        'loesung': ki_analyse.get('loesung', 'Keine Loesung gefunden'),
+        'fix_command': ki_analyse.get('fix_command', fix_command),
+        'auftrag': auftrag,
+        'fehler_id': fehler_id,
+        'erfolgsrate': 100 if not was_merged else 50,  # Bei Merge: neutrale Rate
+        'anzahl': 1,
+        'similar_count': 0,
+        'similar_fehler': similar_fehler[:3]  # Zeige aehnliche Fehler als Referenz
+    }
 
-        logger.info(f"Fehler {'gemerged' if was_merged else 'erstellt'} mit ID: {fehler_id}")
 
-        return {
-            'bekannt': was_merged,  # Wenn gemerged, dann war es quasi bekannt
-            'match_score': merge_result.get('match_score', 0),
-            'merged': was_merged,
-            'merge_action': merge_result.get('action', 'unknown'),
-            'kategorie': final_kategorie,
-            'severity': final_severity,
-            'status': 'aktiv',
-            'tags': tags,
-            'ursache': ki_analyse.get('ursache', 'Unbekannt'),
-            'loesung': ki_analyse.get('loesung', 'Keine Loesung gefunden'),
-            'fix_command': ki_analyse.get('fix_command', fix_command),
-            'auftrag': auftrag,
-            'fehler_id': fehler_id,
-            'erfolgsrate': 100 if not was_merged else 50,  # Bei Merge: neutrale Rate
-            'anzahl': 1,
-            'similar_count': 0,
-            'similar_fehler': similar_fehler[:3]  # Zeige aehnliche Fehler als Referenz
-        }
+def _fallback_ergebnis(fehler_text: str, auto_analyse: dict, similar_fehler: list, e: Exception) -> dict:
+    """
+    Ergebnis bei fehlgeschlagener KI-Analyse (nur Auto-Analyse).
 
-    except Exception as e:
-        logger.error(f"KI-Analyse fehlgeschlagen: {e}")
+    Args:
+        fehler_text: Fehler-Text vom User
+        auto_analyse: Ergebnis der Vor-Analyse (helper_analyze)
+        similar_fehler: Aehnliche Fehler aus der Fuzzy-Suche
+        e: Aufgetretener Fehler
 
-        # Fallback bei API-Fehler - nutze Auto-Analyse
-        return {
-            'bekannt': False,
-            'match_score': 0,
-            'kategorie': kategorie,
-            'severity': severity,
-            'status': 'aktiv',
-            'tags': tags,
-            'ursache': f'Analyse fehlgeschlagen: {str(e)}',
-            'loesung': _get_fallback_loesung(fehler_text),
-            'fix_command': fix_command,
-            'auftrag': _get_fallback_auftrag(fehler_text, kategorie, severity),
-            'fehler_id': None,
-            'erfolgsrate': 0,
-            'anzahl': 0,
-            'similar_count': 0,
-            'similar_fehler': similar_fehler[:3]  # Zeige aehnliche Fehler als Referenz
-        }
+    Returns:
+        dict: Fehler-Analyse mit Fallback-Loesung
+    """
+    kategorie = auto_analyse['kategorie']
+    severity = auto_analyse['severity']
+    tags = auto_analyse['tags']
+    fix_command = auto_analyse['fix_command']
+
+    # Fallback bei API-Fehler - nutze Auto-Analyse
+    return {
+        'bekannt': False,
+        'match_score': 0,
+        'kategorie': kategorie,
+        'severity': severity,
+        'status': 'aktiv',
+        'tags': tags,
+        'ursache': f'Analyse fehlgeschlagen: {str(e)}',
+        'loesung': _get_fallback_loesung(fehler_text),
+        'fix_command': fix_command,
+        'auftrag': _get_fallback_auftrag(fehler_text, kategorie, severity),
+        'fehler_id': None,
+        'erfolgsrate': 0,
+        'anzahl': 0,
+        'similar_count': 0,
+        'similar_fehler': similar_fehler[:3]  # Zeige aehnliche Fehler als Referenz
+    }
 
 
 def _analyze_with_gemini(fehler_text: str) -> dict:
@@ -195,8 +310,21 @@ def _analyze_with_gemini(fehler_text: str) -> dict:
     Returns:
         dict: Analyse-Ergebnis mit Kategorie, Ursache, Loesung, Muster, Fix-Command
     """
-    client = get_client()
+    response = get_client().call_gemini(_gemini_messages(fehler_text), temperature=0.3,
+                                        timeout=30, call_site='fehler_analyse')
+    return _parse_gemini_analyse(response, fehler_text)
+
 
+def _gemini_messages(fehler_text: str) -> list[dict]:
+    """
+    Nachrichten fuer die Fehler-Analyse mit Gemini 3 Pro.
+
+    Args:
+        fehler_text: Fehler-Text
+
+    Returns:
+        list: Nachrichten fuer den Client
+    """
     prompt = f"""Du bist ein Fehler-Analyst fuer Software-Entwicklung.
 
 Analysiere diesen Fehler und gib zurueck:
@@ -212,10 +340,20 @@ Fehler-Text:
 Antworte NUR mit einem JSON-Objekt (keine Erklaerungen):
 {{"kategorie": "...", "ursache": "...", "loesung": "...", "muster": "...", "fix_command": "..."}}"""
 
-    messages = [{"role": "user", "content": prompt}]
+    return [{"role": "user", "content": prompt}]
 
-    response = client.call_gemini(messages, temperature=0.3, timeout=30)
 
+def _parse_gemini_analyse(response: str, fehler_text: str) -> dict:
+    """
+    Parst die JSON-Antwort der Fehler-Analyse (mit Fallback).
+
+    Args:
+        response: Antworttext von Gemini
+        fehler_text: Fehler-Text (fuer den Fallback)
+
+    Returns:
+        dict: Analyse-Ergebnis mit Kategorie, Ursache, Loesung, Muster, Fix-Command
+    """
     # JSON aus Antwort extrahieren
     try:
         json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
@@ -245,8 +383,22 @@ def _create_auftrag_with_opus(fehler_text: str, analyse: dict, projekt_name: str
     Returns:
         str: Formatierter Loesungs-Auftrag
     """
-    client = get_client()
+    return get_client().call_sonnet(_opus_messages(fehler_text, analyse, projekt_name),
+                                    temperature=0.3, timeout=30, call_site='fehler_auftrag')
+
+
+def _opus_messages(fehler_text: str, analyse: dict, projekt_name: str) -> list[dict]:
+    """
+    Nachrichten fuer den Loesungs-Auftrag mit Opus 4.5.
 
+    Args:
+        fehler_text: Original Fehler-Text
+        analyse: Analyse von Gemini
+        projekt_name: Projektname
+
+    Returns:
+        list: Nachrichten fuer den Client
+    """
     prompt = f"""Erstelle einen kurzen, praezisen Loesungs-Auftrag fuer Claude Code.
 
 FEHLER:
@@ -279,11 +431,7 @@ Erstelle einen Auftrag im folgenden Format:
 
 Halte es kurz und praezise. Nur das Noetigste."""
 
-    messages = [{"role": "user", "content": prompt}]
-
-    response = client.call_sonnet(messages, temperature=0.3, timeout=30)
-
-    return response
+    return [{"role": "user", "content": prompt}]
 
 
 def _create_quick_auftrag(fehler: dict) -> str:
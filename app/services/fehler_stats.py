@@ -0,0 +1,350 @@
+"""
+NEXUS OVERLORD v2.0 - Fehler-Statistik Engine
+
+Liefert die Statistiken fuer /fehler/stats aus einem einzigen Scan der
+fehler-Tabelle statt aus ~10 separaten Aggregat-Queries.
+
+Ablauf:
+    1. Erster Aufruf (oder nach Invalidierung): ein Full-Scan baut die Zaehler auf
+    2. Schreibende DB-Funktionen melden Aenderungen per record_change()
+       (Insert, Merge, Feedback, Delete) - die Zaehler werden inkrementell angepasst
+    3. get_stats() liefert den materialisierten Stand aus einem kurzen TTL-Cache
+
+Die Zaehler sind pro Prozess. Schreibzugriffe anderer Prozesse und das
+gleitende 7-Tage-Fenster werden durch einen periodischen Full-Scan
+(FEHLER_STATS_REBUILD) eingefangen.
+"""
+
+import heapq
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+from app.services.database import get_db
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Spalten, die fuer die Statistik pro Fehler benoetigt werden
+STATS_COLUMNS = (
+    "id, muster, kategorie, severity, status, erfolgsrate, "
+    "anzahl, similar_count, created_at"
+)
+
+# TTL des materialisierten Ergebnisses (Sekunden)
+CACHE_TTL = float(os.getenv('FEHLER_STATS_TTL', '5'))
+
+# Maximales Alter der Zaehler bevor neu gescannt wird (Sekunden)
+REBUILD_INTERVAL = float(os.getenv('FEHLER_STATS_REBUILD', '300'))
+
+# Anzahl der "Top Fehler" in der Statistik
+TOP_N = 5
+
+
+def _seven_days_cutoff() -> str:
+    """
+    Grenze fuer 'letzte 7 Tage' im Format von SQLite datetime('now', '-7 days').
+
+    Returns:
+        str: UTC-Zeitstempel 'YYYY-MM-DD HH:MM:SS'
+    """
+    return (datetime.utcnow() - timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class FehlerStatsEngine:
+    """
+    Single-Scan Aggregation mit inkrementellen Zaehlern und TTL-Cache.
+
+    Attributes:
+        ttl: Lebensdauer des materialisierten Ergebnisses in Sekunden
+        rebuild_interval: Maximales Alter der Zaehler in Sekunden
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL, rebuild_interval: float = REBUILD_INTERVAL):
+        """
+        Initialisiert die Engine (ohne DB-Zugriff).
+
+        Args:
+            ttl: Lebensdauer des Caches in Sekunden
+            rebuild_interval: Sekunden bis zum naechsten Full-Scan
+        """
+        self.ttl = ttl
+        self.rebuild_interval = rebuild_interval
+        self._lock = threading.Lock()
+        self._built_at: float | None = None
+        self._top_dirty = False
+        self._cached: dict[str, Any] | None = None
+        self._cached_at = 0.0
+        self._reset_counters()
+
+    # ========================================
+    # ZAEHLER
+    # ========================================
+
+    def _reset_counters(self) -> None:
+        """Setzt alle Zaehler auf den Ausgangszustand."""
+        self._gesamt = 0
+        self._status_counts: dict[str, int] = {}
+        self._total_nutzungen = 0
+        self._aktiv_rate_sum = 0.0
+        self._aktiv_rate_count = 0
+        # kategorie -> [anzahl, rate_sum, rate_count, nutzungen, similar]
+        self._kategorien: dict[str | None, list] = {}
+        self._severity_aktiv: dict[str | None, int] = {}
+        self._critical_aktiv = 0
+        self._letzte_7_tage = 0
+        self._top: list[dict] = []
+
+    def _apply(self, row: dict, sign: int, cutoff: str) -> None:
+        """
+        Addiert (sign=1) oder subtrahiert (sign=-1) eine Zeile von den Zaehlern.
+
+        Args:
+            row: Fehler-Zeile mit STATS_COLUMNS
+            sign: +1 oder -1
+            cutoff: Grenze fuer 'letzte 7 Tage'
+        """
+        status = row.get('status')
+        anzahl = row.get('anzahl') or 0
+        rate = row.get('erfolgsrate')
+
+        self._gesamt += sign
+        if status is not None:
+            self._status_counts[status] = self._status_counts.get(status, 0) + sign
+        self._total_nutzungen += sign * anzahl
+
+        created_at = row.get('created_at')
+        if created_at and str(created_at) > cutoff:
+            self._letzte_7_tage += sign
+
+        if status != 'aktiv':
+            return
+
+        if rate is not None:
+            self._aktiv_rate_sum += sign * rate
+            self._aktiv_rate_count += sign
+
+        kat = self._kategorien.setdefault(row.get('kategorie'), [0, 0.0, 0, 0, 0])
+        kat[0] += sign
+        if rate is not None:
+            kat[1] += sign * rate
+            kat[2] += sign
+        kat[3] += sign * anzahl
+        kat[4] += sign * (row.get('similar_count') or 0)
+        if kat[0] <= 0:
+            del self._kategorien[row.get('kategorie')]
+
+        severity = row.get('severity')
+        self._severity_aktiv[severity] = self._severity_aktiv.get(severity, 0) + sign
+        if self._severity_aktiv[severity] <= 0:
+            del self._severity_aktiv[severity]
+
+        if severity == 'critical':
+            self._critical_aktiv += sign
+
+    def _update_top(self, old: dict | None, new: dict | None) -> None:
+        """
+        Pflegt die Top-Liste inkrementell; markiert sie als veraltet wenn das
+        ohne Scan nicht sicher moeglich ist.
+
+        Args:
+            old: Zeile vor der Aenderung (oder None)
+            new: Zeile nach der Aenderung (oder None)
+        """
+        new_aktiv = new is not None and new.get('status') == 'aktiv'
+        old_index = None
+        if old is not None:
+            for i, top in enumerate(self._top):
+                if top['id'] == old['id']:
+                    old_index = i
+                    break
+
+        if old_index is not None:
+            full = len(self._top) == TOP_N
+            self._top.pop(old_index)
+            if not new_aktiv or (new.get('anzahl') or 0) < (old.get('anzahl') or 0):
+                # Ein unbekannter Kandidat koennte nachruecken
+                if full:
+                    self._top_dirty = True
+                return
+
+        if not new_aktiv:
+            return
+
+        entry = {
+            'id': new['id'],
+            'muster': new.get('muster'),
+            'kategorie': new.get('kategorie'),
+            'anzahl': new.get('anzahl'),
+            'erfolgsrate': new.get('erfolgsrate'),
+        }
+        if len(self._top) < TOP_N or (entry['anzahl'] or 0) > (self._top[-1]['anzahl'] or 0):
+            self._top.append(entry)
+            self._top.sort(key=lambda t: t['anzahl'] or 0, reverse=True)
+            del self._top[TOP_N:]
+
+    # ========================================
+    # FULL-SCAN
+    # ========================================
+
+    def _rebuild(self) -> None:
+        """
+        Baut alle Zaehler mit genau einem Scan der fehler-Tabelle neu auf.
+
+        Raises:
+            sqlite3.Error: Bei Datenbankfehlern
+        """
+        start = time.perf_counter()
+        cutoff = _seven_days_cutoff()
+
+        conn = get_db()
+        try:
+            cursor = conn.execute(f"SELECT {STATS_COLUMNS} FROM fehler")
+            self._reset_counters()
+            aktiv_rows = []
+            for row in cursor:
+                row = dict(row)
+                self._apply(row, 1, cutoff)
+                if row.get('status') == 'aktiv':
+                    aktiv_rows.append(row)
+        finally:
+            conn.close()
+
+        self._top = [
+            {k: r.get(k) for k in ('id', 'muster', 'kategorie', 'anzahl', 'erfolgsrate')}
+            for r in heapq.nlargest(TOP_N, aktiv_rows, key=lambda r: r.get('anzahl') or 0)
+        ]
+        self._top_dirty = False
+        self._built_at = time.monotonic()
+
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.debug(f"Fehler-Statistik neu aufgebaut: {self._gesamt} Fehler in {elapsed:.1f}ms")
+
+    def _materialize(self) -> dict[str, Any]:
+        """
+        Erzeugt das Statistik-Dict aus den aktuellen Zaehlern.
+
+        Returns:
+            dict: Statistiken im Format von get_fehler_stats()
+        """
+        kategorien = {}
+        for name, (anzahl, rate_sum, rate_count, nutzungen, similar) in sorted(
+            self._kategorien.items(), key=lambda item: item[1][0], reverse=True
+        ):
+            kategorien[name] = {
+                'anzahl': anzahl,
+                'erfolgsrate': round(rate_sum / rate_count, 1) if rate_count else 0,
+                'nutzungen': nutzungen,
+                'similar_matches': similar
+            }
+
+        avg_rate = self._aktiv_rate_sum / self._aktiv_rate_count if self._aktiv_rate_count else 0
+
+        return {
+            'gesamt': self._gesamt,
+            'aktiv': self._status_counts.get('aktiv', 0),
+            'veraltet': self._status_counts.get('veraltet', 0),
+            'geloest': self._status_counts.get('geloest', 0),
+            'durchschnitt_erfolgsrate': round(avg_rate, 1),
+            'total_nutzungen': self._total_nutzungen,
+            'kategorien': kategorien,
+            'top_fehler': [
+                {k: t[k] for k in ('muster', 'kategorie', 'anzahl', 'erfolgsrate')}
+                for t in self._top
+            ],
+            'severity_verteilung': dict(self._severity_aktiv),
+            'critical_aktiv': self._critical_aktiv,
+            'letzte_7_tage': self._letzte_7_tage
+        }
+
+    # ========================================
+    # OEFFENTLICHE API
+    # ========================================
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Liefert die Fehler-Statistiken.
+
+        Returns:
+            dict: Statistiken plus 'computed_at' (ISO-Zeitstempel) und
+                  'source' ('cache' oder 'live')
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._cached is not None and now - self._cached_at < self.ttl:
+                return {**self._cached, 'source': 'cache'}
+
+            try:
+                if (self._built_at is None or self._top_dirty
+                        or now - self._built_at >= self.rebuild_interval):
+                    self._rebuild()
+            except sqlite3.Error as e:
+                logger.error(f"Fehler beim Ermitteln der Fehler-Stats: {e}")
+                self._built_at = None
+                return {
+                    'gesamt': 0,
+                    'aktiv': 0,
+                    'veraltet': 0,
+                    'geloest': 0,
+                    'error': str(e),
+                    'computed_at': datetime.now().isoformat(),
+                    'source': 'live'
+                }
+
+            self._cached = self._materialize()
+            self._cached['computed_at'] = datetime.now().isoformat()
+            self._cached_at = now
+            return {**self._cached, 'source': 'live'}
+
+    def record_change(self, old: dict | None, new: dict | None) -> None:
+        """
+        Uebernimmt eine Aenderung an einer Fehler-Zeile in die Zaehler.
+
+        Insert: old=None, Delete: new=None, Update: beide gesetzt.
+        Wird ignoriert solange noch kein Full-Scan stattgefunden hat.
+
+        Args:
+            old: Zeile vor der Aenderung (STATS_COLUMNS) oder None
+            new: Zeile nach der Aenderung (STATS_COLUMNS) oder None
+        """
+        if old is None and new is None:
+            return
+
+        with self._lock:
+            self._cached = None
+            if self._built_at is None:
+                return
+
+            cutoff = _seven_days_cutoff()
+            if old is not None:
+                self._apply(old, -1, cutoff)
+            if new is not None:
+                self._apply(new, 1, cutoff)
+            self._update_top(old, new)
+
+    def invalidate(self) -> None:
+        """Erzwingt beim naechsten Zugriff einen Full-Scan."""
+        with self._lock:
+            self._built_at = None
+            self._cached = None
+
+
+# Singleton-Instanz
+_engine: FehlerStatsEngine | None = None
+
+
+def get_stats_engine() -> FehlerStatsEngine:
+    """
+    Gibt die Singleton-Instanz der Statistik-Engine zurueck.
+
+    Returns:
+        FehlerStatsEngine: Die Engine-Instanz
+    """
+    global _engine
+    if _engine is None:
+        _engine = FehlerStatsEngine()
+    return _engine
@@ -0,0 +1,316 @@
+"""
+NEXUS OVERLORD v2.0 - Ledger fuer alle LLM-Calls
+
+Jeder Call ueber OpenRouterClient landet als Zeile in einer eigenen
+SQLite-Datenbank (wie Session-Store und Extraktions-Cache):
+
+    Aufrufstelle, Modell, Prompt-/Completion-Tokens, gecachte Tokens,
+    Latenz, Wiederholungen, Cache-Treffer, Kosten, Projekt-ID, Erfolg
+
+Auswertung:
+    - SQL-Views llm_nach_tag / llm_nach_modell / llm_nach_projekt /
+      llm_nach_call_site (fuer sqlite3 auf der Konsole)
+    - summary() fuer den Endpoint /metrics/llm (mit Zeitfenster)
+
+Die Projekt-ID wird nicht durch alle Service-Funktionen gereicht, sondern
+ueber eine ContextVar gesetzt (before_request in app.main, llm_context()
+fuer Hintergrund-Threads).
+"""
+
+import contextvars
+import logging
+import os
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Pfad der Ledger-Datenbank (getrennt von nexus.db)
+LLM_LEDGER_PATH = os.getenv('LLM_LEDGER_PATH', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    'database',
+    'llm_ledger.db'
+))
+
+# Ledger abschalten (z.B. fuer Tests): LLM_LEDGER=0
+LLM_LEDGER_ENABLED = os.getenv('LLM_LEDGER', '1') == '1'
+
+# Zulaessige Gruppierungen fuer summary()
+GRUPPEN = {
+    'tag': 'tag',
+    'modell': 'modell',
+    'projekt': 'projekt_id',
+    'call_site': 'call_site',
+}
+
+# Aggregat-Spalten (Views und summary() nutzen dieselbe Definition)
+_AGG_COLUMNS = """
+    COUNT(*) AS calls,
+    SUM(CASE WHEN erfolg = 0 THEN 1 ELSE 0 END) AS fehler,
+    COALESCE(SUM(prompt_tokens), 0) AS prompt_tokens,
+    COALESCE(SUM(completion_tokens), 0) AS completion_tokens,
+    COALESCE(SUM(cached_tokens), 0) AS cached_tokens,
+    SUM(cache_hit) AS cache_hits,
+    SUM(retries) AS retries,
+    ROUND(AVG(latency_ms)) AS avg_latency_ms,
+    MAX(latency_ms) AS max_latency_ms,
+    ROUND(COALESCE(SUM(kosten), 0), 6) AS kosten
+"""
+
+_projekt_id: contextvars.ContextVar[int | None] = contextvars.ContextVar('llm_projekt_id', default=None)
+
+
+def set_projekt_id(projekt_id: int | None) -> None:
+    """
+    Setzt die Projekt-ID fuer alle folgenden LLM-Calls im aktuellen Kontext.
+
+    Args:
+        projekt_id: Projekt-ID oder None
+    """
+    _projekt_id.set(projekt_id)
+
+
+def get_projekt_id() -> int | None:
+    """Projekt-ID des aktuellen Kontexts (oder None)."""
+    return _projekt_id.get()
+
+
+@contextmanager
+def llm_context(projekt_id: int | None) -> Iterator[None]:
+    """
+    Ordnet alle LLM-Calls innerhalb des Blocks einem Projekt zu.
+
+    Args:
+        projekt_id: Projekt-ID
+    """
+    token = _projekt_id.set(projekt_id)
+    try:
+        yield
+    finally:
+        _projekt_id.reset(token)
+
+
+class LlmLedger:
+    """
+    SQLite-Ledger fuer LLM-Calls.
+
+    Attributes:
+        db_path: Pfad zur SQLite-Datei
+        enabled: False = record() ist ein No-op
+    """
+
+    def __init__(self, db_path: str = LLM_LEDGER_PATH, enabled: bool = LLM_LEDGER_ENABLED):
+        """
+        Initialisiert den Ledger und legt Tabelle und Views bei Bedarf an.
+
+        Args:
+            db_path: Pfad zur SQLite-Datei
+            enabled: Ledger aktiv
+        """
+        self.db_path = db_path
+        self.enabled = enabled
+
+        if not enabled:
+            return
+
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_calls (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ts REAL NOT NULL,
+                    tag TEXT NOT NULL,
+                    call_site TEXT NOT NULL,
+                    modell TEXT NOT NULL,
+                    projekt_id INTEGER,
+                    prompt_tokens INTEGER,
+                    completion_tokens INTEGER,
+                    cached_tokens INTEGER DEFAULT 0,
+                    tokens_geschaetzt INTEGER DEFAULT 0,
+                    latency_ms INTEGER NOT NULL,
+                    retries INTEGER DEFAULT 0,
+                    cache_hit INTEGER DEFAULT 0,
+                    stream INTEGER DEFAULT 0,
+                    kosten REAL,
+                    erfolg INTEGER NOT NULL,
+                    fehler TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_ts ON llm_calls(ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_projekt ON llm_calls(projekt_id)")
+            for name, column in GRUPPEN.items():
+                conn.execute(
+                    f"CREATE VIEW IF NOT EXISTS llm_nach_{name} AS "
+                    f"SELECT {column}, {_AGG_COLUMNS} FROM llm_calls GROUP BY {column}"
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Oeffnet eine Verbindung zur Ledger-Datenbank.
+
+        Returns:
+            sqlite3.Connection: Datenbankverbindung
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record(
+        self,
+        call_site: str,
+        modell: str,
+        latency_ms: int,
+        erfolg: bool,
+        prompt_tokens: int | None = None,
+        completion_tokens: int | None = None,
+        cached_tokens: int = 0,
+        tokens_geschaetzt: bool = False,
+        retries: int = 0,
+        stream: bool = False,
+        kosten: float | None = None,
+        fehler: str | None = None,
+        projekt_id: int | None = None
+    ) -> None:
+        """
+        Schreibt einen Call in den Ledger. Fehler beim Schreiben werden nur
+        geloggt - der Ledger darf keinen LLM-Call scheitern lassen.
+
+        Args:
+            call_site: Aufrufstelle (z.B. 'phasen')
+            modell: Model-ID
+            latency_ms: Gesamtdauer inkl. Wiederholungen
+            erfolg: Call erfolgreich
+            prompt_tokens: Eingabe-Tokens
+            completion_tokens: Ausgabe-Tokens
+            cached_tokens: Davon aus dem Prompt-Cache des Providers
+            tokens_geschaetzt: Tokens geschaetzt statt aus usage
+            retries: Anzahl Wiederholungen
+            stream: Streaming-Call
+            kosten: Kosten laut OpenRouter (Credits)
+            fehler: Fehlermeldung bei erfolg=False
+            projekt_id: Projekt (Standard: aus dem aktuellen Kontext)
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        if projekt_id is None:
+            projekt_id = get_projekt_id()
+
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """INSERT INTO llm_calls (ts, tag, call_site, modell, projekt_id,
+                           prompt_tokens, completion_tokens, cached_tokens, tokens_geschaetzt,
+                           latency_ms, retries, cache_hit, stream, kosten, erfolg, fehler)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (now, time.strftime('%Y-%m-%d', time.localtime(now)), call_site, modell,
+                     projekt_id, prompt_tokens, completion_tokens, cached_tokens,
+                     int(tokens_geschaetzt), latency_ms, retries, int(cached_tokens > 0),
+                     int(stream), kosten, int(erfolg), fehler[:500] if fehler else None)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM-Ledger: Eintrag fehlgeschlagen: {e}")
+
+    def summary(
+        self,
+        gruppe: str = 'call_site',
+        tage: int | None = 30,
+        projekt_id: int | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregiert die Calls nach einer Gruppierung.
+
+        Args:
+            gruppe: 'tag', 'modell', 'projekt' oder 'call_site'
+            tage: Nur die letzten N Tage (None = alle)
+            projekt_id: Optional - nur dieses Projekt
+
+        Returns:
+            list: Eine Zeile pro Gruppe mit calls, fehler, Tokens, Latenz, Kosten
+
+        Raises:
+            ValueError: Bei unbekannter Gruppierung
+        """
+        if gruppe not in GRUPPEN:
+            raise ValueError(f"Unbekannte Gruppierung: {gruppe}")
+        if not self.enabled:
+            return []
+
+        column = GRUPPEN[gruppe]
+        where, params = self._filter(tage, projekt_id)
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT {column} AS {gruppe}, {_AGG_COLUMNS} FROM llm_calls {where} "
+                f"GROUP BY {column} ORDER BY {'tag DESC' if gruppe == 'tag' else 'prompt_tokens DESC'}",
+                params
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+
+    def totals(self, tage: int | None = 30, projekt_id: int | None = None) -> dict[str, Any]:
+        """
+        Gesamtsummen ueber alle Calls im Zeitfenster.
+
+        Args:
+            tage: Nur die letzten N Tage (None = alle)
+            projekt_id: Optional - nur dieses Projekt
+
+        Returns:
+            dict: calls, fehler, Tokens, Latenz, Kosten
+        """
+        if not self.enabled:
+            return {}
+
+        where, params = self._filter(tage, projekt_id)
+        conn = self._connect()
+        try:
+            row = conn.execute(f"SELECT {_AGG_COLUMNS} FROM llm_calls {where}", params).fetchone()
+        finally:
+            conn.close()
+        return dict(row)
+
+    @staticmethod
+    def _filter(tage: int | None, projekt_id: int | None) -> tuple[str, list[Any]]:
+        """Baut WHERE-Klausel und Parameter fuer Zeitfenster und Projekt."""
+        clauses, params = [], []
+        if tage:
+            clauses.append("ts >= ?")
+            params.append(time.time() - tage * 86400)
+        if projekt_id is not None:
+            clauses.append("projekt_id = ?")
+            params.append(projekt_id)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+# Singleton-Instanz
+_ledger: LlmLedger | None = None
+
+
+def get_ledger() -> LlmLedger:
+    """
+    Gibt die Singleton-Instanz des LLM-Ledgers zurueck.
+
+    Returns:
+        LlmLedger: Die Ledger-Instanz
+    """
+    global _ledger
+    if _ledger is None:
+        _ledger = LlmLedger()
+    return _ledger
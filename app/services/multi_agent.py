@@ -10,12 +10,19 @@ Workflow:
     4. Gemini 3 Pro prueft Qualitaet
     5. Opus 4.5 verbessert den Plan
     6. Gemini 3 Pro bewertet final
+
+Die Prompts laufen ueber PromptBuilder: jede Phase hat ein Token-Budget,
+lange Zwischenergebnisse werden bei Bedarf deterministisch gekuerzt.
 """
 
 import logging
-from typing import Any
+import time
+from typing import Any, Callable
+
+from app.utils.metrics import WORKFLOW_STEP_SECONDS
 
 from .openrouter import get_client, OpenRouterClient
+from .prompt_builder import PromptBuilder
 
 # Logger konfigurieren
 logger = logging.getLogger(__name__)
@@ -32,10 +39,17 @@ class MultiAgentWorkflow:
     Attributes:
         client: OpenRouter API Client
         status: Aktueller Workflow-Status mit Schritten und Ergebnissen
+        on_status: Optional - wird nach jeder Status-Aenderung mit dem Status aufgerufen
     """
 
-    def __init__(self):
-        """Initialisiert den Multi-Agent Workflow."""
+    def __init__(self, on_status: Callable[[dict[str, Any]], None] | None = None):
+        """
+        Initialisiert den Multi-Agent Workflow.
+
+        Args:
+            on_status: Optional - Callback fuer Status-Aenderungen (z.B. persistieren)
+        """
+        self.on_status = on_status
         self.client: OpenRouterClient = get_client()
         self.status: dict[str, Any] = {
             "current_step": 0,
@@ -45,6 +59,7 @@ class MultiAgentWorkflow:
             "bewertung": None,
             "error": None
         }
+        self._step_start: dict[int, float] = {}
         logger.info("Multi-Agent Workflow initialisiert")
 
     def _init_steps(self) -> list[dict[str, Any]]:
@@ -79,8 +94,24 @@ class MultiAgentWorkflow:
                 step["status"] = status
                 if result:
                     step["result"] = result
+                if status == "active":
+                    self._step_start[step_nr] = time.perf_counter()
+                elif status in ("done", "error") and step_nr in self._step_start:
+                    WORKFLOW_STEP_SECONDS.labels(step["name"], status).observe(
+                        time.perf_counter() - self._step_start.pop(step_nr)
+                    )
                 logger.debug(f"Schritt {step_nr} '{step['name']}': {status}")
                 break
+        self._notify()
+
+    def _notify(self) -> None:
+        """Meldet den aktuellen Status an on_status (Fehler im Callback brechen den Workflow nicht ab)."""
+        if self.on_status is None:
+            return
+        try:
+            self.on_status(self.status)
+        except Exception as e:
+            logger.warning(f"Status-Callback fehlgeschlagen: {e}")
 
     def run(self, projektname: str, projektplan: str) -> dict[str, Any]:
         """
@@ -151,6 +182,7 @@ class MultiAgentWorkflow:
             self.status["final_plan"] = verbesserter_plan
             self.status["bewertung"] = bewertung
             self.status["current_step"] = 6
+            self._notify()
 
             logger.info(f"Multi-Agent Workflow erfolgreich abgeschlossen fuer: {projektname}")
             return self.status
@@ -177,14 +209,7 @@ class MultiAgentWorkflow:
         Returns:
             str: Detaillierte Analyse des Plans
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "Du bist ein Senior Software-Architekt. Analysiere den folgenden Projektplan detailliert und strukturiert."
-            },
-            {
-                "role": "user",
-                "content": f"""Analysiere diesen Projektplan:
+        prompt = (PromptBuilder('workflow_analyse', """Analysiere diesen Projektplan:
 
 {projektplan}
 
@@ -193,11 +218,22 @@ Erstelle eine detaillierte Analyse mit:
 2. Identifizierte Features
 3. Technische Anforderungen
 4. Potenzielle Herausforderungen
-5. Empfohlene Technologie-Stack"""
+5. Empfohlene Technologie-Stack""")
+            .add('projektplan', projektplan, priority=1)
+            .build())
+
+        messages = [
+            {
+                "role": "system",
+                "content": "Du bist ein Senior Software-Architekt. Analysiere den folgenden Projektplan detailliert und strukturiert."
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
         ]
 
-        return self.client.call_sonnet(messages, timeout=90)
+        return self.client.call_sonnet(messages, timeout=90, call_site='workflow_analyse')
 
     def _phase_2_feedback(self, projektplan: str, analyse: str) -> str:
         """
@@ -210,14 +246,7 @@ Erstelle eine detaillierte Analyse mit:
         Returns:
             str: Konstruktives Feedback zur Analyse
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "Du bist ein kritischer Reviewer. Gib konstruktives Feedback zur Projekt-Analyse."
-            },
-            {
-                "role": "user",
-                "content": f"""Urspruenglicher Projektplan:
+        prompt = (PromptBuilder('workflow_feedback', """Urspruenglicher Projektplan:
 {projektplan}
 
 Analyse von Opus:
@@ -227,11 +256,23 @@ Gib kritisches aber konstruktives Feedback:
 1. Was wurde gut analysiert?
 2. Was fehlt in der Analyse?
 3. Welche zusaetzlichen Aspekte sollten beruecksichtigt werden?
-4. Gibt es Risiken die nicht erwaehnt wurden?"""
+4. Gibt es Risiken die nicht erwaehnt wurden?""")
+            .add('projektplan', projektplan, priority=1)
+            .add('analyse', analyse, priority=2)
+            .build())
+
+        messages = [
+            {
+                "role": "system",
+                "content": "Du bist ein kritischer Reviewer. Gib konstruktives Feedback zur Projekt-Analyse."
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
         ]
 
-        return self.client.call_gemini(messages, timeout=60)
+        return self.client.call_gemini(messages, timeout=60, call_site='workflow_feedback')
 
     def _phase_3_enterprise_plan(self, projektplan: str, analyse: str, feedback: str) -> str:
         """
@@ -245,14 +286,7 @@ Gib kritisches aber konstruktives Feedback:
         Returns:
             str: Der erstellte Enterprise-Plan
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "Du bist ein Enterprise-Architekt. Erstelle einen professionellen, strukturierten Projektplan."
-            },
-            {
-                "role": "user",
-                "content": f"""Erstelle einen Enterprise-Projektplan basierend auf:
+        prompt = (PromptBuilder('workflow_enterprise_plan', """Erstelle einen Enterprise-Projektplan basierend auf:
 
 ORIGINALPLAN:
 {projektplan}
@@ -272,11 +306,24 @@ Der Enterprise-Plan soll enthalten:
 6. Ressourcen-Planung
 7. Qualitaetssicherung
 
-Format: Professionell, strukturiert, Enterprise-ready."""
+Format: Professionell, strukturiert, Enterprise-ready.""")
+            .add('projektplan', projektplan, priority=3)
+            .add('analyse', analyse, priority=1)
+            .add('feedback', feedback, priority=2)
+            .build())
+
+        messages = [
+            {
+                "role": "system",
+                "content": "Du bist ein Enterprise-Architekt. Erstelle einen professionellen, strukturierten Projektplan."
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
         ]
 
-        return self.client.call_sonnet(messages, timeout=120)
+        return self.client.call_sonnet(messages, timeout=120, call_site='workflow_enterprise_plan')
 
     def _phase_4_qualitaetspruefung(self, enterprise_plan: str) -> str:
         """
@@ -288,14 +335,7 @@ Format: Professionell, strukturiert, Enterprise-ready."""
         Returns:
             str: Der optimierte Plan
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "Du bist ein Qualitaets-Manager. Pruefe den Plan auf Vollstaendigkeit, Konsistenz und entferne Ueberfluessiges."
-            },
-            {
-                "role": "user",
-                "content": f"""Pruefe diesen Enterprise-Plan:
+        prompt = (PromptBuilder('workflow_qualitaet', """Pruefe diesen Enterprise-Plan:
 
 {enterprise_plan}
 
@@ -306,11 +346,22 @@ Aufgaben:
 4. Identifiziere Luecken
 5. Gib den optimierten Plan zurueck (ohne Ueberfluessiges)
 
-Gib NUR den optimierten Plan zurueck, keine zusaetzliche Erklaerung."""
+Gib NUR den optimierten Plan zurueck, keine zusaetzliche Erklaerung.""")
+            .add('enterprise_plan', enterprise_plan, priority=1)
+            .build())
+
+        messages = [
+            {
+                "role": "system",
+                "content": "Du bist ein Qualitaets-Manager. Pruefe den Plan auf Vollstaendigkeit, Konsistenz und entferne Ueberfluessiges."
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
         ]
 
-        return self.client.call_gemini(messages, timeout=90)
+        return self.client.call_gemini(messages, timeout=90, call_site='workflow_qualitaet')
 
     def _phase_5_verbesserung(self, gepruefter_plan: str, feedback: str) -> str:
         """
@@ -323,14 +374,7 @@ Gib NUR den optimierten Plan zurueck, keine zusaetzliche Erklaerung."""
         Returns:
             str: Der finale, verbesserte Plan
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "Du bist ein Senior Consultant. Verbessere den Plan basierend auf dem Feedback."
-            },
-            {
-                "role": "user",
-                "content": f"""Verbessere diesen Plan:
+        prompt = (PromptBuilder('workflow_verbesserung', """Verbessere diesen Plan:
 
 {gepruefter_plan}
 
@@ -343,11 +387,23 @@ Erstelle die finale, verbesserte Version:
 - Optimiere Struktur und Klarheit
 - Mache ihn actionable und umsetzbar
 
-Gib NUR den finalen Plan zurueck."""
+Gib NUR den finalen Plan zurueck.""")
+            .add('gepruefter_plan', gepruefter_plan, priority=2)
+            .add('feedback', feedback, priority=1)
+            .build())
+
+        messages = [
+            {
+                "role": "system",
+                "content": "Du bist ein Senior Consultant. Verbessere den Plan basierend auf dem Feedback."
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
         ]
 
-        return self.client.call_sonnet(messages, timeout=120)
+        return self.client.call_sonnet(messages, timeout=120, call_site='workflow_verbesserung')
 
     def _phase_6_bewertung(self, finaler_plan: str) -> str:
         """
@@ -359,14 +415,7 @@ Gib NUR den finalen Plan zurueck."""
         Returns:
             str: Die Bewertung mit Sternen und Begruendung
         """
-        messages = [
-            {
-                "role": "system",
-                "content": "Du bist ein erfahrener Projekt-Evaluator. Bewerte den finalen Plan."
-            },
-            {
-                "role": "user",
-                "content": f"""Bewerte diesen finalen Enterprise-Plan:
+        prompt = (PromptBuilder('workflow_bewertung', """Bewerte diesen finalen Enterprise-Plan:
 
 {finaler_plan}
 
@@ -380,11 +429,22 @@ BEGRUeNDUNG:
 - [Umsetzbarkeit]
 - [Vollstaendigkeit]
 
-EMPFEHLUNG: [Kann direkt umgesetzt werden / Noch Anpassungen noetig / etc.]"""
+EMPFEHLUNG: [Kann direkt umgesetzt werden / Noch Anpassungen noetig / etc.]""")
+            .add('finaler_plan', finaler_plan, priority=1)
+            .build())
+
+        messages = [
+            {
+                "role": "system",
+                "content": "Du bist ein erfahrener Projekt-Evaluator. Bewerte den finalen Plan."
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
         ]
 
-        return self.client.call_gemini(messages, timeout=60)
+        return self.client.call_gemini(messages, timeout=60, call_site='workflow_bewertung')
 
     def get_status(self) -> dict[str, Any]:
         """
@@ -9,18 +9,37 @@ Features:
     - Timeout-Handling
     - Rate-Limiting durch Exponential Backoff
     - Logging fuer Debugging
+    - Streaming (Server-Sent Events) fuer inkrementelles Parsen
+    - Jeder Call landet im LLM-Ledger (Tokens, Latenz, Kosten, siehe llm_ledger)
+    - AsyncOpenRouterClient (httpx) fuer die async Views: wartende Calls
+      kosten eine Coroutine statt eines Threads
 """
 
+import asyncio
+import json
 import logging
 import os
 import time
+from collections.abc import Iterator
 from typing import Any
 
+import httpx
 import requests
 
+from app.services.llm_ledger import get_ledger
+from app.services.prompt_builder import estimate_message_tokens, estimate_tokens
+from app.utils.metrics import LLM_SECONDS, LLM_TOKENS
+from app.utils.structured_logging import get_correlation_id
+
 # Logger konfigurieren
 logger = logging.getLogger(__name__)
 
+# Basis-URL der API (z.B. scripts/mock_openrouter.py fuer Lasttests ohne Netz)
+OPENROUTER_BASE_URL = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
+
+# Maximale Anzahl offener Verbindungen des async Clients (alle Requests eines Prozesses)
+LLM_MAX_CONNECTIONS = int(os.getenv('LLM_MAX_CONNECTIONS', '200'))
+
 
 class OpenRouterClient:
     """
@@ -31,35 +50,37 @@ class OpenRouterClient:
 
     Attributes:
         api_key: OpenRouter API-Schluessel
-        base_url: OpenRouter API Endpoint
+        base_url: Chat-Completions Endpoint
     """
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, base_url: str | None = None):
         """
         Initialisiert den OpenRouter Client.
 
         Args:
             api_key: OpenRouter API-Schluessel (Standard: aus Umgebungsvariable)
+            base_url: API-Basis-URL (Standard: OPENROUTER_BASE_URL)
 
         Raises:
             ValueError: Wenn kein API-Schluessel gefunden wird
         """
         self.api_key = api_key or os.getenv('OPENROUTER_API_KEY')
-        self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self.base_url = f"{(base_url or OPENROUTER_BASE_URL).rstrip('/')}/chat/completions"
 
         if not self.api_key:
             logger.error("OpenRouter API-Schluessel nicht gefunden")
             raise ValueError("OpenRouter API key not found in environment")
 
-        logger.info("OpenRouter Client initialisiert")
+        logger.info("OpenRouter Client initialisiert (%s)", self.base_url)
 
     def call(
         self,
         model: str,
-        messages: list[dict[str, str]],
+        messages: list[dict[str, Any]],
         temperature: float = 0.7,
         max_retries: int = 3,
-        timeout: int = 60
+        timeout: int = 60,
+        call_site: str | None = None
     ) -> str:
         """
         Ruft die OpenRouter API mit Retry-Logik auf.
@@ -67,9 +88,11 @@ class OpenRouterClient:
         Args:
             model: Model-ID (z.B. 'anthropic/claude-opus-4-5-20251101')
             messages: Liste von Nachrichten mit 'role' und 'content'
+                      (Text oder Liste von Content-Bloecken, z.B. mit cache_control)
             temperature: Sampling-Temperatur (0-1)
             max_retries: Anzahl der Wiederholungsversuche
             timeout: Request-Timeout in Sekunden
+            call_site: Aufrufstelle fuer Logging (z.B. 'phasen', 'workflow_feedback')
 
         Returns:
             str: Antwortinhalt vom Modell
@@ -77,24 +100,27 @@ class OpenRouterClient:
         Raises:
             Exception: Wenn alle Versuche fehlschlagen
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://nexus-overlord.com",
-            "X-Title": "NEXUS OVERLORD v2.0"
-        }
+        headers = self._headers(call_site)
 
         payload = {
             "model": model,
             "messages": messages,
-            "temperature": temperature
+            "temperature": temperature,
+            "usage": {"include": True}
         }
 
         last_error = None
         model_name = model.split('/')[-1] if '/' in model else model
+        site = call_site or 'unbekannt'
 
-        logger.info(f"API-Call an {model_name} (Temperatur: {temperature})")
-        logger.debug(f"Prompt: {messages[-1]['content'][:200]}...")
+        logger.info("API-Call an %s [%s] (Temperatur: %s, ~%s Tokens Eingabe)",
+                    model_name, site, temperature, estimate_message_tokens(messages))
+        if logger.isEnabledFor(logging.DEBUG):
+            content = messages[-1]['content']
+            if isinstance(content, list):
+                content = content[-1].get('text', '')
+            logger.debug("Prompt: %s...", content[:200])
+        call_start = time.time()
 
         for attempt in range(max_retries):
             try:
@@ -108,49 +134,158 @@ class OpenRouterClient:
                 )
 
                 elapsed = time.time() - start_time
-                logger.debug(f"API-Response in {elapsed:.2f}s (Status: {response.status_code})")
+                logger.debug("API-Response in %.2fs (Status: %s)", elapsed, response.status_code)
 
                 response.raise_for_status()
 
                 data = response.json()
-
-                if "choices" in data and len(data["choices"]) > 0:
-                    content = data["choices"][0]["message"]["content"]
-                    logger.info(f"API-Call erfolgreich ({len(content)} Zeichen)")
-                    return content
-                else:
-                    raise ValueError("Unerwartetes Antwortformat von OpenRouter")
+                content, tokens = _parse_completion(data, site, model, messages, elapsed)
+                _record(site, model, call_start, attempt, data.get("usage"), *tokens)
+                return content
 
             except requests.exceptions.Timeout as e:
                 last_error = f"Timeout nach {timeout}s: {str(e)}"
-                logger.warning(f"Versuch {attempt + 1}/{max_retries}: Timeout")
+                logger.warning("Versuch %s/%s: Timeout", attempt + 1, max_retries)
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
-                    logger.info(f"Warte {wait_time}s vor naechstem Versuch...")
+                    logger.info("Warte %ss vor naechstem Versuch...", wait_time)
                     time.sleep(wait_time)
                     continue
 
             except requests.exceptions.RequestException as e:
                 last_error = f"Request fehlgeschlagen: {str(e)}"
-                logger.warning(f"Versuch {attempt + 1}/{max_retries}: {last_error}")
+                logger.warning("Versuch %s/%s: %s", attempt + 1, max_retries, last_error)
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
-                    logger.info(f"Warte {wait_time}s vor naechstem Versuch...")
+                    logger.info("Warte %ss vor naechstem Versuch...", wait_time)
                     time.sleep(wait_time)
                     continue
 
             except (ValueError, KeyError) as e:
                 last_error = f"Response-Parsing fehlgeschlagen: {str(e)}"
-                logger.warning(f"Versuch {attempt + 1}/{max_retries}: {last_error}")
+                logger.warning("Versuch %s/%s: %s", attempt + 1, max_retries, last_error)
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     time.sleep(wait_time)
                     continue
 
-        logger.error(f"API-Call fehlgeschlagen nach {max_retries} Versuchen: {last_error}")
+        logger.error("API-Call fehlgeschlagen nach %s Versuchen: %s", max_retries, last_error)
+        _record(site, model, call_start, max_retries - 1, fehler=last_error)
         raise Exception(f"OpenRouter API call failed after {max_retries} attempts: {last_error}")
 
-    def call_sonnet(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
+    def _headers(self, call_site: str | None = None) -> dict[str, str]:
+        """
+        Baut die HTTP-Header fuer OpenRouter.
+
+        Args:
+            call_site: Aufrufstelle (als X-Nexus-Call-Site, wertet der Mock-Server aus)
+
+        Die Korrelations-ID des Requests geht als X-Request-ID mit.
+
+        Returns:
+            dict: Header inkl. Authorization
+        """
+        return _build_headers(self.api_key, call_site)
+
+    def stream(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.7,
+        max_retries: int = 3,
+        timeout: int = 60,
+        call_site: str | None = None
+    ) -> Iterator[str]:
+        """
+        Ruft die OpenRouter API im Streaming-Modus auf.
+
+        Liefert die Text-Deltas, sobald sie eintreffen. Wiederholt wird nur,
+        solange noch nichts geliefert wurde - ein Abbruch mitten im Stream
+        wird als Exception weitergereicht, damit der Aufrufer keine
+        doppelten Teile erhaelt.
+
+        Args:
+            model: Model-ID
+            messages: Liste von Nachrichten mit 'role' und 'content'
+            temperature: Sampling-Temperatur (0-1)
+            max_retries: Anzahl der Wiederholungsversuche bis zum ersten Delta
+            timeout: Timeout in Sekunden (Verbindung und Pause zwischen zwei Deltas)
+            call_site: Aufrufstelle fuer Logging
+
+        Yields:
+            str: Naechstes Stueck der Antwort
+
+        Raises:
+            Exception: Wenn alle Versuche fehlschlagen
+        """
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "stream": True,
+            "usage": {"include": True}
+        }
+
+        last_error = None
+        model_name = model.split('/')[-1] if '/' in model else model
+        site = call_site or 'unbekannt'
+        logger.info("Streaming-Call an %s [%s] (Temperatur: %s, ~%s Tokens Eingabe)",
+                    model_name, site, temperature, estimate_message_tokens(messages))
+        call_start = time.time()
+
+        for attempt in range(max_retries):
+            delivered = 0
+            usage: dict[str, Any] = {}
+            output: list[str] = []
+            try:
+                start_time = time.time()
+                with requests.post(
+                    self.base_url,
+                    headers=self._headers(call_site),
+                    json=payload,
+                    timeout=timeout,
+                    stream=True
+                ) as response:
+                    response.raise_for_status()
+
+                    for delta in _iter_sse_deltas(response, usage):
+                        if not delivered:
+                            logger.debug("Erstes Delta nach %.2fs", time.time() - start_time)
+                        delivered += len(delta)
+                        output.append(delta)
+                        yield delta
+
+                tokens_in, tokens_out, geschaetzt = _token_counts(usage, messages, ''.join(output))
+                dauer = time.time() - start_time
+                logger.info(
+                    "Streaming-Call erfolgreich [%s] (%s Zeichen, Tokens ein/aus: %s/%s%s, %.2fs)",
+                    site, delivered, tokens_in, tokens_out, ' geschaetzt' if geschaetzt else '', dauer,
+                    extra={'call_site': site, 'model': model, 'tokens_in': tokens_in,
+                           'tokens_out': tokens_out, 'duration_s': round(dauer, 3)}
+                )
+                _record(site, model, call_start, attempt, usage, tokens_in, tokens_out,
+                        geschaetzt, stream=True)
+                return
+
+            except (requests.exceptions.RequestException, ValueError) as e:
+                if delivered:
+                    logger.error("Stream nach %s Zeichen abgebrochen: %s", delivered, e)
+                    _record(site, model, call_start, attempt, usage, stream=True,
+                            fehler=f"Stream abgebrochen: {e}")
+                    raise Exception(f"OpenRouter stream aborted after {delivered} characters: {e}")
+
+                last_error = f"Stream fehlgeschlagen: {str(e)}"
+                logger.warning("Versuch %s/%s: %s", attempt + 1, max_retries, last_error)
+                if attempt < max_retries - 1:
+                    wait_time = 2 ** attempt
+                    logger.info("Warte %ss vor naechstem Versuch...", wait_time)
+                    time.sleep(wait_time)
+
+        logger.error("Streaming-Call fehlgeschlagen nach %s Versuchen: %s", max_retries, last_error)
+        _record(site, model, call_start, max_retries - 1, stream=True, fehler=last_error)
+        raise Exception(f"OpenRouter API call failed after {max_retries} attempts: {last_error}")
+
+    def call_sonnet(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
         """
         Ruft Opus 4.5 auf (Name fuer Kompatibilitaet beibehalten).
 
@@ -165,7 +300,7 @@ class OpenRouterClient:
         logger.debug("call_sonnet() -> Opus 4.5")
         return self.call(model, messages, **kwargs)
 
-    def call_opus(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
+    def call_opus(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
         """
         Ruft Opus 4.5 auf - das neueste Claude-Modell.
 
@@ -180,7 +315,7 @@ class OpenRouterClient:
         logger.debug("call_opus() -> Opus 4.5")
         return self.call(model, messages, **kwargs)
 
-    def call_gemini(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
+    def call_gemini(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
         """
         Ruft Gemini 3 Pro auf.
 
@@ -196,6 +331,367 @@ class OpenRouterClient:
         return self.call(model, messages, **kwargs)
 
 
+    def stream_sonnet(self, messages: list[dict[str, Any]], **kwargs: Any) -> Iterator[str]:
+        """
+        Streaming-Variante von call_sonnet().
+
+        Args:
+            messages: Liste von Nachrichten
+            **kwargs: Weitere Argumente fuer stream()
+
+        Returns:
+            Iterator[str]: Text-Deltas
+        """
+        model = os.getenv('OPUS_MODEL', 'anthropic/claude-opus-4.5')
+        return self.stream(model, messages, **kwargs)
+
+    def stream_gemini(self, messages: list[dict[str, Any]], **kwargs: Any) -> Iterator[str]:
+        """
+        Streaming-Variante von call_gemini().
+
+        Args:
+            messages: Liste von Nachrichten
+            **kwargs: Weitere Argumente fuer stream()
+
+        Returns:
+            Iterator[str]: Text-Deltas
+        """
+        model = os.getenv('GEMINI_MODEL', 'google/gemini-3-pro-preview')
+        return self.stream(model, messages, **kwargs)
+
+
+class AsyncOpenRouterClient:
+    """
+    Asynchroner Client fuer die OpenRouter API (httpx).
+
+    Gleiche Retry-Logik, Header, Logs, Metriken und Ledger-Eintraege wie
+    OpenRouterClient.call(). Alle Calls laufen auf der gemeinsamen
+    Event-Loop (app/utils/async_loop.py) und teilen sich einen
+    Connection-Pool mit hoechstens LLM_MAX_CONNECTIONS Verbindungen.
+
+    Attributes:
+        api_key: OpenRouter API-Schluessel
+        base_url: Chat-Completions Endpoint
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        max_connections: int = LLM_MAX_CONNECTIONS
+    ):
+        """
+        Initialisiert den async Client.
+
+        Args:
+            api_key: OpenRouter API-Schluessel (Standard: aus Umgebungsvariable)
+            base_url: API-Basis-URL (Standard: OPENROUTER_BASE_URL)
+            max_connections: Groesse des Connection-Pools
+
+        Raises:
+            ValueError: Wenn kein API-Schluessel gefunden wird
+        """
+        self.api_key = api_key or os.getenv('OPENROUTER_API_KEY')
+        self.base_url = f"{(base_url or OPENROUTER_BASE_URL).rstrip('/')}/chat/completions"
+
+        if not self.api_key:
+            logger.error("OpenRouter API-Schluessel nicht gefunden")
+            raise ValueError("OpenRouter API key not found in environment")
+
+        self._http = httpx.AsyncClient(limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max(1, max_connections // 4)
+        ))
+        logger.info("Async OpenRouter Client initialisiert (%s, max %s Verbindungen)",
+                    self.base_url, max_connections)
+
+    async def call(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.7,
+        max_retries: int = 3,
+        timeout: int = 60,
+        call_site: str | None = None
+    ) -> str:
+        """
+        Ruft die OpenRouter API mit Retry-Logik auf (siehe OpenRouterClient.call).
+
+        Args:
+            model: Model-ID
+            messages: Liste von Nachrichten mit 'role' und 'content'
+            temperature: Sampling-Temperatur (0-1)
+            max_retries: Anzahl der Wiederholungsversuche
+            timeout: Request-Timeout in Sekunden
+            call_site: Aufrufstelle fuer Logging
+
+        Returns:
+            str: Antwortinhalt vom Modell
+
+        Raises:
+            Exception: Wenn alle Versuche fehlschlagen
+        """
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "usage": {"include": True}
+        }
+
+        last_error = None
+        model_name = model.split('/')[-1] if '/' in model else model
+        site = call_site or 'unbekannt'
+
+        logger.info("Async API-Call an %s [%s] (Temperatur: %s, ~%s Tokens Eingabe)",
+                    model_name, site, temperature, estimate_message_tokens(messages))
+        call_start = time.time()
+
+        for attempt in range(max_retries):
+            try:
+                start_time = time.time()
+                response = await self._http.post(
+                    self.base_url,
+                    headers=_build_headers(self.api_key, call_site),
+                    json=payload,
+                    timeout=timeout
+                )
+                elapsed = time.time() - start_time
+                logger.debug("API-Response in %.2fs (Status: %s)", elapsed, response.status_code)
+                response.raise_for_status()
+
+                data = response.json()
+                content, tokens = _parse_completion(data, site, model, messages, elapsed)
+                # Ledger schreibt in SQLite - nicht auf der Event-Loop blockieren
+                await asyncio.to_thread(_record, site, model, call_start, attempt, data.get("usage"), *tokens)
+                return content
+
+            except httpx.TimeoutException as e:
+                last_error = f"Timeout nach {timeout}s: {str(e)}"
+                logger.warning("Versuch %s/%s: Timeout", attempt + 1, max_retries)
+
+            except httpx.HTTPError as e:
+                last_error = f"Request fehlgeschlagen: {str(e)}"
+                logger.warning("Versuch %s/%s: %s", attempt + 1, max_retries, last_error)
+
+            except (ValueError, KeyError) as e:
+                last_error = f"Response-Parsing fehlgeschlagen: {str(e)}"
+                logger.warning("Versuch %s/%s: %s", attempt + 1, max_retries, last_error)
+
+            if attempt < max_retries - 1:
+                wait_time = 2 ** attempt
+                logger.info("Warte %ss vor naechstem Versuch...", wait_time)
+                await asyncio.sleep(wait_time)
+
+        logger.error("API-Call fehlgeschlagen nach %s Versuchen: %s", max_retries, last_error)
+        await asyncio.to_thread(_record, site, model, call_start, max_retries - 1, fehler=last_error)
+        raise Exception(f"OpenRouter API call failed after {max_retries} attempts: {last_error}")
+
+    async def call_sonnet(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
+        """
+        Ruft Opus 4.5 auf (Name wie OpenRouterClient.call_sonnet).
+
+        Args:
+            messages: Liste von Nachrichten
+            **kwargs: Weitere Argumente fuer call()
+
+        Returns:
+            str: Antwort vom Modell
+        """
+        return await self.call(os.getenv('OPUS_MODEL', 'anthropic/claude-opus-4.5'), messages, **kwargs)
+
+    async def call_gemini(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
+        """
+        Ruft Gemini 3 Pro auf.
+
+        Args:
+            messages: Liste von Nachrichten
+            **kwargs: Weitere Argumente fuer call()
+
+        Returns:
+            str: Antwort vom Modell
+        """
+        return await self.call(os.getenv('GEMINI_MODEL', 'google/gemini-3-pro-preview'), messages, **kwargs)
+
+
+def _token_counts(
+    usage: dict[str, Any] | None,
+    messages: list[dict[str, Any]],
+    output: str
+) -> tuple[int, int, bool]:
+    """
+    Liefert Eingabe- und Ausgabe-Tokens eines Calls.
+
+    Bevorzugt das usage-Feld der API, sonst Schaetzung ueber prompt_builder.
+
+    Args:
+        usage: usage-Block der API-Antwort (oder None)
+        messages: Gesendete Nachrichten
+        output: Antworttext
+
+    Returns:
+        tuple: (prompt_tokens, completion_tokens, geschaetzt)
+    """
+    if usage and usage.get('prompt_tokens') is not None:
+        return int(usage['prompt_tokens']), int(usage.get('completion_tokens') or 0), False
+    return estimate_message_tokens(messages), estimate_tokens(output), True
+
+
+def _build_headers(api_key: str, call_site: str | None = None) -> dict[str, str]:
+    """
+    HTTP-Header fuer OpenRouter (sync und async Client).
+
+    Args:
+        api_key: OpenRouter API-Schluessel
+        call_site: Aufrufstelle (als X-Nexus-Call-Site, wertet der Mock-Server aus)
+
+    Returns:
+        dict: Header inkl. Authorization und X-Request-ID
+    """
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "https://nexus-overlord.com",
+        "X-Title": "NEXUS OVERLORD v2.0"
+    }
+    if call_site:
+        headers["X-Nexus-Call-Site"] = call_site
+    correlation_id = get_correlation_id()
+    if correlation_id:
+        headers["X-Request-ID"] = correlation_id
+    return headers
+
+
+def _parse_completion(
+    data: dict[str, Any],
+    site: str,
+    model: str,
+    messages: list[dict[str, Any]],
+    elapsed: float
+) -> tuple[str, tuple[int, int, bool]]:
+    """
+    Liest den Antworttext einer Chat-Completion und loggt den Erfolg.
+
+    Args:
+        data: JSON-Antwort der API
+        site: Aufrufstelle
+        model: Model-ID
+        messages: Gesendete Nachrichten (fuer die Token-Schaetzung)
+        elapsed: Dauer des erfolgreichen Versuchs in Sekunden
+
+    Returns:
+        tuple: (content, (tokens_in, tokens_out, geschaetzt))
+
+    Raises:
+        ValueError: Bei unerwartetem Antwortformat
+        KeyError: Wenn message/content fehlt
+    """
+    if not data.get("choices"):
+        raise ValueError("Unerwartetes Antwortformat von OpenRouter")
+
+    content = data["choices"][0]["message"]["content"]
+    tokens_in, tokens_out, geschaetzt = _token_counts(data.get("usage"), messages, content)
+    logger.info(
+        "API-Call erfolgreich [%s] (%s Zeichen, Tokens ein/aus: %s/%s%s, %.2fs)",
+        site, len(content), tokens_in, tokens_out, ' geschaetzt' if geschaetzt else '', elapsed,
+        extra={'call_site': site, 'model': model, 'tokens_in': tokens_in,
+               'tokens_out': tokens_out, 'duration_s': round(elapsed, 3)}
+    )
+    return content, (tokens_in, tokens_out, geschaetzt)
+
+
+def _record(
+    site: str,
+    model: str,
+    call_start: float,
+    retries: int,
+    usage: dict[str, Any] | None = None,
+    tokens_in: int | None = None,
+    tokens_out: int | None = None,
+    geschaetzt: bool = False,
+    stream: bool = False,
+    fehler: str | None = None
+) -> None:
+    """
+    Schreibt einen Call in den LLM-Ledger und in die /metrics-Histogramme.
+
+    Gecachte Tokens und Kosten kommen aus dem usage-Block von OpenRouter
+    (prompt_tokens_details.cached_tokens, cost), falls vorhanden.
+
+    Args:
+        site: Aufrufstelle
+        model: Model-ID
+        call_start: Startzeit des ersten Versuchs
+        retries: Anzahl Wiederholungen (Index des letzten Versuchs)
+        usage: usage-Block der API-Antwort
+        tokens_in: Eingabe-Tokens
+        tokens_out: Ausgabe-Tokens
+        geschaetzt: Tokens nur geschaetzt
+        stream: Streaming-Call
+        fehler: Fehlermeldung, wenn der Call gescheitert ist
+    """
+    usage = usage or {}
+    details = usage.get('prompt_tokens_details') or {}
+    dauer = time.time() - call_start
+    cached_tokens = int(details.get('cached_tokens') or 0)
+
+    LLM_SECONDS.labels(model, site, 'ok' if fehler is None else 'error').observe(dauer)
+    for art, anzahl in (('prompt', tokens_in), ('completion', tokens_out), ('cached', cached_tokens)):
+        if anzahl:
+            LLM_TOKENS.labels(model, art).inc(anzahl)
+
+    get_ledger().record(
+        call_site=site,
+        modell=model,
+        latency_ms=int(dauer * 1000),
+        erfolg=fehler is None,
+        prompt_tokens=tokens_in,
+        completion_tokens=tokens_out,
+        cached_tokens=cached_tokens,
+        tokens_geschaetzt=geschaetzt,
+        retries=retries,
+        stream=stream,
+        kosten=usage.get('cost'),
+        fehler=fehler
+    )
+
+
+def _iter_sse_deltas(response: requests.Response, usage: dict[str, Any] | None = None) -> Iterator[str]:
+    """
+    Liest die Server-Sent Events einer Streaming-Antwort.
+
+    Kommentarzeilen (': OPENROUTER PROCESSING') und leere Deltas werden
+    uebersprungen, 'data: [DONE]' beendet den Stream.
+
+    Args:
+        response: Geoeffnete requests-Response (stream=True)
+        usage: Optional - wird mit dem usage-Block des letzten Events gefuellt
+
+    Yields:
+        str: Inhalt von choices[0].delta.content
+
+    Raises:
+        ValueError: Bei einem Fehler-Event im Stream
+    """
+    for line in response.iter_lines(decode_unicode=False):
+        if not line or not line.startswith(b'data:'):
+            continue
+        data = line[5:].strip()
+        if data == b'[DONE]':
+            return
+
+        event = json.loads(data)
+        if 'error' in event:
+            raise ValueError(f"Fehler im Stream: {event['error']}")
+        if usage is not None and event.get('usage'):
+            usage.update(event['usage'])
+
+        choices = event.get('choices') or []
+        if choices:
+            content = (choices[0].get('delta') or {}).get('content')
+            if content:
+                yield content
+
+
 # Singleton-Instanz
 _client: OpenRouterClient | None = None
 
@@ -211,3 +707,23 @@ def get_client() -> OpenRouterClient:
     if _client is None:
         _client = OpenRouterClient()
     return _client
+
+
+# Singleton-Instanz (async)
+_async_client: AsyncOpenRouterClient | None = None
+
+
+def get_async_client() -> AsyncOpenRouterClient:
+    """
+    Gibt die Singleton-Instanz des async Clients zurueck.
+
+    Nur auf der gemeinsamen Event-Loop verwenden (app/utils/async_loop.py),
+    der Connection-Pool ist an die Loop gebunden.
+
+    Returns:
+        AsyncOpenRouterClient: Die Client-Instanz
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenRouterClient()
+    return _async_client
@@ -0,0 +1,378 @@
+"""
+NEXUS OVERLORD v2.0 - PDF-Export Jobs und Cache
+
+Der vollstaendige PDF-Export (Auftrag 6.2) laeuft als Hintergrund-Job,
+der Fortschritt kann per Polling abgefragt werden. Fertige PDFs werden
+auf der Platte abgelegt und wiederverwendet.
+
+Cache-Key (SHA-256) ueber:
+    - den kompletten Projekt-Baum (Projekt, Phasen, Auftraege)
+    - die Version der Fehler-Datenbank (get_fehler_db_version)
+    - das aktuelle Datum (Titelseite und Statistik enthalten 'Heute')
+    - RENDERER_VERSION (bei Layout-Aenderungen erhoehen)
+
+Der Key dient gleichzeitig als ETag fuer If-None-Match.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import secrets
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, BinaryIO
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Verzeichnis fuer fertige PDFs
+EXPORT_CACHE_DIR = os.getenv('PDF_EXPORT_CACHE_DIR', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    'projekt',
+    'exports'
+))
+
+# Maximale Anzahl gecachter PDFs (aelteste werden zuerst entfernt)
+EXPORT_CACHE_MAX_FILES = int(os.getenv('PDF_EXPORT_CACHE_MAX_FILES', '50'))
+
+# Ohne Cache: ab dieser Groesse wird das PDF auf die Platte ausgelagert (Bytes)
+EXPORT_SPOOL_MAX_MEMORY = int(os.getenv('PDF_EXPORT_SPOOL_MAX_MEMORY', str(1024 * 1024)))
+
+# Parallele Export-Jobs
+EXPORT_WORKERS = int(os.getenv('PDF_EXPORT_WORKERS', '2'))
+
+# Abgeschlossene Jobs werden nach dieser Zeit vergessen (Sekunden)
+JOB_TTL = 3600
+
+# Bei Aenderungen am Layout von generate_full_documentation erhoehen
+RENDERER_VERSION = '1'
+
+
+# ========================================
+# CACHE
+# ========================================
+
+def compute_export_key(projekt: dict) -> str:
+    """
+    Berechnet den Cache-Key fuer den PDF-Export eines Projekts.
+
+    Args:
+        projekt: Ergebnis von get_projekt_komplett()
+
+    Returns:
+        str: SHA-256 Hex-Digest
+    """
+    from app.services.database import get_fehler_db_version
+
+    payload = json.dumps({
+        'projekt': projekt,
+        'fehler_version': get_fehler_db_version(),
+        'datum': date.today().isoformat(),
+        'renderer': RENDERER_VERSION,
+    }, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _cache_path(key: str) -> str:
+    """Pfad der gecachten PDF-Datei zu einem Key."""
+    return os.path.join(EXPORT_CACHE_DIR, f"{key}.pdf")
+
+
+def get_cached_export(key: str) -> str | None:
+    """
+    Liefert den Pfad eines bereits gerenderten PDFs.
+
+    Args:
+        key: Cache-Key aus compute_export_key()
+
+    Returns:
+        str | None: Dateipfad oder None bei Cache-Miss
+    """
+    path = _cache_path(key)
+    if not os.path.isfile(path):
+        return None
+    try:
+        # mtime dient als LRU-Zeitstempel fuer _prune_cache()
+        os.utime(path)
+    except OSError:
+        pass
+    return path
+
+
+def _prune_cache() -> None:
+    """Entfernt die am laengsten nicht genutzten PDFs ueber EXPORT_CACHE_MAX_FILES."""
+    try:
+        entries = [
+            os.path.join(EXPORT_CACHE_DIR, name)
+            for name in os.listdir(EXPORT_CACHE_DIR)
+            if name.endswith('.pdf')
+        ]
+    except OSError:
+        return
+
+    if len(entries) <= EXPORT_CACHE_MAX_FILES:
+        return
+
+    entries.sort(key=lambda p: os.path.getmtime(p))
+    for path in entries[:len(entries) - EXPORT_CACHE_MAX_FILES]:
+        try:
+            os.remove(path)
+            logger.debug(f"PDF-Cache: {os.path.basename(path)} entfernt")
+        except OSError:
+            pass
+
+
+def _load_fehler_context() -> tuple[list, dict]:
+    """Laedt Fehler-Liste und Fehler-Statistik fuer die Dokumentation."""
+    from app.services.database import get_all_fehler, get_fehler_stats
+
+    try:
+        fehler = get_all_fehler()
+    except Exception:
+        fehler = []
+
+    try:
+        stats = get_fehler_stats()
+    except Exception:
+        stats = {}
+
+    return fehler, stats
+
+
+def render_export(projekt: dict, key: str, progress=None) -> str:
+    """
+    Rendert die vollstaendige Dokumentation und legt sie im Cache ab.
+
+    reportlab schreibt direkt in die Cache-Datei, das PDF wird nicht
+    zusaetzlich als bytes im Speicher gehalten.
+
+    Args:
+        projekt: Ergebnis von get_projekt_komplett()
+        key: Cache-Key aus compute_export_key()
+        progress: Callback (prozent, schritt) (optional)
+
+    Returns:
+        str: Pfad der PDF-Datei
+    """
+    from app.services.pdf_generator import write_full_documentation
+
+    fehler, stats = _load_fehler_context()
+
+    # Atomar schreiben, damit parallele Downloads nie eine halbe Datei sehen
+    os.makedirs(EXPORT_CACHE_DIR, exist_ok=True)
+    path = _cache_path(key)
+    tmp_path = f"{path}.{secrets.token_hex(4)}.tmp"
+
+    start = time.perf_counter()
+    try:
+        size = write_full_documentation(
+            tmp_path,
+            projekt=projekt,
+            phasen=projekt.get('phasen', []),
+            fehler=fehler,
+            stats=stats,
+            progress=progress
+        )
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"PDF-Export gerendert: {size} Bytes in {elapsed:.1f}s ({key[:12]})")
+
+    _prune_cache()
+    return path
+
+
+def render_export_spooled(projekt: dict) -> BinaryIO:
+    """
+    Rendert die vollstaendige Dokumentation in eine SpooledTemporaryFile.
+
+    Wird verwendet, wenn der Datei-Cache deaktiviert ist
+    (PDF_EXPORT_CACHE_MAX_FILES=0). PDFs bis EXPORT_SPOOL_MAX_MEMORY
+    bleiben im Speicher, groessere werden auf die Platte ausgelagert.
+
+    Args:
+        projekt: Ergebnis von get_projekt_komplett()
+
+    Returns:
+        BinaryIO: Temporaere Datei auf Position 0 (send_file schliesst sie)
+    """
+    from app.services.pdf_generator import write_full_documentation
+
+    fehler, stats = _load_fehler_context()
+
+    spooled = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_MEMORY, suffix='.pdf')
+    try:
+        write_full_documentation(
+            spooled,
+            projekt=projekt,
+            phasen=projekt.get('phasen', []),
+            fehler=fehler,
+            stats=stats
+        )
+    except Exception:
+        spooled.close()
+        raise
+    spooled.seek(0)
+    return spooled
+
+
+def cache_enabled() -> bool:
+    """Gibt an, ob fertige PDFs auf der Platte gecacht werden."""
+    return EXPORT_CACHE_MAX_FILES > 0
+
+
+# ========================================
+# HINTERGRUND-JOBS
+# ========================================
+
+class PdfExportManager:
+    """
+    Verwaltet PDF-Export Jobs in einem Thread-Pool.
+
+    Laeuft fuer denselben Cache-Key bereits ein Job, wird dieser
+    wiederverwendet statt ein zweites Mal zu rendern.
+    """
+
+    def __init__(self, workers: int = EXPORT_WORKERS):
+        """
+        Args:
+            workers: Anzahl paralleler Export-Threads
+        """
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pdf-export')
+        self._lock = threading.Lock()
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._running_by_key: dict[str, str] = {}
+
+    def submit(self, projekt: dict) -> dict[str, Any]:
+        """
+        Startet einen Export-Job (oder liefert einen passenden vorhandenen).
+
+        Args:
+            projekt: Ergebnis von get_projekt_komplett()
+
+        Returns:
+            dict: Job-Status (siehe get_job)
+        """
+        key = compute_export_key(projekt)
+
+        with self._lock:
+            self._forget_old_jobs()
+
+            running_id = self._running_by_key.get(key)
+            if running_id:
+                return dict(self._jobs[running_id])
+
+            job = {
+                'job_id': secrets.token_urlsafe(12),
+                'projekt_id': projekt['id'],
+                'key': key,
+                'status': 'queued',
+                'progress': 0,
+                'schritt': 'Warteschlange',
+                'error': None,
+                'finished_at': None,
+            }
+
+            if not cache_enabled():
+                # Ohne Cache rendert erst der Download (gestreamt, siehe export_pdf)
+                job.update(status='done', progress=100, schritt='Cache deaktiviert', finished_at=time.time())
+                self._jobs[job['job_id']] = job
+                return dict(job)
+
+            if get_cached_export(key):
+                job.update(status='done', progress=100, schritt='Aus Cache', finished_at=time.time())
+                self._jobs[job['job_id']] = job
+                return dict(job)
+
+            self._jobs[job['job_id']] = job
+            self._running_by_key[key] = job['job_id']
+
+        self._executor.submit(self._run, job['job_id'], projekt)
+        logger.info(f"PDF-Export Job {job['job_id']} fuer Projekt {projekt['id']} gestartet")
+        return dict(job)
+
+    def get_job(self, job_id: str) -> dict[str, Any] | None:
+        """
+        Liefert den Status eines Jobs.
+
+        Args:
+            job_id: ID aus submit()
+
+        Returns:
+            dict | None: job_id, projekt_id, key, status ('queued', 'running',
+                         'done', 'error'), progress (0-100), schritt, error
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def counts(self) -> dict[str, int]:
+        """
+        Zaehlt die bekannten Jobs je Status (fuer /metrics).
+
+        Returns:
+            dict: status -> Anzahl ('queued', 'running', 'done', 'error')
+        """
+        with self._lock:
+            counts = dict.fromkeys(('queued', 'running', 'done', 'error'), 0)
+            for job in self._jobs.values():
+                counts[job['status']] = counts.get(job['status'], 0) + 1
+            return counts
+
+    def _update(self, job_id: str, **fields) -> None:
+        """Aktualisiert Felder eines Jobs thread-sicher."""
+        with self._lock:
+            self._jobs[job_id].update(fields)
+
+    def _run(self, job_id: str, projekt: dict) -> None:
+        """Fuehrt einen Export-Job im Worker-Thread aus."""
+        job = self.get_job(job_id)
+        key = job['key']
+        self._update(job_id, status='running', schritt='Start')
+
+        def progress(prozent: int, schritt: str) -> None:
+            self._update(job_id, progress=prozent, schritt=schritt)
+
+        try:
+            render_export(projekt, key, progress=progress)
+            self._update(job_id, status='done', progress=100, schritt='Fertig')
+        except Exception as e:
+            logger.error(f"PDF-Export Job {job_id} fehlgeschlagen: {e}")
+            self._update(job_id, status='error', error=str(e))
+        finally:
+            with self._lock:
+                self._jobs[job_id]['finished_at'] = time.time()
+                self._running_by_key.pop(key, None)
+
+    def _forget_old_jobs(self) -> None:
+        """Entfernt abgeschlossene Jobs aelter als JOB_TTL (Lock muss gehalten werden)."""
+        cutoff = time.time() - JOB_TTL
+        for job_id in [
+            jid for jid, job in self._jobs.items()
+            if job['finished_at'] and job['finished_at'] < cutoff
+        ]:
+            del self._jobs[job_id]
+
+
+# Singleton-Instanz
+_manager: PdfExportManager | None = None
+
+
+def get_export_manager() -> PdfExportManager:
+    """
+    Gibt die Singleton-Instanz des Export-Managers zurueck.
+
+    Returns:
+        PdfExportManager: Die Manager-Instanz
+    """
+    global _manager
+    if _manager is None:
+        _manager = PdfExportManager()
+    return _manager
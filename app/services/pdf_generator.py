@@ -7,8 +7,9 @@ Nutzt reportlab fuer PDF-Generierung mit Template-System.
 
 import io
 import logging
+import os
 from datetime import datetime
-from typing import Any
+from typing import Any, BinaryIO, Callable
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -662,12 +663,44 @@ class NexusPDFGenerator:
             onLaterPages=self._header_footer
         )
 
+        self.page_count = self.doc.page
         pdf_bytes = self.buffer.getvalue()
         self.buffer.close()
 
         logger.info(f"PDF erstellt: {len(pdf_bytes)} Bytes")
         return pdf_bytes
 
+    def build_to(self, target: str | BinaryIO) -> int:
+        """
+        Baut das PDF direkt in eine Datei statt in den internen Buffer.
+
+        Args:
+            target: Dateipfad oder binaeres File-Objekt
+
+        Returns:
+            int: Groesse des PDFs in Bytes
+        """
+        logger.info(f"Baue PDF: {len(self.elements)} Elemente")
+
+        self.doc.filename = target
+        self.doc.build(
+            self.elements,
+            onFirstPage=self._header_footer,
+            onLaterPages=self._header_footer
+        )
+        self.page_count = self.doc.page
+        # Flowables werden nach dem Rendern nicht mehr gebraucht
+        self.elements = []
+        self.buffer.close()
+
+        if isinstance(target, str):
+            size = os.path.getsize(target)
+        else:
+            size = target.tell()
+
+        logger.info(f"PDF erstellt: {size} Bytes, {self.page_count} Seiten")
+        return size
+
 
 # ========================================
 # CONVENIENCE FUNKTIONEN
@@ -794,18 +827,25 @@ hello_world()""")
 # KOMPLETTE DOKUMENTATION (Auftrag 6.2)
 # ========================================
 
-def generate_full_documentation(projekt: dict, phasen: list, fehler: list = None, stats: dict = None) -> bytes:
+def _compose_full_documentation(
+    projekt: dict,
+    phasen: list,
+    fehler: list | None,
+    stats: dict | None,
+    report: Callable[[int, str], None]
+) -> 'NexusPDFGenerator':
     """
-    Erstellt eine komplette Projekt-Dokumentation als PDF.
+    Baut alle Elemente der kompletten Projekt-Dokumentation auf (ohne Rendern).
 
     Args:
         projekt: Projekt-Dictionary mit allen Daten
         phasen: Liste aller Phasen mit Auftraegen
-        fehler: Liste der aktiven Fehler (optional)
-        stats: Statistik-Dictionary (optional)
+        fehler: Liste der aktiven Fehler (oder None)
+        stats: Statistik-Dictionary (oder None)
+        report: Callback (prozent, schritt) fuer Fortschrittsanzeige
 
     Returns:
-        bytes: PDF-Daten
+        NexusPDFGenerator: Generator mit allen Elementen, bereit fuer build()
 
     Inhalt:
         1. Titelseite
@@ -819,6 +859,8 @@ def generate_full_documentation(projekt: dict, phasen: list, fehler: list = None
 
     logger.info(f"Generiere vollstaendige Dokumentation fuer: {projekt.get('name', 'Unbekannt')}")
 
+    report(5, 'Titelseite')
+
     # Status-Text bestimmen
     status = projekt.get('status', 'erstellt')
     status_text = {
@@ -862,6 +904,8 @@ def generate_full_documentation(projekt: dict, phasen: list, fehler: list = None
 
     pdf.add_toc(toc_entries)
 
+    report(15, 'Projektuebersicht')
+
     # ========================================
     # 3. PROJEKTÜBERSICHT
     # ========================================
@@ -931,6 +975,8 @@ def generate_full_documentation(projekt: dict, phasen: list, fehler: list = None
     else:
         pdf.add_paragraph("Keine Bewertung vorhanden.")
 
+    report(30, 'Phasen & Auftraege')
+
     # ========================================
     # 4. PHASEN & AUFTRÄGE
     # ========================================
@@ -986,6 +1032,8 @@ def generate_full_documentation(projekt: dict, phasen: list, fehler: list = None
 
             pdf.add_spacer(0.3)
 
+    report(55, 'Fehler & Loesungen')
+
     # ========================================
     # 5. FEHLER & LÖSUNGEN
     # ========================================
@@ -1017,6 +1065,8 @@ def generate_full_documentation(projekt: dict, phasen: list, fehler: list = None
 
         pdf.add_table(table_data, col_widths=[5, 3, 6, 2.5])
 
+    report(65, 'Statistiken')
+
     # ========================================
     # 6. STATISTIKEN
     # ========================================
@@ -1093,8 +1143,74 @@ def generate_full_documentation(projekt: dict, phasen: list, fehler: list = None
         style='NxFooter'
     )
 
+    return pdf
+
+
+def generate_full_documentation(
+    projekt: dict,
+    phasen: list,
+    fehler: list = None,
+    stats: dict = None,
+    progress: Callable[[int, str], None] | None = None
+) -> bytes:
+    """
+    Erstellt eine komplette Projekt-Dokumentation als PDF.
+
+    Fuer grosse Projekte write_full_documentation() verwenden, das direkt
+    in eine Datei rendert statt das komplette PDF im Speicher zu halten.
+
+    Args:
+        projekt: Projekt-Dictionary mit allen Daten
+        phasen: Liste aller Phasen mit Auftraegen
+        fehler: Liste der aktiven Fehler (optional)
+        stats: Statistik-Dictionary (optional)
+        progress: Callback (prozent, schritt) fuer Fortschrittsanzeige (optional)
+
+    Returns:
+        bytes: PDF-Daten
+    """
+    report = progress or (lambda prozent, schritt: None)
+    pdf = _compose_full_documentation(projekt, phasen, fehler, stats, report)
+
+    report(75, 'Rendern')
+    pdf_bytes = pdf.build()
+    report(100, 'Fertig')
+
     logger.info("Vollstaendige Dokumentation erstellt")
-    return pdf.build()
+    return pdf_bytes
+
+
+def write_full_documentation(
+    target: str | BinaryIO,
+    projekt: dict,
+    phasen: list,
+    fehler: list = None,
+    stats: dict = None,
+    progress: Callable[[int, str], None] | None = None
+) -> int:
+    """
+    Rendert die komplette Projekt-Dokumentation direkt in eine Datei.
+
+    Args:
+        target: Dateipfad oder binaeres File-Objekt (z.B. SpooledTemporaryFile)
+        projekt: Projekt-Dictionary mit allen Daten
+        phasen: Liste aller Phasen mit Auftraegen
+        fehler: Liste der aktiven Fehler (optional)
+        stats: Statistik-Dictionary (optional)
+        progress: Callback (prozent, schritt) fuer Fortschrittsanzeige (optional)
+
+    Returns:
+        int: Groesse des PDFs in Bytes
+    """
+    report = progress or (lambda prozent, schritt: None)
+    pdf = _compose_full_documentation(projekt, phasen, fehler, stats, report)
+
+    report(75, 'Rendern')
+    size = pdf.build_to(target)
+    report(100, 'Fertig')
+
+    logger.info(f"Vollstaendige Dokumentation erstellt ({pdf.page_count} Seiten)")
+    return size
 
 
 def _truncate_text(text: str, max_length: int) -> str:
@@ -13,10 +13,13 @@ Jede Phase enthaelt:
 """
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
-from app.services.openrouter import get_client
+from app.services.openrouter import get_async_client, get_client
+from app.services.prompt_builder import PromptBuilder
 from app.utils.json_extractor import extract_json
+from app.utils.json_stream import JsonArrayStreamer
 
 # Logger konfigurieren
 logger = logging.getLogger(__name__)
@@ -68,12 +71,19 @@ AUSGABE als JSON (NUR JSON, kein anderer Text):
 """
 
 
-def generate_phasen(enterprise_plan: str) -> dict[str, Any]:
+def generate_phasen(
+    enterprise_plan: str,
+    on_phase: Callable[[dict[str, Any]], None] | None = None
+) -> dict[str, Any]:
     """
     Generiert Phasen-Einteilung mit Gemini 3 Pro.
 
+    Mit on_phase wird die Antwort gestreamt: jede Phase wird validiert
+    und gemeldet, sobald ihr JSON-Objekt vollstaendig ist.
+
     Args:
         enterprise_plan: Der zu analysierende Enterprise-Plan
+        on_phase: Optional - Callback fuer jede fertige Phase
 
     Returns:
         dict: Phasen-Struktur mit:
@@ -90,15 +100,74 @@ def generate_phasen(enterprise_plan: str) -> dict[str, Any]:
 
     client = get_client()
 
-    # Prompt mit Enterprise-Plan fuellen
-    prompt = PHASEN_PROMPT.format(enterprise_plan=enterprise_plan)
-
     # Gemini 3 Pro aufrufen
     logger.debug("Rufe Gemini 3 Pro auf")
-    response = client.call_gemini([
-        {"role": "user", "content": prompt}
-    ], temperature=0.7, timeout=90)
+    messages = _phasen_messages(enterprise_plan)
+    if on_phase is None:
+        response = client.call_gemini(messages, temperature=0.7, timeout=90, call_site='phasen')
+    else:
+        streamer = JsonArrayStreamer('phasen')
+        for chunk in client.stream_gemini(messages, temperature=0.7, timeout=90,
+                                              call_site='phasen'):
+            fertig = streamer.feed(chunk)
+            # emitted zaehlt die fertigen Elemente dieses Chunks schon mit
+            for i, phase in enumerate(fertig, streamer.emitted - len(fertig)):
+                _validate_phase(phase, i)
+                on_phase(phase)
+        response = streamer.text
+
+    return _parse_phasen(response)
+
+
+async def generate_phasen_async(enterprise_plan: str) -> dict[str, Any]:
+    """
+    Async Variante von generate_phasen() (ohne Streaming) fuer async Views.
+
+    Args:
+        enterprise_plan: Der zu analysierende Enterprise-Plan
+
+    Returns:
+        dict: Phasen-Struktur wie generate_phasen()
+
+    Raises:
+        ValueError: Bei ungueltiger JSON-Antwort oder Validierungsfehler
+        Exception: Bei API-Fehler
+    """
+    logger.info("Starte Phasen-Generierung (async)")
+
+    response = await get_async_client().call_gemini(
+        _phasen_messages(enterprise_plan), temperature=0.7, timeout=90, call_site='phasen'
+    )
+    return _parse_phasen(response)
+
+
+def _phasen_messages(enterprise_plan: str) -> list[dict[str, Any]]:
+    """
+    Baut die Nachrichten fuer die Phasen-Generierung.
+
+    Args:
+        enterprise_plan: Der Enterprise-Plan
+
+    Returns:
+        list: Nachrichten fuer den Client
+    """
+    prompt = PromptBuilder('phasen', PHASEN_PROMPT).add('enterprise_plan', enterprise_plan).build()
+    return [{"role": "user", "content": prompt}]
+
+
+def _parse_phasen(response: str) -> dict[str, Any]:
+    """
+    Extrahiert und validiert die Phasen aus der Modell-Antwort.
 
+    Args:
+        response: Antworttext von Gemini
+
+    Returns:
+        dict: Validierte Phasen-Struktur
+
+    Raises:
+        ValueError: Bei ungueltiger JSON-Antwort oder Validierungsfehler
+    """
     logger.debug(f"Gemini-Antwort erhalten ({len(response)} Zeichen)")
 
     # JSON aus Response extrahieren
@@ -143,38 +212,52 @@ def validate_phasen(data: dict[str, Any]) -> None:
 
     # Validiere jede Phase
     for i, phase in enumerate(phasen):
-        # Required fields
-        required = ["nummer", "name", "beschreibung", "abhaengigkeiten", "prioritaet"]
-        for field in required:
-            if field not in phase:
-                # Fuege Standardwert hinzu statt Fehler zu werfen
-                if field == "abhaengigkeiten":
-                    phase["abhaengigkeiten"] = []
-                elif field == "prioritaet":
-                    phase["prioritaet"] = "mittel"
-                elif field == "geschaetzte_dauer":
-                    phase["geschaetzte_dauer"] = "N/A"
-                else:
-                    raise ValueError(f"Phase {i+1} fehlt Feld: '{field}'")
-
-        # Korrigiere Nummer falls noetig
-        if phase["nummer"] != i + 1:
-            logger.warning(f"Phase-Nummer korrigiert: {phase['nummer']} -> {i+1}")
-            phase["nummer"] = i + 1
-
-        # Prioritaet validieren/korrigieren
-        if phase["prioritaet"] not in ["hoch", "mittel", "niedrig"]:
-            logger.warning(f"Ungueltige Prioritaet in Phase {i+1}: {phase['prioritaet']} -> 'mittel'")
-            phase["prioritaet"] = "mittel"
-
-        # Abhaengigkeiten muessen Liste sein
-        if not isinstance(phase["abhaengigkeiten"], list):
-            logger.warning(f"Abhaengigkeiten in Phase {i+1} korrigiert zu leerer Liste")
-            phase["abhaengigkeiten"] = []
+        _validate_phase(phase, i)
 
     logger.debug("Phasen-Validierung erfolgreich")
 
 
+def _validate_phase(phase: dict[str, Any], i: int) -> None:
+    """
+    Validiert und korrigiert eine einzelne Phase (auch fuer gestreamte Phasen).
+
+    Args:
+        phase: Phase aus der KI-Antwort (wird in-place korrigiert)
+        i: Position in der Phasen-Liste (0-basiert)
+
+    Raises:
+        ValueError: Wenn ein Pflichtfeld ohne Standardwert fehlt
+    """
+    # Required fields
+    required = ["nummer", "name", "beschreibung", "abhaengigkeiten", "prioritaet"]
+    for field in required:
+        if field not in phase:
+            # Fuege Standardwert hinzu statt Fehler zu werfen
+            if field == "abhaengigkeiten":
+                phase["abhaengigkeiten"] = []
+            elif field == "prioritaet":
+                phase["prioritaet"] = "mittel"
+            elif field == "geschaetzte_dauer":
+                phase["geschaetzte_dauer"] = "N/A"
+            else:
+                raise ValueError(f"Phase {i+1} fehlt Feld: '{field}'")
+
+    # Korrigiere Nummer falls noetig
+    if phase["nummer"] != i + 1:
+        logger.warning(f"Phase-Nummer korrigiert: {phase['nummer']} -> {i+1}")
+        phase["nummer"] = i + 1
+
+    # Prioritaet validieren/korrigieren
+    if phase["prioritaet"] not in ["hoch", "mittel", "niedrig"]:
+        logger.warning(f"Ungueltige Prioritaet in Phase {i+1}: {phase['prioritaet']} -> 'mittel'")
+        phase["prioritaet"] = "mittel"
+
+    # Abhaengigkeiten muessen Liste sein
+    if not isinstance(phase["abhaengigkeiten"], list):
+        logger.warning(f"Abhaengigkeiten in Phase {i+1} korrigiert zu leerer Liste")
+        phase["abhaengigkeiten"] = []
+
+
 def format_phasen_for_display(data: dict[str, Any]) -> str:
     """
     Formatiert Phasen-Daten fuer die Anzeige (Markdown).
@@ -0,0 +1,418 @@
+"""
+NEXUS OVERLORD v2.0 - Planungs-Jobs (Kachel 2)
+
+Phasen, Auftraege und Qualitaetspruefung laufen als Hintergrund-Jobs auf
+der gemeinsamen Event-Loop (app/utils/async_loop.py) statt im POST-Handler.
+Ein Browser- oder Proxy-Timeout verwirft das Ergebnis damit nicht mehr.
+
+Stufen (in dieser Reihenfolge):
+    phasen     -> generate_phasen_async()
+    auftraege  -> generate_auftraege_async()
+    qualitaet  -> pruefen_auftraege_async()
+
+Mit bis=<stufe> startet nach jeder fertigen Stufe automatisch die naechste
+(Job-Kette ueber 'naechster_job'), bis='qualitaet' plant also komplett.
+
+Job-Status und Ergebnisse liegen im Session-Store (SQLite) und sind in
+allen Gunicorn-Workern sichtbar:
+    <job_id>              Job-Status inkl. Fortschritts-Events
+    <job_id>_ergebnis     Ergebnis der Stufe (phasen_data, auftraege_data, ...)
+    <job_id>_bis          Von einer erneuten Einreichung verlaengerte Kette
+    planung_key_<key>     Idempotenz-Schluessel -> job_id
+
+Idempotenz: Der Schluessel ist ein SHA-256 ueber Projekt, Stufe und
+Eingaben. Wird derselbe Job erneut eingereicht, waehrend er laeuft oder
+solange sein Ergebnis vorhanden ist, kommt der vorhandene Job zurueck
+(ein weiter reichendes bis verlaengert die Kette). neu=True erzwingt eine
+neue Generierung, auch fuer die automatisch gestarteten Folgestufen.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+
+from app.services.session_store import get_store
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Stufen der Planung in Ausfuehrungsreihenfolge
+STUFEN = ('phasen', 'auftraege', 'qualitaet')
+
+# Name des Session-Artefakts je Stufe (Eingabe der folgenden Stufen)
+ARTEFAKTE = {
+    'phasen': 'phasen_data',
+    'auftraege': 'auftraege_data',
+    'qualitaet': 'qualitaet_data',
+}
+
+# Laufende Jobs ohne Lebenszeichen gelten danach als abgebrochen (Sekunden),
+# z.B. wenn der Worker-Prozess neu gestartet wurde
+JOB_STALE = int(os.getenv('PLANUNG_JOB_STALE', '900'))
+
+# Maximale Anzahl gespeicherter Fortschritts-Events je Job
+JOB_MAX_EVENTS = 50
+
+# Abgeschlossene Jobs werden nach dieser Zeit aus dem Speicher des Workers entfernt
+JOB_TTL = 3600
+
+KEY_PREFIX = 'planung_key_'
+
+
+def compute_job_key(projekt_id: int, stufe: str, daten: dict[str, Any]) -> str:
+    """
+    Berechnet den Idempotenz-Schluessel eines Jobs.
+
+    Args:
+        projekt_id: ID des Projekts
+        stufe: Stufe aus STUFEN
+        daten: Eingaben (enterprise_plan und Artefakte der vorherigen Stufen)
+
+    Returns:
+        str: Hex-Digest (SHA-256)
+    """
+    payload = json.dumps({'projekt_id': projekt_id, 'stufe': stufe, 'daten': daten},
+                         sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _eingaben(stufe: str, daten: dict[str, Any]) -> dict[str, Any]:
+    """Reduziert die Daten auf die Eingaben der Stufe (Plan + Artefakte davor)."""
+    vorher = [ARTEFAKTE[s] for s in STUFEN[:STUFEN.index(stufe)]]
+    return {k: daten[k] for k in ['enterprise_plan', *vorher]}
+
+
+class PlanungJobManager:
+    """
+    Startet Planungs-Jobs auf der gemeinsamen Event-Loop und speichert
+    ihren Status im Session-Store.
+
+    Die Futures der Jobs dieses Prozesses werden im Speicher gehalten,
+    daran wird erkannt ob ein Job ohne Lebenszeichen noch laeuft.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+        self._finished: dict[str, tuple[str, float]] = {}
+
+    # ========================================
+    # OEFFENTLICHE API
+    # ========================================
+
+    def submit(
+        self,
+        projekt_id: int,
+        stufe: str,
+        daten: dict[str, Any],
+        bis: str | None = None,
+        neu: bool = False
+    ) -> dict[str, Any]:
+        """
+        Startet einen Job (oder liefert einen passenden vorhandenen).
+
+        Args:
+            projekt_id: ID des Projekts
+            stufe: Erste Stufe ('phasen', 'auftraege' oder 'qualitaet')
+            daten: enterprise_plan und die Artefakte der vorherigen Stufen
+            bis: Letzte Stufe der Kette (Standard: nur stufe)
+            neu: Vorhandenes Ergebnis ignorieren und neu generieren (gilt fuer
+                die ganze Kette)
+
+        Returns:
+            dict: Job-Status (siehe get_job)
+
+        Raises:
+            ValueError: Bei unbekannter Stufe, bis vor stufe oder fehlenden Eingaben
+        """
+        bis = bis or stufe
+        if stufe not in STUFEN or bis not in STUFEN:
+            raise ValueError(f"Unbekannte Stufe: {stufe if stufe not in STUFEN else bis}")
+        if STUFEN.index(bis) < STUFEN.index(stufe):
+            raise ValueError(f"Stufe '{bis}' liegt vor '{stufe}'")
+        try:
+            daten = _eingaben(stufe, daten)
+        except KeyError as e:
+            raise ValueError(f"Fehlende Eingabe fuer Stufe '{stufe}': {e.args[0]}") from None
+
+        key = compute_job_key(projekt_id, stufe, daten)
+
+        with self._lock:
+            self._forget_old_jobs()
+            vorhanden = None if neu else self._find_reusable(key)
+            if not vorhanden:
+                job = self._create(projekt_id, stufe, bis, key, daten, neu)
+
+        if vorhanden:
+            return self._reuse(vorhanden, daten, bis)
+
+        logger.info(f"Planungs-Job {job['job_id']} ({stufe}, bis {bis}) fuer Projekt {projekt_id} gestartet")
+        return job
+
+    def get_job(self, job_id: str) -> dict[str, Any] | None:
+        """
+        Liefert den Status eines Jobs.
+
+        Args:
+            job_id: ID aus submit()
+
+        Returns:
+            dict | None: job_id, projekt_id, stufe, bis, status ('queued', 'running',
+                         'done', 'error'), progress (0-100), schritt, events
+                         ([{zeit, text}]), error, ergebnis_ref, naechster_job
+        """
+        # Nur Job-Eintraege, keine beliebigen Session-Artefakte
+        job = get_store().get(job_id) if job_id.startswith('planung_') else None
+        if not isinstance(job, dict) or job.get('job_id') != job_id:
+            return None
+        if job['status'] in ('queued', 'running'):
+            job['bis'] = self._bis(job)
+            if self._is_stale(job):
+                job.update(status='error', error='Job abgebrochen (kein Lebenszeichen)')
+        return job
+
+    def get_kette(self, job_id: str) -> list[dict[str, Any]]:
+        """
+        Liefert einen Job und alle automatisch gestarteten Folge-Jobs.
+
+        Args:
+            job_id: ID des ersten Jobs
+
+        Returns:
+            list: Jobs in Stufen-Reihenfolge (leer wenn unbekannt)
+        """
+        kette = []
+        while job_id and len(kette) < len(STUFEN):
+            job = self.get_job(job_id)
+            if not job:
+                break
+            kette.append(job)
+            job_id = job.get('naechster_job')
+        return kette
+
+    def get_ergebnis(self, job: dict[str, Any]) -> Any | None:
+        """
+        Laedt das Ergebnis eines fertigen Jobs.
+
+        Args:
+            job: Job-Status aus get_job()
+
+        Returns:
+            Ergebnis der Stufe oder None (nicht fertig/abgelaufen)
+        """
+        if job['status'] != 'done':
+            return None
+        return get_store().get(job['ergebnis_ref'])
+
+    def counts(self) -> dict[str, int]:
+        """
+        Zaehlt die Jobs dieses Prozesses je Status (fuer /metrics).
+
+        Returns:
+            dict: status -> Anzahl ('running', 'done', 'error')
+        """
+        with self._lock:
+            counts = dict.fromkeys(('running', 'done', 'error'), 0)
+            counts['running'] = sum(1 for f in self._futures.values() if not f.done())
+            for status, _ in self._finished.values():
+                counts[status] += 1
+            return counts
+
+    # ========================================
+    # INTERN
+    # ========================================
+
+    def _create(
+        self, projekt_id: int, stufe: str, bis: str, key: str, daten: dict[str, Any], neu: bool = False
+    ) -> dict[str, Any]:
+        """Legt einen Job an und startet ihn auf der Event-Loop (Lock muss gehalten werden)."""
+        from app.utils.async_loop import submit
+
+        store = get_store()
+        jetzt = time.time()
+        job = {
+            'job_id': f"planung_{secrets.token_urlsafe(12)}",
+            'projekt_id': projekt_id,
+            'stufe': stufe,
+            'bis': bis,
+            'key': key,
+            'neu': neu,
+            'status': 'queued',
+            'progress': 0,
+            'schritt': 'Warteschlange',
+            'events': [],
+            'error': None,
+            'naechster_job': None,
+            'erstellt': jetzt,
+            'aktualisiert': jetzt,
+            'finished_at': None,
+        }
+        job['ergebnis_ref'] = f"{job['job_id']}_ergebnis"
+        store.put(job, ref=job['job_id'])
+        store.put(job['job_id'], ref=KEY_PREFIX + key)
+
+        status = dict(job, events=[])
+        self._futures[job['job_id']] = submit(self._run(job, daten))
+        return status
+
+    def _find_reusable(self, key: str) -> dict[str, Any] | None:
+        """Sucht einen laufenden oder fertigen Job mit Ergebnis zum Schluessel (Lock gehalten)."""
+        store = get_store()
+        job_id = store.get(KEY_PREFIX + key)
+        job = self.get_job(job_id) if isinstance(job_id, str) else None
+        if not job or job['status'] == 'error':
+            return None
+        if job['status'] == 'done' and store.get(job['ergebnis_ref']) is None:
+            return None
+        return job
+
+    def _reuse(self, job: dict[str, Any], daten: dict[str, Any], bis: str) -> dict[str, Any]:
+        """
+        Gibt einen vorhandenen Job zurueck und verlaengert bei Bedarf seine Kette.
+
+        Laeuft der Job noch, wird das neue bis unter <job_id>_bis abgelegt und
+        beim Abschluss gelesen. Ist er fertig, startet die naechste Stufe aus
+        seinem Ergebnis (selbst wieder idempotent).
+        """
+        logger.info(f"Planungs-Job {job['job_id']} ({job['stufe']}) wiederverwendet")
+        if STUFEN.index(bis) <= STUFEN.index(job['bis']):
+            return job
+
+        job['bis'] = bis
+        if job['status'] != 'done':
+            get_store().put(bis, ref=f"{job['job_id']}_bis")
+            return job
+
+        if not job.get('naechster_job'):
+            ergebnis = get_store().get(job['ergebnis_ref'])
+            naechste = STUFEN[STUFEN.index(job['stufe']) + 1]
+            folge = self.submit(job['projekt_id'], naechste,
+                                {**daten, ARTEFAKTE[job['stufe']]: ergebnis}, bis=bis)
+            job['naechster_job'] = folge['job_id']
+        get_store().put(job, ref=job['job_id'])
+        return job
+
+    def _bis(self, job: dict[str, Any]) -> str:
+        """Letzte Stufe der Kette inkl. Verlaengerung durch erneute Einreichung."""
+        verlaengert = get_store().get(f"{job['job_id']}_bis")
+        if verlaengert in STUFEN and STUFEN.index(verlaengert) > STUFEN.index(job['bis']):
+            return verlaengert
+        return job['bis']
+
+    def _is_stale(self, job: dict[str, Any]) -> bool:
+        """Laufender Job ohne Future in diesem Prozess und ohne Lebenszeichen seit JOB_STALE."""
+        future = self._futures.get(job['job_id'])
+        if future is not None:
+            return future.done()
+        return time.time() - job['aktualisiert'] > JOB_STALE
+
+    async def _run(self, job: dict[str, Any], daten: dict[str, Any]) -> None:
+        """Fuehrt einen Job auf der Event-Loop aus und startet danach die naechste Stufe."""
+        store = get_store()
+        schreiben = asyncio.Lock()
+        ausstehend: set[asyncio.Task] = set()
+
+        async def speichern() -> None:
+            # Nacheinander schreiben, jeweils den aktuellen Stand
+            async with schreiben:
+                job['aktualisiert'] = time.time()
+                await asyncio.to_thread(store.put, dict(job, events=list(job['events'])), ref=job['job_id'])
+
+        def melden(progress: int, text: str) -> None:
+            job['progress'] = progress
+            job['schritt'] = text
+            job['events'] = (job['events'] + [{'zeit': time.time(), 'text': text}])[-JOB_MAX_EVENTS:]
+            task = asyncio.get_running_loop().create_task(speichern())
+            ausstehend.add(task)
+            task.add_done_callback(ausstehend.discard)
+
+        job['status'] = 'running'
+        stufe = job['stufe']
+        try:
+            ergebnis = await self._stufe_ausfuehren(stufe, daten, melden)
+            await asyncio.to_thread(store.put, ergebnis, ref=job['ergebnis_ref'])
+
+            # bis kann waehrenddessen von einer erneuten Einreichung angehoben worden sein
+            job['bis'] = await asyncio.to_thread(self._bis, job)
+            if STUFEN.index(job['bis']) > STUFEN.index(stufe):
+                naechste = STUFEN[STUFEN.index(stufe) + 1]
+                folge = await asyncio.to_thread(
+                    self.submit, job['projekt_id'], naechste,
+                    {**daten, ARTEFAKTE[stufe]: ergebnis}, job['bis'], job['neu']
+                )
+                job['naechster_job'] = folge['job_id']
+
+            job.update(status='done', finished_at=time.time())
+            melden(100, 'Fertig')
+        except Exception as e:
+            logger.error(f"Planungs-Job {job['job_id']} ({stufe}) fehlgeschlagen: {e}")
+            job.update(status='error', error=str(e), finished_at=time.time())
+            melden(job['progress'], f"Fehler: {e}")
+        finally:
+            await speichern()
+            with self._lock:
+                self._futures.pop(job['job_id'], None)
+                self._finished[job['job_id']] = (job['status'], time.time())
+
+    async def _stufe_ausfuehren(self, stufe: str, daten: dict[str, Any], melden) -> dict[str, Any]:
+        """Ruft den async Generator der Stufe auf und meldet den Fortschritt."""
+        from app.services.auftraege_generator import generate_auftraege_async
+        from app.services.phasen_generator import generate_phasen_async
+        from app.services.qualitaetspruefung import pruefen_auftraege_async
+
+        plan = daten['enterprise_plan']
+
+        if stufe == 'phasen':
+            melden(10, 'Phasen werden generiert')
+            data = await generate_phasen_async(plan)
+            melden(95, f"{len(data['phasen'])} Phasen generiert")
+            return data
+
+        if stufe == 'auftraege':
+            melden(5, 'Auftraege werden generiert')
+            data = await generate_auftraege_async(
+                daten['phasen_data'], plan,
+                on_fortschritt=lambda fertig, alle: melden(
+                    5 + 90 * fertig // alle, f"Auftraege: Phase {fertig}/{alle} fertig")
+            )
+            melden(95, f"{len(data['auftraege'])} Auftraege generiert")
+            return data
+
+        melden(5, 'Qualitaetspruefung laeuft')
+        data = await pruefen_auftraege_async(
+            daten['auftraege_data'], daten['phasen_data'], plan,
+            on_fortschritt=lambda fertig, alle: melden(
+                5 + 90 * fertig // alle, f"Qualitaetspruefung: Teil {fertig}/{alle} fertig")
+        )
+        melden(95, f"Gesamtbewertung {data.get('gesamt_bewertung')}/10")
+        return data
+
+    def _forget_old_jobs(self) -> None:
+        """Entfernt abgeschlossene Jobs aelter als JOB_TTL aus dem Speicher (Lock muss gehalten werden)."""
+        cutoff = time.time() - JOB_TTL
+        for job_id in [jid for jid, (_, t) in self._finished.items() if t < cutoff]:
+            del self._finished[job_id]
+
+
+# Singleton-Instanz
+_manager: PlanungJobManager | None = None
+
+
+def get_planung_manager() -> PlanungJobManager:
+    """
+    Gibt die Singleton-Instanz des Planungs-Job-Managers zurueck.
+
+    Returns:
+        PlanungJobManager: Die Manager-Instanz
+    """
+    global _manager
+    if _manager is None:
+        _manager = PlanungJobManager()
+    return _manager
@@ -233,7 +233,7 @@ Gib eine kurze Einschaetzung (2-3 Saetze):
 3. Empfehlung?"""
 
     messages = [{"role": "user", "content": prompt}]
-    return client.call_gemini(messages, temperature=0.3, timeout=20)
+    return client.call_gemini(messages, temperature=0.3, timeout=20, call_site='projekt_analyse')
 
 
 def _summarize_with_opus(client, daten: dict, analyse: str) -> str:
@@ -261,4 +261,4 @@ Formatiere als:
 Halte es kurz und motivierend."""
 
     messages = [{"role": "user", "content": prompt}]
-    return client.call_sonnet(messages, temperature=0.3, timeout=20)
+    return client.call_sonnet(messages, temperature=0.3, timeout=20, call_site='projekt_zusammenfassung')
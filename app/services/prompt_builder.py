@@ -0,0 +1,357 @@
+"""
+NEXUS OVERLORD v2.0 - Prompt-Builder mit Token-Budget
+
+Baut Prompts aus einem Template und benannten Abschnitten (Plan, Analyse,
+Feedback, JSON-Daten) und haelt pro Aufrufstelle ein Token-Budget ein.
+
+Kompaktierung (deterministisch, ohne zusaetzlichen KI-Call):
+    1. Whitespace normalisieren, JSON kompakt serialisieren (immer)
+    2. Zeilen entfernen, die schon in einem wichtigeren Abschnitt stehen
+    3. Abschnitte niedriger Prioritaet auf Ueberschriften + Anfaenge der
+       Absaetze kuerzen (Abschnitts-Zusammenfassung)
+
+Tokens werden geschaetzt (Zeichen / CHARS_PER_TOKEN), die echten Zahlen
+liefert das usage-Feld der API-Antwort (siehe OpenRouterClient.call).
+
+Verwendung:
+    prompt = (PromptBuilder('workflow_feedback', FEEDBACK_TEMPLATE)
+              .add('projektplan', projektplan, priority=2)
+              .add('analyse', analyse, priority=1)
+              .build())
+"""
+
+import json
+import logging
+import math
+import os
+import re
+from typing import Any
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Durchschnittliche Zeichen pro Token (deutscher Fliesstext mit Markdown)
+CHARS_PER_TOKEN = 3.5
+
+# Zusaetzliche Tokens pro Nachricht (Rolle, Trenner)
+TOKENS_PER_MESSAGE = 4
+
+# Standard-Budget fuer Aufrufstellen ohne eigenen Eintrag
+PROMPT_BUDGET_DEFAULT = int(os.getenv('PROMPT_BUDGET_DEFAULT', '16000'))
+
+# Budget (geschaetzte Eingabe-Tokens) pro Aufrufstelle.
+# Ueberschreibbar per Umgebungsvariable PROMPT_BUDGET_<AUFRUFSTELLE>,
+# z.B. PROMPT_BUDGET_WORKFLOW_FEEDBACK=12000
+PROMPT_BUDGETS = {
+    'workflow_analyse': 12000,
+    'workflow_feedback': 14000,
+    'workflow_enterprise_plan': 20000,
+    'workflow_qualitaet': 16000,
+    'workflow_verbesserung': 20000,
+    'workflow_bewertung': 14000,
+    'phasen': 16000,
+    'auftraege': 24000,
+    'auftraege_phase': 12000,
+    'qualitaet': 24000,
+    'qualitaet_teil': 10000,
+    'fehler_analyse': 4000,
+    'fehler_auftrag': 4000,
+    'auftrag_formatierung': 6000,
+    'projekt_analyse': 4000,
+    'projekt_zusammenfassung': 4000,
+}
+
+# Zeilen ab dieser Laenge gelten bei der Dedup als Wiederholung
+DEDUP_MIN_CHARS = 30
+
+# Mindestgroesse eines gekuerzten Abschnitts in Tokens
+MIN_SECTION_TOKENS = 150
+
+# Ueberschriften: Markdown, ALL-CAPS-Zeilen, fett gesetzte Zeilen, "1. Titel"
+_HEADING_RE = re.compile(
+    r'^(#{1,6}\s+\S.*|[A-Z0-9][A-Z0-9 &/()\-]{3,}:?|\*\*[^*]+\*\*:?|\d+\.\s+\S.{0,60})$'
+)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_TRAILING_WS_RE = re.compile(r'[ \t]+\n')
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Schaetzt die Token-Anzahl eines Textes.
+
+    Args:
+        text: Beliebiger Text
+
+    Returns:
+        int: Geschaetzte Tokens
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def estimate_message_tokens(messages: list[dict[str, Any]]) -> int:
+    """
+    Schaetzt die Eingabe-Tokens einer Nachrichtenliste.
+
+    Args:
+        messages: Nachrichten (content als Text oder Liste von Content-Bloecken)
+
+    Returns:
+        int: Geschaetzte Tokens
+    """
+    total = 0
+    for message in messages:
+        content = message.get('content', '')
+        if isinstance(content, list):
+            content = ''.join(block.get('text', '') for block in content)
+        total += estimate_tokens(content) + TOKENS_PER_MESSAGE
+    return total
+
+
+def get_budget(call_site: str) -> int:
+    """
+    Liefert das Token-Budget einer Aufrufstelle.
+
+    Args:
+        call_site: Name der Aufrufstelle (z.B. 'workflow_feedback')
+
+    Returns:
+        int: Budget in geschaetzten Eingabe-Tokens
+    """
+    override = os.getenv(f'PROMPT_BUDGET_{call_site.upper()}')
+    if override:
+        return int(override)
+    return PROMPT_BUDGETS.get(call_site, PROMPT_BUDGET_DEFAULT)
+
+
+def compact_json(data: Any) -> str:
+    """
+    Serialisiert ohne Einrueckung und Leerzeichen.
+
+    Args:
+        data: JSON-serialisierbare Daten
+
+    Returns:
+        str: Kompaktes JSON
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Entfernt Leerzeichen am Zeilenende und mehr als eine Leerzeile.
+
+    Args:
+        text: Text
+
+    Returns:
+        str: Normalisierter Text
+    """
+    text = text.replace('\r\n', '\n')
+    text = _TRAILING_WS_RE.sub('\n', text)
+    return _BLANK_LINES_RE.sub('\n\n', text).strip()
+
+
+def dedupe_lines(text: str, seen: set[str]) -> str:
+    """
+    Entfernt Zeilen, die bereits in `seen` stehen, und traegt neue ein.
+
+    Kurze Zeilen (Ueberschriften, Aufzaehlungszeichen) bleiben erhalten.
+
+    Args:
+        text: Abschnitt
+        seen: Normalisierte Zeilen der bereits verarbeiteten Abschnitte
+
+    Returns:
+        str: Abschnitt ohne Wiederholungen
+    """
+    kept = []
+    removed = 0
+    for line in text.split('\n'):
+        key = ' '.join(line.split()).lower()
+        if len(key) >= DEDUP_MIN_CHARS:
+            if key in seen:
+                removed += 1
+                continue
+            seen.add(key)
+        kept.append(line)
+
+    if removed:
+        kept.append(f'[{removed} wiederholte Zeilen entfernt]')
+    return '\n'.join(kept)
+
+
+def summarize_sections(text: str, max_tokens: int) -> str:
+    """
+    Kuerzt einen Text auf ca. max_tokens, Struktur bleibt erhalten.
+
+    Alle Ueberschriften bleiben stehen; das verbleibende Budget wird
+    anteilig auf die Abschnitte verteilt, von jedem Abschnitt bleiben
+    die ersten Zeilen. Gleiche Eingabe ergibt immer dieselbe Ausgabe.
+
+    Args:
+        text: Zu kuerzender Text
+        max_tokens: Ziel-Groesse in geschaetzten Tokens
+
+    Returns:
+        str: Gekuerzter Text
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # In Abschnitte (Ueberschrift, Zeilen) zerlegen
+    sections: list[tuple[str | None, list[str]]] = [(None, [])]
+    for line in text.split('\n'):
+        if _HEADING_RE.match(line.strip()):
+            sections.append((line, []))
+        else:
+            sections[-1][1].append(line)
+
+    max_chars = int(max_tokens * CHARS_PER_TOKEN)
+    heading_chars = sum(len(h) + 1 for h, _ in sections if h)
+    body_chars = sum(len(l) + 1 for _, lines in sections for l in lines) or 1
+    available = max(0, max_chars - heading_chars)
+
+    out = []
+    for heading, lines in sections:
+        if heading:
+            out.append(heading)
+        section_chars = sum(len(l) + 1 for l in lines)
+        quota = available * section_chars // body_chars
+        used = 0
+        kept = 0
+        for line in lines:
+            if used + len(line) + 1 > quota:
+                # Erste Zeile eines Abschnitts wird notfalls angeschnitten
+                if not kept and quota > 40:
+                    out.append(line[:quota - 4] + ' ...')
+                    kept = 1
+                break
+            out.append(line)
+            used += len(line) + 1
+            kept += 1
+        skipped = sum(1 for l in lines[kept:] if l.strip())
+        if skipped:
+            out.append(f'[... {skipped} Zeilen gekuerzt]')
+
+    return normalize_whitespace('\n'.join(out))
+
+
+class PromptBuilder:
+    """
+    Fuellt ein Prompt-Template und haelt das Token-Budget der Aufrufstelle ein.
+
+    Abschnitte mit priority=0 werden nie gekuerzt (z.B. JSON, das das
+    Modell vollstaendig sehen muss). Sonst gilt: hoehere Prioritaet =
+    wichtiger, wird zuletzt gekuerzt und behaelt Zeilen bei der Dedup.
+
+    Attributes:
+        call_site: Name der Aufrufstelle (Budget, Logging)
+        budget: Budget in geschaetzten Eingabe-Tokens
+        stats: Nach build(): tokens_before, tokens, budget, compacted
+    """
+
+    def __init__(self, call_site: str, template: str, budget: int | None = None):
+        """
+        Args:
+            call_site: Name der Aufrufstelle (Schluessel in PROMPT_BUDGETS)
+            template: str.format-Template mit einem Platzhalter pro Abschnitt
+            budget: Optional - Budget statt get_budget(call_site)
+        """
+        self.call_site = call_site
+        self.template = template
+        self.budget = budget if budget is not None else get_budget(call_site)
+        self.stats: dict[str, Any] = {}
+        self._sections: dict[str, dict[str, Any]] = {}
+
+    def add(self, name: str, text: str | None, priority: int = 1) -> 'PromptBuilder':
+        """
+        Fuegt einen Text-Abschnitt hinzu.
+
+        Args:
+            name: Platzhalter im Template
+            text: Inhalt
+            priority: 0 = nie kuerzen, sonst hoeher = wichtiger
+
+        Returns:
+            PromptBuilder: self (verkettbar)
+        """
+        self._sections[name] = {'text': normalize_whitespace(text or ''), 'priority': priority}
+        return self
+
+    def add_json(self, name: str, data: Any) -> 'PromptBuilder':
+        """
+        Fuegt Daten als kompaktes JSON hinzu (wird nie gekuerzt).
+
+        Args:
+            name: Platzhalter im Template
+            data: JSON-serialisierbare Daten
+
+        Returns:
+            PromptBuilder: self (verkettbar)
+        """
+        self._sections[name] = {'text': compact_json(data), 'priority': 0}
+        return self
+
+    def _total_tokens(self) -> int:
+        """Geschaetzte Tokens des fertigen Prompts."""
+        fixed = len(self.template) - sum(len(name) + 2 for name in self._sections)
+        return math.ceil((fixed + sum(len(s['text']) for s in self._sections.values())) / CHARS_PER_TOKEN)
+
+    def build(self) -> str:
+        """
+        Kompaktiert bei Bedarf und fuellt das Template.
+
+        Returns:
+            str: Fertiger Prompt
+        """
+        before = self._total_tokens()
+        compacted = False
+
+        if before > self.budget:
+            compacted = True
+            self._dedupe()
+
+            # Abschnitte niedriger Prioritaet zuerst kuerzen
+            by_priority = sorted(
+                (name for name, s in self._sections.items() if s['priority'] > 0),
+                key=lambda name: self._sections[name]['priority']
+            )
+            for name in by_priority:
+                overflow = self._total_tokens() - self.budget
+                if overflow <= 0:
+                    break
+                section = self._sections[name]
+                target = max(MIN_SECTION_TOKENS, estimate_tokens(section['text']) - overflow)
+                section['text'] = summarize_sections(section['text'], target)
+
+        after = self._total_tokens()
+        self.stats = {'tokens_before': before, 'tokens': after,
+                      'budget': self.budget, 'compacted': compacted}
+
+        if after > self.budget:
+            logger.warning(f"Prompt [{self.call_site}]: ~{after} Tokens trotz Kompaktierung "
+                           f"ueber Budget {self.budget}")
+        elif compacted:
+            logger.info(f"Prompt [{self.call_site}] kompaktiert: ~{before} -> ~{after} Tokens "
+                        f"(Budget {self.budget})")
+        else:
+            logger.debug(f"Prompt [{self.call_site}]: ~{after} Tokens (Budget {self.budget})")
+
+        return self.template.format(**{name: s['text'] for name, s in self._sections.items()})
+
+    def _dedupe(self) -> None:
+        """Entfernt Zeilen, die in einem wichtigeren Abschnitt schon vorkommen."""
+        seen: set[str] = set()
+        # Fixe Abschnitte zuerst, danach absteigend nach Prioritaet
+        order = sorted(self._sections, key=lambda name: (
+            self._sections[name]['priority'] != 0, -self._sections[name]['priority']
+        ))
+        for name in order:
+            section = self._sections[name]
+            if section['priority'] == 0:
+                # Fixe Abschnitte bleiben unveraendert, zaehlen aber als gesehen
+                dedupe_lines(section['text'], seen)
+                continue
+            section['text'] = dedupe_lines(section['text'], seen)
@@ -13,16 +13,34 @@ Pruefungskategorien:
     - Duplikate: Gibt es Ueberschneidungen?
 """
 
-import json
+import asyncio
+import contextvars
 import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
-from app.services.openrouter import get_client
+from app.services.openrouter import get_async_client, get_client
+from app.services.prompt_builder import PromptBuilder, compact_json
 from app.utils.json_extractor import extract_json
 
 # Logger konfigurieren
 logger = logging.getLogger(__name__)
 
+# Aufgeteilte, parallele Pruefung (opt-in). Die Gesamtbewertung wird dabei lokal
+# aus den gewichteten Teil-Bewertungen berechnet statt vom Modell vergeben.
+QUALITAET_CHUNKED = os.getenv('QUALITAET_CHUNKED', '0') == '1'
+
+# Maximale Anzahl gleichzeitiger Pruef-Requests
+QUALITAET_WORKERS = int(os.getenv('QUALITAET_WORKERS', '4'))
+
+# Detail-Pruefung: so viele Auftraege (ganze Phasen) pro Request
+QUALITAET_CHUNK_AUFTRAEGE = int(os.getenv('QUALITAET_CHUNK_AUFTRAEGE', '15'))
+
+# Timeout eines einzelnen Pruef-Requests in Sekunden
+QUALITAET_TEIL_TIMEOUT = int(os.getenv('QUALITAET_TEIL_TIMEOUT', '60'))
+
 
 # Prompt-Template fuer Qualitaetspruefung
 QUALITAET_PROMPT = """Du bist ein erfahrener QA-Manager und Software-Architekt. Pruefe die folgenden Auftraege auf Vollstaendigkeit und Qualitaet.
@@ -152,18 +170,72 @@ WICHTIG:
 """
 
 
+# Pruef-Kriterien je Kategorie (fuer die aufgeteilte Pruefung)
+KATEGORIEN = {
+    "Vollstaendigkeit": "Decken die Auftraege den gesamten Enterprise-Plan ab? Sind alle Features/Komponenten beruecksichtigt?",
+    "Reihenfolge": "Sind Abhaengigkeiten korrekt beruecksichtigt? Macht die Sequenz Sinn? Kann man so tatsaechlich arbeiten?",
+    "Klarheit": "Sind die Schritte verstaendlich? Kann ein Entwickler die Auftraege ausfuehren? Sind technische Details ausreichend?",
+    "Dateien": "Sind alle benoetigten Dateien genannt? Sind die Pfade korrekt? Sind die Aktionen (neu/aendern) richtig?",
+    "Regelwerk": "Ist das Uebergabe-Format konsistent? Sind Commit-Messages einheitlich? Sind die Pflichten klar definiert?",
+    "Luecken": "Fehlen wichtige Aspekte? Sind Tests/Dokumentation beruecksichtigt? Gibt es unklare Bereiche?",
+    "Duplikate": "Gibt es unnoetige Ueberschneidungen? Wiederholen sich Aufgaben? Ist alles einzigartig?",
+}
+
+# Pruef-Gruppen: welche Kategorien welche Daten brauchen.
+#   plan     - Plan + Kurzfassung der Auftraege (liefert auch Kommentar und Fazit)
+#   struktur - Phasen-Abhaengigkeiten + Kurzfassung der Auftraege
+#   details  - vollstaendige Auftraege, aufgeteilt nach Phasen
+PRUEF_GRUPPEN = {
+    "plan": ["Vollstaendigkeit", "Luecken"],
+    "struktur": ["Reihenfolge", "Duplikate"],
+    "details": ["Klarheit", "Dateien", "Regelwerk"],
+}
+
+# Felder der Auftraege je Gruppe (alles andere wird weggelassen)
+AUFTRAG_FELDER = {
+    "plan": ("auftrag_nummer", "name", "beschreibung"),
+    "struktur": ("auftrag_nummer", "name", "beschreibung"),
+    "details": ("auftrag_nummer", "name", "schritte", "dateien", "technische_details",
+                "erfolgs_kriterien", "regelwerk"),
+}
+
+# Prompt fuer eine Teil-Pruefung
+QUALITAET_TEIL_PROMPT = """Du bist ein erfahrener QA-Manager und Software-Architekt. Pruefe die folgenden Auftraege kritisch, aber NUR in diesen Kategorien:
+
+{kriterien}
+
+{kontext}
+
+BEWERTUNGS-SKALA (1-10): 1-4 schlecht, 5-7 mittel, 8-10 gut.
+Bei Bewertung < 7: konkrete Verbesserungen angeben. Bei kritischen Problemen: Warnungen.
+
+AUSGABE als JSON (NUR JSON, kein anderer Text):
+{{"kategorien":[{{"name":"{beispiel}","bewertung":8,"status":"gut","kommentar":"..."}}],"verbesserungen":[{{"auftrag":"2.3","typ":"empfehlung","text":"..."}}],"warnungen":[]{zusatz}}}
+"""
+
+# Zusaetzliche Felder, die nur die Plan-Gruppe liefert
+QUALITAET_ZUSATZ = ',"gesamt_kommentar":"Zusammenfassung in 1-2 Saetzen","fazit":"Abschliessendes Fazit"'
+
+
 def pruefen_auftraege(
     auftraege_data: dict[str, Any],
     phasen_data: dict[str, Any],
-    enterprise_plan: str
+    enterprise_plan: str,
+    chunked: bool | None = None
 ) -> dict[str, Any]:
     """
     Prueft Auftraege mit Gemini 3 Pro auf Qualitaet.
 
+    Standardmaessig in einem Request. Die aufgeteilte Pruefung ist opt-in
+    (QUALITAET_CHUNKED=1 oder chunked=True, siehe _pruefen_aufgeteilt):
+    mehrere kleine, parallele Requests mit kompaktem JSON statt eines
+    grossen Prompts.
+
     Args:
         auftraege_data: Auftrags-Struktur aus dem Auftraege-Generator
         phasen_data: Phasen-Struktur aus dem Phasen-Generator
         enterprise_plan: Original Enterprise-Plan
+        chunked: Aufteilung erzwingen/abschalten (Standard: QUALITAET_CHUNKED)
 
     Returns:
         dict: Qualitaets-Bewertung mit:
@@ -178,27 +250,138 @@ def pruefen_auftraege(
         ValueError: Bei ungueltiger JSON-Antwort oder Validierungsfehler
         Exception: Bei API-Fehler
     """
+    if chunked is None:
+        chunked = QUALITAET_CHUNKED
+    if chunked:
+        return _pruefen_aufgeteilt(auftraege_data, phasen_data, enterprise_plan)
+
     logger.info("Starte Qualitaetspruefung")
 
-    client = get_client()
+    # Gemini 3 Pro aufrufen
+    logger.debug("Rufe Gemini 3 Pro auf")
+    response = get_client().call_gemini(
+        _qualitaet_messages(auftraege_data, phasen_data, enterprise_plan),
+        temperature=0.7, timeout=90, call_site='qualitaet'
+    )
+    return _parse_qualitaet(response)
 
-    # Daten als JSON formatieren
-    phasen_json = json.dumps(phasen_data, indent=2, ensure_ascii=False)
-    auftraege_json = json.dumps(auftraege_data, indent=2, ensure_ascii=False)
 
-    # Prompt mit Daten fuellen
-    prompt = QUALITAET_PROMPT.format(
-        enterprise_plan=enterprise_plan,
-        phasen_json=phasen_json,
-        auftraege_json=auftraege_json
-    )
+async def pruefen_auftraege_async(
+    auftraege_data: dict[str, Any],
+    phasen_data: dict[str, Any],
+    enterprise_plan: str,
+    chunked: bool | None = None,
+    on_fortschritt: Callable[[int, int], None] | None = None
+) -> dict[str, Any]:
+    """
+    Async Variante von pruefen_auftraege() fuer async Views.
 
-    # Gemini 3 Pro aufrufen
-    logger.debug("Rufe Gemini 3 Pro auf")
-    response = client.call_gemini([
-        {"role": "user", "content": prompt}
-    ], temperature=0.7, timeout=90)
+    Die Teil-Pruefungen laufen per asyncio.gather auf der Event-Loop des
+    Aufrufers, hoechstens QUALITAET_WORKERS gleichzeitig.
+
+    Args:
+        auftraege_data: Auftrags-Struktur aus dem Auftraege-Generator
+        phasen_data: Phasen-Struktur aus dem Phasen-Generator
+        enterprise_plan: Original Enterprise-Plan
+        chunked: Aufteilung erzwingen/abschalten (Standard: QUALITAET_CHUNKED)
+        on_fortschritt: Optional - Callback (fertige Teile, alle Teile) bei Aufteilung,
+                        wird auf der Loop gerufen und darf nicht blockieren
+
+    Returns:
+        dict: Qualitaets-Bewertung wie pruefen_auftraege()
+
+    Raises:
+        ValueError: Bei ungueltiger Antwort oder unvollstaendiger Teil-Pruefung
+        Exception: Bei API-Fehler
+    """
+    client = get_async_client()
+    if chunked is None:
+        chunked = QUALITAET_CHUNKED
+
+    if not chunked:
+        logger.info("Starte Qualitaetspruefung (async)")
+        response = await client.call_gemini(
+            _qualitaet_messages(auftraege_data, phasen_data, enterprise_plan),
+            temperature=0.7, timeout=90, call_site='qualitaet'
+        )
+        return _parse_qualitaet(response)
+
+    teile = _build_pruef_teile(auftraege_data.get("auftraege", []), phasen_data.get("phasen", []),
+                               enterprise_plan)
+    logger.info(f"Starte Qualitaetspruefung (async, {len(teile)} Teil-Pruefungen)")
+    limit = asyncio.Semaphore(max(1, QUALITAET_WORKERS))
+
+    async def teil_pruefen(teil: dict[str, Any]) -> dict[str, Any]:
+        async with limit:
+            response = await client.call_gemini(_teil_messages(teil), temperature=0.7,
+                                                timeout=QUALITAET_TEIL_TIMEOUT, call_site='qualitaet_teil')
+        ergebnis = _parse_teil(teil, response)
+        if on_fortschritt:
+            on_fortschritt(len(ergebnisse) + 1, len(teile))
+        ergebnisse.append((teil, ergebnis))
+        return ergebnis
+
+    ergebnisse: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    offen = teile
+    fehler: dict[str, str] = {}
+
+    for runde in range(2):
+        if runde:
+            logger.warning(f"Wiederhole {len(offen)} Teil-Pruefung(en)")
+        resultate = await asyncio.gather(*(teil_pruefen(t) for t in offen), return_exceptions=True)
+        naechste = []
+        for teil, ergebnis in zip(offen, resultate):
+            if isinstance(ergebnis, Exception):
+                logger.warning(f"Teil-Pruefung '{teil['label']}' fehlgeschlagen: {ergebnis}")
+                fehler[teil["label"]] = str(ergebnis)
+                naechste.append(teil)
+            else:
+                fehler.pop(teil["label"], None)
+        offen = naechste
+        if not offen:
+            break
+
+    return _finish_aufgeteilt(teile, ergebnisse, offen, fehler)
+
+
+def _qualitaet_messages(
+    auftraege_data: dict[str, Any],
+    phasen_data: dict[str, Any],
+    enterprise_plan: str
+) -> list[dict[str, Any]]:
+    """
+    Baut die Nachrichten der Einzel-Pruefung (alle Kategorien in einem Prompt).
+
+    Args:
+        auftraege_data: Auftrags-Struktur
+        phasen_data: Phasen-Struktur
+        enterprise_plan: Original Enterprise-Plan
 
+    Returns:
+        list: Nachrichten fuer den Client
+    """
+    # Prompt mit Daten fuellen (JSON kompakt, Plan im Budget)
+    prompt = (PromptBuilder('qualitaet', QUALITAET_PROMPT)
+              .add('enterprise_plan', enterprise_plan)
+              .add_json('phasen_json', phasen_data)
+              .add_json('auftraege_json', auftraege_data)
+              .build())
+    return [{"role": "user", "content": prompt}]
+
+
+def _parse_qualitaet(response: str) -> dict[str, Any]:
+    """
+    Extrahiert und validiert die Qualitaetsbewertung der Einzel-Pruefung.
+
+    Args:
+        response: Antworttext von Gemini
+
+    Returns:
+        dict: Validierte Qualitaets-Bewertung
+
+    Raises:
+        ValueError: Bei ungueltiger JSON-Antwort oder Validierungsfehler
+    """
     logger.debug(f"Gemini-Antwort erhalten ({len(response)} Zeichen)")
 
     # JSON aus Response extrahieren
@@ -218,6 +401,335 @@ def pruefen_auftraege(
     return parsed
 
 
+def _pruefen_aufgeteilt(
+    auftraege_data: dict[str, Any],
+    phasen_data: dict[str, Any],
+    enterprise_plan: str
+) -> dict[str, Any]:
+    """
+    Prueft Kategorien-Gruppen und Phasen-Teilmengen parallel und fuehrt zusammen.
+
+    - Jede Gruppe (PRUEF_GRUPPEN) bekommt nur die Daten, die sie braucht,
+      als kompaktes JSON ohne Einrueckung und mit gekuerzten Feldern
+    - Die Detail-Kategorien werden ueber Phasen-Bloecke verteilt
+      (QUALITAET_CHUNK_AUFTRAEGE Auftraege pro Request)
+    - Fehlgeschlagene Teil-Pruefungen werden einmal wiederholt
+    - Ergebnis hat dieselbe Struktur wie die Einzel-Pruefung
+
+    Args:
+        auftraege_data: Auftrags-Struktur
+        phasen_data: Phasen-Struktur
+        enterprise_plan: Original Enterprise-Plan
+
+    Returns:
+        dict: Qualitaets-Bewertung wie pruefen_auftraege()
+
+    Raises:
+        ValueError: Wenn eine Teil-Pruefung auch nach Wiederholung scheitert
+    """
+    auftraege = auftraege_data.get("auftraege", [])
+    teile = _build_pruef_teile(auftraege, phasen_data.get("phasen", []), enterprise_plan)
+    logger.info(f"Starte Qualitaetspruefung ({len(teile)} Teil-Pruefungen, "
+                f"{sum(len(t['prompt']) for t in teile)} Zeichen Prompt gesamt)")
+
+    client = get_client()
+    ergebnisse: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    offen = teile
+    fehler: dict[str, str] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, QUALITAET_WORKERS),
+                            thread_name_prefix='qualitaet') as executor:
+        for runde in range(2):
+            if runde:
+                logger.warning(f"Wiederhole {len(offen)} Teil-Pruefung(en)")
+            futures = {
+                executor.submit(contextvars.copy_context().run, _pruefe_teil, client, teil): teil
+                for teil in offen
+            }
+            offen = []
+            for future in as_completed(futures):
+                teil = futures[future]
+                try:
+                    ergebnisse.append((teil, future.result()))
+                    fehler.pop(teil["label"], None)
+                except Exception as e:
+                    logger.warning(f"Teil-Pruefung '{teil['label']}' fehlgeschlagen: {e}")
+                    fehler[teil["label"]] = str(e)
+                    offen.append(teil)
+            if not offen:
+                break
+
+    return _finish_aufgeteilt(teile, ergebnisse, offen, fehler)
+
+
+def _finish_aufgeteilt(
+    teile: list[dict[str, Any]],
+    ergebnisse: list[tuple[dict[str, Any], dict[str, Any]]],
+    offen: list[dict[str, Any]],
+    fehler: dict[str, str]
+) -> dict[str, Any]:
+    """
+    Fuehrt die Teil-Pruefungen zusammen und validiert das Ergebnis.
+
+    Args:
+        teile: Alle Teile aus _build_pruef_teile()
+        ergebnisse: (Teil, geparste Antwort) der erfolgreichen Pruefungen
+        offen: Auch nach Wiederholung fehlgeschlagene Teile
+        fehler: Label -> letzte Fehlermeldung
+
+    Returns:
+        dict: Qualitaets-Bewertung wie pruefen_auftraege()
+
+    Raises:
+        ValueError: Wenn noch Teile offen sind
+    """
+    if offen:
+        details = "; ".join(f"{label}: {msg}" for label, msg in sorted(fehler.items()))
+        raise ValueError(f"Qualitaetspruefung unvollstaendig: {details}")
+
+    # Reihenfolge der Teile beibehalten (Kommentare in Phasen-Reihenfolge)
+    ergebnisse.sort(key=lambda e: teile.index(e[0]))
+    data = _merge_pruef_ergebnisse(ergebnisse)
+    validate_qualitaet(data)
+
+    logger.info(f"Qualitaetspruefung abgeschlossen: Gesamtbewertung {data['gesamt_bewertung']}/10")
+    return data
+
+
+def _kuerze_auftraege(auftraege: list[dict[str, Any]], gruppe: str) -> str:
+    """
+    Reduziert Auftraege auf die Felder einer Pruef-Gruppe, ein Auftrag pro Zeile.
+
+    Args:
+        auftraege: Auftraege
+        gruppe: Schluessel aus AUFTRAG_FELDER
+
+    Returns:
+        str: Kompaktes JSON (JSON Lines)
+    """
+    felder = AUFTRAG_FELDER[gruppe]
+    return "\n".join(
+        compact_json({feld: a[feld] for feld in felder if a.get(feld) not in (None, "", [], {})})
+        for a in auftraege
+    )
+
+
+def _build_pruef_teile(
+    auftraege: list[dict[str, Any]],
+    phasen: list[dict[str, Any]],
+    enterprise_plan: str
+) -> list[dict[str, Any]]:
+    """
+    Baut die Teil-Pruefungen (Prompt, Kategorien, Gewicht).
+
+    Args:
+        auftraege: Alle Auftraege
+        phasen: Alle Phasen
+        enterprise_plan: Original Enterprise-Plan
+
+    Returns:
+        list: Dicts mit label, gruppe, kategorien, gewicht (Anzahl Auftraege), prompt
+    """
+    phasen_kurz = "\n".join(
+        compact_json({"nummer": p.get("nummer"), "name": p.get("name"),
+                       "abhaengigkeiten": p.get("abhaengigkeiten", [])})
+        for p in phasen
+    )
+    kontexte = {
+        "plan": (PromptBuilder('qualitaet_teil', "ENTERPRISE-PLAN:\n{plan}\n\nAUFTRAEGE (Kurzfassung):\n{auftraege}")
+                 .add('plan', enterprise_plan)
+                 .add('auftraege', _kuerze_auftraege(auftraege, 'plan'), priority=0)
+                 .build()),
+        "struktur": (f"PHASEN:\n{phasen_kurz}\n\n"
+                     f"AUFTRAEGE (Kurzfassung, Nummer = Phase.Auftrag):\n{_kuerze_auftraege(auftraege, 'struktur')}"),
+    }
+
+    teile = []
+    for gruppe in ("plan", "struktur"):
+        teile.append(_pruef_teil(gruppe, gruppe, kontexte[gruppe], len(auftraege)))
+
+    # Detail-Pruefung in Bloecken ganzer Phasen
+    for nummern, block in _phasen_bloecke(auftraege, QUALITAET_CHUNK_AUFTRAEGE):
+        label = f"details Phase {nummern[0]}" + (f"-{nummern[-1]}" if len(nummern) > 1 else "")
+        kontext = f"AUFTRAEGE (Phase {', '.join(map(str, nummern))}):\n{_kuerze_auftraege(block, 'details')}"
+        teile.append(_pruef_teil(label, "details", kontext, len(block)))
+
+    return teile
+
+
+def _pruef_teil(label: str, gruppe: str, kontext: str, gewicht: int) -> dict[str, Any]:
+    """Fuellt QUALITAET_TEIL_PROMPT fuer eine Gruppe."""
+    kategorien = PRUEF_GRUPPEN[gruppe]
+    kriterien = "\n".join(f"- **{name}**: {KATEGORIEN[name]}" for name in kategorien)
+    prompt = QUALITAET_TEIL_PROMPT.format(
+        kriterien=kriterien,
+        kontext=kontext,
+        beispiel=kategorien[0],
+        zusatz=QUALITAET_ZUSATZ if gruppe == "plan" else ""
+    )
+    return {"label": label, "gruppe": gruppe, "kategorien": kategorien,
+            "gewicht": gewicht, "prompt": prompt}
+
+
+def _phasen_bloecke(
+    auftraege: list[dict[str, Any]],
+    max_auftraege: int
+) -> list[tuple[list[Any], list[dict[str, Any]]]]:
+    """
+    Teilt Auftraege in Bloecke ganzer Phasen mit hoechstens max_auftraege Auftraegen.
+
+    Eine Phase mit mehr Auftraegen bildet einen eigenen Block.
+
+    Args:
+        auftraege: Auftraege in Phasen-Reihenfolge
+        max_auftraege: Obergrenze pro Block
+
+    Returns:
+        list: (Phasen-Nummern, Auftraege) je Block
+    """
+    nach_phase: dict[Any, list[dict[str, Any]]] = {}
+    for auftrag in auftraege:
+        nach_phase.setdefault(auftrag.get("phase_nummer"), []).append(auftrag)
+
+    bloecke = []
+    nummern: list[Any] = []
+    block: list[dict[str, Any]] = []
+    for nummer, phase_auftraege in nach_phase.items():
+        if block and len(block) + len(phase_auftraege) > max_auftraege:
+            bloecke.append((nummern, block))
+            nummern, block = [], []
+        nummern.append(nummer)
+        block.extend(phase_auftraege)
+    if block:
+        bloecke.append((nummern, block))
+    return bloecke
+
+
+def _pruefe_teil(client: Any, teil: dict[str, Any]) -> dict[str, Any]:
+    """
+    Fuehrt eine Teil-Pruefung aus.
+
+    Args:
+        client: OpenRouterClient
+        teil: Eintrag aus _build_pruef_teile()
+
+    Returns:
+        dict: Geparste Antwort mit den Kategorien des Teils
+
+    Raises:
+        ValueError: Wenn Kategorien in der Antwort fehlen
+    """
+    response = client.call_gemini(_teil_messages(teil), temperature=0.7,
+                                  timeout=QUALITAET_TEIL_TIMEOUT, call_site='qualitaet_teil')
+    return _parse_teil(teil, response)
+
+
+def _teil_messages(teil: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Nachrichten einer Teil-Pruefung.
+
+    Args:
+        teil: Eintrag aus _build_pruef_teile()
+
+    Returns:
+        list: Nachrichten fuer den Client
+    """
+    return [{"role": "user", "content": teil["prompt"]}]
+
+
+def _parse_teil(teil: dict[str, Any], response: str) -> dict[str, Any]:
+    """
+    Parst die Antwort einer Teil-Pruefung und prueft die Kategorien.
+
+    Args:
+        teil: Eintrag aus _build_pruef_teile()
+        response: Antworttext von Gemini
+
+    Returns:
+        dict: Geparste Antwort mit den Kategorien des Teils
+
+    Raises:
+        ValueError: Wenn Kategorien in der Antwort fehlen
+    """
+    parsed = extract_json(response)
+    gefunden = {k.get("name") for k in parsed.get("kategorien", []) if isinstance(k, dict)}
+    fehlend = [name for name in teil["kategorien"] if name not in gefunden]
+    if fehlend:
+        raise ValueError(f"Kategorien fehlen in der Antwort: {', '.join(fehlend)}")
+
+    logger.debug(f"Teil-Pruefung '{teil['label']}': {len(teil['prompt'])} Zeichen Prompt, "
+                 f"{len(response)} Zeichen Antwort")
+    return parsed
+
+
+def _merge_pruef_ergebnisse(
+    ergebnisse: list[tuple[dict[str, Any], dict[str, Any]]]
+) -> dict[str, Any]:
+    """
+    Fuehrt Teil-Ergebnisse zur Struktur der Einzel-Pruefung zusammen.
+
+    Bewertungen einer Kategorie aus mehreren Bloecken werden nach Anzahl
+    der Auftraege gewichtet gemittelt, Kommentare mit Block-Label verbunden.
+    gesamt_bewertung ist der gerundete Durchschnitt der Kategorien.
+
+    Args:
+        ergebnisse: (Teil, geparste Antwort) je Teil-Pruefung, in Teil-Reihenfolge
+
+    Returns:
+        dict: gesamt_bewertung, gesamt_kommentar, kategorien, verbesserungen, warnungen, fazit
+    """
+    sammlung: dict[str, list[tuple[dict[str, Any], dict[str, Any]]]] = {}
+    verbesserungen: list[Any] = []
+    warnungen: list[Any] = []
+    data: dict[str, Any] = {}
+
+    for teil, antwort in ergebnisse:
+        for kategorie in antwort.get("kategorien", []):
+            if isinstance(kategorie, dict) and kategorie.get("name") in teil["kategorien"]:
+                sammlung.setdefault(kategorie["name"], []).append((teil, kategorie))
+        verbesserungen.extend(antwort.get("verbesserungen") or [])
+        warnungen.extend(antwort.get("warnungen") or [])
+        if teil["gruppe"] == "plan":
+            for feld in ("gesamt_kommentar", "fazit"):
+                if antwort.get(feld):
+                    data[feld] = antwort[feld]
+
+    kategorien = []
+    for name in KATEGORIEN:
+        eintraege = sammlung.get(name)
+        if not eintraege:
+            continue
+        if len(eintraege) == 1:
+            kategorien.append({**eintraege[0][1], "bewertung": round(_note(eintraege[0][1]))})
+            continue
+
+        gewichte = [max(1, teil["gewicht"]) for teil, _ in eintraege]
+        summe = sum(g * _note(k) for g, (_, k) in zip(gewichte, eintraege))
+        kategorien.append({
+            "name": name,
+            "bewertung": round(summe / sum(gewichte)),
+            "kommentar": " ".join(
+                f"{teil['label'].replace('details ', '')}: {k.get('kommentar', '')}"
+                for teil, k in eintraege
+            ),
+        })
+
+    data["kategorien"] = kategorien
+    data["verbesserungen"] = verbesserungen
+    data["warnungen"] = warnungen
+    if kategorien:
+        data["gesamt_bewertung"] = round(sum(_note(k) for k in kategorien) / len(kategorien))
+    return data
+
+
+def _note(kategorie: dict[str, Any]) -> float:
+    """Bewertung einer Kategorie als Zahl (5 bei fehlendem/ungueltigem Wert)."""
+    try:
+        return float(kategorie.get("bewertung", 5))
+    except (TypeError, ValueError):
+        return 5.0
+
+
 def validate_qualitaet(data: dict[str, Any]) -> None:
     """
     Validiert die Qualitaets-Struktur.
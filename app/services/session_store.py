@@ -0,0 +1,363 @@
+"""
+NEXUS OVERLORD v2.0 - Server-seitiger Session-Store
+
+Grosse generierte Artefakte (Phasen, Auftraege, Qualitaetspruefung,
+importierter Plan-Text) liegen nicht mehr im signierten Cookie, sondern
+in einer eigenen SQLite-Datenbank. Im Flask-Session-Cookie steht pro
+Artefakt nur noch eine kurze Referenz.
+
+Verwendung in Routes:
+    set_session_artifact('phasen_data', phasen_data)
+    phasen_data = get_session_artifact('phasen_data')
+    pop_session_artifact('phasen_data')
+
+Abgelaufene Artefakte (SESSION_ARTIFACT_TTL) werden beim Lesen ignoriert
+und beim Schreiben periodisch geloescht.
+"""
+
+import json
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from typing import Any
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Pfad der Session-Datenbank (getrennt von nexus.db)
+SESSION_STORE_PATH = os.getenv('SESSION_STORE_PATH', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    'database',
+    'sessions.db'
+))
+
+# Lebensdauer eines Artefakts in Sekunden (Standard: 24 Stunden)
+ARTIFACT_TTL = int(os.getenv('SESSION_ARTIFACT_TTL', str(24 * 3600)))
+
+# Mindestabstand zwischen zwei Aufraeum-Laeufen in Sekunden
+PURGE_INTERVAL = 300
+
+# Suffix fuer die Referenz im Cookie
+REF_SUFFIX = '_ref'
+
+# Session-Schluessel: Namen der Artefakte, deren Referenz nur verknuepft ist
+# (link_session_artifact) - sie gehoeren nicht der Session und werden nie geloescht
+SHARED_KEY = '_geteilte_artefakte'
+
+
+class ArtifactStore:
+    """
+    SQLite-basierter Key-Value-Store mit TTL fuer Session-Artefakte.
+
+    Attributes:
+        db_path: Pfad zur SQLite-Datei
+        ttl: Lebensdauer eines Artefakts in Sekunden
+    """
+
+    def __init__(self, db_path: str = SESSION_STORE_PATH, ttl: int = ARTIFACT_TTL):
+        """
+        Initialisiert den Store und legt die Tabelle bei Bedarf an.
+
+        Args:
+            db_path: Pfad zur SQLite-Datei
+            ttl: Lebensdauer eines Artefakts in Sekunden
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._last_purge = 0.0
+        self._purge_lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS session_artifacts (
+                    ref TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_session_artifacts_expires "
+                "ON session_artifacts(expires_at)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Oeffnet eine Verbindung zur Session-Datenbank.
+
+        Returns:
+            sqlite3.Connection: Datenbankverbindung
+        """
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def put(self, data: Any, ref: str | None = None) -> str:
+        """
+        Speichert ein Artefakt.
+
+        Args:
+            data: JSON-serialisierbare Daten
+            ref: Optional - bestehende Referenz ueberschreiben
+
+        Returns:
+            str: Referenz auf das Artefakt
+        """
+        ref = ref or secrets.token_urlsafe(16)
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO session_artifacts (ref, data, expires_at) VALUES (?, ?, ?)",
+                (ref, payload, time.time() + self.ttl)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        logger.debug(f"Session-Artefakt gespeichert: {ref} ({len(payload)} Zeichen)")
+        self._maybe_purge()
+        return ref
+
+    def get(self, ref: str) -> Any | None:
+        """
+        Laedt ein Artefakt.
+
+        Args:
+            ref: Referenz aus put()
+
+        Returns:
+            Die gespeicherten Daten oder None (unbekannt/abgelaufen)
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT data FROM session_artifacts WHERE ref = ? AND expires_at > ?",
+                (ref, time.time())
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if not row:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            logger.warning(f"Session-Artefakt {ref} ist beschaedigt")
+            return None
+
+    def delete(self, ref: str) -> None:
+        """
+        Loescht ein Artefakt.
+
+        Args:
+            ref: Referenz aus put()
+        """
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM session_artifacts WHERE ref = ?", (ref,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def purge_expired(self) -> int:
+        """
+        Loescht alle abgelaufenen Artefakte.
+
+        Returns:
+            int: Anzahl geloeschter Artefakte
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "DELETE FROM session_artifacts WHERE expires_at <= ?", (time.time(),)
+            )
+            deleted = cursor.rowcount
+            conn.commit()
+        finally:
+            conn.close()
+
+        if deleted:
+            logger.info(f"{deleted} abgelaufene Session-Artefakte geloescht")
+        return deleted
+
+    def _maybe_purge(self) -> None:
+        """Fuehrt purge_expired() hoechstens alle PURGE_INTERVAL Sekunden aus."""
+        now = time.monotonic()
+        if now - self._last_purge < PURGE_INTERVAL:
+            return
+        if not self._purge_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_purge = now
+            self.purge_expired()
+        except sqlite3.Error as e:
+            logger.warning(f"Aufraeumen des Session-Stores fehlgeschlagen: {e}")
+        finally:
+            self._purge_lock.release()
+
+
+# Singleton-Instanz
+_store: ArtifactStore | None = None
+
+
+def get_store() -> ArtifactStore:
+    """
+    Gibt die Singleton-Instanz des Artefakt-Stores zurueck.
+
+    Returns:
+        ArtifactStore: Die Store-Instanz
+    """
+    global _store
+    if _store is None:
+        _store = ArtifactStore()
+    return _store
+
+
+# ========================================
+# FLASK-SESSION HELFER
+# ========================================
+
+def set_session_artifact(name: str, data: Any) -> None:
+    """
+    Legt ein Artefakt server-seitig ab und merkt sich die Referenz in der Session.
+
+    Args:
+        name: Name des Artefakts (z.B. 'phasen_data')
+        data: JSON-serialisierbare Daten
+    """
+    from flask import session
+
+    _release(name)
+    session[name + REF_SUFFIX] = get_store().put(data)
+
+
+def get_session_artifact(name: str, default: Any = None) -> Any:
+    """
+    Laedt ein Artefakt ueber die Referenz aus der Session.
+
+    Args:
+        name: Name des Artefakts
+        default: Rueckgabewert falls nicht vorhanden oder abgelaufen
+
+    Returns:
+        Die gespeicherten Daten oder default
+    """
+    from flask import session
+
+    ref = session.get(name + REF_SUFFIX)
+    if not ref:
+        return default
+    data = get_store().get(ref)
+    return default if data is None else data
+
+
+def pop_session_artifact(name: str) -> None:
+    """
+    Entfernt ein Artefakt aus Session und Store (geteilte nur aus der Session).
+
+    Args:
+        name: Name des Artefakts
+    """
+    from flask import session
+
+    _release(name)
+    session.pop(name + REF_SUFFIX, None)
+
+
+def reserve_session_artifact(name: str) -> tuple[str, str | None]:
+    """
+    Legt vorab eine neue Referenz fuer ein Artefakt an.
+
+    Fuer Streaming-Responses: Das Session-Cookie wird mit den Headern
+    verschickt, bevor das Ergebnis feststeht. Die neue Referenz steht daher
+    schon vorher in der Session und enthaelt bis dahin eine Kopie des
+    bisherigen Ergebnisses - schlaegt die Generierung fehl, bleibt es
+    lesbar. Die alte Referenz gibt der Aufrufer erst frei, wenn die
+    Generierung beendet ist (siehe release_reserved_artifact()).
+
+    Args:
+        name: Name des Artefakts
+
+    Returns:
+        tuple: (neue Referenz fuer get_store().put(), alte eigene Referenz
+            zum spaeteren Loeschen oder None)
+    """
+    from flask import session
+
+    old_ref = session.get(name + REF_SUFFIX)
+    vorher = get_store().get(old_ref) if old_ref else None
+
+    geteilt = session.get(SHARED_KEY, [])
+    if name in geteilt:
+        # Geteilte Job-Ergebnisse gehoeren nicht der Session
+        session[SHARED_KEY] = [n for n in geteilt if n != name]
+        old_ref = None
+
+    ref = get_store().put(vorher)
+    session[name + REF_SUFFIX] = ref
+    return ref, old_ref
+
+
+def release_reserved_artifact(old_ref: str | None) -> None:
+    """
+    Loescht die alte Referenz, sobald die Generierung beendet ist.
+
+    Laeuft ausserhalb des Request-Kontexts (Streaming-Thread).
+
+    Args:
+        old_ref: Zweiter Rueckgabewert von reserve_session_artifact()
+    """
+    if old_ref:
+        get_store().delete(old_ref)
+
+
+def link_session_artifact(name: str, ref: str) -> None:
+    """
+    Verknuepft ein bereits gespeichertes Artefakt mit der Session.
+
+    Fuer Ergebnisse von Hintergrund-Jobs (app/services/planung_jobs.py):
+    Das Artefakt gehoert dem Job und kann von mehreren Sessions genutzt
+    werden. Es wird als geteilt markiert - set/pop/reserve loesen dann nur
+    die Verknuepfung, statt das Artefakt zu loeschen.
+
+    Args:
+        name: Name des Artefakts
+        ref: Referenz im Store
+    """
+    from flask import session
+
+    if session.get(name + REF_SUFFIX) == ref:
+        return
+    _release(name)
+    session[name + REF_SUFFIX] = ref
+    session[SHARED_KEY] = sorted({*session.get(SHARED_KEY, []), name})
+
+
+def _release(name: str) -> None:
+    """
+    Gibt die aktuelle Referenz eines Artefakts frei.
+
+    Eigene Artefakte der Session werden geloescht, verknuepfte (geteilte)
+    nur aus der Markierung entfernt.
+
+    Args:
+        name: Name des Artefakts
+    """
+    from flask import session
+
+    geteilt = session.get(SHARED_KEY, [])
+    if name in geteilt:
+        session[SHARED_KEY] = [n for n in geteilt if n != name]
+        return
+
+    old_ref = session.get(name + REF_SUFFIX)
+    if old_ref:
+        get_store().delete(old_ref)
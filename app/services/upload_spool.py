@@ -0,0 +1,196 @@
+"""
+NEXUS OVERLORD v2.0 - Streaming Upload-Pipeline
+
+Liest einen Upload genau einmal in festen Bloecken und erledigt dabei:
+    - Groessenlimit (Abbruch sobald ueberschritten, nicht erst am Ende)
+    - SHA-256 (fuer Extraktions-Cache und Dedup)
+    - Encoding-Erkennung fuer Textdateien (inkrementelle Decoder)
+    - Spoolen auf die Platte
+
+Danach arbeiten Extraktion und Speicherung mit der gespoolten Datei,
+der Upload liegt nie komplett im Speicher.
+
+Verwendung:
+    with spool_upload(request.files['file'], max_bytes=5 * 1024 * 1024) as upload:
+        text, error = extract_text_from_upload(upload)
+"""
+
+import codecs
+import hashlib
+import logging
+import os
+import tempfile
+from typing import Any, BinaryIO
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Blockgroesse beim Lesen des Uploads
+CHUNK_SIZE = 64 * 1024
+
+# Kandidaten fuer die Encoding-Erkennung (Reihenfolge = Prioritaet)
+TEXT_ENCODINGS = ('utf-8', 'latin-1', 'cp1252')
+
+
+class UploadTooLarge(ValueError):
+    """Upload ueberschreitet das erlaubte Groessenlimit."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        super().__init__(f"Datei zu gross (max {max_bytes // (1024 * 1024)} MB)")
+
+
+class EncodingSniffer:
+    """
+    Ermittelt das Encoding einer Textdatei blockweise.
+
+    Jeder Kandidat bekommt einen inkrementellen Decoder; scheitert er an
+    einem Block, faellt er raus. Ergebnis ist der erste verbliebene
+    Kandidat in TEXT_ENCODINGS-Reihenfolge.
+    """
+
+    def __init__(self, encodings: tuple[str, ...] = TEXT_ENCODINGS):
+        self._decoders = {enc: codecs.getincrementaldecoder(enc)() for enc in encodings}
+        self._order = encodings
+
+    def feed(self, chunk: bytes, final: bool = False) -> None:
+        """
+        Prueft einen Block gegen alle verbliebenen Kandidaten.
+
+        Args:
+            chunk: Naechster Block der Datei
+            final: True beim letzten Aufruf (unvollstaendige Sequenzen = Fehler)
+        """
+        for enc in list(self._decoders):
+            try:
+                self._decoders[enc].decode(chunk, final=final)
+            except UnicodeDecodeError:
+                del self._decoders[enc]
+
+    @property
+    def encoding(self) -> str | None:
+        """Erstes passendes Encoding oder None."""
+        for enc in self._order:
+            if enc in self._decoders:
+                return enc
+        return None
+
+
+class SpooledUpload:
+    """
+    Ein auf die Platte gespoolter Upload.
+
+    Attributes:
+        path: Pfad der temporaeren Datei
+        filename: Original-Dateiname
+        size: Groesse in Bytes
+        sha256: SHA-256 Hex-Digest des Inhalts
+        encoding: Erkanntes Text-Encoding (nur bei sniff_text=True, sonst None)
+    """
+
+    def __init__(self, path: str, filename: str, size: int, sha256: str, encoding: str | None):
+        self.path = path
+        self.filename = filename
+        self.size = size
+        self.sha256 = sha256
+        self.encoding = encoding
+        self._moved = False
+
+    @property
+    def ext(self) -> str:
+        """Dateiendung in Kleinbuchstaben (ohne Punkt)."""
+        return self.filename.rsplit('.', 1)[-1].lower() if '.' in self.filename else ''
+
+    def open(self) -> BinaryIO:
+        """Oeffnet die gespoolte Datei binaer zum Lesen."""
+        return open(self.path, 'rb')
+
+    def move_to(self, target: str) -> None:
+        """
+        Verschiebt die gespoolte Datei an ihren endgueltigen Ort.
+
+        Args:
+            target: Zielpfad
+        """
+        os.replace(self.path, target)
+        self.path = target
+        self._moved = True
+
+    def cleanup(self) -> None:
+        """Loescht die temporaere Datei (nicht nach move_to)."""
+        if self._moved:
+            return
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> 'SpooledUpload':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.cleanup()
+
+
+def spool_upload(
+    file: Any,
+    max_bytes: int,
+    sniff_text: bool = False,
+    spool_dir: str | None = None
+) -> SpooledUpload:
+    """
+    Liest einen Upload blockweise, prueft Limit, hasht und spoolt auf die Platte.
+
+    Args:
+        file: Werkzeug FileStorage (oder binaeres File-Objekt mit .filename)
+        max_bytes: Maximale Groesse in Bytes
+        sniff_text: Encoding fuer Textdateien mitbestimmen
+        spool_dir: Zielverzeichnis der temporaeren Datei (Standard: System-Temp).
+                   Im selben Dateisystem wie das Ziel ist move_to() atomar.
+
+    Returns:
+        SpooledUpload: Der gespoolte Upload (Aufrufer raeumt per with/cleanup auf)
+
+    Raises:
+        UploadTooLarge: Sobald mehr als max_bytes gelesen wurden
+    """
+    filename = getattr(file, 'filename', None) or 'upload'
+    stream = getattr(file, 'stream', file)
+    digest = hashlib.sha256()
+    sniffer = EncodingSniffer() if sniff_text else None
+    size = 0
+
+    if spool_dir:
+        os.makedirs(spool_dir, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix='upload_', suffix='.part', dir=spool_dir)
+
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                digest.update(chunk)
+                if sniffer:
+                    sniffer.feed(chunk)
+                out.write(chunk)
+
+        if sniffer:
+            sniffer.feed(b'', final=True)
+
+    except BaseException:
+        os.remove(path)
+        raise
+
+    upload = SpooledUpload(
+        path=path,
+        filename=filename,
+        size=size,
+        sha256=digest.hexdigest(),
+        encoding=sniffer.encoding if sniffer else None
+    )
+    logger.debug(f"Upload gespoolt: {filename} ({size} Bytes, {upload.sha256[:12]})")
+    return upload
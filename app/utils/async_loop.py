@@ -0,0 +1,160 @@
+"""
+NEXUS OVERLORD v2.0 - Gemeinsame Event-Loop fuer async Views
+
+Flask fuehrt `async def`-Views standardmaessig ueber asgiref aus: jede
+Coroutine bekommt eine eigene, kurzlebige Event-Loop. Ein gemeinsamer
+httpx-Connection-Pool ist so nicht moeglich, parallele LLM-Calls
+innerhalb eines Requests brauchten wieder Threads.
+
+init_async() leitet alle async Views (und async Hooks) auf eine einzige
+Event-Loop in einem Daemon-Thread um:
+
+    - Alle LLM-Calls eines Prozesses laufen als Coroutinen auf dieser Loop
+      und teilen sich den Pool des AsyncOpenRouterClient
+    - Fan-out (Auftraege je Phase, Teil-Pruefungen) per asyncio.gather
+      statt ThreadPoolExecutor
+    - Der Request-Thread wartet nur noch auf das Ergebnis
+
+Der Kontext des Requests (Flask request/session, Korrelations-ID,
+Projekt-ID fuer den Ledger) wird in die Coroutine kopiert.
+
+Die ganze View laeuft auf dem Loop-Thread: blockierende Arbeit (SQLite,
+render_template, Formular lesen) gehoert in `await asyncio.to_thread(...)`,
+sonst stehen waehrenddessen alle LLM-Coroutinen des Prozesses.
+
+Verwendung ausserhalb von Views:
+    ergebnis = run_sync(generate_phasen_async(plan))
+    future = submit(generate_phasen_async(plan))   # ohne zu warten
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import logging
+import threading
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+from flask import Flask
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Gibt die gemeinsame Event-Loop zurueck und startet sie beim ersten Aufruf.
+
+    Der Start ist lazy, damit die Loop erst im Worker-Prozess (nach dem
+    fork() von Gunicorn) entsteht.
+
+    Returns:
+        asyncio.AbstractEventLoop: Die laufende Loop
+    """
+    global _loop
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='async-loop', daemon=True).start()
+            _loop = loop
+            logger.info("Async Event-Loop gestartet")
+        return _loop
+
+
+def _schedule(coro: Coroutine[Any, Any, T]) -> tuple[concurrent.futures.Future, Callable[[], None]]:
+    """
+    Plant eine Coroutine auf der gemeinsamen Loop ein (Kontext wird kopiert).
+
+    Args:
+        coro: Auszufuehrende Coroutine
+
+    Returns:
+        tuple: (Future mit dem Ergebnis, Funktion zum Abbrechen der Coroutine)
+    """
+    loop = get_loop()
+    context = contextvars.copy_context()
+    future: concurrent.futures.Future = concurrent.futures.Future()
+    tasks: list[asyncio.Task] = []
+
+    def start() -> None:
+        task = loop.create_task(coro, context=context)
+        tasks.append(task)
+
+        def done(t: asyncio.Task) -> None:
+            if t.cancelled():
+                future.cancel()
+            elif t.exception() is not None:
+                future.set_exception(t.exception())
+            else:
+                future.set_result(t.result())
+
+        task.add_done_callback(done)
+
+    loop.call_soon_threadsafe(start)
+    return future, lambda: loop.call_soon_threadsafe(lambda: tasks and tasks[0].cancel())
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future:
+    """
+    Startet eine Coroutine auf der gemeinsamen Loop, ohne auf sie zu warten.
+
+    Fuer Hintergrund-Jobs (siehe app/services/planung_jobs.py). Der aktuelle
+    contextvars-Kontext wird fuer die Coroutine kopiert.
+
+    Args:
+        coro: Auszufuehrende Coroutine
+
+    Returns:
+        concurrent.futures.Future: Ergebnis bzw. Exception der Coroutine
+    """
+    future, _cancel = _schedule(coro)
+    return future
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """
+    Fuehrt eine Coroutine auf der gemeinsamen Loop aus und wartet auf das Ergebnis.
+
+    Der aktuelle contextvars-Kontext wird fuer die Coroutine kopiert.
+
+    Args:
+        coro: Auszufuehrende Coroutine
+        timeout: Optional - maximale Wartezeit in Sekunden
+
+    Returns:
+        Das Ergebnis der Coroutine
+
+    Raises:
+        Exception: Die Exception der Coroutine
+        TimeoutError: Wenn timeout ueberschritten wird (die Coroutine wird abgebrochen)
+    """
+    future, cancel = _schedule(coro)
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        cancel()
+        raise
+
+
+def init_async(app: Flask) -> None:
+    """
+    Fuehrt die async Views der App auf der gemeinsamen Loop aus.
+
+    Ersetzt Flask.async_to_sync (asgiref) fuer diese App-Instanz.
+
+    Args:
+        app: Flask-Anwendung
+    """
+    def async_to_sync(func: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return run_sync(func(*args, **kwargs))
+        return wrapper
+
+    app.async_to_sync = async_to_sync
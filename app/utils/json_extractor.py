@@ -7,21 +7,115 @@ Wird von phasen_generator, auftraege_generator und qualitaetspruefung genutzt.
 
 import json
 import logging
-import re
 from typing import Any
 
 # Logger konfigurieren
 logger = logging.getLogger(__name__)
 
 
+# Decoder fuer alle Kandidaten; strict=False erlaubt rohe Zeilenumbrueche
+# in Strings, wie sie Modelle gelegentlich ausgeben
+_DECODER = json.JSONDecoder(strict=False)
+
+FENCE = '```'
+
+# Zeichen, die nach der oeffnenden Klammer eines gueltigen Werts stehen koennen.
+# Kandidaten wie '{name}' im Fliesstext werden so ohne Parse-Versuch verworfen.
+_OBJECT_NEXT = frozenset('"}')
+_ARRAY_NEXT = frozenset('"{[]-0123456789tfn')
+
+
+def _scan(text: str, want: type) -> tuple[Any, str] | None:
+    """
+    Sucht in einem linearen Durchlauf den besten JSON-Wert vom Typ `want`.
+
+    Kandidaten sind Code-Bloecke (```json / ```) und oeffnende Klammern
+    ausserhalb davon. An jedem Kandidaten parst json.JSONDecoder.raw_decode
+    direkt im Originaltext (keine Teilstring-Kopien); nach einem Treffer
+    geht die Suche hinter dem Ende des Werts weiter.
+
+    Prioritaet wie bisher:
+        1. ```json Code-Block
+        2. Code-Block ohne Sprache
+        3. Erster JSON-Wert im Fliesstext
+
+    Args:
+        text: KI-Antwort
+        want: dict oder list
+
+    Returns:
+        tuple | None: (Wert, Quelle) oder None
+    """
+    opener = '{' if want is dict else '['
+    allowed_next = _OBJECT_NEXT if want is dict else _ARRAY_NEXT
+    fenced = None
+    bare = None
+    pos = 0
+    length = len(text)
+
+    while pos < length:
+        fence = text.find(FENCE, pos)
+        brace = text.find(opener, pos) if bare is None else -1
+
+        if fence == -1 and brace == -1:
+            break
+
+        if fence != -1 and (brace == -1 or fence < brace):
+            # Sprach-Tag bis Zeilenende, danach der Inhalt des Blocks
+            tag_end = fence + 3
+            while tag_end < length and text[tag_end] not in '\n{[':
+                tag_end += 1
+            tag = text[fence + 3:tag_end].strip().lower()
+            start = tag_end
+            while start < length and text[start] in ' \t\r\n':
+                start += 1
+
+            value_end = start
+            if start < length and text[start] in '{[':
+                try:
+                    value, value_end = _DECODER.raw_decode(text, start)
+                except json.JSONDecodeError:
+                    value = None
+                if isinstance(value, want):
+                    if tag == 'json':
+                        return value, 'Code-Block'
+                    if fenced is None:
+                        fenced = value
+
+            close = text.find(FENCE, value_end)
+            pos = length if close == -1 else close + 3
+            continue
+
+        following = brace + 1
+        while following < length and text[following] in ' \t\r\n':
+            following += 1
+        if following >= length or text[following] not in allowed_next:
+            pos = brace + 1
+            continue
+
+        try:
+            value, end = _DECODER.raw_decode(text, brace)
+        except json.JSONDecodeError:
+            pos = brace + 1
+            continue
+
+        if isinstance(value, want):
+            bare = value
+        pos = end
+
+    if fenced is not None:
+        return fenced, 'Code-Block'
+    if bare is not None:
+        return bare, 'Text'
+    return None
+
+
 def extract_json(text: str, fallback: dict | None = None) -> dict:
     """
     Extrahiert ein JSON-Objekt aus einem Text.
 
-    Versucht verschiedene Methoden, um JSON aus KI-Antworten zu extrahieren:
-    1. Direkt als JSON parsen
-    2. JSON aus Markdown Code-Bloecken extrahieren
-    3. JSON-Objekt mit Regex finden
+    Ein einziger Durchlauf ueber die KI-Antwort (siehe _scan): Code-Bloecke
+    haben Vorrang, sonst gilt das erste vollstaendige Objekt im Text.
 
     Args:
         text: Text der JSON enthalten koennte
@@ -37,81 +131,10 @@ def extract_json(text: str, fallback: dict | None = None) -> dict:
         logger.warning("Leerer Text fuer JSON-Extraktion uebergeben")
         return fallback
 
-    # 1. Versuche direkt zu parsen
-    try:
-        result = json.loads(text.strip())
-        if isinstance(result, dict):
-            logger.debug("JSON direkt geparst")
-            return result
-    except json.JSONDecodeError:
-        pass
-
-    # 2. Suche in Markdown Code-Bloecken
-    code_block_patterns = [
-        r'```json\s*\n?(.*?)\n?```',
-        r'```\s*\n?(.*?)\n?```',
-    ]
-
-    for pattern in code_block_patterns:
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            try:
-                result = json.loads(match.group(1).strip())
-                if isinstance(result, dict):
-                    logger.debug("JSON aus Code-Block extrahiert")
-                    return result
-            except json.JSONDecodeError:
-                continue
-
-    # 3. Suche nach JSON-Objekt mit geschweiften Klammern
-    # Finde das aeusserste Klammerpaar
-    try:
-        start = text.find('{')
-        if start != -1:
-            depth = 0
-            end = start
-            in_string = False
-            escape_next = False
-
-            for i, char in enumerate(text[start:], start):
-                if escape_next:
-                    escape_next = False
-                    continue
-                if char == '\\':
-                    escape_next = True
-                    continue
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-                if in_string:
-                    continue
-                if char == '{':
-                    depth += 1
-                elif char == '}':
-                    depth -= 1
-                    if depth == 0:
-                        end = i + 1
-                        break
-
-            if end > start:
-                json_str = text[start:end]
-                result = json.loads(json_str)
-                if isinstance(result, dict):
-                    logger.debug("JSON mit Klammer-Matching extrahiert")
-                    return result
-    except (json.JSONDecodeError, ValueError) as e:
-        logger.debug(f"Klammer-Matching fehlgeschlagen: {e}")
-
-    # 4. Einfaches Regex als letzte Option
-    try:
-        match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
-        if match:
-            result = json.loads(match.group())
-            if isinstance(result, dict):
-                logger.debug("JSON mit einfachem Regex extrahiert")
-                return result
-    except json.JSONDecodeError:
-        pass
+    found = _scan(text, dict)
+    if found:
+        logger.debug(f"JSON extrahiert ({found[1]})")
+        return found[0]
 
     logger.warning("Kein gueltiges JSON-Objekt gefunden, verwende Fallback")
     return fallback
@@ -135,69 +158,10 @@ def extract_json_array(text: str, fallback: list | None = None) -> list:
         logger.warning("Leerer Text fuer JSON-Array-Extraktion uebergeben")
         return fallback
 
-    # 1. Versuche direkt zu parsen
-    try:
-        result = json.loads(text.strip())
-        if isinstance(result, list):
-            logger.debug("JSON-Array direkt geparst")
-            return result
-    except json.JSONDecodeError:
-        pass
-
-    # 2. Suche in Markdown Code-Bloecken
-    code_block_patterns = [
-        r'```json\s*\n?(.*?)\n?```',
-        r'```\s*\n?(.*?)\n?```',
-    ]
-
-    for pattern in code_block_patterns:
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            try:
-                result = json.loads(match.group(1).strip())
-                if isinstance(result, list):
-                    logger.debug("JSON-Array aus Code-Block extrahiert")
-                    return result
-            except json.JSONDecodeError:
-                continue
-
-    # 3. Suche nach JSON-Array mit eckigen Klammern
-    try:
-        start = text.find('[')
-        if start != -1:
-            depth = 0
-            end = start
-            in_string = False
-            escape_next = False
-
-            for i, char in enumerate(text[start:], start):
-                if escape_next:
-                    escape_next = False
-                    continue
-                if char == '\\':
-                    escape_next = True
-                    continue
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-                if in_string:
-                    continue
-                if char == '[':
-                    depth += 1
-                elif char == ']':
-                    depth -= 1
-                    if depth == 0:
-                        end = i + 1
-                        break
-
-            if end > start:
-                json_str = text[start:end]
-                result = json.loads(json_str)
-                if isinstance(result, list):
-                    logger.debug("JSON-Array mit Klammer-Matching extrahiert")
-                    return result
-    except (json.JSONDecodeError, ValueError) as e:
-        logger.debug(f"Klammer-Matching fuer Array fehlgeschlagen: {e}")
+    found = _scan(text, list)
+    if found:
+        logger.debug(f"JSON-Array extrahiert ({found[1]})")
+        return found[0]
 
     logger.warning("Kein gueltiges JSON-Array gefunden, verwende Fallback")
     return fallback
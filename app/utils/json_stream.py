@@ -0,0 +1,155 @@
+"""
+NEXUS OVERLORD v2.0 - Inkrementeller JSON-Parser fuer gestreamte KI-Antworten
+
+Die Generatoren erwarten ein Objekt der Form {"phasen": [ {...}, {...} ], ...}.
+Beim Streaming kommt die Antwort in kleinen Stuecken an. JsonArrayStreamer
+verfolgt die Verschachtelung Zeichen fuer Zeichen und liefert jedes Element
+des Ziel-Arrays, sobald seine schliessende Klammer eingetroffen ist - Phase 1
+kann angezeigt werden, waehrend Phase 5 noch generiert wird.
+
+Jedes Zeichen wird genau einmal betrachtet, fertige Elemente parst
+json.JSONDecoder.raw_decode direkt im Puffer.
+
+Verwendung:
+    streamer = JsonArrayStreamer('phasen')
+    for chunk in client.stream_gemini(messages):
+        for phase in streamer.feed(chunk):
+            zeige(phase)
+    data = extract_json(streamer.text)   # Endergebnis wie bisher
+"""
+
+import json
+import logging
+from typing import Any
+
+from app.utils.json_extractor import _DECODER
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+
+class JsonArrayStreamer:
+    """
+    Liefert die Objekte eines Arrays im Wurzel-Objekt, sobald sie vollstaendig sind.
+
+    Text vor dem Wurzel-Objekt (Code-Block, kurze Einleitung) wird ignoriert.
+    Schliesst sich ein Objekt, ohne dass der Schluessel vorkam (z.B.
+    '{name}' im Fliesstext), beginnt die Suche danach von vorn.
+    Das Endergebnis bleibt Sache von extract_json(streamer.text), der
+    Streamer liefert nur die Vorschau der fertigen Elemente.
+
+    Attributes:
+        key: Schluessel des Arrays (z.B. 'phasen')
+        emitted: Anzahl bisher gelieferter Elemente
+    """
+
+    def __init__(self, key: str):
+        """
+        Args:
+            key: Schluessel des Arrays im Wurzel-Objekt
+        """
+        self.key = key
+        self.emitted = 0
+        self._buffer = ''
+        self._pos = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._expect_key = False
+        self._last_key: str | None = None
+        self._array_depth = 0
+        self._element_start = -1
+
+    @property
+    def text(self) -> str:
+        """Gesamter bisher empfangener Text."""
+        return self._buffer
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """
+        Verarbeitet das naechste Stueck der Antwort.
+
+        Args:
+            chunk: Neuer Text (beliebig geschnitten, auch mitten in Strings)
+
+        Returns:
+            list: Elemente, die mit diesem Stueck vollstaendig wurden
+        """
+        if not chunk:
+            return []
+
+        self._buffer += chunk
+        buffer = self._buffer
+        stack = self._stack
+        completed = []
+
+        for pos in range(self._pos, len(buffer)):
+            char = buffer[pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._expect_key and stack and stack[-1] == '{':
+                        self._last_key = buffer[self._string_start + 1:pos]
+                continue
+
+            if char == '"':
+                if stack:
+                    self._in_string = True
+                    self._string_start = pos
+            elif char == '{':
+                if stack and len(stack) == self._array_depth and self._element_start < 0:
+                    self._element_start = pos
+                stack.append('{')
+                self._expect_key = True
+            elif char == '[':
+                if (stack and len(stack) == 1 and not self._array_depth
+                        and self._last_key == self.key):
+                    self._array_depth = 2
+                stack.append('[')
+                self._expect_key = False
+            elif char in '}]':
+                if not stack:
+                    continue
+                stack.pop()
+                if char == '}' and self._element_start >= 0 and len(stack) == self._array_depth:
+                    element = self._decode(self._element_start)
+                    self._element_start = -1
+                    if element is not None:
+                        completed.append(element)
+                elif char == ']' and len(stack) == self._array_depth - 1:
+                    # Ziel-Array abgeschlossen, weitere Arrays nicht verfolgen
+                    self._array_depth = -1
+                if not stack:
+                    self._reset_root()
+                self._expect_key = False
+            elif char == ':':
+                self._expect_key = False
+            elif char == ',':
+                self._expect_key = bool(stack) and stack[-1] == '{'
+
+        self._pos = len(buffer)
+        self.emitted += len(completed)
+        return completed
+
+    def _decode(self, start: int) -> dict[str, Any] | None:
+        """Parst ein fertiges Element ab `start`; None bei kaputtem JSON."""
+        try:
+            value, _ = _DECODER.raw_decode(self._buffer, start)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Gestreamtes '{self.key}'-Element nicht parsebar: {e}")
+            return None
+        return value if isinstance(value, dict) else None
+
+    def _reset_root(self) -> None:
+        """Wurzel-Objekt geschlossen: ohne Treffer von vorn suchen."""
+        if self._array_depth == 0:
+            self._last_key = None
+        elif self._array_depth > 0:
+            # Antwort endete, ohne dass das Array geschlossen wurde
+            self._array_depth = -1
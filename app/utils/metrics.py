@@ -0,0 +1,454 @@
+"""
+NEXUS OVERLORD v2.0 - Metriken im Prometheus-Textformat
+
+In-Process Registry mit Countern, Histogrammen und Gauges. GET /metrics
+liefert alle Werte im Prometheus-Textformat (Version 0.0.4).
+
+Counter und Histogramme schreiben pro Thread in einen eigenen Shard
+(nur der besitzende Thread schreibt, kein Lock auf dem heissen Pfad).
+Erst beim Abruf von /metrics werden die Shards summiert. Gauges und
+Callback-Metriken (Cache-Trefferquoten, Warteschlangen) werden erst beim
+Abruf gelesen.
+
+Verwendung:
+    from app.utils.metrics import LLM_SECONDS
+    LLM_SECONDS.labels(modell, call_site, 'ok').observe(1.7)
+
+Mit METRICS_ENABLED=0 werden keine Hooks registriert und /metrics
+antwortet mit 404.
+"""
+
+import bisect
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from flask import Flask, Response, g, request
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Metriken einschalten (Hooks + /metrics)
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', '1') == '1'
+
+# Standard-Buckets (Sekunden) - von schnellen Seiten bis zu langen LLM-Calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Buckets fuer einzelne SQLite-Statements
+SQL_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _fmt(value: float) -> str:
+    """Formatiert einen Wert fuer das Textformat."""
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    """Escaped einen Label-Wert."""
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = '') -> str:
+    """Baut '{a="1",b="2"}' (leer ohne Labels)."""
+    teile = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        teile.append(extra)
+    return '{' + ','.join(teile) + '}' if teile else ''
+
+
+class _Shards:
+    """
+    Werte-Vektor mit einem Shard pro Thread.
+
+    Jeder Thread schreibt nur in seinen eigenen Shard; total() summiert.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._shards: dict[int, list[float]] = {}
+
+    def local(self) -> list[float]:
+        """Shard des aktuellen Threads (wird bei Bedarf angelegt)."""
+        shard = self._shards.get(threading.get_ident())
+        if shard is None:
+            shard = self._shards.setdefault(threading.get_ident(), [0.0] * self._size)
+        return shard
+
+    def total(self) -> list[float]:
+        """Summe ueber alle Shards."""
+        summe = [0.0] * self._size
+        for shard in list(self._shards.values()):
+            for i, wert in enumerate(shard):
+                summe[i] += wert
+        return summe
+
+
+class _Metric:
+    """
+    Basis fuer Counter, Gauge und Histogram.
+
+    Attributes:
+        name: Metrik-Name
+        doc: Hilfetext (# HELP)
+        labelnames: Label-Namen
+    """
+
+    typ = 'untyped'
+
+    def __init__(self, name: str, doc: str, labelnames: Iterable[str] = (),
+                 callback: Callable[[], dict[tuple[str, ...], float]] | None = None):
+        """
+        Args:
+            name: Metrik-Name
+            doc: Hilfetext
+            labelnames: Label-Namen
+            callback: Optional - liefert {Label-Werte: Wert} erst beim Abruf
+        """
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self._callback = callback
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames and callback is None:
+            # Metriken ohne Labels erscheinen sofort (mit 0)
+            self._children[()] = self._new_child()
+
+    def labels(self, *values: Any) -> Any:
+        """
+        Liefert die Zeitreihe fuer diese Label-Werte.
+
+        Args:
+            *values: Label-Werte in der Reihenfolge von labelnames
+
+        Returns:
+            Kind-Objekt mit inc()/observe()/set()
+        """
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: erwartet Labels {self.labelnames}, bekommen {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def _samples(self) -> list[str]:
+        """Zeilen ohne HELP/TYPE."""
+        if self._callback is not None:
+            try:
+                werte = self._callback()
+            except Exception as e:
+                logger.warning(f"Metrik {self.name}: Callback fehlgeschlagen: {e}")
+                return []
+            return [f'{self.name}{_labels(self.labelnames, key)} {_fmt(wert)}'
+                    for key, wert in sorted(werte.items())]
+        return [f'{self.name}{_labels(self.labelnames, key)} {_fmt(child.value())}'
+                for key, child in sorted(self._children.items())]
+
+    def expose(self) -> str:
+        """
+        Textformat dieser Metrik.
+
+        Returns:
+            str: HELP, TYPE und alle Zeitreihen
+        """
+        zeilen = [f'# HELP {self.name} {self.doc}', f'# TYPE {self.name} {self.typ}']
+        zeilen.extend(self._samples())
+        return '\n'.join(zeilen)
+
+
+class _CounterChild:
+    def __init__(self):
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1) -> None:
+        self._shards.local()[0] += amount
+
+    def value(self) -> float:
+        return self._shards.total()[0]
+
+
+class Counter(_Metric):
+    """Monoton steigender Zaehler (Name endet auf _total)."""
+
+    typ = 'counter'
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        """Erhoeht den Zaehler ohne Labels."""
+        self.labels().inc(amount)
+
+
+class _GaugeChild:
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.inc(-amount)
+
+    def value(self) -> float:
+        return self._value
+
+
+class Gauge(_Metric):
+    """Momentanwert (steigt und faellt)."""
+
+    typ = 'gauge'
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def inc(self, amount: float = 1) -> None:
+        """Erhoeht den Wert ohne Labels."""
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        """Verringert den Wert ohne Labels."""
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        """Setzt den Wert ohne Labels."""
+        self.labels().set(value)
+
+
+class _HistogramChild:
+    def __init__(self, buckets: tuple[float, ...]):
+        self._buckets = buckets
+        # Ein Feld je Bucket, eines fuer +Inf, eines fuer die Summe
+        self._shards = _Shards(len(buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        shard = self._shards.local()
+        shard[bisect.bisect_left(self._buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self) -> tuple[list[float], float, float]:
+        """(kumulierte Bucket-Zaehler inkl. +Inf, Summe, Anzahl)"""
+        total = self._shards.total()
+        kumuliert, laufend = [], 0.0
+        for anzahl in total[:-1]:
+            laufend += anzahl
+            kumuliert.append(laufend)
+        return kumuliert, total[-1], laufend
+
+
+class Histogram(_Metric):
+    """Verteilung (Buckets, Summe, Anzahl)."""
+
+    typ = 'histogram'
+
+    def __init__(self, name: str, doc: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            name: Metrik-Name
+            doc: Hilfetext
+            labelnames: Label-Namen
+            buckets: Obere Bucket-Grenzen (aufsteigend, ohne +Inf)
+        """
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, doc, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Erfasst einen Wert ohne Labels."""
+        self.labels().observe(value)
+
+    def _samples(self) -> list[str]:
+        zeilen = []
+        grenzen = [_fmt(b) for b in self.buckets] + ['+Inf']
+        for key, child in sorted(self._children.items()):
+            kumuliert, summe, anzahl = child.snapshot()
+            for grenze, wert in zip(grenzen, kumuliert):
+                le = f'le="{grenze}"'
+                zeilen.append(f'{self.name}_bucket{_labels(self.labelnames, key, le)} {_fmt(wert)}')
+            zeilen.append(f'{self.name}_sum{_labels(self.labelnames, key)} {_fmt(summe)}')
+            zeilen.append(f'{self.name}_count{_labels(self.labelnames, key)} {_fmt(anzahl)}')
+        return zeilen
+
+
+class Registry:
+    """Sammlung aller Metriken fuer /metrics."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Registriert eine Metrik.
+
+        Args:
+            metric: Counter, Gauge oder Histogram
+
+        Returns:
+            Die Metrik (fuer Zuweisung auf Modulebene)
+
+        Raises:
+            ValueError: Wenn der Name bereits vergeben ist
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metrik bereits registriert: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def expose(self) -> str:
+        """
+        Alle Metriken im Prometheus-Textformat.
+
+        Returns:
+            str: Text fuer GET /metrics
+        """
+        return '\n'.join(m.expose() for m in list(self._metrics.values())) + '\n'
+
+
+REGISTRY = Registry()
+
+
+# ============================================================================
+# CALLBACKS (werden erst beim Abruf gelesen)
+# ============================================================================
+
+def _cache_requests() -> dict[tuple[str, ...], float]:
+    """Treffer/Fehlschlaege von Extraktions-Cache und Blob-LRU."""
+    from app.services.blob_store import get_blob_store
+    from app.services.extraction_cache import get_extraction_cache
+
+    extraction = get_extraction_cache()
+    blobs = get_blob_store()
+    return {
+        ('extraction', 'hit'): extraction.hits,
+        ('extraction', 'miss'): extraction.misses,
+        ('blob_lru', 'hit'): blobs.hits,
+        ('blob_lru', 'miss'): blobs.misses,
+    }
+
+
+def _job_queue() -> dict[tuple[str, ...], float]:
+    """Jobs je Warteschlange und Status."""
+    from app.services.pdf_export import get_export_manager
+    from app.services.planung_jobs import get_planung_manager
+
+    werte = {('pdf_export', status): anzahl
+             for status, anzahl in get_export_manager().counts().items()}
+    werte.update({('planung', status): anzahl
+                  for status, anzahl in get_planung_manager().counts().items()})
+    return werte
+
+
+# ============================================================================
+# METRIKEN
+# ============================================================================
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    'nexus_http_requests_total', 'HTTP-Requests je Route und Status',
+    ('method', 'route', 'status')))
+HTTP_SECONDS = REGISTRY.register(Histogram(
+    'nexus_http_request_duration_seconds', 'Antwortzeit je Route (ohne gestreamten Body)',
+    ('method', 'route')))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    'nexus_http_requests_in_flight', 'Gerade bearbeitete HTTP-Requests'))
+
+WORKFLOWS_ACTIVE = REGISTRY.register(Gauge(
+    'nexus_workflows_active', 'Laufende Multi-Agent Workflows'))
+WORKFLOW_STEP_SECONDS = REGISTRY.register(Histogram(
+    'nexus_workflow_step_duration_seconds', 'Dauer der Workflow-Schritte',
+    ('step', 'status')))
+
+LLM_SECONDS = REGISTRY.register(Histogram(
+    'nexus_llm_request_duration_seconds', 'Dauer der LLM-Calls inkl. Retries',
+    ('model', 'call_site', 'outcome')))
+LLM_TOKENS = REGISTRY.register(Counter(
+    'nexus_llm_tokens_total', 'LLM-Tokens je Modell (prompt, completion, cached)',
+    ('model', 'art')))
+
+SQL_SECONDS = REGISTRY.register(Histogram(
+    'nexus_sqlite_duration_seconds', 'SQLite-Zeit je Aufruf (execute oder fetch)',
+    ('op',), buckets=SQL_BUCKETS))
+
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    'nexus_cache_requests_total', 'Cache-Zugriffe je Cache und Ergebnis',
+    ('cache', 'result'), callback=_cache_requests))
+JOBS = REGISTRY.register(Gauge(
+    'nexus_jobs', 'Hintergrund-Jobs je Warteschlange und Status',
+    ('queue', 'status'), callback=_job_queue))
+
+
+# ============================================================================
+# FLASK
+# ============================================================================
+
+def _observe_sql(op: str, seconds: float) -> None:
+    SQL_SECONDS.labels(op).observe(seconds)
+
+
+def init_metrics(app: Flask, enabled: bool = METRICS_ENABLED) -> None:
+    """
+    Registriert die Request-Hooks und die SQLite-Zeitmessung.
+
+    Args:
+        app: Flask-Anwendung
+        enabled: Metriken aktiv (Standard: METRICS_ENABLED)
+    """
+    app.config['METRICS_ENABLED'] = enabled
+    if not enabled:
+        return
+
+    from app.utils.request_profiler import enable_sql_timing
+    enable_sql_timing(_observe_sql)
+
+    def _route() -> str:
+        # Regel statt Pfad, damit IDs keine neuen Zeitreihen erzeugen
+        return request.url_rule.rule if request.url_rule else '<unmatched>'
+
+    @app.before_request
+    def _metrics_start() -> None:
+        g.metrics_start = time.perf_counter()
+        HTTP_IN_FLIGHT.inc()
+
+    @app.after_request
+    def _metrics_finish(response: Response) -> Response:
+        start = g.pop('metrics_start', None)
+        if start is not None:
+            HTTP_IN_FLIGHT.dec()
+            HTTP_REQUESTS.labels(request.method, _route(), response.status_code).inc()
+            HTTP_SECONDS.labels(request.method, _route()).observe(time.perf_counter() - start)
+        return response
+
+    @app.teardown_request
+    def _metrics_abbruch(exc: BaseException | None) -> None:
+        # after_request laeuft nicht, wenn die View eine Exception wirft
+        start = g.pop('metrics_start', None)
+        if start is not None:
+            HTTP_IN_FLIGHT.dec()
+            HTTP_REQUESTS.labels(request.method, _route(), 500).inc()
+            HTTP_SECONDS.labels(request.method, _route()).observe(time.perf_counter() - start)
+
+    logger.info("Metriken aktiv (GET /metrics)")
@@ -0,0 +1,375 @@
+"""
+NEXUS OVERLORD v2.0 - Opt-in Profiling pro Request
+
+Mit REQUEST_PROFILING=1 bekommt jede Antwort einen Server-Timing Header
+(sichtbar im Network-Tab der Browser-DevTools):
+
+    Server-Timing: sql;dur=41.2;desc="17 Queries", tpl;dur=8.3,
+                   llm;dur=0.0;desc="0 Calls", app;dur=12.0, total;dur=61.5
+
+    sql   - SQLite (nexus.db): execute + fetch, Anzahl per Trace-Callback
+    tpl   - render_template (Flask-Signale)
+    llm   - OpenRouterClient.call/stream und AsyncOpenRouterClient.call
+            (Summe, parallele Calls zaehlen einzeln)
+    app   - Rest (Python, JSON, Markdown, ...)
+
+Zusaetzlich schaltet ?_profile=1 einen Sampling-Profiler fuer genau diesen
+Request ein. Er schreibt die Stacks im "folded"-Format (flamegraph.pl,
+speedscope.app) nach PROFILE_DIR, der Dateiname steht im Header
+X-Profile-Dump. Abgetastet wird nur der Request-Thread: bei async Views
+(app/utils/async_loop.py) wartet er nur auf die Loop, deren Thread wird
+nicht abgetastet - der Dump zeigt dann vor allem das Warten.
+
+Ohne REQUEST_PROFILING=1 wird nichts registriert und nichts gemessen.
+"""
+
+import contextvars
+import functools
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from flask import Flask, Response, before_render_template, g, request, template_rendered
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Profiling einschalten (Server-Timing + ?_profile=1)
+REQUEST_PROFILING = os.getenv('REQUEST_PROFILING', '0') == '1'
+
+# Ablage der Flame-Graph-Dumps
+PROFILE_DIR = os.getenv('PROFILE_DIR', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    'projekt',
+    'profiles'
+))
+
+# Abtastintervall des Sampling-Profilers (Millisekunden)
+PROFILE_SAMPLE_MS = float(os.getenv('PROFILE_SAMPLE_MS', '2'))
+
+# Transaktions-Steuerung zaehlt nicht als Query
+_KEINE_QUERY = ('BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE')
+
+_current: contextvars.ContextVar['RequestProfile | None'] = contextvars.ContextVar(
+    'request_profile', default=None
+)
+
+# Optional: erhaelt jede SQLite-Messung ('execute'/'fetch', Sekunden), z.B. fuer /metrics
+_sql_observer: Callable[[str, float], None] | None = None
+
+
+class RequestProfile:
+    """
+    Messwerte eines Requests (thread-sicher, Fan-out-Threads schreiben mit).
+
+    Attributes:
+        start: Startzeit (perf_counter)
+        sql_ms / sql_queries: Zeit und Anzahl der SQLite-Statements
+        tpl_ms: Zeit in render_template
+        llm_ms / llm_calls: Zeit und Anzahl der LLM-Calls
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.sql_ms = 0.0
+        self.sql_queries = 0
+        self.tpl_ms = 0.0
+        self.llm_ms = 0.0
+        self.llm_calls = 0
+        self._lock = threading.Lock()
+
+    def add(self, kind: str, ms: float, count: int = 0) -> None:
+        """
+        Addiert eine Messung.
+
+        Args:
+            kind: 'sql', 'tpl' oder 'llm'
+            ms: Dauer in Millisekunden
+            count: Zusaetzliche Anzahl (Queries/Calls)
+        """
+        with self._lock:
+            if kind == 'sql':
+                self.sql_ms += ms
+                self.sql_queries += count
+            elif kind == 'tpl':
+                self.tpl_ms += ms
+            elif kind == 'llm':
+                self.llm_ms += ms
+                self.llm_calls += count
+
+    def server_timing(self) -> str:
+        """
+        Baut den Server-Timing Header.
+
+        Returns:
+            str: Header-Wert
+        """
+        total = (time.perf_counter() - self.start) * 1000
+        app_ms = max(0.0, total - self.sql_ms - self.tpl_ms - self.llm_ms)
+        return ', '.join([
+            f'sql;dur={self.sql_ms:.1f};desc="{self.sql_queries} Queries"',
+            f'tpl;dur={self.tpl_ms:.1f}',
+            f'llm;dur={self.llm_ms:.1f};desc="{self.llm_calls} Calls"',
+            f'app;dur={app_ms:.1f}',
+            f'total;dur={total:.1f}',
+        ])
+
+
+# ============================================================================
+# SQLITE
+# ============================================================================
+
+def _timed_sql(method: Callable[..., Any], op: str) -> Callable[..., Any]:
+    """Misst eine Cursor-Methode, wenn ein Profil oder ein Observer aktiv ist."""
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        profile = _current.get()
+        observer = _sql_observer
+        if profile is None and observer is None:
+            return method(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            dauer = time.perf_counter() - start
+            if profile is not None:
+                profile.add('sql', dauer * 1000)
+            if observer is not None:
+                observer(op, dauer)
+    return wrapper
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor, der execute und fetch dem aktiven Profil zurechnet."""
+
+    execute = _timed_sql(sqlite3.Cursor.execute, 'execute')
+    executemany = _timed_sql(sqlite3.Cursor.executemany, 'execute')
+    fetchone = _timed_sql(sqlite3.Cursor.fetchone, 'fetch')
+    fetchmany = _timed_sql(sqlite3.Cursor.fetchmany, 'fetch')
+    fetchall = _timed_sql(sqlite3.Cursor.fetchall, 'fetch')
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """
+    Verbindung fuer database.get_db() bei aktivem Profiling oder Metriken.
+
+    Zaehlt Statements per Trace-Callback und liefert ProfiledCursor.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        profile = _current.get()
+        if profile is not None:
+            def trace(statement: str) -> None:
+                if not statement.lstrip().upper().startswith(_KEINE_QUERY):
+                    profile.add('sql', 0.0, 1)
+            self.set_trace_callback(trace)
+
+    def cursor(self, factory: type[sqlite3.Cursor] = ProfiledCursor) -> sqlite3.Cursor:  # type: ignore[override]
+        return super().cursor(factory)
+
+    def execute(self, *args: Any) -> sqlite3.Cursor:  # type: ignore[override]
+        return self.cursor().execute(*args)
+
+    def executemany(self, *args: Any) -> sqlite3.Cursor:  # type: ignore[override]
+        return self.cursor().executemany(*args)
+
+
+def enable_sql_timing(observer: Callable[[str, float], None] | None = None) -> None:
+    """
+    Schaltet database.get_db() auf ProfiledConnection um.
+
+    Args:
+        observer: Optional - erhaelt jede Messung ('execute'/'fetch', Sekunden)
+    """
+    global _sql_observer
+    from app.services import database
+
+    database.CONNECTION_FACTORY = ProfiledConnection
+    if observer is not None:
+        _sql_observer = observer
+
+
+# ============================================================================
+# LLM
+# ============================================================================
+
+def _wrap_llm_call(call: Callable[..., str]) -> Callable[..., str]:
+    """Rechnet OpenRouterClient.call dem aktiven Profil zu."""
+    @functools.wraps(call)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        profile = _current.get()
+        if profile is None:
+            return call(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            profile.add('llm', (time.perf_counter() - start) * 1000, 1)
+    return wrapper
+
+
+def _wrap_llm_call_async(call: Callable[..., Any]) -> Callable[..., Any]:
+    """Rechnet AsyncOpenRouterClient.call dem aktiven Profil zu (Kontext kopiert die Loop mit)."""
+    @functools.wraps(call)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        profile = _current.get()
+        if profile is None:
+            return await call(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return await call(*args, **kwargs)
+        finally:
+            profile.add('llm', (time.perf_counter() - start) * 1000, 1)
+    return wrapper
+
+
+def _wrap_llm_stream(stream: Callable[..., Iterator[str]]) -> Callable[..., Iterator[str]]:
+    """Rechnet die Zeit in OpenRouterClient.stream (ohne Verbraucher) dem Profil zu."""
+    @functools.wraps(stream)
+    def wrapper(*args: Any, **kwargs: Any) -> Iterator[str]:
+        profile = _current.get()
+        iterator = stream(*args, **kwargs)
+        if profile is None:
+            yield from iterator
+            return
+        spent = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    delta = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    spent += time.perf_counter() - start
+                yield delta
+        finally:
+            profile.add('llm', spent * 1000, 1)
+    return wrapper
+
+
+# ============================================================================
+# SAMPLING-PROFILER
+# ============================================================================
+
+class StackSampler:
+    """
+    Tastet den Stack eines Threads periodisch ab (Folded-Stack-Format).
+
+    Attributes:
+        stacks: Zaehler je Stack 'modul:funktion;modul:funktion;...'
+    """
+
+    def __init__(self, thread_id: int, interval_ms: float | None = None):
+        self.stacks: Counter[str] = Counter()
+        self._thread_id = thread_id
+        self._interval = max(0.5, interval_ms or PROFILE_SAMPLE_MS) / 1000
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def start(self) -> None:
+        """Startet das Abtasten."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Beendet das Abtasten und wartet auf den Sampler-Thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            teile = []
+            while frame is not None:
+                code = frame.f_code
+                teile.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(teile))] += 1
+
+    def dump(self, path: str) -> None:
+        """
+        Schreibt die Stacks im folded-Format ('stack anzahl' pro Zeile).
+
+        Args:
+            path: Zieldatei
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, anzahl in self.stacks.most_common():
+                f.write(f'{stack} {anzahl}\n')
+
+
+# ============================================================================
+# FLASK
+# ============================================================================
+
+def init_profiler(app: Flask, enabled: bool = REQUEST_PROFILING) -> None:
+    """
+    Registriert die Profiling-Hooks (nur wenn eingeschaltet).
+
+    Args:
+        app: Flask-Anwendung
+        enabled: Profiling aktiv (Standard: REQUEST_PROFILING)
+    """
+    if not enabled:
+        return
+
+    from app.services.openrouter import AsyncOpenRouterClient, OpenRouterClient
+
+    enable_sql_timing()
+    OpenRouterClient.call = _wrap_llm_call(OpenRouterClient.call)
+    OpenRouterClient.stream = _wrap_llm_stream(OpenRouterClient.stream)
+    AsyncOpenRouterClient.call = _wrap_llm_call_async(AsyncOpenRouterClient.call)
+
+    @app.before_request
+    def _profile_start() -> None:
+        g.profile_token = _current.set(RequestProfile())
+        if request.args.get('_profile') == '1':
+            g.profile_sampler = StackSampler(threading.get_ident())
+            g.profile_sampler.start()
+
+    @app.after_request
+    def _profile_finish(response: Response) -> Response:
+        profile = _current.get()
+        if profile is None:
+            return response
+
+        sampler = g.pop('profile_sampler', None)
+        if sampler is not None:
+            sampler.stop()
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            name = f"{time.strftime('%Y%m%d-%H%M%S')}_{request.endpoint or 'unbekannt'}.folded"
+            sampler.dump(os.path.join(PROFILE_DIR, name))
+            response.headers['X-Profile-Dump'] = name
+            logger.info(f"Profil {request.method} {request.path}: {profile.server_timing()} -> {name}")
+
+        response.headers['Server-Timing'] = profile.server_timing()
+        return response
+
+    @app.teardown_request
+    def _profile_reset(_exc: BaseException | None) -> None:
+        token = g.pop('profile_token', None)
+        if token is not None:
+            _current.reset(token)
+
+    def _template_start(_sender: Flask, **_extra: Any) -> None:
+        g.setdefault('profile_tpl_start', []).append(time.perf_counter())
+
+    def _template_done(_sender: Flask, **_extra: Any) -> None:
+        profile = _current.get()
+        starts = g.get('profile_tpl_start')
+        if profile is not None and starts:
+            profile.add('tpl', (time.perf_counter() - starts.pop()) * 1000)
+
+    before_render_template.connect(_template_start, app, weak=False)
+    template_rendered.connect(_template_done, app, weak=False)
+
+    logger.info(f"Request-Profiling aktiv (Dumps: {PROFILE_DIR})")
@@ -0,0 +1,322 @@
+"""
+NEXUS OVERLORD v2.0 - Strukturiertes Logging
+
+Ersetzt logging.basicConfig durch:
+
+    - JSON-Zeilen (LOG_FORMAT=json, Standard) oder das bisherige Textformat
+    - QueueHandler: Request-Threads legen den Record nur in eine Queue,
+      Formatieren und Schreiben uebernimmt ein eigener Listener-Thread
+    - Sampling pro Logger fuer DEBUG/INFO (LOG_SAMPLING), WARNING und
+      hoeher werden nie verworfen
+    - Korrelations-ID pro Request (Header X-Request-ID), die ueber
+      contextvars an Workflow-Threads und LLM-Calls weitergegeben wird
+
+Log-Aufrufe sollten %-Platzhalter nutzen (logger.debug("x=%s", x)), dann
+wird die Nachricht nur gebaut, wenn der Record auch ausgegeben wird.
+
+Beispiel einer Zeile:
+    {"ts": "2026-01-05T10:31:12.481+00:00", "level": "INFO",
+     "logger": "app.services.openrouter", "msg": "API-Call erfolgreich ...",
+     "thread": "auftraege_0", "correlation_id": "3f9c2a7d1e5b4c08",
+     "call_site": "auftraege_phase", "model": "...", "tokens_in": 1830}
+"""
+
+import atexit
+import contextlib
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import sys
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+from flask import Flask, Response, g, request
+
+# Ausgabeformat: 'json' oder 'text'
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json')
+
+# Minimales Level
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+
+# Optional zusaetzlich in eine Datei schreiben (z.B. server.log)
+LOG_FILE = os.getenv('LOG_FILE', '')
+
+# Sampling pro Logger-Praefix: 'app.services.database=0.05,app.services.openrouter=0.2'
+LOG_SAMPLING = os.getenv('LOG_SAMPLING', '')
+
+# Eine Zeile pro Request (Logger app.access, mit Route und Dauer)
+ACCESS_LOG = os.getenv('ACCESS_LOG', '1') == '1'
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(correlation_id)s] %(message)s'
+
+# Erlaubte Korrelations-IDs aus dem Header (sonst wird eine neue erzeugt)
+_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+# Attribute jedes LogRecords - alles andere kam ueber extra={...}
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'correlation_id', 'taskName'}
+
+_correlation_id: contextvars.ContextVar[str | None] = contextvars.ContextVar('correlation_id', default=None)
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+# ============================================================================
+# KORRELATIONS-ID
+# ============================================================================
+
+def new_correlation_id() -> str:
+    """Erzeugt eine neue Korrelations-ID (16 Hex-Zeichen)."""
+    return uuid.uuid4().hex[:16]
+
+
+def get_correlation_id() -> str | None:
+    """
+    Korrelations-ID des aktuellen Kontexts.
+
+    Returns:
+        str | None: ID oder None ausserhalb eines Requests/Jobs
+    """
+    return _correlation_id.get()
+
+
+def set_correlation_id(correlation_id: str | None) -> contextvars.Token:
+    """
+    Setzt die Korrelations-ID fuer den aktuellen Kontext.
+
+    Threads, die mit contextvars.copy_context().run gestartet werden,
+    erben den Wert.
+
+    Args:
+        correlation_id: ID oder None
+
+    Returns:
+        Token fuer _correlation_id.reset()
+    """
+    return _correlation_id.set(correlation_id)
+
+
+@contextlib.contextmanager
+def correlation_context(correlation_id: str | None = None) -> Iterator[str]:
+    """
+    Fuehrt einen Block mit eigener Korrelations-ID aus (z.B. Hintergrund-Jobs).
+
+    Args:
+        correlation_id: Optional - sonst wird eine neue erzeugt
+
+    Yields:
+        str: Die verwendete ID
+    """
+    correlation_id = correlation_id or new_correlation_id()
+    token = _correlation_id.set(correlation_id)
+    try:
+        yield correlation_id
+    finally:
+        _correlation_id.reset(token)
+
+
+# ============================================================================
+# FILTER, FORMATTER, HANDLER
+# ============================================================================
+
+class CorrelationFilter(logging.Filter):
+    """Haengt die Korrelations-ID an (laeuft im aufrufenden Thread)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = _correlation_id.get() or '-'
+        return True
+
+
+def parse_sampling(spec: str) -> dict[str, float]:
+    """
+    Liest LOG_SAMPLING.
+
+    Args:
+        spec: 'logger=rate,logger=rate' (rate zwischen 0 und 1)
+
+    Returns:
+        dict: Logger-Praefix -> Rate (ungueltige Eintraege werden ignoriert)
+    """
+    rates = {}
+    for teil in spec.split(','):
+        name, _, rate = teil.partition('=')
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            continue
+    return {name: rate for name, rate in rates.items() if name}
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Laesst DEBUG/INFO eines Loggers nur mit der konfigurierten Rate durch.
+
+    Der laengste passende Praefix gewinnt. Durchgelassene Records bekommen
+    sample_rate, damit Auswertungen hochrechnen koennen.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self._rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+        self._cache: dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._cache.get(name)
+        if rate is None:
+            rate = next((r for prefix, r in self._rates
+                         if name == prefix or name.startswith(prefix + '.')), 1.0)
+            self._cache[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self._rates:
+            return True
+        rate = self._rate(record.name)
+        if rate >= 1.0:
+            return True
+        if random.random() >= rate:
+            return False
+        record.sample_rate = rate
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Eine JSON-Zeile pro Record, extra={...} wird als Felder uebernommen."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+            'thread': record.threadName,
+        }
+        correlation_id = getattr(record, 'correlation_id', '-')
+        if correlation_id != '-':
+            payload['correlation_id'] = correlation_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                payload[key] = value
+        if record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload['exc'] = record.exc_text
+        if record.stack_info:
+            payload['stack'] = record.stack_info
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler, der nur die Nachricht aufloest.
+
+    Der Standard formatiert den kompletten Record samt Traceback in msg;
+    hier bleiben Traceback und extra-Felder fuer den JsonFormatter getrennt.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # args koennen veraenderliche Objekte sein - jetzt aufloesen
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging(
+    level: str = LOG_LEVEL,
+    fmt: str = LOG_FORMAT,
+    sampling: str = LOG_SAMPLING,
+    log_file: str = LOG_FILE
+) -> None:
+    """
+    Konfiguriert den Root-Logger (einmalig, weitere Aufrufe sind wirkungslos).
+
+    Args:
+        level: Minimales Level
+        fmt: 'json' oder 'text'
+        sampling: Sampling-Spezifikation (siehe parse_sampling)
+        log_file: Optional - zusaetzliche Log-Datei
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    formatter = JsonFormatter() if fmt == 'json' else logging.Formatter(TEXT_FORMAT)
+    targets: list[logging.Handler] = [logging.StreamHandler(sys.stderr)]
+    if log_file:
+        targets.append(logging.FileHandler(log_file, encoding='utf-8'))
+    for target in targets:
+        target.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = _QueueHandler(log_queue)
+    handler.addFilter(CorrelationFilter())
+    rates = parse_sampling(sampling)
+    if rates:
+        handler.addFilter(SamplingFilter(rates))
+
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *targets, respect_handler_level=True)
+    _listener.start()
+    # Queue beim Beenden noch leeren
+    atexit.register(_listener.stop)
+
+
+def init_correlation(app: Flask, access_log: bool = ACCESS_LOG) -> None:
+    """
+    Vergibt pro Request eine Korrelations-ID und schreibt das Access-Log.
+
+    Uebernimmt X-Request-ID vom Client/Proxy, falls gueltig, und sendet
+    die ID in der Antwort zurueck. Das Access-Log (Logger app.access)
+    enthaelt Methode, Route-Regel, Pfad, Status und Dauer - die Grundlage
+    fuer scripts/log_analytics.py.
+
+    Args:
+        app: Flask-Anwendung
+        access_log: Eine Log-Zeile pro Request (Standard: ACCESS_LOG)
+    """
+    access_logger = logging.getLogger('app.access')
+
+    @app.before_request
+    def _correlation_start() -> None:
+        header = request.headers.get('X-Request-ID', '')
+        correlation_id = header if _ID_PATTERN.match(header) else new_correlation_id()
+        g.correlation_id = correlation_id
+        g.correlation_token = _correlation_id.set(correlation_id)
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def _correlation_header(response: Response) -> Response:
+        correlation_id = g.get('correlation_id')
+        if correlation_id:
+            response.headers['X-Request-ID'] = correlation_id
+        start = g.get('request_start')
+        if access_log and start is not None:
+            dauer_ms = (time.perf_counter() - start) * 1000
+            route = request.url_rule.rule if request.url_rule else None
+            access_logger.info(
+                "%s %s %s %.1fms", request.method, request.path, response.status_code, dauer_ms,
+                extra={'method': request.method, 'route': route, 'path': request.path,
+                       'status': response.status_code, 'duration_ms': round(dauer_ms, 1)}
+            )
+        return response
+
+    @app.teardown_request
+    def _correlation_reset(_exc: BaseException | None) -> None:
+        token = g.pop('correlation_token', None)
+        if token is not None:
+            _correlation_id.reset(token)
@@ -0,0 +1,139 @@
+"""
+NEXUS OVERLORD v2.0 - Warm-up nach dem Start
+
+Schwere Abhaengigkeiten (requests, pdfplumber, python-docx, reportlab,
+rapidfuzz, markdown2) und die Services dahinter werden bewusst erst in
+den Handlern importiert, damit der Server schnell bindet. Damit der erste
+echte Request nicht die Importzeit bezahlt, laedt start_warmup() sie kurz
+nach dem Binden in einem Hintergrund-Thread vor und kompiliert alle
+Jinja-Templates.
+
+Ein Request, der ein Modul braucht, das gerade vorgeladen wird, wartet
+auf den Import-Lock statt es ein zweites Mal zu laden.
+
+Status unter GET /health (warmup: pending, running, done).
+"""
+
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from flask import Flask
+
+# Logger konfigurieren
+logger = logging.getLogger(__name__)
+
+# Warm-up einschalten
+WARMUP = os.getenv('WARMUP', '1') == '1'
+
+# Wartezeit nach dem Start, damit das Binden nicht um den GIL konkurriert (Sekunden)
+WARMUP_DELAY = float(os.getenv('WARMUP_DELAY', '0.5'))
+
+# Vorzuladende Module in Reihenfolge der typischen ersten Nutzung
+WARMUP_MODULES = [m.strip() for m in os.getenv('WARMUP_MODULES', ','.join([
+    'requests',
+    'app.services.openrouter',
+    'markdown2',
+    'rapidfuzz.fuzz',
+    'app.services.fehler_analyzer',
+    'app.services.projekt_analyzer',
+    'app.services.phasen_generator',
+    'app.services.auftraege_generator',
+    'app.services.qualitaetspruefung',
+    'app.services.multi_agent',
+    'app.services.document_extractor',
+    'pdfplumber',
+    'docx',
+    'app.services.pdf_generator',
+    'app.services.pdf_export',
+])).split(',') if m.strip()]
+
+_lock = threading.Lock()
+_status: dict[str, Any] = {'status': 'pending', 'module': {}, 'templates': 0, 'dauer_ms': None}
+
+
+def warmup(app: Flask, modules: list[str] | None = None) -> dict[str, Any]:
+    """
+    Importiert die Module und kompiliert alle Templates (blockierend).
+
+    Fehlende optionale Pakete werden protokolliert, nicht geworfen.
+
+    Args:
+        app: Flask-Anwendung (fuer die Templates)
+        modules: Optional - statt WARMUP_MODULES
+
+    Returns:
+        dict: status, module (Name -> ms oder Fehlertext), templates, dauer_ms
+    """
+    with _lock:
+        _status['status'] = 'running'
+    start = time.perf_counter()
+
+    for name in modules if modules is not None else WARMUP_MODULES:
+        t0 = time.perf_counter()
+        try:
+            importlib.import_module(name)
+            ergebnis: float | str = round((time.perf_counter() - t0) * 1000, 1)
+        except Exception as e:
+            ergebnis = f"{type(e).__name__}: {e}"
+            logger.warning("Warm-up: %s nicht geladen (%s)", name, ergebnis)
+        with _lock:
+            _status['module'][name] = ergebnis
+
+    templates = 0
+    for name in app.jinja_env.list_templates():
+        try:
+            app.jinja_env.get_template(name)
+            templates += 1
+        except Exception as e:
+            logger.warning("Warm-up: Template %s nicht kompiliert (%s)", name, e)
+
+    dauer_ms = round((time.perf_counter() - start) * 1000, 1)
+    with _lock:
+        _status.update(status='done', templates=templates, dauer_ms=dauer_ms)
+    logger.info("Warm-up fertig: %s Module, %s Templates in %.0fms",
+                len(_status['module']), templates, dauer_ms)
+    return get_warmup_status()
+
+
+def start_warmup(app: Flask, delay: float = WARMUP_DELAY, enabled: bool = WARMUP) -> threading.Thread | None:
+    """
+    Startet warmup() in einem Daemon-Thread.
+
+    Aufruf direkt vor dem Binden (app.run) bzw. im Worker-Hook des
+    WSGI-Servers.
+
+    Args:
+        app: Flask-Anwendung
+        delay: Wartezeit vor dem ersten Import (Sekunden)
+        enabled: Warm-up aktiv (Standard: WARMUP)
+
+    Returns:
+        threading.Thread | None: Der Thread oder None wenn deaktiviert
+    """
+    if not enabled:
+        with _lock:
+            _status['status'] = 'disabled'
+        return None
+
+    def run() -> None:
+        time.sleep(delay)
+        warmup(app)
+
+    thread = threading.Thread(target=run, name='warmup', daemon=True)
+    thread.start()
+    return thread
+
+
+def get_warmup_status() -> dict[str, Any]:
+    """
+    Aktueller Warm-up Status (Kopie).
+
+    Returns:
+        dict: status, module, templates, dauer_ms
+    """
+    with _lock:
+        return {**_status, 'module': dict(_status['module'])}
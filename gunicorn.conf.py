@@ -0,0 +1,107 @@
+"""
+NEXUS OVERLORD v2.0 - Gunicorn-Konfiguration (Produktion)
+
+Start:
+    gunicorn -c gunicorn.conf.py app.main:app
+    ./start_server.sh              # compileall + gunicorn
+
+Worker-Modell: gthread. Die LLM-Routen (/fehler, /phasen POST, Auftraege,
+Qualitaetspruefung) sind async Views: die OpenRouter-Calls und ihr Fan-out
+laufen als Coroutinen auf einem Event-Loop je Worker, der Request-Thread
+wartet nur auf das Ergebnis. Deshalb wenige Prozesse mit vielen Threads.
+
+Mehrere Worker (WEB_CONCURRENCY > 1): der Status des Multi-Agent
+Workflows und der Planungs-Jobs liegt im Session-Store (SQLite) und ist
+in allen Workern sichtbar. PDF-Export-Jobs und /metrics gelten dagegen je Worker - fuer
+verlaessliches Polling und Scraping WEB_CONCURRENCY=1 lassen.
+
+Alle Werte per Umgebungsvariable (siehe .env.example).
+"""
+
+import multiprocessing
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5000')}"
+
+# Prozesse (Standard 1, siehe oben) und Threads je Prozess = gleichzeitige Requests
+workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', str(min(64, 8 * multiprocessing.cpu_count()))))
+
+# Warteschlange vor dem Accept, wenn alle Threads belegt sind
+backlog = int(os.getenv('GUNICORN_BACKLOG', '256'))
+
+# ============================================================================
+# TIMEOUTS (LLM-Calls: bis 90s, dazu Retries)
+# ============================================================================
+
+# Worker ohne Heartbeat werden neu gestartet. Bei gthread schlaegt der
+# Heartbeat auch waehrend langer Requests - das betrifft nur haengende Worker.
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '180'))
+
+# Beim Reload/Stop duerfen laufende LLM-Requests noch fertig werden
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '120'))
+
+# HTMX-Polling des Trackers (alle 2s) nutzt die Verbindung weiter
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+
+# Kein Recycling nach N Requests: es wuerde laufende Workflow-Threads abbrechen
+max_requests = 0
+
+# ============================================================================
+# PROZESSE
+# ============================================================================
+
+# Nicht vorladen: setup_logging() startet beim Import einen QueueListener-Thread,
+# der einen fork() nicht ueberlebt. Jeder Worker importiert die App selbst.
+preload_app = False
+
+# Heartbeat-Dateien im RAM statt auf der Platte
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# ============================================================================
+# LOGGING
+# ============================================================================
+
+# Request-Zeilen schreibt die App selbst (app.access, mit Dauer und Korrelations-ID)
+accesslog = os.getenv('GUNICORN_ACCESSLOG') or None
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'INFO').lower()
+
+# Proxy (nginx) setzt X-Forwarded-*
+forwarded_allow_ips = os.getenv('FORWARDED_ALLOW_IPS', '127.0.0.1')
+
+
+# ============================================================================
+# HOOKS
+# ============================================================================
+
+def on_starting(server) -> None:
+    """Einmal im Master: Fehler-Datenbank Wartung (wie beim Entwicklungsserver)."""
+    if os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production') == 'dev-secret-key-change-in-production':
+        server.log.warning("SECRET_KEY ist nicht gesetzt - Sessions sind nicht sicher")
+
+    try:
+        from app.services.database import run_fehler_maintenance
+        result = run_fehler_maintenance()
+        server.log.info("Fehler-Wartung: %s gemerged, %s bereinigt, %s aktiv",
+                        result['deduplizierung']['merged_count'],
+                        result['cleanup']['deleted_count'],
+                        result['stats']['aktiv'])
+    except Exception as e:
+        server.log.warning("Fehler-Wartung fehlgeschlagen: %s", e)
+
+
+def post_worker_init(worker) -> None:
+    """Je Worker: schwere Module und Templates im Hintergrund vorladen (WARMUP=0 schaltet ab)."""
+    from app.utils.warmup import start_warmup
+    start_warmup(worker.wsgi)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+NEXUS OVERLORD - Micro-Benchmark der heissen Funktionen in database.py
+
+Misst Laufzeit und Anzahl SQL-Statements pro Aufruf fuer:
+
+    search_similar_fehler, find_and_merge_duplicates, save_or_merge_fehler,
+    get_projekt_komplett, get_projekt_analyse, get_chat_messages,
+    save_auftraege
+
+auf mehreren Datenmengen. Skala N bedeutet: N Fehler, N Auftraege und
+N Chat-Nachrichten (10 Projekte mit je 10 Phasen), erzeugt von
+scripts/seed_db.py mit festem Seed.
+
+Statements werden ueber sqlite3.set_trace_callback auf jeder Verbindung
+aus database.get_db() gezaehlt (ohne BEGIN/COMMIT). Veraendernde
+Funktionen laufen pro Wiederholung auf einer frischen Kopie der Datenbank.
+
+Verwendung:
+    python scripts/bench_database.py
+    python scripts/bench_database.py --skalen 1000,10000 --repeat 3 --json bench_db.json
+    python scripts/bench_database.py --baseline bench_db.json --toleranz 0.3   # Exit 1 bei Regression
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from scripts.seed_db import seed_database  # noqa: E402
+
+DEFAULT_SKALEN = '1000,10000,100000'
+
+# Projekte und Phasen pro Projekt (Skala verteilt sich darauf)
+PROJEKTE = 10
+PHASEN = 10
+
+# Transaktions-Steuerung zaehlt nicht als Query
+_KEINE_QUERY = ('BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE')
+
+
+class QueryCounter:
+    """
+    Zaehlt Verbindungen und SQL-Statements von database.get_db().
+
+    Attributes:
+        connections: Geoeffnete Verbindungen
+        queries: Ausgefuehrte Statements (ohne Transaktions-Steuerung)
+    """
+
+    def __init__(self, database: Any):
+        self.connections = 0
+        self.queries = 0
+        self._database = database
+        self._original = database.get_db
+
+    def _get_db(self) -> sqlite3.Connection:
+        conn = self._original()
+        self.connections += 1
+        conn.set_trace_callback(self._trace)
+        return conn
+
+    def _trace(self, statement: str) -> None:
+        if not statement.lstrip().upper().startswith(_KEINE_QUERY):
+            self.queries += 1
+
+    def reset(self) -> None:
+        """Setzt die Zaehler zurueck."""
+        self.connections = 0
+        self.queries = 0
+
+    def __enter__(self) -> 'QueryCounter':
+        self._database.get_db = self._get_db
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._database.get_db = self._original
+
+
+def _neue_auftraege(anzahl: int) -> list[dict[str, Any]]:
+    """Auftraege im Format des Generators fuer save_auftraege."""
+    return [
+        {
+            'auftrag_nummer': f'99.{i}',
+            'name': f'Benchmark-Auftrag {i}',
+            'beschreibung': 'Wird vom Benchmark angelegt.',
+            'schritte': ['Schritt 1', 'Schritt 2', 'Schritt 3'],
+            'dateien': [f'bench/datei_{i}.py'],
+            'technische_details': ['Python'],
+            'erfolgs_kriterien': ['Tests gruen'],
+            'regelwerk': {'commit_message': f'[99.{i}] Benchmark'},
+        }
+        for i in range(1, anzahl + 1)
+    ]
+
+
+def benchmarks(database: Any) -> list[tuple[str, Callable[[], Any], bool]]:
+    """
+    Liste der Benchmarks.
+
+    Args:
+        database: Modul app.services.database
+
+    Returns:
+        list: (Name, Aufruf, veraendert Daten)
+    """
+    auftraege = _neue_auftraege(20)
+    return [
+        ('search_similar_fehler',
+         lambda: database.search_similar_fehler("ModuleNotFoundError: No module named 'flask'", 'python'),
+         False),
+        ('search_similar_fehler_ohne_kategorie',
+         lambda: database.search_similar_fehler("EACCES: permission denied, open '/var/www/api'"),
+         False),
+        ('get_projekt_komplett', lambda: database.get_projekt_komplett(1), False),
+        ('get_projekt_analyse', lambda: database.get_projekt_analyse(1), False),
+        ('get_chat_messages', lambda: database.get_chat_messages(1), False),
+        ('save_auftraege_20', lambda: database.save_auftraege(1, auftraege), True),
+        ('save_or_merge_fehler_merge',
+         lambda: database.save_or_merge_fehler("KeyError: 'flask'", 'python', 'Schluessel pruefen'),
+         True),
+        ('save_or_merge_fehler_neu',
+         lambda: database.save_or_merge_fehler('ZeroDivisionError: division by zero in bench.py',
+                                               'python', 'Nenner pruefen'),
+         True),
+        ('find_and_merge_duplicates', lambda: database.find_and_merge_duplicates(), True),
+    ]
+
+
+def run_scale(skala: int, repeat: int, tmp: str, nur: set[str] | None) -> list[dict[str, Any]]:
+    """
+    Fuehrt alle Benchmarks fuer eine Skala aus.
+
+    Args:
+        skala: Anzahl Zeilen (Fehler, Auftraege, Chat-Nachrichten)
+        repeat: Wiederholungen pro Benchmark
+        tmp: Arbeitsverzeichnis
+        nur: Optional - nur diese Benchmarks
+
+    Returns:
+        list: Ergebnis je Benchmark
+    """
+    from app.services import database
+
+    vorlage = os.path.join(tmp, f'seed_{skala}.db')
+    arbeit = os.path.join(tmp, f'arbeit_{skala}.db')
+    start = time.perf_counter()
+    seed_database(vorlage, projekte=PROJEKTE, phasen=PHASEN,
+                  auftraege=max(1, skala // (PROJEKTE * PHASEN)),
+                  chat=max(1, skala // PROJEKTE), fehler=skala)
+    print(f"\nSkala {skala:,}: Seed in {time.perf_counter() - start:.1f}s")
+
+    database.DB_PATH = arbeit
+    shutil.copyfile(vorlage, arbeit)
+    results = []
+
+    with QueryCounter(database) as counter:
+        for name, aufruf, veraendert in benchmarks(database):
+            if nur and name not in nur:
+                continue
+
+            zeiten = []
+            queries = connections = 0
+            for _ in range(repeat):
+                if veraendert:
+                    shutil.copyfile(vorlage, arbeit)
+                counter.reset()
+                t0 = time.perf_counter()
+                aufruf()
+                zeiten.append((time.perf_counter() - t0) * 1000)
+                queries, connections = counter.queries, counter.connections
+
+            result = {
+                'skala': skala,
+                'name': name,
+                'repeat': repeat,
+                'min_ms': round(min(zeiten), 3),
+                'median_ms': round(statistics.median(zeiten), 3),
+                'queries': queries,
+                'connections': connections,
+            }
+            results.append(result)
+            print(f"  {name:<38} median {result['median_ms']:>10.2f} ms   min {result['min_ms']:>10.2f} ms"
+                  f"   {queries:>6} Queries / {connections} Verbindungen")
+
+    return results
+
+
+def compare(results: list[dict[str, Any]], baseline: list[dict[str, Any]], toleranz: float) -> list[str]:
+    """
+    Vergleicht Median-Laufzeit und Query-Anzahl mit einer Baseline.
+
+    Mehr Queries als in der Baseline gelten immer als Regression,
+    Laufzeit erst ab der Toleranz.
+
+    Args:
+        results: Aktuelle Ergebnisse
+        baseline: Gespeicherte Ergebnisse
+        toleranz: Erlaubte Verschlechterung der Laufzeit (0.3 = 30 %)
+
+    Returns:
+        list: Beschreibung jeder Regression
+    """
+    alt = {(r['skala'], r['name']): r for r in baseline}
+    regressionen = []
+    for r in results:
+        b = alt.get((r['skala'], r['name']))
+        if not b:
+            continue
+        label = f"{r['name']} @ {r['skala']:,}"
+        if r['queries'] > b['queries']:
+            regressionen.append(f"{label}: Queries {b['queries']} -> {r['queries']}")
+        if b['median_ms'] and r['median_ms'] > b['median_ms'] * (1 + toleranz):
+            regressionen.append(f"{label}: median {b['median_ms']} -> {r['median_ms']} ms")
+    return regressionen
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Micro-Benchmark database.py')
+    parser.add_argument('--skalen', default=DEFAULT_SKALEN, help=f'Zeilen je Skala (Standard: {DEFAULT_SKALEN})')
+    parser.add_argument('--repeat', type=int, default=5, help='Wiederholungen pro Benchmark')
+    parser.add_argument('--nur', help='Kommagetrennte Benchmark-Namen')
+    parser.add_argument('--json', help='Ergebnisse zusaetzlich als JSON speichern')
+    parser.add_argument('--baseline', help='Mit Baseline vergleichen (Exit 1 bei Regression)')
+    parser.add_argument('--toleranz', type=float, default=0.3, help='Erlaubte Verschlechterung der Laufzeit')
+    args = parser.parse_args()
+
+    skalen = [int(s) for s in args.skalen.split(',') if s.strip()]
+    nur = {n.strip() for n in args.nur.split(',')} if args.nur else None
+
+    # Kein Log-Rauschen aus database.py
+    logging.basicConfig(level=logging.WARNING)
+    results = []
+    with tempfile.TemporaryDirectory(prefix='nexus_bench_db_') as tmp:
+        for skala in skalen:
+            results.extend(run_scale(skala, max(1, args.repeat), tmp, nur))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'skalen': skalen, 'repeat': args.repeat, 'results': results}, f, indent=2)
+        print(f"\nErgebnisse gespeichert: {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressionen = compare(results, baseline, args.toleranz)
+        if regressionen:
+            print(f"\nREGRESSION (Toleranz {args.toleranz:.0%}):")
+            for zeile in regressionen:
+                print(f"  - {zeile}")
+            return 1
+        print(f"\nKeine Regression gegenueber {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
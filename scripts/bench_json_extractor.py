@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+NEXUS OVERLORD - Micro-Benchmark JSON-Extraktion
+
+Vergleicht extract_json() (ein Durchlauf mit raw_decode) mit der
+bisherigen Kaskade aus json.loads, zwei Regex, Klammer-Scanner und
+Regex-Fallback (als legacy_extract_json unten eingefroren).
+
+Korpus: typische Modell-Antworten fuer Phasen/Auftraege/Qualitaet -
+reines JSON, ```json mit Prosa drumherum, Block ohne Sprache, Prosa mit
+Platzhaltern vor dem Objekt und abgeschnittene Antworten.
+
+Verwendung:
+    python scripts/bench_json_extractor.py
+    python scripts/bench_json_extractor.py --repeat 200 --json bench_json.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import timeit
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def _phasen_payload(anzahl: int) -> dict:
+    """Deterministische Phasen-Antwort mit `anzahl` Phasen."""
+    return {
+        'projektname': 'Benchmark',
+        'phasen': [
+            {
+                'nummer': i,
+                'name': f'Phase {i}: Modul {i}',
+                'beschreibung': f'Implementiert Modul {i} inkl. Tests und Doku. ' * 4,
+                'abhaengigkeiten': list(range(1, i)),
+                'prioritaet': 'hoch',
+                'geschaetzte_dauer': f'{i} Tage',
+                'code': f'```python\\ndef modul_{i}():\\n    return {{"ok": True}}\\n```',
+            }
+            for i in range(1, anzahl + 1)
+        ],
+    }
+
+
+def build_corpus() -> dict[str, str]:
+    """
+    Erzeugt den Benchmark-Korpus.
+
+    Returns:
+        dict: Name -> Modell-Antwort
+    """
+    klein = json.dumps(_phasen_payload(3), ensure_ascii=False, indent=2)
+    gross = json.dumps(_phasen_payload(40), ensure_ascii=False, indent=2)
+    prosa = ('Ich habe den Plan analysiert. Platzhalter wie {name} und {pfad} '
+             'werden spaeter ersetzt. ' * 20)
+
+    return {
+        'rein_klein': klein,
+        'rein_gross': gross,
+        'fenced_json_gross': f"Hier ist der Plan:\n\n```json\n{gross}\n```\n\nViel Erfolg!",
+        'fenced_ohne_sprache': f"Ergebnis:\n```\n{gross}\n```",
+        'prosa_davor': f"{prosa}\n{gross}\n{prosa}",
+        'abgeschnitten': f"```json\n{gross[: len(gross) * 2 // 3]}",
+    }
+
+
+def legacy_extract_json(text: str) -> dict:
+    """Bisherige Implementierung von extract_json (Referenz, ohne Logging)."""
+    try:
+        result = json.loads(text.strip())
+        if isinstance(result, dict):
+            return result
+    except json.JSONDecodeError:
+        pass
+
+    for pattern in (r'```json\s*\n?(.*?)\n?```', r'```\s*\n?(.*?)\n?```'):
+        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        if match:
+            try:
+                result = json.loads(match.group(1).strip())
+                if isinstance(result, dict):
+                    return result
+            except json.JSONDecodeError:
+                continue
+
+    try:
+        start = text.find('{')
+        if start != -1:
+            depth, end, in_string, escape_next = 0, start, False, False
+            for i, char in enumerate(text[start:], start):
+                if escape_next:
+                    escape_next = False
+                    continue
+                if char == '\\':
+                    escape_next = True
+                    continue
+                if char == '"':
+                    in_string = not in_string
+                    continue
+                if in_string:
+                    continue
+                if char == '{':
+                    depth += 1
+                elif char == '}':
+                    depth -= 1
+                    if depth == 0:
+                        end = i + 1
+                        break
+            if end > start:
+                result = json.loads(text[start:end])
+                if isinstance(result, dict):
+                    return result
+    except (json.JSONDecodeError, ValueError):
+        pass
+
+    try:
+        match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
+        if match:
+            result = json.loads(match.group())
+            if isinstance(result, dict):
+                return result
+    except json.JSONDecodeError:
+        pass
+
+    return {}
+
+
+def main() -> int:
+    import logging
+
+    from app.utils.json_extractor import extract_json
+
+    parser = argparse.ArgumentParser(description='Micro-Benchmark JSON-Extraktion')
+    parser.add_argument('--repeat', type=int, default=100, help='Aufrufe pro Messung')
+    parser.add_argument('--json', help='Ergebnisse zusaetzlich als JSON speichern')
+    args = parser.parse_args()
+
+    # Fallback-Warnungen (abgeschnittene Antworten) nicht mitmessen
+    logging.disable(logging.WARNING)
+
+    results = []
+    for name, text in build_corpus().items():
+        legacy = min(timeit.repeat(lambda: legacy_extract_json(text), number=args.repeat, repeat=5))
+        neu = min(timeit.repeat(lambda: extract_json(text), number=args.repeat, repeat=5))
+        results.append({
+            'fall': name,
+            'zeichen': len(text),
+            'legacy_us': round(legacy / args.repeat * 1e6, 1),
+            'neu_us': round(neu / args.repeat * 1e6, 1),
+            'gleich': legacy_extract_json(text) == extract_json(text),
+        })
+
+    print(f"{'Fall':<22} {'Zeichen':>8} {'legacy us':>10} {'neu us':>9} {'Faktor':>7}  gleich")
+    for r in results:
+        faktor = r['legacy_us'] / r['neu_us'] if r['neu_us'] else 0
+        print(f"{r['fall']:<22} {r['zeichen']:>8} {r['legacy_us']:>10.1f} {r['neu_us']:>9.1f} "
+              f"{faktor:>6.1f}x  {r['gleich']}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+NEXUS OVERLORD - Benchmark PDF-Export (Spitzen-Speicher)
+
+Vergleicht den Peak-RSS eines grossen Exports (Standard: ~500 Seiten):
+
+    bytes   - bisheriger Weg: generate_full_documentation() -> bytes -> Response
+    stream  - write_full_documentation() in SpooledTemporaryFile -> FileWrapper
+
+Jeder Modus laeuft in einem eigenen Prozess, damit ru_maxrss nicht vom
+anderen Modus beeinflusst wird.
+
+Verwendung:
+    python scripts/bench_pdf_export.py
+    python scripts/bench_pdf_export.py --pages 500 --json bench_pdf.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Erfahrungswert: so viele Auftrags-Zeilen passen auf eine Seite
+ROWS_PER_PAGE = 24
+
+# Chunk-Groesse von werkzeug beim Senden von Dateien
+CHUNK_SIZE = 8192
+
+
+def build_projekt(pages: int) -> dict:
+    """
+    Erzeugt ein deterministisches Projekt, das ungefaehr `pages` Seiten ergibt.
+
+    Args:
+        pages: Gewuenschte Seitenzahl
+
+    Returns:
+        dict: Projekt im Format von get_projekt_komplett()
+    """
+    auftraege_pro_phase = 200
+    anzahl_phasen = max(1, pages * ROWS_PER_PAGE // auftraege_pro_phase)
+
+    phasen = []
+    for p in range(1, anzahl_phasen + 1):
+        phasen.append({
+            'nummer': p,
+            'name': f'Phase {p}: Modul {p}',
+            'status': ('fertig', 'in_arbeit', 'offen')[p % 3],
+            'beschreibung': f'Beschreibung der Phase {p}. ' * 5,
+            'auftraege': [
+                {
+                    'nummer': a,
+                    'name': f'Auftrag {p}.{a} - Komponente implementieren und testen',
+                    'status': ('fertig', 'offen')[a % 2],
+                    'updated_at': '2025-01-15 10:00:00',
+                }
+                for a in range(1, auftraege_pro_phase + 1)
+            ],
+        })
+
+    return {
+        'id': 1,
+        'name': 'Benchmark Projekt',
+        'status': 'in_arbeit',
+        'created_at': '2025-01-01 09:00:00',
+        'original_plan': 'Zeile des Original-Plans\n' * 20,
+        'enterprise_plan': 'Zeile des Enterprise-Plans\n' * 30,
+        'bewertung': 'Bewertung\n' * 10,
+        'phasen': phasen,
+    }
+
+
+def _peak_rss_mb() -> float:
+    """Peak-RSS des aktuellen Prozesses in MB (Linux: ru_maxrss in KB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode: str, pages: int) -> dict:
+    """
+    Fuehrt einen Export im aktuellen Prozess aus und misst ihn.
+
+    Args:
+        mode: 'bytes' oder 'stream'
+        pages: Gewuenschte Seitenzahl
+
+    Returns:
+        dict: Messwerte
+    """
+    from flask import Response
+    from werkzeug.wsgi import FileWrapper
+
+    from app.services.pdf_generator import generate_full_documentation, write_full_documentation
+
+    projekt = build_projekt(pages)
+    rss_before = _peak_rss_mb()
+    start = time.perf_counter()
+    sent = 0
+
+    if mode == 'bytes':
+        pdf_bytes = generate_full_documentation(projekt, projekt['phasen'])
+        response = Response(pdf_bytes, mimetype='application/pdf')
+        for chunk in response.response:
+            sent += len(chunk)
+    else:
+        with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as spooled:
+            write_full_documentation(spooled, projekt, projekt['phasen'])
+            spooled.seek(0)
+            for chunk in FileWrapper(spooled, CHUNK_SIZE):
+                sent += len(chunk)
+
+    return {
+        'mode': mode,
+        'phasen': len(projekt['phasen']),
+        'pdf_bytes': sent,
+        'seconds': round(time.perf_counter() - start, 2),
+        'rss_before_mb': round(rss_before, 1),
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark PDF-Export Peak-RSS')
+    parser.add_argument('--pages', type=int, default=500, help='Ungefaehre Seitenzahl')
+    parser.add_argument('--mode', choices=['bytes', 'stream'], help='Nur einen Modus (intern)')
+    parser.add_argument('--json', help='Ergebnisse zusaetzlich als JSON speichern')
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.pages)))
+        return 0
+
+    results = []
+    for mode in ('bytes', 'stream'):
+        output = subprocess.run(
+            [sys.executable, __file__, '--mode', mode, '--pages', str(args.pages)],
+            capture_output=True, text=True, check=True, cwd=PROJECT_ROOT
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{'Modus':<8} {'PDF (MB)':>9} {'Zeit (s)':>9} {'RSS vorher':>11} {'Peak RSS':>9}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['pdf_bytes'] / 1e6:>9.1f} {r['seconds']:>9.2f} "
+              f"{r['rss_before_mb']:>10.1f}M {r['peak_rss_mb']:>8.1f}M")
+
+    bytes_peak = results[0]['peak_rss_mb'] - results[0]['rss_before_mb']
+    stream_peak = results[1]['peak_rss_mb'] - results[1]['rss_before_mb']
+    print(f"\nZusatz-Speicher: bytes {bytes_peak:.1f}M, stream {stream_peak:.1f}M")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'pages': args.pages, 'results': results}, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+NEXUS OVERLORD - Lasttest der Flask-App gegen den lokalen OpenRouter-Mock
+
+Ablauf:
+    1. Temporaeres Verzeichnis mit geseedeter Datenbank (scripts/seed_db.py),
+       Session-Store, Ledger, Caches und Blob Store
+    2. Mock-OpenRouter (scripts/mock_openrouter.py) und die App im selben
+       Prozess, beide als echte HTTP-Server auf freien Ports
+    3. N parallele Clients feuern eine gewichtete Mischung aus
+       steuern / auftrag / fehler / chat / export-pdf
+    4. Bericht mit p50/p95/p99, Durchsatz und Fehlerquote je Route,
+       optional Vergleich mit einer gespeicherten Baseline
+
+Verwendung:
+    python scripts/loadtest.py --dauer 30 --clients 8
+    python scripts/loadtest.py --mix steuern=5,chat=3,fehler=2 --mock-latenz lognormal:400:0.5
+    python scripts/loadtest.py --save-baseline baseline_last.json
+    python scripts/loadtest.py --baseline baseline_last.json --toleranz 0.25   # Exit 1 bei Regression
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import requests
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from scripts.mock_openrouter import MockConfig, start_mock_server  # noqa: E402
+from scripts.seed_db import fehler_text, seed_database  # noqa: E402
+
+# Standard-Mischung (Gewichte)
+DEFAULT_MIX = 'steuern=40,chat=25,auftrag=15,fehler=15,export=5'
+
+# Neue Fehler (nicht in der Fehler-DB) gehen an den Mock
+NEUE_FEHLER = [
+    'TypeError: unsupported operand type(s) for +: int and str in rechner.py line {n}',
+    'RecursionError: maximum recursion depth exceeded while calling parser {n}',
+    'UnicodeDecodeError: utf-8 codec cannot decode byte 0x{n:02x} in position 12',
+]
+
+
+# ============================================================================
+# ROUTEN
+# ============================================================================
+
+def _request(session: requests.Session, base: str, route: str, projekt_id: int,
+             rng: random.Random) -> requests.Response:
+    """Fuehrt einen Request der Mischung aus."""
+    prefix = f'{base}/projekt/{projekt_id}'
+    if route == 'steuern':
+        return session.get(f'{prefix}/steuern', allow_redirects=False)
+    if route == 'chat':
+        return session.post(f'{prefix}/chat', data={'inhalt': f'Lasttest {rng.random():.6f}', 'typ': 'USER'})
+    if route == 'auftrag':
+        return session.post(f'{prefix}/auftrag')
+    if route == 'fehler':
+        if rng.random() < 0.8:
+            text = fehler_text(rng)[1]
+        else:
+            text = rng.choice(NEUE_FEHLER).format(n=rng.randint(1, 255))
+        return session.post(f'{prefix}/fehler', data={'fehler_text': text})
+    if route == 'export':
+        return session.get(f'{prefix}/export-pdf')
+    raise ValueError(f"Unbekannte Route: {route}")
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    """
+    Parst eine Mischung wie 'steuern=40,chat=25'.
+
+    Args:
+        spec: Kommagetrennte route=gewicht Paare
+
+    Returns:
+        dict: Route -> Gewicht
+
+    Raises:
+        ValueError: Bei unbekannter Route oder Gewicht <= 0
+    """
+    mix = {}
+    for teil in spec.split(','):
+        route, _, gewicht = teil.partition('=')
+        route = route.strip()
+        if route not in ('steuern', 'chat', 'auftrag', 'fehler', 'export'):
+            raise ValueError(f"Unbekannte Route in --mix: {route}")
+        mix[route] = int(gewicht or 1)
+        if mix[route] <= 0:
+            raise ValueError(f"Gewicht fuer {route} muss > 0 sein")
+    return mix
+
+
+# ============================================================================
+# AUSWERTUNG
+# ============================================================================
+
+def percentile(werte: list[float], p: float) -> float:
+    """
+    Perzentil nach Nearest-Rank.
+
+    Args:
+        werte: Aufsteigend sortierte Messwerte
+        p: Perzentil (0-100)
+
+    Returns:
+        float: Messwert (0.0 bei leerer Liste)
+    """
+    if not werte:
+        return 0.0
+    index = max(0, min(len(werte) - 1, math.ceil(p / 100 * len(werte)) - 1))
+    return werte[index]
+
+
+def summarize(messungen: dict[str, list[tuple[float, int]]], dauer: float) -> dict[str, dict[str, Any]]:
+    """
+    Verdichtet die Messungen je Route.
+
+    Args:
+        messungen: Route -> [(Latenz in ms, HTTP-Status)]; Status 0 = Verbindungsfehler
+        dauer: Laufzeit in Sekunden
+
+    Returns:
+        dict: Route -> requests, fehler, rps, p50/p95/p99/max in ms
+    """
+    bericht = {}
+    for route, werte in sorted(messungen.items()):
+        latenzen = sorted(ms for ms, _ in werte)
+        fehler = sum(1 for _, status in werte if status == 0 or status >= 500)
+        bericht[route] = {
+            'requests': len(werte),
+            'fehler': fehler,
+            'rps': round(len(werte) / dauer, 2) if dauer else 0.0,
+            'p50_ms': round(percentile(latenzen, 50), 1),
+            'p95_ms': round(percentile(latenzen, 95), 1),
+            'p99_ms': round(percentile(latenzen, 99), 1),
+            'max_ms': round(latenzen[-1], 1) if latenzen else 0.0,
+        }
+    return bericht
+
+
+def compare(bericht: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]],
+            toleranz: float) -> list[str]:
+    """
+    Vergleicht p95 und Durchsatz mit einer Baseline.
+
+    Args:
+        bericht: Aktueller Bericht
+        baseline: Gespeicherter Bericht
+        toleranz: Erlaubte Verschlechterung (0.2 = 20 %)
+
+    Returns:
+        list: Beschreibung jeder Regression (leer = alles im Rahmen)
+    """
+    regressionen = []
+    for route, aktuell in bericht.items():
+        alt = baseline.get(route)
+        if not alt:
+            continue
+        if alt['p95_ms'] and aktuell['p95_ms'] > alt['p95_ms'] * (1 + toleranz):
+            regressionen.append(f"{route}: p95 {alt['p95_ms']} -> {aktuell['p95_ms']} ms")
+        if alt['rps'] and aktuell['rps'] < alt['rps'] * (1 - toleranz):
+            regressionen.append(f"{route}: Durchsatz {alt['rps']} -> {aktuell['rps']} req/s")
+    return regressionen
+
+
+# ============================================================================
+# LAUF
+# ============================================================================
+
+def run_load(
+    base: str,
+    mix: dict[str, int],
+    projekte: int,
+    clients: int,
+    dauer: float,
+    seed: int
+) -> tuple[dict[str, list[tuple[float, int]]], float]:
+    """
+    Treibt die App mit parallelen Clients.
+
+    Args:
+        base: Basis-URL der App
+        mix: Route -> Gewicht
+        projekte: Anzahl geseedeter Projekte (IDs 1..projekte)
+        clients: Parallele Clients
+        dauer: Laufzeit in Sekunden
+        seed: Zufalls-Seed (je Client abgeleitet)
+
+    Returns:
+        tuple: (Messungen je Route, tatsaechliche Laufzeit)
+    """
+    routen = list(mix)
+    gewichte = [mix[r] for r in routen]
+    messungen: dict[str, list[tuple[float, int]]] = defaultdict(list)
+    lock = threading.Lock()
+    ende = time.perf_counter() + dauer
+
+    def client(nr: int) -> None:
+        rng = random.Random(seed * 1000 + nr)
+        session = requests.Session()
+        while time.perf_counter() < ende:
+            route = rng.choices(routen, gewichte)[0]
+            start = time.perf_counter()
+            try:
+                status = _request(session, base, route, rng.randint(1, projekte), rng).status_code
+            except requests.RequestException:
+                status = 0
+            ms = (time.perf_counter() - start) * 1000
+            with lock:
+                messungen[route].append((ms, status))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        for future in [executor.submit(client, nr) for nr in range(clients)]:
+            future.result()
+    return messungen, time.perf_counter() - start
+
+
+def _prepare_environment(tmp: str, mock_url: str) -> None:
+    """Leitet alle Datenpfade der App ins temporaere Verzeichnis um."""
+    os.environ.update({
+        'OPENROUTER_BASE_URL': mock_url,
+        'OPENROUTER_API_KEY': 'mock',
+        'LLM_LEDGER_PATH': os.path.join(tmp, 'llm_ledger.db'),
+        'SESSION_STORE_PATH': os.path.join(tmp, 'sessions.db'),
+        'EXTRACTION_CACHE_PATH': os.path.join(tmp, 'extraction_cache.db'),
+        'PDF_EXPORT_CACHE_DIR': os.path.join(tmp, 'exports'),
+        'UEBERGABE_BLOB_DIR': os.path.join(tmp, 'blobs'),
+    })
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Lasttest der Flask-App gegen den OpenRouter-Mock')
+    parser.add_argument('--dauer', type=float, default=20, help='Laufzeit in Sekunden')
+    parser.add_argument('--clients', type=int, default=8, help='Parallele Clients')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'Gewichte je Route (Standard: {DEFAULT_MIX})')
+    parser.add_argument('--projekte', type=int, default=20)
+    parser.add_argument('--phasen', type=int, default=5)
+    parser.add_argument('--auftraege', type=int, default=4)
+    parser.add_argument('--chat', type=int, default=30)
+    parser.add_argument('--fehler', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--mock-latenz', default='lognormal:300:0.4', help='Latenz des Mock-Modells')
+    parser.add_argument('--mock-fehlerrate', type=float, default=0.0)
+    parser.add_argument('--mock-429', type=float, default=0.0)
+    parser.add_argument('--json', help='Bericht als JSON speichern')
+    parser.add_argument('--save-baseline', help='Bericht als Baseline speichern')
+    parser.add_argument('--baseline', help='Mit Baseline vergleichen (Exit 1 bei Regression)')
+    parser.add_argument('--toleranz', type=float, default=0.2, help='Erlaubte Verschlechterung')
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    import logging
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory(prefix='nexus_last_') as tmp:
+        db_path = os.path.join(tmp, 'nexus.db')
+        counts = seed_database(db_path, args.projekte, args.phasen, args.auftraege,
+                               args.chat, args.fehler, args.seed)
+        print("Seed: " + ', '.join(f'{k}={v}' for k, v in counts.items()))
+
+        mock = start_mock_server(MockConfig(latenz=args.mock_latenz, fehlerrate=args.mock_fehlerrate,
+                                            rate_429=args.mock_429, seed=args.seed))
+        _prepare_environment(tmp, mock.base_url)
+
+        # Erst nach dem Umleiten importieren (Pfade werden beim Import gelesen)
+        from werkzeug.serving import make_server
+
+        from app.main import app
+        from app.services import database
+        database.DB_PATH = db_path
+        logging.getLogger().setLevel(logging.WARNING)
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        threading.Thread(target=server.serve_forever, name='loadtest-app', daemon=True).start()
+        base = f'http://127.0.0.1:{server.server_port}'
+
+        print(f"App: {base}, Mock: {mock.base_url} ({args.mock_latenz})")
+        print(f"{args.clients} Clients, {args.dauer:.0f}s, Mix: {args.mix}\n")
+
+        try:
+            messungen, dauer = run_load(base, mix, args.projekte, args.clients, args.dauer, args.seed)
+        finally:
+            server.shutdown()
+            mock.shutdown()
+            mock.server_close()
+
+        mock_stats = mock.stats()
+
+    bericht = summarize(messungen, dauer)
+
+    print(f"{'Route':<10} {'Requests':>9} {'Fehler':>7} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    print('-' * 72)
+    for route, r in bericht.items():
+        print(f"{route:<10} {r['requests']:>9} {r['fehler']:>7} {r['rps']:>8.2f} "
+              f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['max_ms']:>8.1f}")
+    gesamt = sum(r['requests'] for r in bericht.values())
+    print(f"\nGesamt: {gesamt} Requests in {dauer:.1f}s ({gesamt / dauer:.1f} req/s)")
+    print(f"Mock-Requests: {json.dumps(mock_stats)}")
+
+    result = {
+        'meta': {'clients': args.clients, 'dauer_s': round(dauer, 1), 'mix': mix, 'seed': args.seed,
+                 'mock_latenz': args.mock_latenz, 'seed_counts': counts},
+        'routen': bericht,
+    }
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2)
+            print(f"Gespeichert: {path}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['routen']
+        regressionen = compare(bericht, baseline, args.toleranz)
+        if regressionen:
+            print(f"\nREGRESSION (Toleranz {args.toleranz:.0%}):")
+            for zeile in regressionen:
+                print(f"  - {zeile}")
+            return 1
+        print(f"\nKeine Regression gegenueber {args.baseline} (Toleranz {args.toleranz:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+NEXUS OVERLORD - Lokale Log-Auswertung (ersetzt den SSH-tail in monitor.py)
+
+Liest Log-Dateien (oder stdin) einmalig oder fortlaufend und aggregiert
+in gleitenden Fenstern (1, 5, 15 Minuten):
+
+    - Request-Rate und Status-Klassen (2xx/3xx/4xx/5xx)
+    - Langsame Routen (Durchschnitt, Maximum, Anzahl ueber --langsam-ms)
+    - Exception-Signaturen (Typ + normalisierte Meldung, mit Traceback)
+
+Verstanden werden die JSON-Zeilen aus app/utils/structured_logging.py
+(inkl. Access-Log app.access mit Dauer), das alte Textformat und die
+Access-Zeilen des Werkzeug-Servers. Alle Muster stecken in EINER
+kompilierten Regex, jede Zeile wird genau einmal durchsucht.
+
+--follow haelt die Datei offen und liest per seek weiter, Log-Rotation
+(neue Inode oder kuerzere Datei) wird erkannt. Mit --fehler-db werden neue
+Exception-Signaturen ueber analyze_fehler() und save_or_merge_fehler()
+in die Fehler-Datenbank uebernommen.
+
+Verwendung:
+    python scripts/log_analytics.py logs/server.log
+    python scripts/log_analytics.py --follow logs/server.log --intervall 30
+    ssh server 'tail -F /pfad/server.log' | python scripts/log_analytics.py --follow -
+    python scripts/log_analytics.py logs/server.log --json bericht.json --fehler-db database/nexus.db
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, TextIO
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Gleitende Fenster in Sekunden
+FENSTER = (60, 300, 900)
+
+# Ab dieser Dauer gilt ein Request als langsam
+DEFAULT_LANGSAM_MS = 2000.0
+
+# Alle Muster in einer Regex - finditer liefert jeden Treffer einer Zeile in einem Durchlauf
+LINE_PATTERN = re.compile(r'''
+    (?P<ts>\d{4}-\d\d-\d\d[ T]\d\d:\d\d:\d\d(?:[.,]\d+)?)
+  | \[(?P<clf>\d\d/\w{3}/\d{4}[ :]\d\d:\d\d:\d\d)\]
+  | "(?P<w_method>GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\ (?P<w_path>\S+)\ HTTP/[\d.]+"\ (?P<w_status>\d{3})
+  | [ ]-[ ](?P<level>DEBUG|INFO|WARNING|ERROR|CRITICAL)[ ]-[ ]
+  | (?P<traceback>Traceback\ \(most\ recent\ call\ last\):)
+  | (?P<exc>\b(?:[a-z_]\w*\.)*[A-Z]\w*(?:Error|Exception|Timeout|Exit))(?::\ ?(?P<exc_msg>.*))?
+''', re.VERBOSE)
+
+# Normalisierung der Meldung fuer die Signatur
+_NORMALISIERUNG = [
+    (re.compile(r"'[^']*'|\"[^\"]*\""), "'<s>'"),
+    (re.compile(r'0x[0-9a-fA-F]+'), '<hex>'),
+    (re.compile(r'(?<![\w<])/[\w./-]+'), '<pfad>'),
+    (re.compile(r'\d+'), '<n>'),
+]
+
+# IDs in Pfaden ohne Route-Regel (Werkzeug-Zeilen)
+_PFAD_ID = re.compile(r'/\d+(?=/|$)')
+
+# Korrelations-ID im Textformat ('[3f9c2a7d1e5b4c08] ')
+_KORRELATION = re.compile(r'^\[[^\]]*\]\s*')
+
+
+@dataclass
+class Event:
+    """
+    Ein ausgewertetes Log-Ereignis.
+
+    Attributes:
+        ts: Zeitstempel (Unix-Sekunden)
+        route: Route bei Requests (Regel oder normalisierter Pfad)
+        status: HTTP-Status bei Requests
+        dauer_ms: Antwortzeit (nur aus dem Access-Log)
+        access_log: Stammt aus app.access (nicht aus Werkzeug)
+        exc_typ / exc_msg: Exception-Typ und Meldung
+        traceback: Traceback-Text, falls vorhanden
+    """
+
+    ts: float
+    route: str | None = None
+    status: int | None = None
+    dauer_ms: float | None = None
+    access_log: bool = False
+    exc_typ: str | None = None
+    exc_msg: str = ''
+    traceback: str | None = None
+
+
+def signatur(exc_typ: str, exc_msg: str) -> str:
+    """
+    Normalisierte Exception-Signatur (Zahlen, Strings, Pfade ersetzt).
+
+    Args:
+        exc_typ: Exception-Typ oder Log-Level
+        exc_msg: Meldung
+
+    Returns:
+        str: z.B. "KeyError: '<s>'"
+    """
+    msg = exc_msg.strip()
+    for pattern, ersatz in _NORMALISIERUNG:
+        msg = pattern.sub(ersatz, msg)
+    return f"{exc_typ}: {msg[:160]}" if msg else exc_typ
+
+
+def _parse_ts(iso: str | None, clf: str | None) -> float | None:
+    """Zeitstempel aus ISO- oder Common-Log-Format."""
+    try:
+        if iso:
+            return datetime.fromisoformat(iso.replace(',', '.')).timestamp()
+        if clf:
+            # '18/Oct/2026 10:00:02' (Werkzeug) oder '18/Oct/2026:10:00:02' (Apache)
+            return datetime.strptime(f'{clf[:11]} {clf[12:]}', '%d/%b/%Y %H:%M:%S').timestamp()
+    except ValueError:
+        return None
+    return None
+
+
+class LineParser:
+    """
+    Wandelt Log-Zeilen in Events (ein Parser pro Quelle).
+
+    Text-Tracebacks ueber mehrere Zeilen werden gesammelt, bis die
+    abschliessende Exception-Zeile kommt. Eine ERROR-Zeile direkt vor
+    einem Traceback (logger.exception) zaehlt nicht extra - sie wird erst
+    mit der naechsten Zeile ausgegeben.
+    """
+
+    def __init__(self):
+        self._traceback: list[str] | None = None
+        self._offen: Event | None = None
+        self._letzte_ts = time.time()
+
+    def feed(self, line: str) -> list[Event]:
+        """
+        Wertet eine Zeile aus.
+
+        Args:
+            line: Log-Zeile (mit oder ohne Zeilenumbruch)
+
+        Returns:
+            list: 0..n Events
+        """
+        line = line.rstrip('\n')
+        if not line.strip():
+            return []
+        if line.startswith('{'):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if isinstance(record, dict):
+                return self.flush() + self._feed_json(record)
+        return self._feed_text(line)
+
+    def flush(self) -> list[Event]:
+        """
+        Gibt eine zurueckgehaltene ERROR-Zeile aus (Ende der Eingabe).
+
+        Returns:
+            list: 0..1 Events
+        """
+        offen, self._offen = self._offen, None
+        return [offen] if offen else []
+
+    def _feed_json(self, record: dict[str, Any]) -> list[Event]:
+        ts = _parse_ts(record.get('ts'), None) or self._letzte_ts
+        self._letzte_ts = ts
+
+        if record.get('logger') == 'app.access' and record.get('status') is not None:
+            return [Event(ts, route=record.get('route') or _PFAD_ID.sub('/<id>', record.get('path', '?')),
+                          status=int(record['status']), dauer_ms=record.get('duration_ms'), access_log=True)]
+
+        events = self._feed_text(str(record.get('msg', '')), ts, mit_exceptions=False)
+        if record.get('exc'):
+            exc = record['exc'].rstrip()
+            letzte = exc.splitlines()[-1] if exc else ''
+            match = next((m for m in LINE_PATTERN.finditer(letzte) if m.group('exc')), None)
+            if match:
+                events.append(Event(ts, exc_typ=match.group('exc'), exc_msg=match.group('exc_msg') or '',
+                                    traceback=exc))
+        elif record.get('level') in ('ERROR', 'CRITICAL'):
+            msg = str(record.get('msg', ''))
+            match = next((m for m in LINE_PATTERN.finditer(msg) if m.group('exc')), None)
+            if match:
+                events.append(Event(ts, exc_typ=match.group('exc'), exc_msg=match.group('exc_msg') or ''))
+            else:
+                events.append(Event(ts, exc_typ=f"{record['level']} {record.get('logger', '?')}", exc_msg=msg))
+        return events
+
+    def _feed_text(self, line: str, ts: float | None = None, mit_exceptions: bool = True) -> list[Event]:
+        iso = clf = request = level = exc = None
+        traceback_start = False
+        for match in LINE_PATTERN.finditer(line):
+            art = match.lastgroup
+            if art == 'ts' and iso is None:
+                iso = match
+            elif art == 'clf':
+                clf = match.group('clf')
+            elif art == 'w_status':
+                request = match
+            elif art == 'level' and level is None:
+                level = match
+            elif art == 'traceback':
+                traceback_start = True
+            elif art in ('exc', 'exc_msg') and exc is None:
+                exc = match
+
+        if ts is None:
+            ts = _parse_ts(iso.group('ts') if iso else None, clf) or self._letzte_ts
+        self._letzte_ts = ts
+        events = []
+
+        if request is not None:
+            pfad = request.group('w_path').split('?', 1)[0]
+            events.append(Event(ts, route=_PFAD_ID.sub('/<id>', pfad), status=int(request.group('w_status'))))
+
+        if not mit_exceptions:
+            return events
+
+        if traceback_start:
+            # Der Traceback ersetzt die zurueckgehaltene ERROR-Zeile
+            self._offen = None
+            self._traceback = [line]
+            return events
+        events = self.flush() + events
+        if self._traceback is not None:
+            self._traceback.append(line)
+            # Die Exception-Zeile am Ende steht am Zeilenanfang
+            if exc is not None and exc.start() == 0:
+                events.append(Event(ts, exc_typ=exc.group('exc'), exc_msg=exc.group('exc_msg') or '',
+                                    traceback='\n'.join(self._traceback)))
+                self._traceback = None
+            elif len(self._traceback) > 200:
+                self._traceback = None
+            return events
+
+        if level is not None and level.group('level') in ('ERROR', 'CRITICAL'):
+            if exc is not None:
+                self._offen = Event(ts, exc_typ=exc.group('exc'), exc_msg=exc.group('exc_msg') or '')
+            else:
+                logger_name = line[iso.end():level.start()].strip(' -') if iso else '?'
+                self._offen = Event(ts, exc_typ=f"{level.group('level')} {logger_name}",
+                                    exc_msg=_KORRELATION.sub('', line[level.end():]))
+        return events
+
+
+# ============================================================================
+# AGGREGATION
+# ============================================================================
+
+@dataclass
+class _Bucket:
+    requests: int = 0
+    status: Counter = field(default_factory=Counter)
+    routen: dict[str, list[float]] = field(default_factory=dict)
+    exceptions: Counter = field(default_factory=Counter)
+
+
+class Aggregator:
+    """
+    Gleitende Fenster ueber Sekunden-Buckets plus Gesamtsummen.
+
+    "Jetzt" ist der juengste Zeitstempel aus dem Log, damit auch alte
+    Dateien sinnvolle Fenster ergeben.
+
+    Attributes:
+        signaturen: Signatur -> Typ, Beispiel, Anzahl, erstes/letztes Auftreten
+    """
+
+    def __init__(self, fenster: Iterable[int] = FENSTER, langsam_ms: float = DEFAULT_LANGSAM_MS,
+                 on_neue_signatur: Callable[[str, Event], None] | None = None):
+        """
+        Args:
+            fenster: Fenstergroessen in Sekunden
+            langsam_ms: Schwelle fuer langsame Requests
+            on_neue_signatur: Optional - wird beim ersten Auftreten einer Signatur aufgerufen
+        """
+        self.fenster = tuple(sorted(fenster))
+        self.langsam_ms = langsam_ms
+        self.signaturen: dict[str, dict[str, Any]] = {}
+        self.gesamt = _Bucket()
+        self._buckets: dict[int, _Bucket] = {}
+        self._jetzt = 0.0
+        self._access_log = False
+        self._on_neue_signatur = on_neue_signatur
+
+    def add(self, event: Event) -> None:
+        """Nimmt ein Event auf."""
+        if event.status is not None:
+            if event.access_log:
+                self._access_log = True
+            elif self._access_log:
+                # Werkzeug-Zeile zu einem Request, der schon im Access-Log steht
+                return
+
+        sekunde = int(event.ts)
+        if sekunde > self._jetzt:
+            self._jetzt = sekunde
+            grenze = sekunde - self.fenster[-1]
+            for alt in [s for s in self._buckets if s <= grenze]:
+                del self._buckets[alt]
+        elif sekunde <= self._jetzt - self.fenster[-1]:
+            self._add_to(self.gesamt, event, None)
+            return
+
+        bucket = self._buckets.get(sekunde)
+        if bucket is None:
+            bucket = self._buckets[sekunde] = _Bucket()
+        sig = self._add_to(self.gesamt, event, None)
+        self._add_to(bucket, event, sig)
+
+    def _add_to(self, bucket: _Bucket, event: Event, sig: str | None) -> str | None:
+        if event.status is not None:
+            bucket.requests += 1
+            bucket.status[f'{event.status // 100}xx'] += 1
+            route = bucket.routen.setdefault(event.route or '?', [0, 0.0, 0.0, 0, 0])
+            route[0] += 1
+            if event.dauer_ms is not None:
+                route[1] += event.dauer_ms
+                route[2] = max(route[2], event.dauer_ms)
+                route[3] += event.dauer_ms >= self.langsam_ms
+                route[4] += 1
+        if event.exc_typ:
+            if sig is None:
+                sig = signatur(event.exc_typ, event.exc_msg)
+                self._remember(sig, event)
+            bucket.exceptions[sig] += 1
+        return sig
+
+    def _remember(self, sig: str, event: Event) -> None:
+        eintrag = self.signaturen.get(sig)
+        if eintrag is None:
+            eintrag = self.signaturen[sig] = {
+                'typ': event.exc_typ,
+                'beispiel': f"{event.exc_typ}: {event.exc_msg}".strip(': ')[:500],
+                'traceback': event.traceback,
+                'anzahl': 0,
+                'erstes': event.ts,
+                'letztes': event.ts,
+            }
+            if self._on_neue_signatur:
+                self._on_neue_signatur(sig, event)
+        eintrag['anzahl'] += 1
+        eintrag['letztes'] = max(eintrag['letztes'], event.ts)
+        if event.traceback and not eintrag['traceback']:
+            eintrag['traceback'] = event.traceback
+
+    @staticmethod
+    def _routen(buckets: Iterable[_Bucket], top: int) -> list[dict[str, Any]]:
+        summe: dict[str, list[float]] = defaultdict(lambda: [0, 0.0, 0.0, 0, 0])
+        for bucket in buckets:
+            for route, werte in bucket.routen.items():
+                s = summe[route]
+                s[0] += werte[0]
+                s[1] += werte[1]
+                s[2] = max(s[2], werte[2])
+                s[3] += werte[3]
+                s[4] += werte[4]
+        routen = [
+            {'route': route, 'requests': int(s[0]), 'langsam': int(s[3]),
+             'avg_ms': round(s[1] / s[4], 1) if s[4] else None, 'max_ms': round(s[2], 1) if s[4] else None}
+            for route, s in summe.items()
+        ]
+        routen.sort(key=lambda r: (r['langsam'], r['avg_ms'] or 0), reverse=True)
+        return routen[:top]
+
+    def _fenster_bericht(self, buckets: list[_Bucket], sekunden: float, top: int) -> dict[str, Any]:
+        requests = sum(b.requests for b in buckets)
+        status: Counter = Counter()
+        exceptions: Counter = Counter()
+        for b in buckets:
+            status.update(b.status)
+            exceptions.update(b.exceptions)
+        return {
+            'requests': requests,
+            'rps': round(requests / sekunden, 3) if sekunden else None,
+            'status': dict(sorted(status.items())),
+            'routen': self._routen(buckets, top),
+            'exceptions': [{'signatur': sig, 'anzahl': n} for sig, n in exceptions.most_common(top)],
+        }
+
+    def report(self, top: int = 10) -> dict[str, Any]:
+        """
+        Bericht ueber alle Fenster und die Gesamtlaufzeit.
+
+        Args:
+            top: Anzahl Routen/Signaturen pro Liste
+
+        Returns:
+            dict: jetzt, fenster ('1m', '5m', ...), gesamt, signaturen
+        """
+        bericht: dict[str, Any] = {
+            'jetzt': datetime.fromtimestamp(self._jetzt).isoformat() if self._jetzt else None,
+            'fenster': {},
+        }
+        for sekunden in self.fenster:
+            grenze = self._jetzt - sekunden
+            buckets = [b for s, b in self._buckets.items() if s > grenze]
+            bericht['fenster'][f'{sekunden // 60}m'] = self._fenster_bericht(buckets, sekunden, top)
+        bericht['gesamt'] = self._fenster_bericht([self.gesamt], 0, top)
+        bericht['signaturen'] = {
+            sig: {**e, 'erstes': datetime.fromtimestamp(e['erstes']).isoformat(timespec='seconds'),
+                  'letztes': datetime.fromtimestamp(e['letztes']).isoformat(timespec='seconds')}
+            for sig, e in sorted(self.signaturen.items(), key=lambda item: -item[1]['anzahl'])
+        }
+        return bericht
+
+
+# ============================================================================
+# EINGABE
+# ============================================================================
+
+def follow(path: str, from_start: bool = False, poll: float = 0.5,
+           stop: Callable[[], bool] | None = None) -> Iterator[str | None]:
+    """
+    Liest eine Datei fortlaufend (wie tail -F) per seek.
+
+    Erkennt Rotation (neue Inode) und Abschneiden (Datei kuerzer als die
+    Leseposition). Liefert None, wenn gerade nichts Neues da ist, damit der
+    Aufrufer periodisch berichten kann.
+
+    Args:
+        path: Log-Datei
+        from_start: Ab Dateianfang statt ab dem Ende lesen
+        poll: Wartezeit ohne neue Daten (Sekunden)
+        stop: Optional - beendet das Lesen, sobald True
+
+    Yields:
+        str | None: Vollstaendige Zeile oder None
+    """
+    f: TextIO | None = None
+    rest = ''
+    while not (stop and stop()):
+        if f is None:
+            try:
+                f = open(path, encoding='utf-8', errors='replace')
+            except FileNotFoundError:
+                time.sleep(poll)
+                yield None
+                continue
+            if not from_start:
+                f.seek(0, os.SEEK_END)
+            from_start = True  # nach Rotation die neue Datei immer komplett lesen
+
+        chunk = f.read(65536)
+        if chunk:
+            rest += chunk
+            *zeilen, rest = rest.split('\n')
+            for zeile in zeilen:
+                yield zeile
+            continue
+
+        try:
+            stat = os.stat(path)
+            if stat.st_ino != os.fstat(f.fileno()).st_ino or stat.st_size < f.tell():
+                f.close()
+                f, rest = None, ''
+                continue
+        except FileNotFoundError:
+            pass
+        time.sleep(poll)
+        yield None
+    if f is not None:
+        f.close()
+
+
+def _push_fehler(sig: str, event: Event) -> None:
+    """Uebernimmt eine neue Signatur in die Fehler-Datenbank."""
+    from app.services.database import save_or_merge_fehler
+    from app.utils.fehler_helper import analyze_fehler
+
+    text = event.traceback or f"{event.exc_typ}: {event.exc_msg}"
+    analyse = analyze_fehler(text)
+    result = save_or_merge_fehler(
+        muster=sig,
+        kategorie=analyse['kategorie'],
+        loesung='Automatisch aus dem Server-Log erfasst - Loesung noch offen.',
+        stack_trace=event.traceback,
+        severity=analyse['severity'],
+        tags=analyse['tags'] + ['server-log'],
+        fix_command=analyse['fix_command'],
+    )
+    print(f"  -> Fehler-DB: {result.get('action')} (ID {result.get('fehler_id')})")
+
+
+def print_report(bericht: dict[str, Any], top: int) -> None:
+    """Gibt den Bericht als Tabelle aus."""
+    print(f"\n=== Stand {bericht['jetzt'] or '-'} ===")
+    for name, f in list(bericht['fenster'].items()) + [('gesamt', bericht['gesamt'])]:
+        status = ' '.join(f'{k}={v}' for k, v in f['status'].items()) or '-'
+        rps = f" ({f['rps']:.2f} req/s)" if f['rps'] is not None else ''
+        print(f"[{name:>6}] {f['requests']} Requests{rps}  {status}  "
+              f"Exceptions: {sum(e['anzahl'] for e in f['exceptions'])}")
+
+    gesamt = bericht['gesamt']
+    routen = [r for r in gesamt['routen'] if r['avg_ms'] is not None]
+    if routen:
+        print(f"\n{'Route':<48} {'Requests':>9} {'langsam':>8} {'avg ms':>9} {'max ms':>9}")
+        for r in routen[:top]:
+            print(f"{r['route'][:48]:<48} {r['requests']:>9} {r['langsam']:>8} {r['avg_ms']:>9.1f} {r['max_ms']:>9.1f}")
+    if gesamt['exceptions']:
+        print(f"\n{'Anzahl':>7}  Exception-Signatur")
+        for e in gesamt['exceptions']:
+            print(f"{e['anzahl']:>7}  {e['signatur'][:110]}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Lokale Log-Auswertung (Requests, Status, langsame Routen, Exceptions)')
+    parser.add_argument('dateien', nargs='+', help="Log-Dateien ('-' = stdin)")
+    parser.add_argument('--follow', '-f', action='store_true', help='Fortlaufend lesen (eine Datei oder stdin)')
+    parser.add_argument('--from-start', action='store_true', help='Mit --follow: ab Dateianfang lesen')
+    parser.add_argument('--intervall', type=float, default=60, help='Mit --follow: Bericht alle N Sekunden')
+    parser.add_argument('--langsam-ms', type=float, default=DEFAULT_LANGSAM_MS, help='Schwelle langsamer Request')
+    parser.add_argument('--top', type=int, default=10, help='Eintraege pro Liste')
+    parser.add_argument('--json', help='Abschlussbericht als JSON speichern')
+    parser.add_argument('--fehler-db', help='Neue Exception-Signaturen in diese Fehler-Datenbank uebernehmen')
+    args = parser.parse_args()
+
+    if args.follow and len(args.dateien) != 1:
+        parser.error('--follow erwartet genau eine Datei')
+
+    if args.fehler_db:
+        import logging
+
+        from app.services import database
+        logging.basicConfig(level=logging.WARNING)
+        database.DB_PATH = args.fehler_db
+
+    def neue_signatur(sig: str, event: Event) -> None:
+        if args.follow:
+            print(f"NEU {datetime.fromtimestamp(event.ts):%H:%M:%S}  {sig[:120]}")
+        if args.fehler_db:
+            _push_fehler(sig, event)
+
+    aggregator = Aggregator(langsam_ms=args.langsam_ms, on_neue_signatur=neue_signatur)
+
+    try:
+        if args.follow:
+            pfad = args.dateien[0]
+            line_parser = LineParser()
+            if pfad == '-':
+                quelle: Iterable[str | None] = sys.stdin
+            else:
+                quelle = follow(pfad, from_start=args.from_start)
+            naechster = time.monotonic() + args.intervall
+            for zeile in quelle:
+                events = line_parser.feed(zeile) if zeile is not None else line_parser.flush()
+                for event in events:
+                    aggregator.add(event)
+                if time.monotonic() >= naechster:
+                    print_report(aggregator.report(args.top), args.top)
+                    naechster = time.monotonic() + args.intervall
+        else:
+            for pfad in args.dateien:
+                line_parser = LineParser()
+                with (open(pfad, encoding='utf-8', errors='replace') if pfad != '-' else sys.stdin) as f:
+                    for zeile in f:
+                        for event in line_parser.feed(zeile):
+                            aggregator.add(event)
+                for event in line_parser.flush():
+                    aggregator.add(event)
+    except KeyboardInterrupt:
+        pass
+
+    bericht = aggregator.report(args.top)
+    print_report(bericht, args.top)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(bericht, f, indent=2, ensure_ascii=False)
+        print(f"\nBericht gespeichert: {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+NEXUS OVERLORD - Lokaler OpenRouter-Ersatz fuer Last- und Regressionstests
+
+Beantwortet POST /api/v1/chat/completions wie OpenRouter (auch mit
+stream=true als Server-Sent Events) - ohne Netz und ohne Kosten. Die
+Antworten sind so geformt, wie die Generatoren sie erwarten:
+
+    phasen            -> {"phasen": [...]}
+    auftraege(_phase) -> {"auftraege": [...]} passend zu den Phasen im Prompt
+    qualitaet(_teil)  -> {"kategorien": [...], ...} fuer die angefragten Kategorien
+    fehler_analyse    -> {"kategorie", "ursache", "loesung", "muster", "fix_command"}
+    alles andere      -> Markdown-Text
+
+Die Aufrufstelle kommt aus dem Header X-Nexus-Call-Site (setzt
+OpenRouterClient), sonst wird sie am Prompt erkannt.
+
+Stoerungen:
+    --latenz fix:800 | uniform:200:1500 | lognormal:800:0.5   (Millisekunden)
+    --fehlerrate 0.05   Anteil HTTP 500
+    --rate-429 0.1      Anteil HTTP 429 (mit Retry-After)
+    --abbruchrate 0.02  Anteil Streams, die mittendrin abbrechen
+
+Verwendung:
+    python scripts/mock_openrouter.py --port 8099 --latenz lognormal:600:0.4
+    OPENROUTER_BASE_URL=http://127.0.0.1:8099/api/v1 OPENROUTER_API_KEY=mock python app/main.py
+
+    GET /stats liefert Anzahl Requests je Aufrufstelle und Status.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+# Zeichen pro Token fuer das usage-Feld (wie prompt_builder.CHARS_PER_TOKEN)
+CHARS_PER_TOKEN = 3.5
+
+# Fiktive Kosten pro 1000 Tokens (Eingabe, Ausgabe)
+KOSTEN_PRO_1K = (0.003, 0.015)
+
+_KATEGORIE_RE = re.compile(r'^- \*\*(\w+)\*\*:', re.MULTILINE)
+_PHASE_NUMMER_RE = re.compile(r'"phase_nummer":\s*(\d+)')
+_NUMMER_RE = re.compile(r'"nummer":\s*(\d+)')
+
+ALLE_KATEGORIEN = ['Vollstaendigkeit', 'Reihenfolge', 'Klarheit', 'Dateien',
+                   'Regelwerk', 'Luecken', 'Duplikate']
+
+
+# ============================================================================
+# KONFIGURATION
+# ============================================================================
+
+class MockConfig:
+    """
+    Verhalten des Mock-Servers.
+
+    Attributes:
+        latenz: Latenz-Verteilung ('fix:MS', 'uniform:MIN:MAX', 'lognormal:MEDIAN:SIGMA')
+        fehlerrate: Anteil Requests mit HTTP 500
+        rate_429: Anteil Requests mit HTTP 429
+        abbruchrate: Anteil Streams, die nach der Haelfte abbrechen
+        phasen: Anzahl Phasen in der Phasen-Antwort
+        auftraege_pro_phase: Auftraege je Phase
+        chunk_zeichen: Zeichen pro Stream-Delta
+        seed: Zufalls-Seed (reproduzierbare Laeufe)
+    """
+
+    def __init__(
+        self,
+        latenz: str = 'fix:0',
+        fehlerrate: float = 0.0,
+        rate_429: float = 0.0,
+        abbruchrate: float = 0.0,
+        phasen: int = 5,
+        auftraege_pro_phase: int = 3,
+        chunk_zeichen: int = 40,
+        seed: int | None = None
+    ):
+        self.latenz = latenz
+        self.fehlerrate = fehlerrate
+        self.rate_429 = rate_429
+        self.abbruchrate = abbruchrate
+        self.phasen = phasen
+        self.auftraege_pro_phase = auftraege_pro_phase
+        self.chunk_zeichen = max(1, chunk_zeichen)
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._parse_latenz(latenz)
+
+    def _parse_latenz(self, spec: str) -> None:
+        """Prueft die Latenz-Angabe (ValueError bei unbekanntem Format)."""
+        art, *werte = spec.split(':')
+        if art not in ('fix', 'uniform', 'lognormal') or not werte:
+            raise ValueError(f"Unbekannte Latenz-Verteilung: {spec}")
+        self._latenz_art = art
+        self._latenz_werte = [float(w) for w in werte]
+
+    def ziehe(self) -> float:
+        """Zufallszahl 0..1 (thread-sicher, reproduzierbar mit seed)."""
+        with self._lock:
+            return self.random.random()
+
+    def latenz_sekunden(self) -> float:
+        """
+        Zieht eine Latenz aus der konfigurierten Verteilung.
+
+        Returns:
+            float: Latenz in Sekunden
+        """
+        werte = self._latenz_werte
+        with self._lock:
+            if self._latenz_art == 'fix':
+                ms = werte[0]
+            elif self._latenz_art == 'uniform':
+                ms = self.random.uniform(werte[0], werte[1])
+            else:
+                sigma = werte[1] if len(werte) > 1 else 0.5
+                ms = werte[0] * self.random.lognormvariate(0, sigma)
+        return max(0.0, ms) / 1000
+
+
+# ============================================================================
+# ANTWORTEN
+# ============================================================================
+
+def detect_call_site(prompt: str) -> str:
+    """
+    Erkennt die Aufrufstelle am Prompt (falls der Header fehlt).
+
+    Args:
+        prompt: Text aller Nachrichten
+
+    Returns:
+        str: Aufrufstelle
+    """
+    if '"kategorien"' in prompt:
+        return 'qualitaet_teil' if '- **' in prompt else 'qualitaet'
+    if '"auftraege"' in prompt:
+        return 'auftraege_phase' if 'NUR fuer diese Phase' in prompt else 'auftraege'
+    if '"phasen"' in prompt:
+        return 'phasen'
+    if '"fix_command"' in prompt:
+        return 'fehler_analyse'
+    return 'text'
+
+
+def _phasen(anzahl: int) -> dict[str, Any]:
+    """Phasen-Antwort mit `anzahl` Phasen."""
+    return {
+        'projektname': 'Mock-Projekt',
+        'gesamt_phasen': anzahl,
+        'gesamt_dauer': f'{anzahl * 2} Wochen',
+        'phasen': [
+            {
+                'nummer': i,
+                'name': f'Phase {i}: Modul {i}',
+                'beschreibung': f'Baut Modul {i} inklusive Tests und Dokumentation auf.',
+                'abhaengigkeiten': [i - 1] if i > 1 else [],
+                'prioritaet': 'hoch' if i == 1 else 'mittel',
+                'geschaetzte_dauer': '2 Wochen',
+            }
+            for i in range(1, anzahl + 1)
+        ],
+        'hinweise': 'Mock-Antwort, keine echte Planung.',
+    }
+
+
+def _auftrag(phase: int, nr: int) -> dict[str, Any]:
+    """Ein Auftrag im Format des Auftraege-Generators."""
+    nummer = f'{phase}.{nr}'
+    return {
+        'phase_nummer': phase,
+        'auftrag_nummer': nummer,
+        'name': f'Modul {phase} Schritt {nr}',
+        'beschreibung': f'Setzt Schritt {nr} von Modul {phase} um.',
+        'schritte': [f'Datei modul_{phase}/schritt_{nr}.py anlegen', 'Logik implementieren',
+                     'Tests schreiben'],
+        'dateien': [f'modul_{phase}/schritt_{nr}.py', f'tests/test_modul_{phase}_{nr}.py'],
+        'technische_details': ['Python 3.11', 'Flask'],
+        'erfolgs_kriterien': ['Tests laufen gruen'],
+        'regelwerk': {
+            'commit_message': f'[{nummer}] Modul {phase} Schritt {nr}',
+            'hinweise': ['Bestehende Konventionen einhalten'],
+        },
+    }
+
+
+def _auftraege(phasen: list[int], pro_phase: int) -> dict[str, Any]:
+    """Auftrags-Antwort fuer die angegebenen Phasen."""
+    return {
+        'auftraege': [_auftrag(p, nr) for p in phasen for nr in range(1, pro_phase + 1)],
+        'gesamt_auftraege': len(phasen) * pro_phase,
+        'hinweise': 'Mock-Antwort',
+    }
+
+
+def _qualitaet(kategorien: list[str], mit_gesamt: bool) -> dict[str, Any]:
+    """Qualitaets-Antwort fuer die angefragten Kategorien."""
+    data: dict[str, Any] = {
+        'kategorien': [
+            {'name': name, 'bewertung': 8, 'status': 'gut', 'kommentar': f'{name} ist in Ordnung.'}
+            for name in kategorien
+        ],
+        'verbesserungen': [{'auftrag': '1.1', 'typ': 'empfehlung', 'text': 'Mehr Tests.'}],
+        'warnungen': [],
+    }
+    if mit_gesamt:
+        data.update(gesamt_bewertung=8, gesamt_kommentar='Solider Plan.', fazit='Freigabe moeglich.')
+    return data
+
+
+def build_response(call_site: str, prompt: str, config: MockConfig) -> str:
+    """
+    Erzeugt die Modell-Antwort fuer eine Aufrufstelle.
+
+    Args:
+        call_site: Aufrufstelle (Header oder detect_call_site)
+        prompt: Text aller Nachrichten
+        config: Mock-Konfiguration
+
+    Returns:
+        str: Antworttext (JSON oder Markdown)
+    """
+    if call_site == 'phasen':
+        data: Any = _phasen(config.phasen)
+    elif call_site == 'auftraege_phase':
+        match = _PHASE_NUMMER_RE.search(prompt)
+        data = _auftraege([int(match.group(1)) if match else 1], config.auftraege_pro_phase)
+    elif call_site == 'auftraege':
+        phasen = sorted({int(n) for n in _NUMMER_RE.findall(prompt)}) or [1]
+        data = _auftraege(phasen, config.auftraege_pro_phase)
+    elif call_site == 'qualitaet_teil':
+        kategorien = _KATEGORIE_RE.findall(prompt) or ALLE_KATEGORIEN
+        data = _qualitaet(kategorien, 'gesamt_kommentar' in prompt)
+    elif call_site == 'qualitaet':
+        data = _qualitaet(ALLE_KATEGORIEN, True)
+    elif call_site == 'fehler_analyse':
+        data = {'kategorie': 'python', 'ursache': 'Modul fehlt in der Umgebung.',
+                'loesung': '1. Abhaengigkeit installieren\n2. Erneut starten',
+                'muster': 'ModuleNotFoundError', 'fix_command': 'pip install -r requirements.txt'}
+    else:
+        return (f"## Mock-Antwort ({call_site})\n\n"
+                "Dies ist eine lokale Antwort ohne Modell.\n\n- Punkt 1\n- Punkt 2\n")
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def _prompt_text(messages: list[dict[str, Any]]) -> str:
+    """Text aller Nachrichten (auch Content-Bloecke)."""
+    teile = []
+    for message in messages:
+        content = message.get('content', '')
+        if isinstance(content, list):
+            teile.extend(block.get('text', '') for block in content)
+        else:
+            teile.append(str(content))
+    return '\n'.join(teile)
+
+
+def _usage(prompt: str, antwort: str) -> dict[str, Any]:
+    """usage-Block wie OpenRouter (geschaetzte Tokens, fiktive Kosten)."""
+    tokens_in = int(len(prompt) / CHARS_PER_TOKEN)
+    tokens_out = int(len(antwort) / CHARS_PER_TOKEN)
+    return {
+        'prompt_tokens': tokens_in,
+        'completion_tokens': tokens_out,
+        'total_tokens': tokens_in + tokens_out,
+        'prompt_tokens_details': {'cached_tokens': 0},
+        'cost': round(tokens_in / 1000 * KOSTEN_PRO_1K[0] + tokens_out / 1000 * KOSTEN_PRO_1K[1], 6),
+    }
+
+
+# ============================================================================
+# HTTP-SERVER
+# ============================================================================
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Request-Handler; Konfiguration und Zaehler haengen am Server."""
+
+    server: 'MockServer'
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None:
+        if self.path.rstrip('/') == '/stats':
+            self._send_json(200, self.server.stats())
+        else:
+            self._send_json(404, {'error': {'message': 'not found'}})
+
+    def do_POST(self) -> None:
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send_json(404, {'error': {'message': 'not found'}})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError:
+            self._send_json(400, {'error': {'message': 'invalid JSON'}})
+            return
+
+        config = self.server.config
+        prompt = _prompt_text(payload.get('messages') or [])
+        call_site = self.headers.get('X-Nexus-Call-Site') or detect_call_site(prompt)
+
+        time.sleep(config.latenz_sekunden())
+
+        zufall = config.ziehe()
+        if zufall < config.rate_429:
+            self.server.count(call_site, 429)
+            self._send_json(429, {'error': {'code': 429, 'message': 'Rate limit exceeded (mock)'}},
+                            {'Retry-After': '1'})
+            return
+        if zufall < config.rate_429 + config.fehlerrate:
+            self.server.count(call_site, 500)
+            self._send_json(500, {'error': {'code': 500, 'message': 'Internal error (mock)'}})
+            return
+
+        antwort = build_response(call_site, prompt, config)
+        usage = _usage(prompt, antwort)
+        model = payload.get('model', 'mock')
+
+        if payload.get('stream'):
+            abbrechen = config.ziehe() < config.abbruchrate
+            self.server.count(call_site, 'stream_abbruch' if abbrechen else 200)
+            self._send_stream(model, antwort, usage, abbrechen)
+        else:
+            self.server.count(call_site, 200)
+            self._send_json(200, {
+                'id': f'mock-{time.time_ns()}',
+                'object': 'chat.completion',
+                'model': model,
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': antwort},
+                             'finish_reason': 'stop'}],
+                'usage': usage,
+            })
+
+    def _send_json(self, status: int, data: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+        """Sendet eine JSON-Antwort."""
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, model: str, antwort: str, usage: dict[str, Any], abbrechen: bool) -> None:
+        """Sendet die Antwort als Server-Sent Events in Stuecken."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        def event(data: Any) -> None:
+            self.wfile.write(b'data: ' + json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n\n')
+            self.wfile.flush()
+
+        self.wfile.write(b': OPENROUTER PROCESSING\n\n')
+        size = self.server.config.chunk_zeichen
+        ende = len(antwort) // 2 if abbrechen else len(antwort)
+        for start in range(0, ende, size):
+            event({'model': model, 'choices': [{'index': 0, 'delta': {'content': antwort[start:start + size]}}]})
+
+        if abbrechen:
+            event({'error': {'code': 502, 'message': 'Upstream stream aborted (mock)'}})
+            return
+
+        event({'model': model, 'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}],
+               'usage': usage})
+        self.wfile.write(b'data: [DONE]\n\n')
+        self.wfile.flush()
+
+
+class MockServer(ThreadingHTTPServer):
+    """
+    HTTP-Server mit Konfiguration und Request-Zaehlern.
+
+    Attributes:
+        config: MockConfig
+        verbose: Requests loggen
+    """
+
+    daemon_threads = True
+
+    # Viele gleichzeitige Verbindungen (async Client) nicht schon beim Accept abweisen
+    request_queue_size = 256
+
+    def __init__(self, address: tuple[str, int], config: MockConfig, verbose: bool = False):
+        super().__init__(address, MockHandler)
+        self.config = config
+        self.verbose = verbose
+        self._counts: Counter[tuple[str, str]] = Counter()
+        self._counts_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        """Basis-URL fuer OPENROUTER_BASE_URL."""
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/api/v1'
+
+    def count(self, call_site: str, status: int | str) -> None:
+        """Zaehlt einen Request je Aufrufstelle und Status."""
+        with self._counts_lock:
+            self._counts[(call_site, str(status))] += 1
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Requests je Aufrufstelle und Status.
+
+        Returns:
+            dict: {call_site: {status: anzahl}}
+        """
+        result: dict[str, dict[str, int]] = {}
+        with self._counts_lock:
+            for (call_site, status), anzahl in sorted(self._counts.items()):
+                result.setdefault(call_site, {})[status] = anzahl
+        return result
+
+
+def start_mock_server(
+    config: MockConfig | None = None,
+    host: str = '127.0.0.1',
+    port: int = 0
+) -> MockServer:
+    """
+    Startet den Mock-Server in einem Hintergrund-Thread (fuer Tests und Lasttests).
+
+    Args:
+        config: Mock-Konfiguration (Standard: ohne Latenz und Fehler)
+        host: Bind-Adresse
+        port: Port (0 = freier Port)
+
+    Returns:
+        MockServer: Laufender Server (stoppen mit shutdown() + server_close())
+    """
+    server = MockServer((host, port), config or MockConfig())
+    threading.Thread(target=server.serve_forever, name='mock-openrouter', daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Lokaler OpenRouter-Ersatz')
+    parser.add_argument('--host', default=os.getenv('MOCK_OPENROUTER_HOST', '127.0.0.1'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('MOCK_OPENROUTER_PORT', '8099')))
+    parser.add_argument('--latenz', default='fix:0',
+                        help="fix:MS | uniform:MIN:MAX | lognormal:MEDIAN:SIGMA (Millisekunden)")
+    parser.add_argument('--fehlerrate', type=float, default=0.0, help='Anteil HTTP 500')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Anteil HTTP 429')
+    parser.add_argument('--abbruchrate', type=float, default=0.0, help='Anteil abgebrochener Streams')
+    parser.add_argument('--phasen', type=int, default=5, help='Phasen in der Phasen-Antwort')
+    parser.add_argument('--auftraege', type=int, default=3, help='Auftraege pro Phase')
+    parser.add_argument('--chunk', type=int, default=40, help='Zeichen pro Stream-Delta')
+    parser.add_argument('--seed', type=int, help='Zufalls-Seed')
+    parser.add_argument('--verbose', action='store_true', help='Requests loggen')
+    args = parser.parse_args()
+
+    try:
+        config = MockConfig(
+            latenz=args.latenz,
+            fehlerrate=args.fehlerrate,
+            rate_429=args.rate_429,
+            abbruchrate=args.abbruchrate,
+            phasen=args.phasen,
+            auftraege_pro_phase=args.auftraege,
+            chunk_zeichen=args.chunk,
+            seed=args.seed
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = MockServer((args.host, args.port), config, verbose=args.verbose)
+    print(f"Mock-OpenRouter laeuft auf {server.base_url}")
+    print(f"  Latenz: {args.latenz}, Fehler: {args.fehlerrate:.0%}, 429: {args.rate_429:.0%}, "
+          f"Stream-Abbruch: {args.abbruchrate:.0%}")
+    print(f"  OPENROUTER_BASE_URL={server.base_url} OPENROUTER_API_KEY=mock")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
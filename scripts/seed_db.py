@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+NEXUS OVERLORD - Deterministische Testdaten fuer Last- und Micro-Benchmarks
+
+Legt eine SQLite-Datenbank mit dem aktuellen Schema an (SCHEMA nutzt auch
+tests/conftest.py) und fuellt sie mit Projekten, Phasen, Auftraegen,
+Chat-Nachrichten und Fehlern. Gleicher Seed = gleiche Daten, damit
+Messungen zwischen zwei Laeufen vergleichbar bleiben.
+
+Verwendung:
+    python scripts/seed_db.py /tmp/nexus_last.db --projekte 50 --fehler 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+from typing import Any
+
+# Aktuelles Schema (schema.sql + Migrationen + Spalten aus database.py)
+SCHEMA = """
+CREATE TABLE projekte (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    original_plan TEXT,
+    enterprise_plan TEXT,
+    bewertung TEXT,
+    status TEXT DEFAULT 'erstellt',
+    qualitaet_bewertung REAL,
+    qualitaet_details TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE phasen (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    projekt_id INTEGER NOT NULL,
+    nummer INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    beschreibung TEXT,
+    abhaengigkeiten TEXT,
+    prioritaet TEXT,
+    geschaetzte_dauer TEXT,
+    status TEXT DEFAULT 'offen',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE auftraege (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    phase_id INTEGER NOT NULL,
+    nummer TEXT NOT NULL,
+    name TEXT NOT NULL,
+    beschreibung TEXT,
+    schritte TEXT,
+    dateien TEXT,
+    technische_details TEXT,
+    erfolgs_kriterien TEXT,
+    regelwerk TEXT,
+    status TEXT DEFAULT 'offen',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME
+);
+CREATE TABLE fehler (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    muster TEXT NOT NULL,
+    kategorie TEXT,
+    loesung TEXT NOT NULL,
+    erfolgsrate REAL DEFAULT 0,
+    anzahl INTEGER DEFAULT 1,
+    projekt_id INTEGER,
+    severity TEXT DEFAULT 'medium',
+    status TEXT DEFAULT 'aktiv',
+    tags TEXT DEFAULT '[]',
+    stack_trace TEXT,
+    fix_command TEXT,
+    similar_count INTEGER DEFAULT 0,
+    last_seen TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT
+);
+CREATE TABLE uebergaben (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    projekt_id INTEGER,
+    auftrag_id INTEGER,
+    datei_pfad TEXT NOT NULL,
+    datei_name TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE chat_messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    projekt_id INTEGER,
+    auftrag_id INTEGER,
+    typ TEXT NOT NULL,
+    inhalt TEXT NOT NULL,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX idx_phasen_projekt ON phasen(projekt_id);
+CREATE INDEX idx_auftraege_phase ON auftraege(phase_id);
+CREATE INDEX idx_fehler_kategorie ON fehler(kategorie);
+CREATE INDEX idx_chat_projekt ON chat_messages(projekt_id);
+"""
+
+# Fehler-Vorlagen: (Kategorie, Muster, Loesung, Fix-Command, Tags)
+FEHLER_VORLAGEN = [
+    ('python', "ModuleNotFoundError: No module named '{name}'",
+     '1. Abhaengigkeit installieren\n2. Virtuelle Umgebung pruefen', 'pip install {name}', ['python', 'import']),
+    ('python', "ImportError: cannot import name '{name}' from 'app.services'",
+     '1. Zirkulaeren Import aufloesen', None, ['python', 'import']),
+    ('python', "KeyError: '{name}'",
+     '1. Schluessel mit .get() lesen\n2. Eingabedaten pruefen', None, ['python']),
+    ('npm', "npm ERR! code ERESOLVE unable to resolve dependency tree ({name})",
+     '1. package-lock.json loeschen\n2. npm install --legacy-peer-deps', 'npm install --legacy-peer-deps', ['npm']),
+    ('permission', "EACCES: permission denied, open '/var/www/{name}'",
+     '1. Dateirechte pruefen\n2. Besitzer korrigieren', 'sudo chown -R $USER /var/www', ['permission']),
+    ('database', "sqlite3.OperationalError: no such table: {name}",
+     '1. Migration ausfuehren', 'python database/migrate.py', ['database', 'sqlite']),
+    ('database', "sqlite3.OperationalError: database is locked ({name})",
+     '1. WAL aktivieren\n2. Verbindungen schliessen', None, ['database', 'sqlite']),
+    ('network', "requests.exceptions.ConnectionError: HTTPSConnectionPool(host='{name}.example.com')",
+     '1. Netzwerk pruefen\n2. Proxy-Einstellungen pruefen', None, ['network']),
+    ('git', "fatal: refusing to merge unrelated histories ({name})",
+     '1. git pull --allow-unrelated-histories', 'git pull --allow-unrelated-histories', ['git']),
+    ('docker', "docker: Error response from daemon: Conflict. The container name \"/{name}\" is already in use",
+     '1. Alten Container entfernen', 'docker rm -f {name}', ['docker']),
+]
+
+NAMEN = ['flask', 'requests', 'markdown2', 'reportlab', 'rapidfuzz', 'pydantic', 'redis',
+         'celery', 'numpy', 'pandas', 'auth', 'users', 'orders', 'sessions', 'api', 'worker']
+
+SEVERITIES = ['low', 'medium', 'high', 'critical']
+CHAT_TYPEN = ['USER', 'AUFTRAG', 'FEHLER', 'ANALYSE', 'SYSTEM', 'RUECKMELDUNG']
+
+
+def create_schema(conn: sqlite3.Connection) -> None:
+    """
+    Legt alle Tabellen an.
+
+    Args:
+        conn: Verbindung zur (leeren) Datenbank
+    """
+    conn.executescript(SCHEMA)
+
+
+def fehler_text(rng: random.Random) -> tuple[str, str, str, str | None, list[str]]:
+    """
+    Zieht einen realistischen Fehler aus den Vorlagen.
+
+    Args:
+        rng: Zufallsgenerator
+
+    Returns:
+        tuple: (Kategorie, Muster, Loesung, Fix-Command, Tags)
+    """
+    kategorie, muster, loesung, fix, tags = rng.choice(FEHLER_VORLAGEN)
+    name = rng.choice(NAMEN)
+    return (kategorie, muster.format(name=name), loesung,
+            fix.format(name=name) if fix else None, tags)
+
+
+def seed_database(
+    path: str,
+    projekte: int = 20,
+    phasen: int = 5,
+    auftraege: int = 4,
+    chat: int = 30,
+    fehler: int = 200,
+    seed: int = 42
+) -> dict[str, int]:
+    """
+    Erzeugt eine Datenbank mit deterministischen Testdaten.
+
+    Args:
+        path: Pfad der SQLite-Datei (wird neu angelegt)
+        projekte: Anzahl Projekte
+        phasen: Phasen pro Projekt
+        auftraege: Auftraege pro Phase
+        chat: Chat-Nachrichten pro Projekt
+        fehler: Anzahl Eintraege in der Fehler-Datenbank
+        seed: Zufalls-Seed
+
+    Returns:
+        dict: Anzahl erzeugter Zeilen je Tabelle
+    """
+    rng = random.Random(seed)
+    if os.path.exists(path):
+        os.remove(path)
+
+    conn = sqlite3.connect(path)
+    create_schema(conn)
+    cursor = conn.cursor()
+    counts = {'projekte': 0, 'phasen': 0, 'auftraege': 0, 'chat_messages': 0, 'fehler': 0}
+
+    plan = '\n'.join(f'## Abschnitt {i}\nAnforderungen fuer Modul {i}: Login, API, Tests.' for i in range(20))
+
+    for p in range(1, projekte + 1):
+        cursor.execute(
+            """INSERT INTO projekte (name, original_plan, enterprise_plan, bewertung, status)
+               VALUES (?, ?, ?, ?, ?)""",
+            (f'Lastprojekt {p}', plan[:500], plan, 'Bewertung: 8/10', 'in_arbeit')
+        )
+        projekt_id = cursor.lastrowid
+        counts['projekte'] += 1
+
+        for ph in range(1, phasen + 1):
+            cursor.execute(
+                """INSERT INTO phasen (projekt_id, nummer, name, beschreibung, abhaengigkeiten,
+                       prioritaet, geschaetzte_dauer, status)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (projekt_id, ph, f'Phase {ph}: Modul {ph}', f'Baut Modul {ph} auf.',
+                 json.dumps([ph - 1] if ph > 1 else []), rng.choice(['hoch', 'mittel', 'niedrig']),
+                 '2 Wochen', 'fertig' if ph == 1 else 'offen')
+            )
+            phase_id = cursor.lastrowid
+            counts['phasen'] += 1
+
+            cursor.executemany(
+                """INSERT INTO auftraege (phase_id, nummer, name, beschreibung, schritte, dateien,
+                       technische_details, erfolgs_kriterien, regelwerk, status)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (phase_id, str(a), f'Auftrag {ph}.{a}', f'Setzt Schritt {a} von Modul {ph} um.',
+                     json.dumps(['Datei anlegen', 'Logik implementieren', 'Tests schreiben']),
+                     json.dumps([f'modul_{ph}/schritt_{a}.py']),
+                     json.dumps(['Python', 'Flask']), json.dumps(['Tests gruen']),
+                     json.dumps({'commit_message': f'[{ph}.{a}] Schritt {a}'}),
+                     'fertig' if ph == 1 else 'offen')
+                    for a in range(1, auftraege + 1)
+                ]
+            )
+            counts['auftraege'] += auftraege
+
+        cursor.executemany(
+            "INSERT INTO chat_messages (projekt_id, typ, inhalt) VALUES (?, ?, ?)",
+            [(projekt_id, rng.choice(CHAT_TYPEN), f'Nachricht {m} in Projekt {p}') for m in range(chat)]
+        )
+        counts['chat_messages'] += chat
+
+    rows = []
+    for _ in range(fehler):
+        kategorie, muster, loesung, fix, tags = fehler_text(rng)
+        rows.append((muster, kategorie, loesung, round(rng.uniform(20, 100), 1), rng.randint(1, 50),
+                     rng.randint(1, max(1, projekte)), rng.choice(SEVERITIES),
+                     json.dumps(tags), fix, rng.randint(0, 10)))
+    cursor.executemany(
+        """INSERT INTO fehler (muster, kategorie, loesung, erfolgsrate, anzahl, projekt_id,
+               severity, tags, fix_command, similar_count, last_seen, updated_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))""",
+        rows
+    )
+    counts['fehler'] = fehler
+
+    conn.commit()
+    conn.close()
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Deterministische Testdaten anlegen')
+    parser.add_argument('path', help='Ziel-Datenbank (wird ueberschrieben)')
+    parser.add_argument('--projekte', type=int, default=20)
+    parser.add_argument('--phasen', type=int, default=5, help='pro Projekt')
+    parser.add_argument('--auftraege', type=int, default=4, help='pro Phase')
+    parser.add_argument('--chat', type=int, default=30, help='Nachrichten pro Projekt')
+    parser.add_argument('--fehler', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    counts: dict[str, Any] = seed_database(
+        args.path, args.projekte, args.phasen, args.auftraege, args.chat, args.fehler, args.seed
+    )
+    print(f"{args.path}: " + ', '.join(f'{k}={v}' for k, v in counts.items()))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+NEXUS OVERLORD - Kaltstart-Profil der Flask-App
+
+Ablauf:
+    1. `python -X importtime -c "import app.main"` in einem frischen Prozess,
+       Top-N Module nach kumulierter und eigener Importzeit
+    2. Pruefung ob schwere Abhaengigkeiten (requests, pdfplumber, docx,
+       reportlab, markdown2, rapidfuzz) schon beim Start geladen werden
+    3. Zeit bis zum ersten Request: die App wird in einem Kindprozess auf
+       einem freien Port gestartet (geseedete Temp-DB), gemessen wird bis
+       /health antwortet und die Latenz der ersten Requests auf --pfade,
+       einmal ohne und einmal mit Warm-up (WARMUP=0/1)
+
+Hinweis: Ist PYTHONDONTWRITEBYTECODE gesetzt, wird jedes Modul bei jedem
+Start neu kompiliert. Fuer Deployments einmal `python -m compileall -q app`
+ausfuehren und die Variable nicht setzen.
+
+Verwendung:
+    python scripts/startup_profile.py
+    python scripts/startup_profile.py --top 30 --pfade /,/projekt/1/steuern,/projekt/1/phasen/ergebnis
+    python scripts/startup_profile.py --ziel-ms 1500 --json startup.json   # Exit 1 wenn langsamer
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+import requests
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from scripts.loadtest import _prepare_environment  # noqa: E402
+from scripts.seed_db import seed_database  # noqa: E402
+
+# Erste Requests nach dem Start (ohne LLM-Aufruf)
+DEFAULT_PFADE = '/,/projekt/1/steuern,/projekt/1/phasen/ergebnis,/projekt/1/auftraege/qualitaet'
+
+# Duerfen beim Import von app.main nicht geladen werden (siehe app/utils/warmup.py)
+SCHWERE_MODULE = ['requests', 'pdfplumber', 'docx', 'reportlab', 'markdown2', 'rapidfuzz']
+
+# Zeile aus -X importtime: "import time:       123 |       4567 |   paket.modul"
+IMPORTTIME_PATTERN = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)')
+
+# Kindprozess: App importieren, auf freiem Port binden, Port melden, bedienen
+_CHILD = '''
+import json, sys, time
+t0 = time.perf_counter()
+from app.main import app
+from app.services import database
+database.DB_PATH = sys.argv[1]
+import_ms = (time.perf_counter() - t0) * 1000
+from werkzeug.serving import make_server
+from app.utils.warmup import start_warmup
+server = make_server('127.0.0.1', 0, app, threaded=True)
+start_warmup(app)
+print(json.dumps({'port': server.server_port, 'import_ms': round(import_ms, 1)}), flush=True)
+server.serve_forever()
+'''
+
+
+# ============================================================================
+# IMPORTZEIT
+# ============================================================================
+
+def parse_importtime(stderr: str) -> list[dict[str, Any]]:
+    """
+    Parst die Ausgabe von `python -X importtime`.
+
+    Args:
+        stderr: stderr des Prozesses
+
+    Returns:
+        list: Eintraege mit modul, self_ms, cumulative_ms, tiefe (Importreihenfolge)
+    """
+    eintraege = []
+    for zeile in stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(zeile)
+        if match:
+            eigen, kumuliert, einzug, modul = match.groups()
+            eintraege.append({
+                'modul': modul,
+                'self_ms': int(eigen) / 1000,
+                'cumulative_ms': int(kumuliert) / 1000,
+                'tiefe': len(einzug) // 2,
+            })
+    return eintraege
+
+
+def profile_imports(env: dict[str, str]) -> list[dict[str, Any]]:
+    """Importiert app.main in einem frischen Interpreter mit -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app.main'],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import app.main fehlgeschlagen:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def bytecode_hinweise(env: dict[str, str]) -> list[str]:
+    """Findet Module von app/, deren Bytecode fehlt oder aelter als die Quelle ist."""
+    hinweise = []
+    if env.get('PYTHONDONTWRITEBYTECODE'):
+        hinweise.append('PYTHONDONTWRITEBYTECODE ist gesetzt - Bytecode wird bei jedem Start neu kompiliert')
+
+    import importlib.util
+    veraltet = []
+    for root, _dirs, files in os.walk(os.path.join(PROJECT_ROOT, 'app')):
+        for name in files:
+            if not name.endswith('.py'):
+                continue
+            quelle = os.path.join(root, name)
+            pyc = importlib.util.cache_from_source(quelle)
+            if not os.path.exists(pyc) or os.path.getmtime(pyc) < os.path.getmtime(quelle):
+                veraltet.append(os.path.relpath(quelle, PROJECT_ROOT))
+    if veraltet:
+        hinweise.append(f"{len(veraltet)} Module ohne aktuellen Bytecode (z.B. {', '.join(sorted(veraltet)[:3])})")
+    if hinweise:
+        hinweise.append('Empfehlung: beim Deployment `python -m compileall -q app` ausfuehren')
+    return hinweise
+
+
+# ============================================================================
+# ZEIT BIS ZUM ERSTEN REQUEST
+# ============================================================================
+
+def first_requests(env: dict[str, str], db_path: str, pfade: list[str], pause: float) -> dict[str, Any]:
+    """
+    Startet die App im Kindprozess und misst die ersten Requests.
+
+    Args:
+        env: Umgebung des Kindprozesses (inkl. WARMUP)
+        db_path: Geseedete Datenbank
+        pfade: Nach /health abgefragte Pfade (je einmal, der Reihe nach)
+        pause: Wartezeit zwischen /health und den Pfaden (Sekunden)
+
+    Returns:
+        dict: bind_ms, import_ms, health_ms, pfade (Pfad -> {status, ms})
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, '-c', _CHILD, db_path], cwd=PROJECT_ROOT, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        zeile = proc.stdout.readline()
+        if not zeile:
+            raise RuntimeError('App-Prozess ohne Port beendet')
+        info = json.loads(zeile)
+        bind_ms = (time.perf_counter() - start) * 1000
+        base = f"http://127.0.0.1:{info['port']}"
+
+        with requests.Session() as session:
+            session.get(f'{base}/health', timeout=30).raise_for_status()
+            health_ms = (time.perf_counter() - start) * 1000
+            time.sleep(pause)
+
+            ergebnisse = {}
+            for pfad in pfade:
+                t0 = time.perf_counter()
+                antwort = session.get(base + pfad, timeout=60)
+                ergebnisse[pfad] = {'status': antwort.status_code,
+                                    'ms': round((time.perf_counter() - t0) * 1000, 1)}
+            warmup = session.get(f'{base}/health', timeout=30).json().get('warmup')
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    return {
+        'import_ms': info['import_ms'],
+        'bind_ms': round(bind_ms, 1),
+        'health_ms': round(health_ms, 1),
+        'pfade': ergebnisse,
+        'erster_request_ms': round(max((r['ms'] for r in ergebnisse.values()), default=0.0), 1),
+        'warmup': warmup,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Kaltstart-Profil: Importzeiten und Zeit bis zum ersten Request')
+    parser.add_argument('--top', type=int, default=20, help='Anzahl Module je Rangliste')
+    parser.add_argument('--pfade', default=DEFAULT_PFADE, help='Kommagetrennte Pfade fuer die ersten Requests')
+    parser.add_argument('--pause', type=float, default=2.0,
+                        help='Wartezeit nach /health vor den ersten Requests (Sekunden)')
+    parser.add_argument('--ziel-ms', type=float, help='Exit 1 wenn die App langsamer bindet')
+    parser.add_argument('--json', help='Bericht als JSON speichern')
+    args = parser.parse_args()
+
+    pfade = [p.strip() for p in args.pfade.split(',') if p.strip()]
+
+    with tempfile.TemporaryDirectory(prefix='nexus_start_') as tmp:
+        db_path = os.path.join(tmp, 'nexus.db')
+        seed_database(db_path, projekte=3, phasen=5, auftraege=4, chat=10, fehler=50)
+        _prepare_environment(tmp, 'http://127.0.0.1:9')
+        env = {**os.environ, 'LOG_LEVEL': 'WARNING', 'LOG_FILE': ''}
+
+        module = profile_imports(env)
+        hinweise = bytecode_hinweise(env)
+        laeufe = {
+            'ohne_warmup': first_requests({**env, 'WARMUP': '0'}, db_path, pfade, args.pause),
+            'mit_warmup': first_requests({**env, 'WARMUP': '1', 'WARMUP_DELAY': '0'}, db_path, pfade, args.pause),
+        }
+
+    app_main = next((m for m in module if m['modul'] == 'app.main'), None)
+    geladen = {m['modul'] for m in module}
+    schwer = [m for m in SCHWERE_MODULE if m in geladen]
+
+    print(f"import app.main: {app_main['cumulative_ms']:.0f}ms" if app_main else 'import app.main: ?')
+    for titel, schluessel in (('kumuliert', 'cumulative_ms'), ('eigen', 'self_ms')):
+        print(f"\nTop {args.top} ({titel}):")
+        for m in sorted(module, key=lambda m: m[schluessel], reverse=True)[:args.top]:
+            print(f"  {m[schluessel]:>8.1f}ms  {m['modul']}")
+
+    print(f"\nSchwere Module beim Start: {', '.join(schwer) if schwer else 'keine'}")
+    for hinweis in hinweise:
+        print(f"Hinweis: {hinweis}")
+
+    print(f"\n{'Lauf':<13} {'Import':>8} {'Bind':>8} {'Health':>8}  " + '  '.join(pfade))
+    print('-' * 72)
+    for name, lauf in laeufe.items():
+        werte = '  '.join(f"{lauf['pfade'][p]['ms']:.0f}ms/{lauf['pfade'][p]['status']}" for p in pfade)
+        print(f"{name:<13} {lauf['import_ms']:>6.0f}ms {lauf['bind_ms']:>6.0f}ms {lauf['health_ms']:>6.0f}ms  {werte}")
+
+    result = {
+        'import_ms': app_main['cumulative_ms'] if app_main else None,
+        'top_kumuliert': sorted(module, key=lambda m: m['cumulative_ms'], reverse=True)[:args.top],
+        'top_eigen': sorted(module, key=lambda m: m['self_ms'], reverse=True)[:args.top],
+        'schwere_module': schwer,
+        'hinweise': hinweise,
+        'laeufe': laeufe,
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"Gespeichert: {args.json}")
+
+    if args.ziel_ms is not None:
+        bind_ms = laeufe['ohne_warmup']['bind_ms']
+        if bind_ms > args.ziel_ms:
+            print(f"\nZIEL VERFEHLT: Bind nach {bind_ms:.0f}ms (Ziel {args.ziel_ms:.0f}ms)")
+            return 1
+        print(f"\nZiel erreicht: Bind nach {bind_ms:.0f}ms (Ziel {args.ziel_ms:.0f}ms)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
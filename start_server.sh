@@ -1,7 +1,11 @@
 #!/bin/bash
 #
 # NEXUS OVERLORD v2.0 - Server Start Script
-# Starts Flask server with correct PYTHONPATH for multi-agent workflow
+# Starts Gunicorn (gthread workers, see gunicorn.conf.py) with correct PYTHONPATH
+#
+# Usage:
+#   ./start_server.sh          # Produktion (Gunicorn)
+#   ./start_server.sh --dev    # Flask-Entwicklungsserver (app/main.py)
 #
 
 cd /home/nexus/nexus-overlord
@@ -12,5 +16,13 @@ source venv/bin/activate
 # Set PYTHONPATH so background threads can import 'app' module
 export PYTHONPATH=/home/nexus/nexus-overlord:$PYTHONPATH
 
+if [ "$1" = "--dev" ]; then
+    exec python app/main.py
+fi
+
+# Bytecode einmal vorab erzeugen (schnellerer Worker-Start)
+unset PYTHONDONTWRITEBYTECODE
+python -m compileall -q app scripts > /dev/null
+
 # Start server
-python app/main.py
+exec gunicorn -c gunicorn.conf.py app.main:app
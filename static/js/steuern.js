@@ -644,58 +644,79 @@ document.addEventListener('DOMContentLoaded', function() {
         // Info-Nachricht anzeigen
         addChatMessage('system', 'PDF-Dokumentation wird generiert...');
 
-        // PDF herunterladen ueber versteckten Link
-        const downloadUrl = `/projekt/${projektId}/export-pdf`;
-
-        // Temporaeren Link erstellen und klicken
-        const link = document.createElement('a');
-        link.href = downloadUrl;
-        link.download = '';  // Filename kommt vom Server
-        link.style.display = 'none';
-        document.body.appendChild(link);
-
-        // Fetch um zu pruefen ob PDF erfolgreich generiert wird
-        fetch(downloadUrl)
+        const exportUrl = `/projekt/${projektId}/export-pdf`;
+
+        function resetButton() {
+            btnExport.disabled = false;
+            btnExport.innerHTML = '<span class="btn-icon">&#128196;</span><span class="btn-text">Export PDF</span>';
+        }
+
+        function showProgress(job) {
+            btnExport.innerHTML = `<span class="btn-icon">&#8987;</span><span class="btn-text">${job.progress}%</span>`;
+        }
+
+        // Job starten und Fortschritt pollen, bis das PDF im Cache liegt.
+        // Job-Status liegt nur im Speicher des Workers: kennt der Server den
+        // Job nicht (Neustart, aufgeraeumt, anderer Worker), nicht weiter
+        // pollen, sondern direkt download_url laden - der Download bedient
+        // sich aus dem gemeinsamen Cache oder rendert selbst.
+        function pollJob(startJob) {
+            return fetch(startJob.status_url)
+                .then(response => response.ok ? response.json() : null)
+                .then(job => {
+                    if (!job || !job.status) {
+                        return startJob;
+                    }
+                    if (job.status === 'error') {
+                        throw new Error(job.error || 'PDF-Generierung fehlgeschlagen');
+                    }
+                    showProgress(job);
+                    if (job.status === 'done') {
+                        return job;
+                    }
+                    return new Promise(resolve => setTimeout(resolve, 1000))
+                        .then(() => pollJob(startJob));
+                });
+        }
+
+        fetch(`${exportUrl}/jobs`, { method: 'POST' })
             .then(response => {
                 if (!response.ok) {
                     throw new Error('PDF-Generierung fehlgeschlagen');
                 }
+                return response.json();
+            })
+            .then(job => job.status === 'done' ? job : pollJob(job))
+            .then(job => fetch(job.download_url))
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error('PDF-Download fehlgeschlagen');
+                }
                 return response.blob();
             })
             .then(blob => {
                 // Blob-URL erstellen und herunterladen
                 const blobUrl = URL.createObjectURL(blob);
+                const link = document.createElement('a');
                 link.href = blobUrl;
 
-                // Dateiname aus Header holen oder Standard verwenden
                 const datum = new Date().toISOString().split('T')[0];
                 link.download = `NEXUS_Dokumentation_${datum}.pdf`;
-
+                link.style.display = 'none';
+                document.body.appendChild(link);
                 link.click();
 
                 // Aufraumen
                 URL.revokeObjectURL(blobUrl);
                 document.body.removeChild(link);
 
-                // Erfolgs-Nachricht
                 addChatMessage('system', 'PDF-Dokumentation erfolgreich heruntergeladen!');
-
-                // Button wieder aktivieren
-                btnExport.disabled = false;
-                btnExport.innerHTML = '<span class="btn-icon">&#128196;</span><span class="btn-text">Export PDF</span>';
+                resetButton();
             })
             .catch(error => {
                 console.error('PDF-Export-Fehler:', error);
                 addChatMessage('system', 'Fehler beim PDF-Export: ' + error.message);
-
-                // Button wieder aktivieren
-                btnExport.disabled = false;
-                btnExport.innerHTML = '<span class="btn-icon">&#128196;</span><span class="btn-text">Export PDF</span>';
-
-                // Link entfernen
-                if (document.body.contains(link)) {
-                    document.body.removeChild(link);
-                }
+                resetButton();
             });
     }
 
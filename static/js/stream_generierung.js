@@ -0,0 +1,60 @@
+/**
+ * NEXUS OVERLORD v2.0 - Gestreamte Generierung (Phasen / Auftraege)
+ *
+ * Liest die NDJSON-Antwort von /phasen/stream bzw. /auftraege/stream
+ * und meldet jedes fertige Element sofort, statt auf die komplette
+ * KI-Antwort zu warten.
+ */
+
+/**
+ * Startet eine gestreamte Generierung.
+ *
+ * @param {string} url - Stream-Endpoint (POST)
+ * @param {function(Object)} onItem - Wird fuer jede fertige Phase / jeden Auftrag aufgerufen
+ * @returns {Promise<Object>} Abschluss-Zeile ({typ: 'fertig', anzahl, redirect})
+ */
+async function streamGenerierung(url, onItem) {
+    const response = await fetch(url, { method: 'POST' });
+    if (!response.ok || !response.body) {
+        let meldung = `HTTP ${response.status}`;
+        try {
+            meldung = (await response.json()).error || meldung;
+        } catch (e) { /* keine JSON-Fehlermeldung */ }
+        throw new Error(meldung);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let puffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        puffer += decoder.decode(value, { stream: true });
+
+        let zeilenende;
+        while ((zeilenende = puffer.indexOf('\n')) >= 0) {
+            const zeile = puffer.slice(0, zeilenende).trim();
+            puffer = puffer.slice(zeilenende + 1);
+            if (!zeile) continue;
+
+            const event = JSON.parse(zeile);
+            if (event.typ === 'fertig') return event;
+            if (event.typ === 'fehler') throw new Error(event.meldung);
+            onItem(event.daten);
+        }
+    }
+    throw new Error('Verbindung vorzeitig beendet');
+}
+
+/**
+ * Haengt eine Zeile an die Live-Liste im Loading-Overlay an.
+ *
+ * @param {HTMLElement} liste - <ul> im Overlay
+ * @param {string} text - Anzuzeigender Text
+ */
+function streamListeAnhaengen(liste, text) {
+    const eintrag = document.createElement('li');
+    eintrag.textContent = text;
+    liste.appendChild(eintrag);
+}
@@ -0,0 +1,29 @@
+"""
+NEXUS OVERLORD v2.0 - Test-Fixtures
+
+Stellt eine temporaere SQLite-Datenbank mit dem aktuellen Schema bereit.
+"""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.seed_db import SCHEMA as TEST_SCHEMA  # noqa: E402
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Leere Datenbank mit aktuellem Schema, database.DB_PATH zeigt darauf."""
+    from app.services import database
+
+    db_path = str(tmp_path / 'nexus_test.db')
+    conn = sqlite3.connect(db_path)
+    conn.executescript(TEST_SCHEMA)
+    conn.close()
+
+    monkeypatch.setattr(database, 'DB_PATH', db_path)
+    return db_path
@@ -0,0 +1,73 @@
+"""
+NEXUS OVERLORD v2.0 - Tests async LLM-Client und async Views gegen den OpenRouter-Mock
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services import llm_ledger, openrouter
+from app.services.auftraege_generator import generate_auftraege_async
+from app.services.phasen_generator import generate_phasen_async
+from app.services.qualitaetspruefung import pruefen_auftraege_async
+from app.utils.async_loop import run_sync
+from scripts.mock_openrouter import MockConfig, start_mock_server
+
+
+@pytest.fixture
+def mock_async(monkeypatch):
+    """AsyncOpenRouterClient gegen einen Mock-Server auf freiem Port, Ledger aus."""
+    server = start_mock_server(MockConfig(phasen=3, auftraege_pro_phase=2))
+    monkeypatch.setattr(openrouter, '_async_client',
+                        openrouter.AsyncOpenRouterClient(api_key='mock', base_url=server.base_url))
+    monkeypatch.setattr(llm_ledger, '_ledger', llm_ledger.LlmLedger(enabled=False))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_pipeline_and_concurrent_calls_without_threads(mock_async):
+    async def pipeline():
+        phasen = await generate_phasen_async('Plan')
+        auftraege = await generate_auftraege_async(phasen, 'Plan', fanout=True)
+        return auftraege, await pruefen_auftraege_async(auftraege, phasen, 'Plan', chunked=True)
+
+    auftraege, qualitaet = run_sync(pipeline())
+    assert [a['auftrag_nummer'] for a in auftraege['auftraege']] == ['1.1', '1.2', '2.1', '2.2', '3.1', '3.2']
+    assert qualitaet['gesamt_bewertung'] == 8
+
+    # 40 gleichzeitige Calls mit je 200ms: parallel auf der Loop, ohne Thread pro Call
+    mock_async.config._parse_latenz('fix:200')
+    client = openrouter.get_async_client()
+
+    def app_threads() -> int:
+        # Handler-Threads des Mock-Servers nicht mitzaehlen
+        return sum(1 for t in threading.enumerate() if 'process_request' not in t.name)
+
+    threads_vorher = app_threads()
+
+    async def viele():
+        return await asyncio.gather(*(client.call('m', [{'role': 'user', 'content': f'x{i}'}])
+                                      for i in range(40)))
+
+    start = time.perf_counter()
+    antworten = run_sync(viele())
+    assert len(antworten) == 40
+    assert time.perf_counter() - start < 2.0
+    assert mock_async.stats()['text'] == {'200': 40}
+    assert app_threads() <= threads_vorher + 2  # Loop + Ledger-Executor, nicht 40
+
+
+def test_fehler_view_is_async_and_keeps_request_context(mock_async, temp_db):
+    from app.main import app
+    from app.services.database import get_chat_messages, save_projekt
+
+    projekt_id = save_projekt('Demo', 'Plan', 'Enterprise', '8/10')
+    antwort = app.test_client().post(f'/projekt/{projekt_id}/fehler',
+                                      data={'fehler_text': 'ZeroDivisionError: division by zero in rechner.py'})
+
+    assert antwort.status_code == 200
+    assert mock_async.stats()['fehler_analyse'] == {'200': 1}
+    assert 'Fehler analysiert' in get_chat_messages(projekt_id)[-1]['inhalt']
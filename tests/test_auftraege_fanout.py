@@ -0,0 +1,88 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Fan-out der Auftrags-Generierung pro Phase
+"""
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from app.services import auftraege_generator
+
+PHASEN = {"phasen": [
+    {"nummer": n, "name": f"Phase {n}", "beschreibung": "...", "abhaengigkeiten": [], "prioritaet": "hoch"}
+    for n in range(1, 5)
+], "gesamt_dauer": "10 Stunden"}
+
+
+class FakeClient:
+    """Antwortet pro Phase mit zwei Auftraegen; Phasen in `fail` scheitern einmal."""
+
+    def __init__(self, delay=0.0, fail=(), fail_always=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.fail_always = set(fail_always)
+        self.calls = Counter()
+        self.lock = threading.Lock()
+
+    def call_sonnet(self, messages, **kwargs):
+        kontext, aufgabe = (block['text'] for block in messages[0]['content'])
+        assert 'ENTERPRISE-PLAN' in kontext
+        nummer = int(re.search(r'"nummer":(\d+)', aufgabe).group(1))
+        with self.lock:
+            self.calls[nummer] += 1
+            erster_versuch = self.calls[nummer] == 1
+        time.sleep(self.delay)
+
+        if nummer in self.fail_always or (nummer in self.fail and erster_versuch):
+            return 'Entschuldigung, das hat nicht geklappt.'
+        return json.dumps({"auftraege": [
+            {"phase_nummer": nummer, "auftrag_nummer": f"{nummer}.{a}", "name": f"A{a}",
+             "beschreibung": "..."}
+            for a in (1, 2)
+        ], "hinweise": f"H{nummer}"})
+
+
+def _run(monkeypatch, client, **kwargs):
+    monkeypatch.setattr(auftraege_generator, 'get_client', lambda: client)
+    monkeypatch.setattr(auftraege_generator, 'AUFTRAEGE_FANOUT', True)
+    monkeypatch.setattr(auftraege_generator, 'AUFTRAEGE_FANOUT_WORKERS', 4)
+    return auftraege_generator.generate_auftraege(PHASEN, 'Plan', **kwargs)
+
+
+def test_fanout_runs_phases_concurrently(monkeypatch):
+    client = FakeClient(delay=0.2)
+    gemeldet = []
+
+    start = time.perf_counter()
+    data = _run(monkeypatch, client, on_auftrag=gemeldet.append)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+    assert [a['auftrag_nummer'] for a in data['auftraege']] == [
+        f"{p}.{a}" for p in range(1, 5) for a in (1, 2)
+    ]
+    assert data['gesamt_auftraege'] == 8
+    assert len(gemeldet) == 8
+    assert 'Phase 3: H3' in data['hinweise']
+
+
+def test_fanout_retries_only_failed_phases(monkeypatch):
+    client = FakeClient(fail={2, 4})
+
+    data = _run(monkeypatch, client)
+
+    assert client.calls == Counter({1: 1, 2: 2, 3: 1, 4: 2})
+    assert data['gesamt_auftraege'] == 8
+
+
+def test_fanout_gives_up_after_retries(monkeypatch):
+    client = FakeClient(fail_always={3})
+    monkeypatch.setattr(auftraege_generator, 'AUFTRAEGE_PHASE_RETRIES', 1)
+
+    with pytest.raises(ValueError, match='Phase 3'):
+        _run(monkeypatch, client)
+    assert client.calls[3] == 2
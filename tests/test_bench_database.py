@@ -0,0 +1,22 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Micro-Benchmark database.py (Query-Zaehlung)
+"""
+
+from app.services import database
+from scripts.bench_database import compare, run_scale
+
+
+def test_run_scale_counts_queries(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, 'DB_PATH', database.DB_PATH)
+    results = run_scale(200, 1, str(tmp_path), {'get_chat_messages', 'save_auftraege_20'})
+
+    by_name = {r['name']: r for r in results}
+    assert by_name['get_chat_messages']['queries'] == 1
+    assert by_name['save_auftraege_20']['queries'] == 20
+    assert all(r['connections'] == 1 for r in results)
+
+    mehr_queries = [dict(r, queries=r['queries'] + 1) for r in results]
+    assert compare(mehr_queries, results, toleranz=0.3) == [
+        'get_chat_messages @ 200: Queries 1 -> 2',
+        'save_auftraege_20 @ 200: Queries 20 -> 21',
+    ]
@@ -0,0 +1,81 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Blob Store fuer Uebergaben
+"""
+
+import io
+import os
+
+import pytest
+
+from app.services import blob_store, database
+
+
+@pytest.fixture
+def store(temp_db, tmp_path, monkeypatch):
+    s = blob_store.BlobStore(root=str(tmp_path / 'blobs'), cache_mb=1)
+    monkeypatch.setattr(blob_store, '_store', s)
+    return s
+
+
+@pytest.fixture
+def client(store):
+    from app.main import app
+
+    return app.test_client()
+
+
+def _upload(client, projekt_id, data, name='notiz.md'):
+    return client.post(
+        f'/projekt/{projekt_id}/uebergaben/upload',
+        data={'file': (io.BytesIO(data), name)},
+        content_type='multipart/form-data'
+    ).get_json()
+
+
+def test_dedup_and_refcounted_delete(store, client):
+    projekt_id = database.save_projekt('Blob', 'a', 'b', 'c')
+
+    erste = _upload(client, projekt_id, b'# Uebergabe\nFertig.')
+    zweite = _upload(client, projekt_id, b'# Uebergabe\nFertig.', name='kopie.md')
+
+    assert not erste['dedupliziert']
+    assert zweite['dedupliziert']
+    pfad = database.get_uebergabe(erste['uebergabe_id'])['datei_pfad']
+    assert pfad == database.get_uebergabe(zweite['uebergabe_id'])['datei_pfad']
+    assert os.path.dirname(pfad).endswith(os.path.join(os.path.basename(pfad)[:2], os.path.basename(pfad)[2:4]))
+
+    assert database.delete_uebergabe(erste['uebergabe_id'])
+    assert os.path.exists(pfad)
+    assert database.delete_uebergabe(zweite['uebergabe_id'])
+    assert not os.path.exists(pfad)
+
+
+def test_read_text_cache_and_mmap(store, monkeypatch):
+    from app.services.upload_spool import spool_upload
+
+    class Datei(io.BytesIO):
+        filename = 'gross.md'
+
+    monkeypatch.setattr(blob_store, 'MMAP_THRESHOLD', 16)
+    with spool_upload(Datei('ä'.encode('utf-8') * 20), 1024, spool_dir=store.tmp_dir) as upload:
+        gross, _ = store.put(upload)
+    assert store.read_text(gross) == 'ä' * 20
+    assert not store._cache
+
+    with spool_upload(Datei(b'klein'), 1024, spool_dir=store.tmp_dir) as upload:
+        klein, _ = store.put(upload)
+    assert store.read_text(klein) == 'klein'
+    assert store.digest_for_path(klein) in store._cache
+
+
+def test_range_download(store, client):
+    projekt_id = database.save_projekt('Blob', 'a', 'b', 'c')
+    result = _upload(client, projekt_id, b'0123456789')
+
+    response = client.get(
+        f"/projekt/{projekt_id}/uebergaben/{result['uebergabe_id']}/download",
+        headers={'Range': 'bytes=2-5'}
+    )
+
+    assert response.status_code == 206
+    assert response.data == b'2345'
@@ -0,0 +1,91 @@
+"""
+NEXUS OVERLORD v2.0 - Tests PDF-Extraktion (sequentiell und parallel)
+"""
+
+import io
+
+import pytest
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from app.services import document_extractor
+
+
+def _make_pdf(path, pages, leer=()):
+    c = canvas.Canvas(str(path), pagesize=A4)
+    for i in range(pages):
+        if i not in leer:
+            c.drawString(72, 750, f"Seite {i + 1} - Projektplan Abschnitt {i + 1}")
+            c.drawString(72, 730, "Anforderungen, Architektur und Tests")
+        c.showPage()
+    c.save()
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_pages_in_order(tmp_path, monkeypatch, workers):
+    monkeypatch.setattr(document_extractor, 'PDF_PARALLEL_MIN_PAGES', 10)
+    pdf_path = tmp_path / 'plan.pdf'
+    _make_pdf(pdf_path, 24, leer={5})
+
+    pages, complete = document_extractor.extract_pdf_pages(str(pdf_path), workers=workers)
+
+    assert complete
+    assert [index for index, _, _ in pages] == list(range(24))
+    assert 'Seite 1 ' in pages[0][1]
+    assert 'Seite 24 ' in pages[23][1]
+    assert pages[0][2] == 'text'
+    assert pages[5][2] == 'leer'
+
+
+def test_time_budget(tmp_path):
+    pdf_path = tmp_path / 'leer.pdf'
+    _make_pdf(pdf_path, 3, leer={0, 1, 2})
+
+    pages, complete = document_extractor.extract_pdf_pages(str(pdf_path), workers=1, time_budget=-1)
+
+    assert not complete
+    assert {method for _, _, method in pages} == {'timeout'}
+
+
+def test_extract_pdf_text_from_stream(tmp_path):
+    pdf_path = tmp_path / 'plan.pdf'
+    _make_pdf(pdf_path, 3)
+
+    text, error = document_extractor.extract_pdf_text(io.BytesIO(pdf_path.read_bytes()))
+
+    assert error is None
+    assert text.index('Seite 1 ') < text.index('Seite 3 ')
+
+
+def test_extraction_cache_hit(tmp_path, monkeypatch):
+    from app.services import extraction_cache
+
+    cache = extraction_cache.ExtractionCache(db_path=str(tmp_path / 'cache.db'), max_mb=1)
+    monkeypatch.setattr(extraction_cache, '_cache', cache)
+
+    calls = []
+
+    def fake_txt(file, encoding=None):
+        calls.append(1)
+        return file.read().decode('utf-8'), None
+
+    monkeypatch.setattr(document_extractor, 'extract_txt_text', fake_txt)
+
+    for _ in range(3):
+        text, error = document_extractor.extract_text_from_file(io.BytesIO(b'Plan A'), 'plan.txt')
+        assert (text, error) == ('Plan A', None)
+
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (2, 1, 1)
+
+
+def test_extraction_cache_lru_limit(tmp_path):
+    from app.services.extraction_cache import ExtractionCache
+
+    cache = ExtractionCache(db_path=str(tmp_path / 'cache.db'), max_mb=0.001)  # ~1 KB
+    cache.put('alt', 'a' * 600)
+    cache.put('neu', 'b' * 600)
+
+    assert cache.get('alt') is None
+    assert cache.get('neu') == 'b' * 600
@@ -0,0 +1,84 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Fehler-Statistik Engine
+"""
+
+import pytest
+
+from app.services import database, fehler_stats
+
+
+@pytest.fixture
+def engine(temp_db, monkeypatch):
+    """Frische Engine mit langem TTL, damit Cache-Verhalten pruefbar ist."""
+    eng = fehler_stats.FehlerStatsEngine(ttl=60, rebuild_interval=3600)
+    monkeypatch.setattr(fehler_stats, '_engine', eng)
+    return eng
+
+
+def _seed():
+    ids = []
+    for i in range(8):
+        ids.append(database.save_fehler(
+            muster=f"ModuleNotFoundError: No module named 'paket{i}'",
+            kategorie='python' if i % 2 else 'database',
+            loesung=f'pip install paket{i}',
+            severity='critical' if i == 0 else 'medium'
+        ))
+    return ids
+
+
+def _full_scan():
+    fresh = fehler_stats.FehlerStatsEngine(ttl=0)
+    stats = fresh.get_stats()
+    stats.pop('computed_at')
+    stats.pop('source')
+    return stats
+
+
+def _without_meta(stats):
+    return {k: v for k, v in stats.items() if k not in ('computed_at', 'source')}
+
+
+def test_cache_and_source(engine):
+    _seed()
+    erste = engine.get_stats()
+    zweite = engine.get_stats()
+
+    assert erste['source'] == 'live'
+    assert zweite['source'] == 'cache'
+    assert zweite['computed_at'] == erste['computed_at']
+    assert erste['gesamt'] == 8
+    assert erste['critical_aktiv'] == 1
+
+
+def test_incremental_matches_full_scan(engine):
+    ids = _seed()
+    engine.get_stats()
+
+    database.increment_fehler_count(ids[3])
+    database.increment_fehler_count(ids[3])
+    database.update_fehler_feedback(ids[1], helpful=False)
+    database.update_fehler_status(ids[2], 'geloest')
+    database.save_or_merge_fehler(
+        muster="ModuleNotFoundError: No module named 'paket5'",
+        kategorie='python',
+        loesung='pip install paket5'
+    )
+    database.find_and_merge_duplicates(threshold=90.0)
+
+    stats = engine.get_stats()
+    assert stats['source'] == 'live'
+    assert _without_meta(stats) == _full_scan()
+
+
+def test_cleanup_updates_counters(engine):
+    ids = _seed()
+    engine.get_stats()
+
+    database.update_fehler_status(ids[4], 'veraltet')
+    result = database.cleanup_old_fehler()
+
+    assert result['deleted_count'] == 1
+    stats = engine.get_stats()
+    assert stats['gesamt'] == 7
+    assert _without_meta(stats) == _full_scan()
@@ -0,0 +1,41 @@
+"""
+NEXUS OVERLORD v2.0 - Tests JSON-Extraktion aus KI-Antworten
+"""
+
+import pytest
+
+from app.utils.json_extractor import extract_json, extract_json_array
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('{"a": 1}', {'a': 1}),
+    ('  \n{"a": 1}\n', {'a': 1}),
+    ('Hier das Ergebnis:\n```json\n{"a": 1}\n```\nViel Erfolg!', {'a': 1}),
+    ('```JSON\n{"a": 1}\n```', {'a': 1}),
+    ('```\n{"a": 1}\n```', {'a': 1}),
+    # ```json hat Vorrang vor einem Block ohne Sprache und vor Fliesstext
+    ('Beispiel {"x": 0}\n```\n{"b": 2}\n```\n```json\n{"a": 1}\n```', {'a': 1}),
+    ('Beispiel {"x": 0} und\n```\n{"b": 2}\n```', {'b': 2}),
+    # ``` innerhalb eines Strings beendet den Block nicht
+    ('```json\n{"code": "```python\\nprint(1)\\n```"}\n```', {'code': '```python\nprint(1)\n```'}),
+    ('Nutze {name} als Platzhalter: {"a": {"b": [1, 2]}} Ende', {'a': {'b': [1, 2]}}),
+    ('{"text": "Zeile 1\nZeile 2"}', {'text': 'Zeile 1\nZeile 2'}),
+    ('kein json hier', {}),
+    ('', {}),
+])
+def test_extract_json(text, expected):
+    assert extract_json(text) == expected
+
+
+def test_extract_json_fallback():
+    assert extract_json('{"abgeschnitten": [1, 2', fallback={'f': True}) == {'f': True}
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('[1, 2]', [1, 2]),
+    ('Ergebnis:\n```json\n[{"a": 1}]\n```', [{'a': 1}]),
+    ('Liste [kaputt und dann [3, 4]', [3, 4]),
+    ('{"a": 1}', []),
+])
+def test_extract_json_array(text, expected):
+    assert extract_json_array(text) == expected
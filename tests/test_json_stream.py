@@ -0,0 +1,85 @@
+"""
+NEXUS OVERLORD v2.0 - Tests inkrementelles JSON-Parsing gestreamter Antworten
+"""
+
+import json
+
+import pytest
+
+from app.utils.json_extractor import extract_json
+from app.utils.json_stream import JsonArrayStreamer
+
+PHASEN = {
+    "phasen": [
+        {"nummer": 1, "name": "Setup {Basis}", "beschreibung": "Sagt \"hallo\" \\ und }]",
+         "abhaengigkeiten": [], "prioritaet": "hoch", "details": {"x": [1, {"y": 2}]}},
+        {"nummer": 2, "name": "API", "beschreibung": "Routen", "abhaengigkeiten": [1],
+         "prioritaet": "mittel"},
+    ],
+    "gesamt_phasen": 2,
+    "hinweise": "Ende",
+}
+
+
+def _feed_all(streamer, text, size):
+    emitted = []
+    for i in range(0, len(text), size):
+        emitted.extend(streamer.feed(text[i:i + size]))
+    return emitted
+
+
+@pytest.mark.parametrize('size', [1, 3, 17, 10_000])
+@pytest.mark.parametrize('wrap', [
+    '{}',
+    'Hier die Phasen:\n```json\n{}\n```\nViel Erfolg!',
+    'Nutze {{name}} als Platzhalter.\n{}',
+])
+def test_streamer_emits_elements_like_extract_json(wrap, size):
+    text = wrap.replace('{}', json.dumps(PHASEN, indent=2, ensure_ascii=False), 1).replace('{{name}}', '{name}')
+    streamer = JsonArrayStreamer('phasen')
+
+    emitted = _feed_all(streamer, text, size)
+
+    assert emitted == PHASEN['phasen']
+    assert streamer.emitted == 2
+    assert extract_json(streamer.text) == PHASEN
+
+
+def test_streamer_emits_element_as_soon_as_it_closes():
+    text = json.dumps(PHASEN)
+    cut = text.index('{"nummer": 2')
+    streamer = JsonArrayStreamer('phasen')
+
+    assert streamer.feed(text[:cut]) == [PHASEN['phasen'][0]]
+    assert streamer.feed(text[cut:]) == [PHASEN['phasen'][1]]
+
+
+def test_streamer_ignores_other_keys_and_nested_arrays():
+    text = json.dumps({"meta": {"phasen": [{"falsch": 1}]}, "andere": [{"a": 1}],
+                       "auftraege": [{"b": 2}], "phasen": [{"c": 3}]})
+    assert JsonArrayStreamer('auftraege').feed(text) == [{"b": 2}]
+
+
+@pytest.mark.parametrize('size', [5, 10_000])  # 10_000: ein Chunk schliesst beide Phasen ab
+def test_generate_phasen_streams_validated_phases(monkeypatch, size):
+    from app.services import phasen_generator
+
+    response = json.dumps({"phasen": [
+        {"nummer": 7, "name": "A", "beschreibung": "a", "prioritaet": "dringend"},
+        {"nummer": 2, "name": "B", "beschreibung": "b", "abhaengigkeiten": [1], "prioritaet": "hoch"},
+    ]})
+
+    class FakeClient:
+        def stream_gemini(self, messages, **kwargs):
+            for i in range(0, len(response), size):
+                yield response[i:i + size]
+
+    monkeypatch.setattr(phasen_generator, 'get_client', lambda: FakeClient())
+    streamed = []
+
+    result = phasen_generator.generate_phasen('Plan', on_phase=streamed.append)
+
+    assert [p['nummer'] for p in streamed] == [1, 2]
+    assert streamed[0]['prioritaet'] == 'mittel'
+    assert streamed[0]['abhaengigkeiten'] == []
+    assert result['phasen'] == streamed
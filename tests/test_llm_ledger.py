@@ -0,0 +1,54 @@
+"""
+Tests fuer den LLM-Ledger (app/services/llm_ledger.py).
+"""
+
+import contextvars
+import sqlite3
+import threading
+
+from app.services.llm_ledger import LlmLedger, llm_context
+
+
+def test_record_and_summary(tmp_path):
+    ledger = LlmLedger(str(tmp_path / 'ledger.db'))
+    with llm_context(7):
+        ledger.record('phasen', 'google/gemini', 1200, True,
+                      prompt_tokens=1000, completion_tokens=200, cached_tokens=800, kosten=0.01)
+        ledger.record('phasen', 'google/gemini', 3000, False, retries=2, fehler='Timeout')
+    ledger.record('qualitaet', 'anthropic/opus', 500, True, prompt_tokens=300, completion_tokens=50)
+
+    nach_site = {row['call_site']: row for row in ledger.summary('call_site')}
+    assert nach_site['phasen']['calls'] == 2
+    assert nach_site['phasen']['fehler'] == 1
+    assert nach_site['phasen']['prompt_tokens'] == 1000
+    assert nach_site['phasen']['cache_hits'] == 1
+    assert nach_site['phasen']['retries'] == 2
+
+    projekt = ledger.summary('projekt', projekt_id=7)
+    assert [row['projekt'] for row in projekt] == [7]
+    assert ledger.totals()['calls'] == 3
+    assert ledger.totals(projekt_id=7)['kosten'] == 0.01
+
+    # Views fuer die Konsole
+    conn = sqlite3.connect(ledger.db_path)
+    assert conn.execute("SELECT calls FROM llm_nach_modell WHERE modell = 'anthropic/opus'").fetchone() == (1,)
+    conn.close()
+
+
+def test_projekt_id_via_copied_context(tmp_path):
+    ledger = LlmLedger(str(tmp_path / 'ledger.db'))
+
+    with llm_context(3):
+        thread = threading.Thread(target=contextvars.copy_context().run,
+                                  args=(ledger.record, 'auftraege_phase', 'm', 10, True))
+    thread.start()
+    thread.join()
+
+    assert ledger.summary('projekt')[0]['projekt'] == 3
+
+
+def test_disabled_ledger_writes_nothing(tmp_path):
+    ledger = LlmLedger(str(tmp_path / 'ledger.db'), enabled=False)
+    ledger.record('phasen', 'm', 10, True)
+    assert ledger.summary('tag') == []
+    assert not (tmp_path / 'ledger.db').exists()
@@ -0,0 +1,46 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Auswertung des Lasttests und Seed-Daten
+"""
+
+import sqlite3
+
+import pytest
+
+from scripts.loadtest import compare, parse_mix, percentile, summarize
+from scripts.seed_db import seed_database
+
+
+def test_percentile_nearest_rank():
+    werte = [float(i) for i in range(1, 101)]
+    assert percentile(werte, 50) == 50.0
+    assert percentile(werte, 95) == 95.0
+    assert percentile(werte, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_summarize_and_compare():
+    bericht = summarize({'chat': [(10.0, 200), (20.0, 200), (30.0, 500), (40.0, 0)]}, dauer=2.0)
+    assert bericht['chat']['requests'] == 4
+    assert bericht['chat']['fehler'] == 2
+    assert bericht['chat']['rps'] == 2.0
+
+    baseline = {'chat': dict(bericht['chat'], p95_ms=20.0)}
+    assert compare(bericht, baseline, 0.2) == ['chat: p95 20.0 -> 40.0 ms']
+    assert compare(bericht, {'chat': bericht['chat']}, 0.2) == []
+
+
+def test_parse_mix_rejects_unknown_route():
+    assert parse_mix('steuern=3,chat') == {'steuern': 3, 'chat': 1}
+    with pytest.raises(ValueError):
+        parse_mix('loeschen=1')
+
+
+def test_seed_is_deterministic(tmp_path):
+    a, b = str(tmp_path / 'a.db'), str(tmp_path / 'b.db')
+    counts = seed_database(a, projekte=3, phasen=2, auftraege=2, chat=4, fehler=25, seed=7)
+    seed_database(b, projekte=3, phasen=2, auftraege=2, chat=4, fehler=25, seed=7)
+    assert counts == {'projekte': 3, 'phasen': 6, 'auftraege': 12, 'chat_messages': 12, 'fehler': 25}
+
+    query = "SELECT muster, kategorie, severity FROM fehler ORDER BY id"
+    rows = [sqlite3.connect(path).execute(query).fetchall() for path in (a, b)]
+    assert rows[0] == rows[1]
@@ -0,0 +1,85 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Log-Auswertung (scripts/log_analytics.py)
+"""
+
+import json
+import os
+
+from scripts.log_analytics import Aggregator, LineParser, _push_fehler, follow
+
+LOG = [
+    '127.0.0.1 - - [18/Oct/2026 10:00:02] "GET /projekt/12/steuern?x=1 HTTP/1.1" 200 -',
+    '127.0.0.1 - - [18/Oct/2026 10:00:03] "POST /projekt/12/fehler HTTP/1.1" 500 -',
+    '2026-10-18 10:00:03,500 - app.routes.projekt - ERROR - [abc] Workflow Fehler: boom',
+    'Traceback (most recent call last):',
+    '  File "/x/y.py", line 12, in run',
+    "KeyError: 'flask_42'",
+    '2026-10-18 10:00:04,000 - app.services.database - ERROR - [-] Fehler beim Laden von Projekt 17: kaputt',
+    json.dumps({'ts': '2026-10-18T10:00:05', 'level': 'INFO', 'logger': 'app.access', 'route': '/projekt/<int:projekt_id>',
+                'path': '/projekt/3', 'status': 200, 'duration_ms': 2500.0}),
+    json.dumps({'ts': '2026-10-18T10:00:05', 'level': 'INFO', 'logger': 'werkzeug',
+                'msg': '127.0.0.1 - - [18/Oct/2026 10:00:05] "GET /projekt/3 HTTP/1.1" 200 -'}),
+    json.dumps({'ts': '2026-10-18T10:00:06', 'level': 'ERROR', 'logger': 'app.routes.projekt', 'msg': 'Fehler',
+                'exc': "Traceback (most recent call last):\n  File \"a.py\"\nKeyError: 'flask_7'"}),
+]
+
+
+def _aggregate(lines, **kwargs):
+    parser = LineParser()
+    aggregator = Aggregator(**kwargs)
+    for line in lines:
+        for event in parser.feed(line):
+            aggregator.add(event)
+    for event in parser.flush():
+        aggregator.add(event)
+    return aggregator
+
+
+def test_report_merges_formats_and_normalizes_signatures():
+    neu = []
+    bericht = _aggregate(LOG, langsam_ms=2000, on_neue_signatur=lambda sig, event: neu.append(sig)).report()
+
+    gesamt = bericht['gesamt']
+    # Werkzeug-Zeile nach dem Access-Log wird nicht doppelt gezaehlt
+    assert gesamt['requests'] == 3
+    assert gesamt['status'] == {'2xx': 2, '5xx': 1}
+    assert gesamt['routen'][0] == {'route': '/projekt/<int:projekt_id>', 'requests': 1, 'langsam': 1,
+                                   'avg_ms': 2500.0, 'max_ms': 2500.0}
+    assert {r['route'] for r in gesamt['routen']} >= {'/projekt/<id>/steuern', '/projekt/<id>/fehler'}
+
+    # ERROR-Zeile + Traceback = ein Ereignis, beide KeyErrors = eine Signatur
+    assert neu == ["KeyError: '<s>'", 'ERROR app.services.database: Fehler beim Laden von Projekt <n>: kaputt']
+    assert bericht['signaturen']["KeyError: '<s>'"]['anzahl'] == 2
+    assert 'File "/x/y.py"' in bericht['signaturen']["KeyError: '<s>'"]['traceback']
+    assert bericht['fenster']['1m']['requests'] == 3
+
+
+def test_follow_reads_appended_lines_and_survives_rotation(tmp_path):
+    log = tmp_path / 'server.log'
+    log.write_text('alt\n', encoding='utf-8')
+    gelesen = []
+    schritte = iter([
+        lambda: log.open('a', encoding='utf-8').write('eins\nzw'),
+        lambda: log.open('a', encoding='utf-8').write('ei\n'),
+        lambda: (os.replace(log, tmp_path / 'server.log.1'), log.write_text('neu\n', encoding='utf-8')),
+    ])
+
+    for zeile in follow(str(log), poll=0.01, stop=lambda: len(gelesen) >= 3):
+        if zeile is None:
+            next(schritte, lambda: None)()
+        else:
+            gelesen.append(zeile)
+
+    assert gelesen == ['eins', 'zwei', 'neu']
+
+
+def test_new_signature_goes_into_fehler_db(temp_db):
+    from app.services import database
+
+    aggregator = _aggregate(LOG[2:6], on_neue_signatur=_push_fehler)
+    sig = next(iter(aggregator.signaturen))
+
+    gespeichert = database.get_all_fehler()
+    assert len(gespeichert) == 1
+    assert gespeichert[0]['muster'] == sig
+    assert 'server-log' in gespeichert[0]['tags']
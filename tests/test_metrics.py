@@ -0,0 +1,74 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Prometheus-Metriken (/metrics)
+"""
+
+import re
+import threading
+
+from flask import Flask
+
+from app.routes.metrics import metrics_bp
+from app.services import blob_store, database, extraction_cache
+from app.utils import metrics, request_profiler
+
+
+def test_histogram_merges_thread_shards_into_cumulative_buckets():
+    registry = metrics.Registry()
+    histogram = registry.register(metrics.Histogram('test_dauer_seconds', 'Test', ('route',), buckets=(0.1, 1)))
+
+    def messen():
+        for wert in (0.05, 0.5, 5):
+            histogram.labels('/a"b').observe(wert)
+
+    threads = [threading.Thread(target=messen) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    text = registry.expose()
+    assert '# TYPE test_dauer_seconds histogram' in text
+    assert 'test_dauer_seconds_bucket{route="/a\\"b",le="0.1"} 4' in text
+    assert 'test_dauer_seconds_bucket{route="/a\\"b",le="1"} 8' in text
+    assert 'test_dauer_seconds_bucket{route="/a\\"b",le="+Inf"} 12' in text
+    assert 'test_dauer_seconds_count{route="/a\\"b"} 12' in text
+
+
+def test_metrics_endpoint_records_routes_and_sql(temp_db, monkeypatch, tmp_path):
+    monkeypatch.setattr(database, 'CONNECTION_FACTORY', database.CONNECTION_FACTORY)
+    monkeypatch.setattr(request_profiler, '_sql_observer', None)
+    monkeypatch.setattr(extraction_cache, '_cache', extraction_cache.ExtractionCache(str(tmp_path / 'cache.db')))
+    monkeypatch.setattr(blob_store, '_store', blob_store.BlobStore(str(tmp_path / 'blobs')))
+
+    app = Flask(__name__)
+    metrics.init_metrics(app, enabled=True)
+    app.register_blueprint(metrics_bp)
+
+    @app.route('/projekt/<int:projekt_id>/test')
+    def seite(projekt_id):
+        conn = database.get_db()
+        conn.execute("SELECT COUNT(*) FROM fehler").fetchone()
+        conn.close()
+        return 'ok'
+
+    client = app.test_client()
+    client.get('/projekt/1/test')
+    client.get('/projekt/2/test')
+    response = client.get('/metrics')
+
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+    text = response.get_data(as_text=True)
+    match = re.search(
+        r'^nexus_http_requests_total\{method="GET",route="/projekt/<int:projekt_id>/test",status="200"\} (\d+)$',
+        text, re.MULTILINE)
+    assert match and int(match.group(1)) >= 2
+    assert re.search(r'^nexus_sqlite_duration_seconds_count\{op="execute"\} [1-9]', text, re.MULTILINE)
+    assert 'nexus_cache_requests_total{cache="extraction",result="hit"}' in text
+
+
+def test_metrics_endpoint_disabled():
+    app = Flask(__name__)
+    metrics.init_metrics(app, enabled=False)
+    app.register_blueprint(metrics_bp)
+
+    assert app.test_client().get('/metrics').status_code == 404
@@ -0,0 +1,49 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Generator-Pipeline gegen den lokalen OpenRouter-Mock
+"""
+
+import pytest
+
+from app.services import llm_ledger, openrouter
+from app.services.auftraege_generator import generate_auftraege
+from app.services.openrouter import OpenRouterClient
+from app.services.phasen_generator import generate_phasen
+from app.services.qualitaetspruefung import pruefen_auftraege
+from scripts.mock_openrouter import MockConfig, start_mock_server
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """OpenRouterClient gegen einen Mock-Server auf freiem Port, Ledger aus."""
+    server = start_mock_server(MockConfig(phasen=3, auftraege_pro_phase=2, chunk_zeichen=7))
+    client = OpenRouterClient(api_key='mock', base_url=server.base_url)
+    monkeypatch.setattr(openrouter, '_client', client)
+    monkeypatch.setattr(llm_ledger, '_ledger', llm_ledger.LlmLedger(enabled=False))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_pipeline_against_mock(mock_client):
+    gestreamt = []
+    phasen = generate_phasen('Plan', on_phase=gestreamt.append)
+    assert [p['nummer'] for p in phasen['phasen']] == [1, 2, 3]
+    assert len(gestreamt) == 3
+
+    auftraege = generate_auftraege(phasen, 'Plan', fanout=True)
+    assert [a['auftrag_nummer'] for a in auftraege['auftraege']] == ['1.1', '1.2', '2.1', '2.2', '3.1', '3.2']
+
+    qualitaet = pruefen_auftraege(auftraege, phasen, 'Plan', chunked=True)
+    assert len(qualitaet['kategorien']) == 7
+    assert qualitaet['gesamt_bewertung'] == 8
+
+    stats = mock_client.stats()
+    assert stats['phasen'] == {'200': 1}
+    assert stats['auftraege_phase'] == {'200': 3}
+
+
+def test_mock_rate_limit_is_http_429(mock_client):
+    mock_client.config.rate_429 = 1.0
+    with pytest.raises(Exception, match='429'):
+        openrouter.get_client().call('m', [{'role': 'user', 'content': 'x'}], max_retries=1)
+    assert mock_client.stats()['text'] == {'429': 1}
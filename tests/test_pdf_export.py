@@ -0,0 +1,77 @@
+"""
+NEXUS OVERLORD v2.0 - Tests PDF-Export Cache und Jobs
+"""
+
+import os
+import time
+
+import pytest
+
+from app.services import database, pdf_export
+
+
+@pytest.fixture
+def export_env(temp_db, tmp_path, monkeypatch):
+    """Eigenes Cache-Verzeichnis, eigener Export-Manager, ein Projekt mit Phase."""
+    monkeypatch.setattr(pdf_export, 'EXPORT_CACHE_DIR', str(tmp_path / 'exports'))
+    monkeypatch.setattr(pdf_export, '_manager', pdf_export.PdfExportManager(workers=1))
+
+    projekt_id = database.save_projekt('Export Test', 'Plan', 'Enterprise', 'Gut')
+    database.save_phasen(projekt_id, {'phasen': [{'nummer': 1, 'name': 'Setup'}]})
+    return projekt_id
+
+
+def test_key_changes_with_fehler_db(export_env):
+    projekt = database.get_projekt_komplett(export_env)
+    key = pdf_export.compute_export_key(projekt)
+
+    assert pdf_export.compute_export_key(projekt) == key
+
+    database.save_fehler(muster='KeyError: x', kategorie='python', loesung='dict.get verwenden')
+    assert pdf_export.compute_export_key(projekt) != key
+
+
+def test_job_fills_cache(export_env):
+    manager = pdf_export.get_export_manager()
+    projekt = database.get_projekt_komplett(export_env)
+
+    job = manager.submit(projekt)
+    for _ in range(100):
+        job = manager.get_job(job['job_id'])
+        if job['status'] in ('done', 'error'):
+            break
+        time.sleep(0.05)
+
+    assert job['status'] == 'done'
+    assert job['progress'] == 100
+    assert pdf_export.get_cached_export(job['key'])
+
+    # Zweiter Start kommt direkt aus dem Cache
+    again = manager.submit(projekt)
+    assert again['status'] == 'done'
+    assert again['schritt'] == 'Aus Cache'
+
+
+def test_route_etag(export_env):
+    from app.main import app
+
+    client = app.test_client()
+    first = client.get(f'/projekt/{export_env}/export-pdf')
+    assert first.status_code == 200
+    assert first.data.startswith(b'%PDF')
+
+    etag = first.headers['ETag']
+    second = client.get(f'/projekt/{export_env}/export-pdf', headers={'If-None-Match': etag})
+    assert second.status_code == 304
+
+
+def test_route_streams_without_cache(export_env, monkeypatch):
+    from app.main import app
+
+    monkeypatch.setattr(pdf_export, 'EXPORT_CACHE_MAX_FILES', 0)
+    monkeypatch.setattr(pdf_export, 'EXPORT_SPOOL_MAX_MEMORY', 1024)
+
+    response = app.test_client().get(f'/projekt/{export_env}/export-pdf')
+    assert response.status_code == 200
+    assert response.data.startswith(b'%PDF')
+    assert not os.path.exists(pdf_export.EXPORT_CACHE_DIR)
@@ -0,0 +1,109 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Planungs-Jobs (Kette, Fortschritt, Idempotenz) gegen den OpenRouter-Mock
+"""
+
+import time
+
+import pytest
+
+from app.services import auftraege_generator, llm_ledger, openrouter, planung_jobs, session_store
+from scripts.mock_openrouter import MockConfig, start_mock_server
+
+
+@pytest.fixture
+def planung(tmp_path, monkeypatch):
+    """Mock-Server, eigener Session-Store und frischer Job-Manager."""
+    server = start_mock_server(MockConfig(phasen=3, auftraege_pro_phase=2))
+    monkeypatch.setattr(openrouter, '_async_client',
+                        openrouter.AsyncOpenRouterClient(api_key='mock', base_url=server.base_url))
+    monkeypatch.setattr(openrouter, '_client', openrouter.OpenRouterClient(api_key='mock', base_url=server.base_url))
+    monkeypatch.setattr(llm_ledger, '_ledger', llm_ledger.LlmLedger(enabled=False))
+    monkeypatch.setattr(session_store, '_store', session_store.ArtifactStore(str(tmp_path / 'sessions.db')))
+    monkeypatch.setattr(planung_jobs, '_manager', planung_jobs.PlanungJobManager())
+    monkeypatch.setattr(auftraege_generator, 'AUFTRAEGE_FANOUT', True)  # Fortschritt je Phase
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _warten(client, url: str) -> dict:
+    deadline = time.monotonic() + 10
+    while True:
+        status = client.get(url).get_json()
+        if status['status'] in ('done', 'error') or time.monotonic() > deadline:
+            return status
+        time.sleep(0.02)
+
+
+def test_pipeline_chains_stages_and_resubmission_is_idempotent(planung, temp_db):
+    from app.main import app
+    from app.services.database import save_projekt
+
+    projekt_id = save_projekt('Demo', 'Plan', 'Enterprise', '8/10')
+    client = app.test_client()
+
+    antwort = client.post(f'/projekt/{projekt_id}/planung/jobs', json={'stufe': 'phasen', 'bis': 'qualitaet'})
+    assert antwort.status_code == 202
+    status = _warten(client, antwort.get_json()['status_url'])
+
+    assert status['status'] == 'done', status['error']
+    assert [s['status'] for s in status['stufen']] == ['done', 'done', 'done']
+    assert status['progress'] == 100
+    assert status['redirect'] == f'/projekt/{projekt_id}/auftraege/qualitaet'
+    assert any('Phase 3/3' in e['text'] for e in status['events'] if e['stufe'] == 'auftraege')
+
+    # Ergebnisse liegen in der Session, die Ergebnis-Seiten funktionieren
+    assert client.get(f'/projekt/{projekt_id}/auftraege').status_code == 200
+    assert '8' in client.get(status['redirect']).get_data(as_text=True)
+
+    # Erneut einreichen: gleicher Job, kein weiterer LLM-Call
+    calls = sum(sum(c.values()) for c in planung.stats().values())
+    erneut = client.post(f'/projekt/{projekt_id}/planung/jobs', json={'stufe': 'phasen', 'bis': 'qualitaet'})
+    assert erneut.get_json()['job_id'] == status['job_id']
+    assert sum(sum(c.values()) for c in planung.stats().values()) == calls
+
+    # Formular: Qualitaetspruefung mit denselben Eingaben -> neuer Job, erneut geprueft
+    formular = client.post(f'/projekt/{projekt_id}/auftraege/pruefen')
+    fortschritt = formular.headers['Location']
+    assert '/planung/jobs/planung_' in fortschritt
+    geprueft = _warten(client, fortschritt.removesuffix('/fortschritt'))
+    assert geprueft['status'] == 'done', geprueft['error']
+    assert geprueft['job_id'] != status['job_id']
+    assert sum(sum(c.values()) for c in planung.stats().values()) > calls
+    assert client.get(fortschritt).headers['Location'] == status['redirect']
+
+    # Zweite Session verknuepft dieselben Ergebnisse; Abschliessen und Streamen
+    # in der ersten Session loescht nur deren Verknuepfung, nicht die Ergebnisse
+    andere = app.test_client()
+    assert andere.get(status['status_url']).get_json()['status'] == 'done'
+    assert client.post(f'/projekt/{projekt_id}/abschliessen').status_code == 302
+    assert andere.get(f'/projekt/{projekt_id}/auftraege').status_code == 200
+    with andere.session_transaction() as sess:
+        phasen_ref = sess['phasen_data_ref']
+    assert '"fertig"' in andere.post(f'/projekt/{projekt_id}/phasen/stream').get_data(as_text=True)
+    assert session_store.get_store().get(phasen_ref) is not None
+    assert client.post(f'/projekt/{projekt_id}/planung/jobs',
+                       json={'stufe': 'phasen'}).get_json()['job_id'] == status['job_id']
+
+    # Fremde Session-Artefakte sind ueber die Status-Route nicht lesbar
+    assert client.get(f'/projekt/{projekt_id}/planung/jobs/planung_key_x').status_code == 404
+    assert client.get(f"/projekt/{projekt_id + 1}/planung/jobs/{status['job_id']}").status_code == 404
+
+
+def test_form_rerolls_the_whole_chain(planung, temp_db):
+    from app.main import app
+    from app.services.database import save_projekt
+
+    projekt_id = save_projekt('Demo', 'Plan', 'Enterprise', '8/10')
+    client = app.test_client()
+
+    ketten = []
+    for _ in range(2):
+        antwort = client.post(f'/projekt/{projekt_id}/phasen', data={'bis': 'qualitaet'})
+        status = _warten(client, antwort.headers['Location'].removesuffix('/fortschritt'))
+        assert status['status'] == 'done', status['error']
+        ketten.append(planung_jobs.get_planung_manager().get_kette(status['job_id']))
+
+    # Gleiche Eingaben (deterministischer Mock), trotzdem jede Stufe neu
+    assert [job['stufe'] for job in ketten[1]] == ['phasen', 'auftraege', 'qualitaet']
+    assert not {job['job_id'] for job in ketten[0]} & {job['job_id'] for job in ketten[1]}
@@ -0,0 +1,48 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Workflow-Status im Session-Store (mehrere Worker)
+"""
+
+import time
+
+from app.routes import projekt
+from app.services import multi_agent, session_store
+
+
+class _FakeWorkflow:
+    """Ersetzt MultiAgentWorkflow: meldet zwei Status-Aenderungen, ohne LLM."""
+
+    def __init__(self, on_status=None):
+        self.on_status = on_status
+        self.status = {'current_step': 0, 'steps': [], 'final_plan': None, 'bewertung': None, 'error': None}
+
+    def run(self, projektname, projektplan):
+        self.status['current_step'] = 3
+        self.on_status(self.status)
+        self.status.update(current_step=6, final_plan=f'# {projektname}', bewertung='9/10')
+        self.on_status(self.status)
+        return self.status
+
+
+def test_tracker_status_is_read_from_store_not_process_memory(tmp_path, monkeypatch):
+    store = session_store.ArtifactStore(str(tmp_path / 'sessions.db'))
+    monkeypatch.setattr(session_store, '_store', store)
+    monkeypatch.setattr(multi_agent, 'MultiAgentWorkflow', _FakeWorkflow)
+    from app.main import app
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['projektname'] = 'Demo'
+    assert client.get('/projekt/tracker').status_code == 200
+    with client.session_transaction() as sess:
+        workflow_id = sess['workflow_id']
+
+    # Anderer Worker: nur der Store ist gemeinsam
+    anderer_worker = session_store.ArtifactStore(store.db_path)
+    deadline = time.monotonic() + 5
+    while anderer_worker.get(workflow_id)['current_step'] != 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert anderer_worker.get(workflow_id)['final_plan'] == '# Demo'
+
+    assert 'window.location.href="/projekt/ergebnis"' in client.get('/projekt/tracker/status').get_data(as_text=True)
+    assert 'Demo' in client.get('/projekt/ergebnis').get_data(as_text=True)
+    assert projekt.get_workflow_status('workflow_unbekannt') is None
@@ -0,0 +1,70 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Prompt-Builder und Token-Budget
+"""
+
+import json
+
+from app.services.prompt_builder import (
+    PromptBuilder, estimate_tokens, get_budget, summarize_sections
+)
+
+
+def _plan(abschnitte: int, zeilen: int) -> str:
+    teile = []
+    for a in range(1, abschnitte + 1):
+        teile.append(f"## Abschnitt {a}")
+        teile.extend(f"Zeile {z} im Abschnitt {a} mit etwas Inhalt fuer die Planung" for z in range(zeilen))
+        teile.append("")
+    return "\n".join(teile)
+
+
+def test_under_budget_only_normalizes_whitespace():
+    prompt = (PromptBuilder('test', "A:\n{a}\nJ:{j}", budget=1000)
+              .add('a', "Text   \n\n\n\nmehr")
+              .add_json('j', {"x": [1, 2]})
+              .build())
+    assert prompt == 'A:\nText\n\nmehr\nJ:{"x":[1,2]}'
+
+
+def test_over_budget_compacts_low_priority_first_and_keeps_json():
+    daten = {"auftraege": [{"nummer": f"1.{i}", "name": "x" * 40} for i in range(20)]}
+    builder = (PromptBuilder('test', "PLAN:\n{plan}\nANALYSE:\n{analyse}\nDATEN:\n{daten}", budget=2500)
+               .add('plan', _plan(10, 10), priority=2)
+               .add('analyse', _plan(10, 20), priority=1)
+               .add_json('daten', daten))
+
+    prompt = builder.build()
+
+    assert builder.stats['compacted']
+    assert builder.stats['tokens'] <= 2500 < builder.stats['tokens_before']
+    assert estimate_tokens(prompt) <= 2600
+    plan, rest = prompt.split('ANALYSE:\n')
+    analyse, json_text = rest.split('DATEN:\n')
+    # Analyse (niedrigere Prioritaet) wird zuerst gekuerzt, alle Ueberschriften bleiben
+    assert 'gekuerzt' in analyse and analyse.count('## Abschnitt') == 10
+    assert json.loads(json_text) == daten
+
+
+def test_duplicate_lines_are_removed_from_less_important_section():
+    wiederholt = "Diese Anforderung steht in beiden Abschnitten des Prompts"
+    builder = (PromptBuilder('test', "{a}\n---\n{b}", budget=10)
+               .add('a', f"{wiederholt}\nNur in A vorhanden und lang genug", priority=2)
+               .add('b', f"{wiederholt}\nNur in B", priority=1))
+
+    a, b = builder.build().split('\n---\n')
+
+    assert wiederholt in a
+    assert wiederholt not in b
+    assert 'wiederholte Zeilen entfernt' in b
+
+
+def test_summarize_is_deterministic():
+    text = _plan(5, 40)
+    assert summarize_sections(text, 300) == summarize_sections(text, 300)
+    assert estimate_tokens(summarize_sections(text, 300)) < estimate_tokens(text)
+
+
+def test_budget_override_from_env(monkeypatch):
+    monkeypatch.setenv('PROMPT_BUDGET_PHASEN', '1234')
+    assert get_budget('phasen') == 1234
+    assert get_budget('unbekannt') > 0
@@ -0,0 +1,63 @@
+"""
+NEXUS OVERLORD v2.0 - Tests aufgeteilte Qualitaetspruefung
+"""
+
+import json
+import re
+import threading
+
+from app.services import qualitaetspruefung
+
+PHASEN = {"phasen": [{"nummer": n, "name": f"Phase {n}", "abhaengigkeiten": [n - 1] if n > 1 else []}
+                     for n in range(1, 4)]}
+AUFTRAEGE = {"auftraege": [
+    {"phase_nummer": p, "auftrag_nummer": f"{p}.{a}", "name": f"Auftrag {p}.{a}",
+     "beschreibung": "Beschreibung", "schritte": ["a", "b"], "dateien": [], "technische_details": [],
+     "erfolgs_kriterien": ["ok"], "regelwerk": {"commit_message": f"[{p}.{a}] x"}}
+    for p in range(1, 4) for a in range(1, 5)
+]}
+
+
+class FakeClient:
+    """Bewertet jede angefragte Kategorie; Phase 3 bekommt schlechtere Noten."""
+
+    def __init__(self):
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def call_gemini(self, messages, **kwargs):
+        prompt = messages[0]['content']
+        with self.lock:
+            self.prompts.append(prompt)
+        namen = re.findall(r'^- \*\*(\w+)\*\*', prompt, re.M)
+        note = 4 if 'AUFTRAEGE (Phase 3)' in prompt else 8
+        antwort = {
+            "kategorien": [{"name": n, "bewertung": note, "kommentar": f"{n} ok"} for n in namen],
+            "verbesserungen": [{"auftrag": "3.1", "typ": "empfehlung", "text": "x"}] if note == 4 else [],
+            "warnungen": [],
+        }
+        if 'ENTERPRISE-PLAN' in prompt:
+            antwort.update(gesamt_kommentar="Solide", fazit="Bereit")
+        return json.dumps(antwort)
+
+
+def test_chunked_review_merges_into_existing_structure(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(qualitaetspruefung, 'get_client', lambda: client)
+    monkeypatch.setattr(qualitaetspruefung, 'QUALITAET_CHUNK_AUFTRAEGE', 8)
+
+    data = qualitaetspruefung.pruefen_auftraege(AUFTRAEGE, PHASEN, 'Der Plan', chunked=True)
+
+    # plan + struktur + 2 Detail-Bloecke (Phase 1-2, Phase 3)
+    assert len(client.prompts) == 4
+    assert sum('Der Plan' in p for p in client.prompts) == 1
+    assert all('\n    ' not in p.split('AUFTRAEGE', 1)[-1] for p in client.prompts)
+
+    assert [k['name'] for k in data['kategorien']] == list(qualitaetspruefung.KATEGORIEN)
+    klarheit = next(k for k in data['kategorien'] if k['name'] == 'Klarheit')
+    assert klarheit['bewertung'] == round((8 * 8 + 4 * 4) / 12)
+    assert klarheit['status'] == 'mittel'
+    assert data['gesamt_bewertung'] == round((8 * 4 + 7 * 3) / 7)
+    assert data['gesamt_kommentar'] == 'Solide'
+    assert data['fazit'] == 'Bereit'
+    assert len(data['verbesserungen']) == 1
@@ -0,0 +1,81 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Request-Profiling (Server-Timing, ?_profile=1)
+"""
+
+import asyncio
+import re
+import time
+
+from flask import Flask, render_template_string
+
+from app.services import database
+from app.services.openrouter import AsyncOpenRouterClient, OpenRouterClient
+from app.utils import request_profiler
+from app.utils.async_loop import init_async
+
+
+def _profiled_app(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, 'CONNECTION_FACTORY', database.CONNECTION_FACTORY)
+    monkeypatch.setattr(OpenRouterClient, 'call', OpenRouterClient.call)
+    monkeypatch.setattr(OpenRouterClient, 'stream', OpenRouterClient.stream)
+    monkeypatch.setattr(AsyncOpenRouterClient, 'call', AsyncOpenRouterClient.call)
+    monkeypatch.setattr(request_profiler, 'PROFILE_DIR', str(tmp_path / 'profiles'))
+
+    app = Flask(__name__)
+    request_profiler.init_profiler(app, enabled=True)
+
+    @app.route('/projekt/<int:projekt_id>/test')
+    def seite(projekt_id):
+        conn = database.get_db()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM fehler")
+        cursor.fetchone()
+        conn.execute("SELECT 1").fetchall()
+        conn.close()
+        time.sleep(0.02)
+        return render_template_string('<p>{{ n }}</p>', n=projekt_id)
+
+    return app
+
+
+def test_server_timing_counts_queries_and_templates(temp_db, monkeypatch, tmp_path):
+    client = _profiled_app(monkeypatch, tmp_path).test_client()
+
+    response = client.get('/projekt/1/test')
+    timing = response.headers['Server-Timing']
+
+    assert 'desc="2 Queries"' in timing
+    assert re.search(r'tpl;dur=\d+\.\d', timing)
+    assert 'desc="0 Calls"' in timing
+    assert 'X-Profile-Dump' not in response.headers
+
+
+def test_profile_switch_writes_folded_stacks(temp_db, monkeypatch, tmp_path):
+    monkeypatch.setattr(request_profiler, 'PROFILE_SAMPLE_MS', 0.5)
+    client = _profiled_app(monkeypatch, tmp_path).test_client()
+
+    response = client.get('/projekt/1/test?_profile=1')
+
+    dump = tmp_path / 'profiles' / response.headers['X-Profile-Dump']
+    zeilen = dump.read_text(encoding='utf-8').splitlines()
+    assert zeilen and all(re.match(r'^\S.* \d+$', zeile) for zeile in zeilen)
+
+
+def test_async_llm_calls_on_the_shared_loop_are_counted(monkeypatch, tmp_path):
+    async def fake_call(self, model, messages, **kwargs):
+        await asyncio.sleep(0.03)
+        return 'ok'
+
+    monkeypatch.setattr(AsyncOpenRouterClient, 'call', fake_call)
+    app = _profiled_app(monkeypatch, tmp_path)
+    init_async(app)
+
+    @app.route('/async')
+    async def async_seite():
+        client = AsyncOpenRouterClient.__new__(AsyncOpenRouterClient)
+        await asyncio.gather(client.call('m', []), client.call('m', []))
+        return 'fertig'
+
+    timing = app.test_client().get('/async').headers['Server-Timing']
+    assert 'desc="2 Calls"' in timing
+    assert float(re.search(r'llm;dur=([\d.]+)', timing).group(1)) >= 50
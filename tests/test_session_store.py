@@ -0,0 +1,102 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Server-seitiger Session-Store (TTL, Cookie-Referenzen)
+"""
+
+import time
+
+import pytest
+from flask import Flask, session
+
+from app.services import session_store
+from app.services.session_store import (
+    ArtifactStore, get_session_artifact, pop_session_artifact, release_reserved_artifact,
+    reserve_session_artifact, set_session_artifact
+)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Eigener Store in tmp_path, als Singleton eingesetzt."""
+    store = ArtifactStore(str(tmp_path / 'sessions.db'))
+    monkeypatch.setattr(session_store, '_store', store)
+    return store
+
+
+def _rows(store: ArtifactStore) -> int:
+    conn = store._connect()
+    try:
+        return conn.execute("SELECT COUNT(*) FROM session_artifacts").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_put_get_roundtrip(store):
+    data = {'phasen': [{'nummer': 1, 'name': 'Setup äöü'}], 'gesamt_phasen': 1}
+
+    ref = store.put(data)
+
+    assert store.get(ref) == data
+    assert store.put({'x': 2}, ref=ref) == ref
+    assert store.get(ref) == {'x': 2}
+    assert store.get('unbekannt') is None
+
+
+def test_expired_artifacts_are_ignored_and_purged(tmp_path, monkeypatch):
+    store = ArtifactStore(str(tmp_path / 'sessions.db'), ttl=60)
+    ref = store.put({'alt': True})
+    assert store.purge_expired() == 0
+
+    jetzt = time.time()
+    monkeypatch.setattr(time, 'time', lambda: jetzt + 61)
+    assert store.get(ref) is None
+    assert _rows(store) == 1
+    assert store.purge_expired() == 1
+    assert _rows(store) == 0
+
+
+def test_session_helpers_keep_only_the_ref_in_the_cookie(store):
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    gross = {'auftraege': [{'beschreibung': 'x' * 5000}]}
+
+    with app.test_request_context():
+        set_session_artifact('auftraege_data', gross)
+        erster_ref = session['auftraege_data_ref']
+
+        # Nur die kurze Referenz steht in der Session, nicht die Daten
+        assert dict(session) == {'auftraege_data_ref': erster_ref}
+        assert len(erster_ref) < 40
+        assert get_session_artifact('auftraege_data') == gross
+
+        # Ersetzen loescht das alte Artefakt
+        set_session_artifact('auftraege_data', {'auftraege': []})
+        assert session['auftraege_data_ref'] != erster_ref
+        assert store.get(erster_ref) is None
+        assert _rows(store) == 1
+
+        # Entfernen loescht Referenz und Zeile
+        pop_session_artifact('auftraege_data')
+        assert 'auftraege_data_ref' not in session
+        assert get_session_artifact('auftraege_data', 'leer') == 'leer'
+        assert _rows(store) == 0
+
+
+def test_reserve_keeps_previous_result_until_released(store):
+    app = Flask(__name__)
+    app.secret_key = 'test'
+
+    with app.test_request_context():
+        set_session_artifact('phasen_data', {'phasen': ['alt']})
+        alter_ref = session['phasen_data_ref']
+
+        ref, freigeben = reserve_session_artifact('phasen_data')
+
+        # Waehrend (und nach einer fehlgeschlagenen) Generierung lesbar
+        assert freigeben == alter_ref
+        assert session['phasen_data_ref'] == ref
+        assert get_session_artifact('phasen_data') == {'phasen': ['alt']}
+
+        store.put({'phasen': ['neu']}, ref=ref)
+        release_reserved_artifact(freigeben)
+        assert get_session_artifact('phasen_data') == {'phasen': ['neu']}
+        assert store.get(alter_ref) is None
@@ -0,0 +1,87 @@
+"""
+NEXUS OVERLORD v2.0 - Tests strukturiertes Logging (JSON, Sampling, Korrelations-ID)
+"""
+
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+
+from flask import Flask
+
+from app.utils import structured_logging as sl
+
+
+def _capture(*filters: logging.Filter) -> tuple[logging.Logger, queue.SimpleQueue]:
+    """Logger mit _QueueHandler, die Queue enthaelt die vorbereiteten Records."""
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = sl._QueueHandler(records)
+    handler.addFilter(sl.CorrelationFilter())
+    for f in filters:
+        handler.addFilter(f)
+    logger = logging.getLogger(f'nexus.test.{id(records)}')
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger, records
+
+
+def test_json_lines_carry_correlation_id_into_threads_and_extra_fields():
+    logger, records = _capture()
+
+    with sl.correlation_context('req-42'):
+        thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(logger.info, 'Auftrag %s gespeichert'),
+            kwargs={'extra': {'projekt_id': 7}},
+        )
+        thread.start()
+        thread.join()
+    try:
+        raise ValueError('kaputt')
+    except ValueError:
+        logger.exception('ohne Kontext')
+
+    formatter = sl.JsonFormatter()
+    erste = json.loads(formatter.format(records.get_nowait()))
+    zweite = json.loads(formatter.format(records.get_nowait()))
+
+    assert erste['msg'] == 'Auftrag %s gespeichert'
+    assert erste['correlation_id'] == 'req-42'
+    assert erste['projekt_id'] == 7
+    assert 'correlation_id' not in zweite
+    assert zweite['level'] == 'ERROR' and 'ValueError: kaputt' in zweite['exc']
+
+
+def test_sampling_drops_debug_but_never_warnings(monkeypatch):
+    monkeypatch.setattr(sl.random, 'random', lambda: 0.5)
+    filt = sl.SamplingFilter(sl.parse_sampling('app.services.database=0.1, kaputt, app=1'))
+    db_logger, records = _capture(filt)
+    db_logger.name = 'app.services.database'
+
+    db_logger.debug('Lade Projekt %s', 1)
+    db_logger.warning('Projekt %s nicht gefunden', 1)
+
+    assert records.get_nowait().levelname == 'WARNING'
+    assert records.empty()
+    assert filt._rate('app.services.database_alt') == 1.0
+
+
+def test_request_id_header_round_trip():
+    app = Flask(__name__)
+    sl.init_correlation(app)
+
+    @app.route('/id')
+    def aktuelle_id():
+        return sl.get_correlation_id()
+
+    client = app.test_client()
+    eigene = client.get('/id', headers={'X-Request-ID': 'proxy-123'})
+    neue = client.get('/id', headers={'X-Request-ID': 'ungueltig mit leerzeichen'})
+
+    assert eigene.get_data(as_text=True) == 'proxy-123' == eigene.headers['X-Request-ID']
+    assert len(neue.headers['X-Request-ID']) == 16
+    assert neue.get_data(as_text=True) == neue.headers['X-Request-ID']
+    assert sl.get_correlation_id() is None
@@ -0,0 +1,61 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Streaming Upload-Pipeline
+"""
+
+import hashlib
+import io
+import os
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+from app.services import extraction_cache, upload_spool
+
+
+@pytest.fixture(autouse=True)
+def no_extraction_cache(monkeypatch):
+    monkeypatch.setattr(extraction_cache, '_cache', extraction_cache.ExtractionCache(max_mb=0))
+
+
+def _storage(data: bytes, name: str = 'plan.txt') -> FileStorage:
+    return FileStorage(stream=io.BytesIO(data), filename=name)
+
+
+def test_spool_hash_and_encoding(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload_spool, 'CHUNK_SIZE', 4)
+    data = 'Größe: äöü'.encode('cp1252')
+
+    with upload_spool.spool_upload(_storage(data), 1024, sniff_text=True, spool_dir=str(tmp_path)) as upload:
+        assert upload.size == len(data)
+        assert upload.sha256 == hashlib.sha256(data).hexdigest()
+        assert upload.encoding == 'latin-1'
+        path = upload.path
+        assert open(path, 'rb').read() == data
+
+    assert not os.path.exists(path)
+
+
+def test_utf8_split_across_chunks(monkeypatch):
+    monkeypatch.setattr(upload_spool, 'CHUNK_SIZE', 1)
+
+    with upload_spool.spool_upload(_storage('Übergabe'.encode('utf-8')), 1024, sniff_text=True) as upload:
+        assert upload.encoding == 'utf-8'
+
+
+def test_limit_aborts_and_cleans_up(tmp_path):
+    with pytest.raises(upload_spool.UploadTooLarge):
+        upload_spool.spool_upload(_storage(b'x' * 100), 10, spool_dir=str(tmp_path))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_upload_plan_route():
+    from app.main import app
+
+    client = app.test_client()
+    response = client.post('/projekt/upload-plan', data={
+        'file': (io.BytesIO('Plan für Phase 1'.encode('utf-8')), 'plan.txt')
+    }, content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    assert response.get_json()['text'] == 'Plan für Phase 1'
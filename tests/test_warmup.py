@@ -0,0 +1,38 @@
+"""
+NEXUS OVERLORD v2.0 - Tests Warm-up und Kaltstart-Profil
+"""
+
+from flask import Flask
+
+from app.utils import warmup as wu
+from scripts.startup_profile import parse_importtime
+
+
+def test_warmup_imports_modules_compiles_templates_and_reports_failures(monkeypatch):
+    monkeypatch.setattr(wu, '_status', {'status': 'pending', 'module': {}, 'templates': 0, 'dauer_ms': None})
+    from app.main import app
+
+    status = wu.warmup(app, modules=['json', 'gibt_es_nicht_xyz'])
+
+    assert status['status'] == 'done'
+    assert isinstance(status['module']['json'], float)
+    assert status['module']['gibt_es_nicht_xyz'].startswith('ModuleNotFoundError')
+    assert status['templates'] == len(app.jinja_env.list_templates()) > 0
+    assert wu.start_warmup(Flask(__name__), enabled=False) is None
+    assert wu.get_warmup_status()['status'] == 'disabled'
+
+
+def test_parse_importtime():
+    stderr = '\n'.join([
+        'import time: self [us] | cumulative | imported package',
+        'import time:       120 |        120 |     _io',
+        'import time:      1500 |      61000 |   flask.json',
+        'import time:     18500 |     181500 | app.main',
+        'irgendeine andere Zeile',
+    ])
+
+    module = parse_importtime(stderr)
+
+    assert [m['modul'] for m in module] == ['_io', 'flask.json', 'app.main']
+    assert module[2] == {'modul': 'app.main', 'self_ms': 18.5, 'cumulative_ms': 181.5, 'tiefe': 0}
+    assert module[0]['tiefe'] == 2